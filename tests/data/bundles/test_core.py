@@ -331,6 +331,90 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             version_table = metadata.tables['version_info']
             check_version_info(eng, version_table, version)
 
+    def test_ingest_resume(self):
+        calendar = get_calendar('XNYS')
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        minute_bar_data = list(make_bar_data(equities, minutes))
+
+        interrupted = [True]
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            adjustment_writer.write()
+
+            def data():
+                for sid, df in minute_bar_data:
+                    if interrupted[0] and sid == 2:
+                        raise ValueError('interrupted')
+                    if not interrupted[0] and sid == 0:
+                        # This sid was written before the interruption, so
+                        # its data in the resumed ingestion is ignored.
+                        df = df * 2
+                    yield sid, df
+
+            minute_bar_writer.write(data())
+
+        first = pd.Timestamp.utcnow()
+        with assert_raises(ValueError):
+            self.ingest('bundle', self.environ, timestamp=first)
+
+        interrupted[0] = False
+        self.ingest(
+            'bundle',
+            self.environ,
+            timestamp=first + pd.Timedelta(seconds=1),
+            resume=True,
+        )
+
+        # The resumed ingestion keeps the timestamp of the interrupted one.
+        assert_equal(
+            ingestions_for_bundle('bundle', self.environ),
+            [first.tz_convert('utc').tz_localize(None)],
+        )
+        assert_false(os.path.exists(
+            pth.data_path(['bundle', '.incomplete'], environ=self.environ),
+        ))
+
+        bundle = self.load('bundle', environ=self.environ)
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, sids, equities, colname),
+                msg=colname,
+            )
+
     @parameterized.expand([('clean',), ('load',)])
     def test_bundle_doesnt_exist(self, fnname):
         with assert_raises(UnknownBundle) as e:
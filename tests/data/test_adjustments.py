@@ -1,7 +1,10 @@
+import pickle
+
 import logbook
 import numpy as np
 import pandas as pd
 
+from zipline.data.adjustment_factors import AdjustmentFactors
 from zipline.data.adjustments import (
     SQLiteAdjustmentReader,
     SQLiteAdjustmentWriter,
@@ -262,3 +265,148 @@ class TestSQLiteAdjustementsWriter(WithTradingCalendars,
         self.assert_all_empty(dfs)
 
         assert_equal(output, input_)
+
+    def test_preloaded_lookups(self):
+        sids = np.arange(5)
+        dates = self.trading_calendar.all_sessions.tz_convert(None)
+
+        def T(n):
+            return dates[n]
+
+        splits = pd.DataFrame(
+            [[T(4), 2.0, 2],
+             [T(0), 0.1, 1],
+             [T(1), 2.0, 1],
+             [T(0), 0.1, 2],
+             [T(8), 2.4, 2]],
+            columns=['effective_date', 'ratio', 'sid'],
+        )
+        mergers = pd.DataFrame(
+            [[T(1), 0.5, 3]],
+            columns=['effective_date', 'ratio', 'sid'],
+        )
+        stock_dividends = pd.DataFrame(
+            [[0, T(0), 1.5, 1],
+             [1, T(0), 1.2, 3],
+             [1, T(0), 1, 2],
+             [0, T(1), 0.5, 2]],
+            columns=['sid', 'ex_date', 'ratio', 'payment_sid'],
+        )
+        for col in 'declared_date', 'record_date', 'pay_date':
+            stock_dividends[col] = T(10)
+
+        self.writer_without_pricing(dates, sids).write(
+            splits=splits,
+            mergers=mergers,
+            stock_dividends=stock_dividends,
+        )
+
+        class AssetFinder(object):
+            def retrieve_asset(self, sid):
+                return sid
+
+        finder = AssetFinder()
+        reader = self.enter_instance_context(
+            SQLiteAdjustmentReader(self.db_path),
+        )
+        preloaded = self.enter_instance_context(
+            SQLiteAdjustmentReader(self.db_path, preload=True),
+        )
+        # The index doesn't hold a connection, so it can be shipped to other
+        # processes.
+        shared = self.enter_instance_context(
+            SQLiteAdjustmentReader(
+                self.db_path,
+                index=pickle.loads(pickle.dumps(preloaded.index)),
+            ),
+        )
+
+        for r in preloaded, shared:
+            for table_name in 'splits', 'mergers', 'dividends':
+                for sid in range(6):
+                    assert_equal(
+                        r.get_adjustments_for_sid(table_name, sid),
+                        sorted(reader.get_adjustments_for_sid(
+                            table_name,
+                            sid,
+                        )),
+                    )
+
+                for n in range(10):
+                    date = T(n).tz_localize('UTC')
+                    assert_equal(
+                        r.get_adjustments_with_effective_date(
+                            table_name,
+                            date,
+                        ),
+                        sorted(reader.get_adjustments_with_effective_date(
+                            table_name,
+                            date,
+                        )),
+                    )
+
+            for n in range(3):
+                date = T(n).tz_localize('UTC')
+                for assets in [0, 1], [1], [4]:
+                    assert_equal(
+                        r.get_stock_dividends_with_ex_date(
+                            assets,
+                            date,
+                            finder,
+                        ),
+                        sorted(reader.get_stock_dividends_with_ex_date(
+                            assets,
+                            date,
+                            finder,
+                        )),
+                    )
+
+    def test_adjustment_factors(self):
+        sids = np.arange(5)
+        dates = self.trading_calendar.all_sessions.tz_convert(None)
+
+        def T(n):
+            return dates[n]
+
+        splits = pd.DataFrame(
+            [[T(2), 0.5, 1],
+             [T(4), 0.25, 1],
+             [T(4), 0.5, 2]],
+            columns=['effective_date', 'ratio', 'sid'],
+        )
+        mergers = pd.DataFrame(
+            [[T(2), 0.8, 1]],
+            columns=['effective_date', 'ratio', 'sid'],
+        )
+        self.writer_without_pricing(dates, sids).write(
+            splits=splits,
+            mergers=mergers,
+        )
+
+        with SQLiteAdjustmentReader(self.db_path) as reader:
+            factors = AdjustmentFactors.from_adjustment_reader(reader)
+
+        path = self.instance_tmpdir.getpath('adjustment_factors.npz')
+        factors.write(path)
+        read_factors = AdjustmentFactors.read(path)
+
+        dts = self.trading_calendar.all_sessions[:6]
+        for f in factors, read_factors:
+            assert_equal(
+                f.cumulative_factors('close', [0, 1, 2], dts),
+                np.array([[1.0, 0.5 * 0.8 * 0.25, 0.5],
+                          [1.0, 0.5 * 0.8 * 0.25, 0.5],
+                          [1.0, 0.25, 0.5],
+                          [1.0, 0.25, 0.5],
+                          [1.0, 1.0, 1.0],
+                          [1.0, 1.0, 1.0]]),
+            )
+            assert_equal(
+                f.cumulative_factors('volume', [0, 1, 2], dts),
+                np.array([[1.0, 8.0, 2.0],
+                          [1.0, 8.0, 2.0],
+                          [1.0, 4.0, 2.0],
+                          [1.0, 4.0, 2.0],
+                          [1.0, 1.0, 1.0],
+                          [1.0, 1.0, 1.0]]),
+            )
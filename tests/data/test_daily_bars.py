@@ -37,6 +37,7 @@ from trading_calendars import get_calendar
 from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
+    NoDataForSid,
     NoDataOnDate,
 )
 from zipline.data.bcolz_daily_bars import BcolzDailyBarWriter
@@ -49,6 +50,10 @@ from zipline.data.hdf5_daily_bars import (
     VOLUME,
     coerce_to_uint32,
 )
+from zipline.data.mmap_daily_bars import (
+    MMapDailyBarReader,
+    MMapDailyBarWriter,
+)
 from zipline.pipeline.loaders.synthetic import (
     OHLCV,
     asset_start,
@@ -468,6 +473,30 @@ class _DailyBarsTestCase(WithEquityDailyBarData,
                     ).format(asset, date.date())
                 )
 
+    def test_get_values(self):
+        reader = self.daily_bar_reader
+        columns = [OPEN, CLOSE, VOLUME]
+        assets = self.assets[::-1]
+        for date in self.sessions:
+            expected = reader.load_raw_arrays(columns, date, date, assets)
+            results = reader.get_values(assets, date, columns)
+            for column, result, expected_result in zip(columns,
+                                                       results,
+                                                       expected):
+                assert_equal(
+                    result,
+                    expected_result[0].astype(result.dtype),
+                    msg='column={} date={}'.format(column, date.date()),
+                )
+            assert_equal(results[-1].dtype, np.dtype('int64'))
+
+        with self.assertRaises(NoDataForSid):
+            reader.get_values(
+                [self.assets[0], 1337],
+                self.sessions[0],
+                columns,
+            )
+
     def test_get_last_traded_dt(self):
         for sid in self.assets:
             assert_equal(
@@ -727,6 +756,77 @@ class HDF5DailyBarCanadaTestCase(_HDF5DailyBarTestCase):
     DAILY_BARS_TEST_QUERY_COUNTRY_CODE = 'CA'
 
 
+class MMapDailyBarTestCase(WithTmpDir, _DailyBarsTestCase):
+    EQUITY_DAILY_BAR_COUNTRY_CODES = ['US']
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MMapDailyBarTestCase, cls).init_class_fixtures()
+
+        path = cls.tmpdir.getpath('daily_equity_pricing.mmap')
+        sids = cls.asset_finder.equities_sids_for_country_code('US')
+        days = cls.equity_daily_bar_days
+        MMapDailyBarWriter(
+            path,
+            cls.trading_calendar,
+            days[0],
+            days[-1],
+        ).write_from_sid_df_pairs(
+            cls.make_equity_daily_bar_data(country_code='US', sids=sids),
+        )
+        cls.daily_bar_reader = MMapDailyBarReader(path)
+
+    def test_asset_lifetimes(self):
+        reader = self.daily_bar_reader
+        assert_sequence_equal(reader.sids, self.assets)
+
+        for ix, sid in enumerate(reader.sids):
+            assert_equal(
+                reader.asset_start_dates[ix],
+                self.asset_start(sid).asm8,
+            )
+            assert_equal(reader.asset_end_dates[ix], self.asset_end(sid).asm8)
+
+    def test_read_returns_views(self):
+        reader = self.daily_bar_reader
+        close, volume = reader.load_raw_arrays(
+            [CLOSE, VOLUME],
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            self.assets[1:4],
+        )
+        assert_equal(volume.dtype, np.dtype('uint32'))
+        for result in close, volume:
+            self.assertIs(type(result), np.ndarray)
+            self.assertFalse(result.flags.writeable)
+            self.assertFalse(result.flags.owndata)
+
+        # Reading non-consecutive sids copies.
+        close, = reader.load_raw_arrays(
+            [CLOSE],
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            self.assets[::-1],
+        )
+        self.assertTrue(close.flags.owndata)
+
+    def test_invalid_date(self):
+        with self.assertRaises(NoDataOnDate):
+            self.daily_bar_reader.load_raw_arrays(
+                OHLCV,
+                Timestamp('2015-06-07', tz='UTC'),
+                TEST_QUERY_STOP,
+                self.assets,
+            )
+
+        with self.assertRaises(NoDataOnDate):
+            self.daily_bar_reader.get_value(
+                self.assets[0],
+                self.trading_calendar.next_session_label(TEST_CALENDAR_STOP),
+                CLOSE,
+            )
+
+
 class TestCoerceToUint32Price(ZiplineTestCase):
     """Test the coerce_to_uint32() function used by the HDF5DailyBarWriter."""
 
@@ -0,0 +1,368 @@
+"""
+Tests for zipline.data.hdf5_minute_bars
+"""
+from datetime import timedelta
+
+from mock import patch
+import numpy as np
+from numpy import nan
+from numpy.testing import assert_almost_equal, assert_array_equal
+from pandas import DataFrame, NaT, Timedelta, Timestamp
+
+from zipline.data.bar_reader import NoDataForSid, NoDataOnDate
+from zipline.data.hdf5_minute_bars import (
+    HDF5MinuteBarReader,
+    HDF5MinuteBarWriter,
+)
+from zipline.testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithTradingCalendars,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+TEST_CALENDAR_START = Timestamp('2015-11-02', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-12-31', tz='UTC')
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class HDF5MinuteBarTestCase(WithTradingCalendars,
+                            WithAssetFinder,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
+    COMPRESSION = 'lzf'
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(HDF5MinuteBarTestCase, cls).init_class_fixtures()
+
+        cal = cls.trading_calendar.schedule.loc[
+            TEST_CALENDAR_START:TEST_CALENDAR_STOP
+        ]
+        cls.market_opens = cal.market_open
+        cls.market_closes = cal.market_close
+
+    def init_instance_fixtures(self):
+        super(HDF5MinuteBarTestCase, self).init_instance_fixtures()
+
+        self.path = self.instance_tmpdir.getpath('minute_bars.h5')
+        self.writer = HDF5MinuteBarWriter(
+            self.path,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            self.ASSET_FINDER_EQUITY_SIDS,
+            ohlc_ratios_per_sid={3: 25},
+            compression=self.COMPRESSION,
+        )
+
+    def reader(self):
+        reader = HDF5MinuteBarReader.from_path(self.path)
+        self.add_instance_callback(reader._h5_file.close)
+        return reader
+
+    def make_frames(self, minutes, sids):
+        """
+        Make a frame per field with distinct, increasing values for each
+        minute and sid.
+        """
+        base = np.arange(len(minutes) * len(sids), dtype=float).reshape(
+            len(minutes), len(sids),
+        )
+        return {
+            field: DataFrame(
+                base + (i + 1) * 1000.0,
+                index=minutes,
+                columns=sids,
+            )
+            for i, field in enumerate(FIELDS)
+        }
+
+    def test_write_and_read(self):
+        session = self.market_opens.index[3]
+        minutes = self.trading_calendar.minutes_for_session(session)
+        sids = [1, 2, 3]
+        frames = self.make_frames(minutes, sids)
+        self.writer.write(frames)
+
+        reader = self.reader()
+        assert_equal(reader.sids, np.array(sids))
+        assert_equal(reader.first_trading_day, TEST_CALENDAR_START)
+        assert_equal(
+            reader.last_available_dt,
+            self.market_closes[TEST_CALENDAR_STOP],
+        )
+
+        results = reader.load_raw_arrays(
+            FIELDS,
+            minutes[10],
+            minutes[20],
+            [3, 1],
+        )
+        for field, result in zip(FIELDS, results):
+            expected = frames[field].loc[minutes[10]:minutes[20], [3, 1]]
+            assert_almost_equal(result, expected.values)
+        assert_equal(results[-1].dtype, np.dtype('uint32'))
+
+        for sid in sids:
+            for field in FIELDS:
+                assert_almost_equal(
+                    reader.get_value(sid, minutes[5], field),
+                    frames[field].loc[minutes[5], sid],
+                )
+
+    def test_many_sids(self):
+        # Enough sids that a compressed dataset has several chunks per
+        # session.
+        sids = list(range(1, 1001))
+        path = self.instance_tmpdir.getpath('many_sids.h5')
+        writer = HDF5MinuteBarWriter(
+            path,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            sids,
+            compression=self.COMPRESSION,
+        )
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            self.market_opens.index[0],
+            self.market_opens.index[1],
+        )
+        frames = self.make_frames(minutes, sids)
+        writer.write(frames)
+
+        reader = HDF5MinuteBarReader.from_path(path)
+        self.add_instance_callback(reader._h5_file.close)
+
+        dataset = reader._h5_file['data']['close']
+        if self.COMPRESSION is not None:
+            self.assertIsNotNone(dataset.chunks)
+            self.assertLess(dataset.chunks[1], len(sids))
+            self.assertLessEqual(
+                np.prod(dataset.chunks) * dataset.dtype.itemsize,
+                2 ** 20,
+            )
+
+        # Read sids from the first and last chunks.
+        query_sids = [1000, 2, 500]
+        results = reader.load_raw_arrays(
+            FIELDS,
+            minutes[400],
+            minutes[410],
+            query_sids,
+        )
+        for field, result in zip(FIELDS, results):
+            assert_almost_equal(
+                result,
+                frames[field].loc[
+                    minutes[400]:minutes[410], query_sids
+                ].values,
+            )
+
+        results = reader.get_values(query_sids, minutes[5], FIELDS)
+        for field, result in zip(FIELDS, results):
+            assert_almost_equal(
+                result,
+                frames[field].loc[minutes[5], query_sids].values,
+            )
+        assert_equal(
+            reader.get_value(1000, minutes[-1], 'close'),
+            frames['close'].loc[minutes[-1], 1000],
+        )
+
+    def test_write_in_blocks(self):
+        sessions = self.market_opens.index[:4]
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            sessions[0],
+            sessions[-1],
+        )
+        sids = [1, 2, 3]
+        frames = self.make_frames(minutes, sids)
+
+        # Write one session at a time, and combine two (sid, df) pairs into
+        # each write.
+        block_bytes = len(minutes) // len(sessions) * len(sids) * 8
+        pairs = [
+            (sid, DataFrame({
+                field: frames[field][sid] + 1.0 for field in FIELDS
+            }))
+            for sid in sids
+        ]
+        with patch(
+            'zipline.data.hdf5_minute_bars.WRITE_BLOCK_BYTES',
+            block_bytes,
+        ), patch('zipline.data.hdf5_minute_bars.WRITE_BATCH_ROWS',
+                 2 * len(minutes)):
+            self.writer.write(frames)
+
+            # Overwrite a few minutes of sid 2 in the second and fourth
+            # sessions.
+            updated_minutes = minutes[[len(minutes) - 1, 400]]
+            update = {
+                field: frame.loc[updated_minutes, [2]] + 0.25
+                for field, frame in frames.items()
+            }
+            self.writer.write(update)
+
+            reader = self.reader()
+            close = reader.load_raw_arrays(
+                ['close'],
+                minutes[0],
+                minutes[-1],
+                sids,
+            )[0]
+            expected_close = frames['close'].copy()
+            expected_close.loc[updated_minutes, 2] += 0.25
+            assert_almost_equal(close, expected_close.values)
+            reader._h5_file.close()
+
+            self.writer.write_from_sid_df_pairs(iter(pairs))
+
+        close = self.reader().load_raw_arrays(
+            ['close'],
+            minutes[0],
+            minutes[-1],
+            sids,
+        )[0]
+        assert_almost_equal(close, frames['close'].values + 1.0)
+
+    def test_missing_values(self):
+        minute = self.market_opens.iloc[0]
+        self.writer.write_from_sid_df_pairs([
+            (1, DataFrame({
+                'open': [10.0],
+                'high': [20.0],
+                'low': [30.0],
+                'close': [40.0],
+                'volume': [50],
+            }, index=[minute])),
+        ])
+
+        reader = self.reader()
+        assert_equal(reader.get_value(1, minute, 'close'), 40.0)
+        assert_almost_equal(reader.get_value(2, minute, 'close'), nan)
+        assert_equal(reader.get_value(2, minute, 'volume'), 0)
+
+        close, volume = reader.load_raw_arrays(
+            ['close', 'volume'],
+            minute,
+            minute + Timedelta('1 min'),
+            [1, 2],
+        )
+        assert_almost_equal(close, [[40.0, nan], [nan, nan]])
+        assert_array_equal(volume, [[50, 0], [0, 0]])
+
+    def test_unknown_sid_and_minute(self):
+        reader = self.reader()
+        minute = self.market_opens.iloc[0]
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(1337, minute, 'close')
+        with self.assertRaises(NoDataForSid):
+            reader.load_raw_arrays(['close'], minute, minute, [1, 1337])
+        with self.assertRaises(NoDataOnDate):
+            reader.get_value(1, minute - Timedelta('1 min'), 'close')
+
+        frames = self.make_frames([minute - Timedelta('1 min')], [1])
+        with self.assertRaises(NoDataOnDate):
+            self.writer.write(frames)
+        with self.assertRaises(ValueError):
+            self.writer.write(self.make_frames([minute], [1337]))
+
+    def test_early_close(self):
+        day_before_thanksgiving = Timestamp('2015-11-25', tz='UTC')
+        friday_after_thanksgiving = Timestamp('2015-11-27', tz='UTC')
+        monday = Timestamp('2015-11-30', tz='UTC')
+
+        early_close = self.market_closes[friday_after_thanksgiving]
+        minutes = [
+            self.market_closes[day_before_thanksgiving] - Timedelta('1 min'),
+            early_close - timedelta(minutes=8),
+            # Data after an early close shouldn't be read.
+            early_close + timedelta(minutes=8),
+            self.market_opens[monday] + Timedelta('1 min'),
+        ]
+        frames = self.make_frames(minutes, [1, 2])
+        self.writer.write(frames)
+
+        reader = self.reader()
+        results = reader.load_raw_arrays(
+            FIELDS,
+            minutes[0],
+            minutes[-1],
+            [1, 2],
+        )
+
+        expected_minutes = self.trading_calendar.minutes_in_range(
+            minutes[0],
+            minutes[-1],
+        )
+        for field, result in zip(FIELDS, results):
+            assert_equal(len(result), len(expected_minutes))
+            expected = frames[field].drop(minutes[2])
+            locs = expected_minutes.get_indexer(expected.index)
+            assert_almost_equal(result[locs], expected.values)
+
+        asset = self.asset_finder.retrieve_asset(1)
+        self.assertEqual(
+            reader.get_last_traded_dt(asset, self.market_opens[monday]),
+            minutes[1],
+        )
+        self.assertEqual(reader.get_last_traded_dt(asset, minutes[-1]),
+                         minutes[-1])
+        self.assertIs(
+            reader.get_last_traded_dt(asset, minutes[0] - Timedelta('1 min')),
+            NaT,
+        )
+
+    def test_overwrite_preserves_other_sids(self):
+        session = self.market_opens.index[0]
+        minutes = self.trading_calendar.minutes_for_session(session)
+        original = self.make_frames(minutes, [1, 2, 3])
+        self.writer.write(original)
+
+        # Overwrite the first two minutes of sid 2 only.
+        update = {
+            field: frame.loc[minutes[:2], [2]] + 0.5
+            for field, frame in original.items()
+        }
+        HDF5MinuteBarWriter.open(self.path).write(update)
+
+        reader = self.reader()
+        close = reader.load_raw_arrays(
+            ['close'],
+            minutes[0],
+            minutes[-1],
+            [1, 2, 3],
+        )[0]
+        expected_close = original['close'].values.copy()
+        expected_close[:2, 1] += 0.5
+        assert_almost_equal(close, expected_close)
+
+    def test_invalid_data(self):
+        minute = self.market_opens.iloc[0]
+        frames = self.make_frames([minute], [1, 2])
+        frames['close'].loc[minute, 2] = 2.0 ** 32
+
+        with self.assertRaises(ValueError):
+            self.writer.write(frames, invalid_data_behavior='raise')
+
+        self.writer.write(frames, invalid_data_behavior='ignore')
+        reader = self.reader()
+        assert_equal(reader.get_value(1, minute, 'close'),
+                     frames['close'].loc[minute, 1])
+        for field in FIELDS[:-1]:
+            assert_almost_equal(reader.get_value(2, minute, field), nan)
+        assert_equal(reader.get_value(2, minute, 'volume'), 0)
+
+
+class HDF5UncompressedMinuteBarTestCase(HDF5MinuteBarTestCase):
+    COMPRESSION = None
+
+    def test_memory_mapped(self):
+        reader = self.reader()
+        for field in FIELDS:
+            self.assertIsInstance(reader._arrays[field], np.memmap)
@@ -601,6 +601,122 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
 
         self.assertEquals(200.0, volume_price)
 
+    def test_write_in_processes(self):
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            self.test_calendar_start,
+            self.trading_calendar.next_session_label(self.test_calendar_start),
+        )
+        first_day = minutes[:US_EQUITIES_MINUTES_PER_DAY]
+        second_day = minutes[US_EQUITIES_MINUTES_PER_DAY:]
+
+        def frame(index, base):
+            values = arange(len(index), dtype=float64) + base
+            return DataFrame(
+                data={
+                    'open': values,
+                    'high': values + 2,
+                    'low': values - 1,
+                    'close': values + 1,
+                    'volume': values * 100,
+                },
+                index=index,
+            )
+
+        # Sid 1 appears twice, so its second write has to wait for its first.
+        data = [
+            (1, frame(first_day, 10.0)),
+            (2, frame(minutes, 20.0)),
+            (1, frame(second_day, 30.0)),
+            (3, frame(first_day, 40.0)),
+        ]
+        self.writer.write(data, processes=2)
+
+        for sid, df in data:
+            for field in 'open', 'high', 'low', 'close', 'volume':
+                assert_array_equal(
+                    self.reader.load_raw_arrays(
+                        [field], df.index[0], df.index[-1], [sid],
+                    )[0][:, 0],
+                    df[field].values,
+                )
+
+        self.assertEqual(
+            self.writer.checkpoints(),
+            {1: minutes[-1], 2: minutes[-1], 3: first_day[-1]},
+        )
+
+    def test_resume_write(self):
+        minute = self.market_opens[self.test_calendar_start]
+
+        def frame(price):
+            return DataFrame(
+                data={
+                    'open': [price],
+                    'high': [price],
+                    'low': [price],
+                    'close': [price],
+                    'volume': [100.0],
+                },
+                index=[minute],
+            )
+
+        # Sid 1 is written and checkpointed, sid 2 was written when the write
+        # was interrupted, but never checkpointed.
+        self.writer.write([(1, frame(10.0))])
+        self.writer.write_sid(2, frame(20.0))
+        self.assertEqual(self.writer.checkpoints(), {1: minute})
+
+        writer = BcolzMinuteBarWriter.open(self.dest, resume=True)
+
+        # Writing sid 2 again doesn't fail with overlapping data, because its
+        # partial table was removed, and sid 1 isn't rewritten.
+        writer.write([(1, frame(11.0)), (2, frame(21.0))])
+
+        reader = BcolzMinuteBarReader(self.dest)
+        self.assertEqual(reader.get_value(1, minute, 'close'), 10.0)
+        self.assertEqual(reader.get_value(2, minute, 'close'), 21.0)
+        self.assertEqual(writer.checkpoints(), {1: minute, 2: minute})
+
+    def test_resume_write_between_chunks_of_a_sid(self):
+        first_session = self.test_calendar_start
+        second_session = self.trading_calendar.next_session_label(
+            first_session,
+        )
+        first_minute = self.market_opens[first_session]
+        second_minute = self.market_opens[second_session]
+
+        def frame(minute, price):
+            return DataFrame(
+                data={
+                    'open': [price],
+                    'high': [price],
+                    'low': [price],
+                    'close': [price],
+                    'volume': [100.0],
+                },
+                index=[minute],
+            )
+
+        # The first chunk of sid 1 is written and checkpointed, and its second
+        # chunk was written when the write was interrupted, but never
+        # checkpointed.
+        self.writer.write([(1, frame(first_minute, 10.0))])
+        self.writer.write_sid(1, frame(second_minute, 20.0))
+        self.assertEqual(self.writer.checkpoints(), {1: first_minute})
+
+        writer = BcolzMinuteBarWriter.open(self.dest, resume=True)
+
+        # The first chunk is skipped, and the second one is written again.
+        writer.write([
+            (1, frame(first_minute, 11.0)),
+            (1, frame(second_minute, 21.0)),
+        ])
+
+        reader = BcolzMinuteBarReader(self.dest)
+        self.assertEqual(reader.get_value(1, first_minute, 'close'), 10.0)
+        self.assertEqual(reader.get_value(1, second_minute, 'close'), 21.0)
+        self.assertEqual(writer.checkpoints(), {1: second_minute})
+
     def test_pad_data(self):
         """
         Test writing empty data.
@@ -914,6 +1030,114 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                 assert_almost_equal(data[sid].loc[minutes, col],
                                     arrays[i][j][minute_locs])
 
+    def test_unadjusted_minutes_multiple_early_closes(self):
+        """
+        Test a window spanning several early closes for sids with different
+        ohlc ratios, where one sid's data ends before the window does.
+        """
+        sessions = self.trading_calendar.sessions_in_range(
+            Timestamp('2015-11-25', tz='UTC'),
+            Timestamp('2015-12-28', tz='UTC'),
+        )
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            sessions[0],
+            sessions[-1],
+        )
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+
+        values = arange(1, len(minutes) + 1, dtype=float64)
+        short = len(minutes) // 2
+        data = {
+            1: DataFrame(
+                {field: values for field in ('open', 'high', 'low', 'close')},
+                index=minutes,
+            ).assign(volume=values),
+            2: DataFrame(
+                {
+                    field: values[:short] + 0.04
+                    for field in ('open', 'high', 'low', 'close')
+                },
+                index=minutes[:short],
+            ).assign(volume=values[:short]),
+        }
+        for sid, frame in data.items():
+            writer.write_sid(sid, frame)
+
+        reader = BcolzMinuteBarReader(self.dest)
+        close, volume = reader.load_raw_arrays(
+            ['close', 'volume'],
+            minutes[0],
+            minutes[-1],
+            [2, 1],
+        )
+
+        expected_close = full((len(minutes), 2), nan)
+        expected_close[:, 1] = values
+        expected_close[:short, 0] = values[:short] + 0.04
+        expected_volume = zeros((len(minutes), 2))
+        expected_volume[:, 1] = values
+        expected_volume[:short, 0] = values[:short]
+
+        assert_almost_equal(close, expected_close)
+        assert_array_equal(volume, expected_volume)
+
+    def test_get_values(self):
+        minutes = self.trading_calendar.minutes_for_session(
+            self.test_calendar_start,
+        )
+        writer = BcolzMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            US_EQUITIES_MINUTES_PER_DAY,
+            ohlc_ratios_per_sid={2: 25},
+        )
+        values = arange(1, 11, dtype=float64)
+        # Sid 1 has data for the first 10 minutes, with a gap, and sid 2
+        # only has data for the first 5 minutes.
+        data_1 = DataFrame(
+            {
+                field: values
+                for field in ('open', 'high', 'low', 'close', 'volume')
+            },
+            index=minutes[:10],
+        )
+        data_1.iloc[3] = nan
+        data_1.iloc[3, -1] = 0
+        writer.write_sid(1, data_1)
+        writer.write_sid(2, DataFrame(
+            {
+                field: values[:5] * 2
+                for field in ('open', 'high', 'low', 'close', 'volume')
+            },
+            index=minutes[:5],
+        ))
+
+        reader = BcolzMinuteBarReader(self.dest)
+        fields = ['open', 'close', 'volume']
+        for minute in minutes[:12]:
+            results = reader.get_values([2, 1], minute, fields)
+            for field, result in zip(fields, results):
+                assert_almost_equal(
+                    result,
+                    [reader.get_value(sid, minute, field) for sid in (2, 1)],
+                )
+            self.assertEqual(results[-1].dtype, int64)
+
+        with self.assertRaises(NoDataOnDate):
+            reader.get_values([1, 2], minutes[0] - timedelta(minutes=1),
+                              fields)
+        with self.assertRaises(NoDataForSid):
+            reader.get_values([1, 1337], minutes[0], fields)
+
     def test_adjust_non_trading_minutes(self):
         start_day = Timestamp('2015-06-01', tz='UTC')
         end_day = Timestamp('2015-06-02', tz='UTC')
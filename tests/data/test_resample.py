@@ -523,6 +523,29 @@ class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                     err_msg='sid={0} field={1} dt={2}'.format(
                         asset, field, minute))
 
+    @parameterized.expand(OHLCV)
+    def test_staggered_minutes_multiple(self, field):
+        # Request assets at different minutes, so that a later request reads
+        # from a different minute for each asset, then request an earlier
+        # minute again.
+        method = getattr(self.equity_daily_aggregator, field + 's')
+        asset_1, asset_2 = self.asset_finder.retrieve_all([1, 2])
+        minutes = EQUITY_CASES[1].index
+        requests = (
+            ([asset_1], 1),
+            ([asset_2], 3),
+            ([asset_1, asset_2], 4),
+            ([asset_2, asset_1], 2),
+        )
+        for assets, i in requests:
+            values = method(assets, minutes[i])
+            for asset, value in zip(assets, values):
+                assert_almost_equal(
+                    value,
+                    EXPECTED_AGGREGATION[asset][field][i],
+                    err_msg='sid={0} field={1} dt={2}'.format(
+                        asset, field, minutes[i]))
+
 
 class TestMinuteToSession(WithEquityMinuteBarData,
                           ZiplineTestCase):
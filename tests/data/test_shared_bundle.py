@@ -0,0 +1,96 @@
+import pandas as pd
+
+from zipline.data.bundles.core import BundleData
+from zipline.data.shared_bundle import SharedBundle, write_shared_bundle
+from zipline.testing import parameter_space, str_to_seconds
+from zipline.testing.fixtures import (
+    WithDataPortal,
+    WithInstanceTmpDir,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+
+
+class SharedBundleTestCase(WithDataPortal,
+                           WithInstanceTmpDir,
+                           ZiplineTestCase):
+    START_DATE = pd.Timestamp('2016-01-04', tz='utc')
+    END_DATE = pd.Timestamp('2016-01-29', tz='utc')
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
+    EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE = True
+
+    @classmethod
+    def make_splits_data(cls):
+        return pd.DataFrame([
+            {
+                'effective_date': str_to_seconds('2016-01-12'),
+                'ratio': 0.5,
+                'sid': 1,
+            },
+        ])
+
+    @classmethod
+    def make_mergers_data(cls):
+        return pd.DataFrame([
+            {
+                'effective_date': str_to_seconds('2016-01-20'),
+                'ratio': 0.8,
+                'sid': 2,
+            },
+        ])
+
+    def init_instance_fixtures(self):
+        super(SharedBundleTestCase, self).init_instance_fixtures()
+        rootdir = self.instance_tmpdir.getpath('shared')
+        write_shared_bundle(
+            rootdir,
+            BundleData(
+                asset_finder=self.asset_finder,
+                equity_minute_bar_reader=self.bcolz_equity_minute_bar_reader,
+                equity_daily_bar_reader=self.bcolz_equity_daily_bar_reader,
+                adjustment_reader=self.adjustment_reader,
+            ),
+        )
+        self.shared_data_portal = SharedBundle(rootdir).data_portal(
+            self.asset_finder,
+            self.trading_calendar,
+        )
+
+    @parameter_space(
+        field=['open', 'high', 'low', 'close', 'volume', 'price'],
+        frequency=['1m', '1d'],
+    )
+    def test_history_matches_bundle(self, field, frequency):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        for session in '2016-01-12', '2016-01-20', '2016-01-29':
+            minutes = self.trading_calendar.minutes_for_session(
+                pd.Timestamp(session, tz='UTC'),
+            )
+            for dt in minutes[0], minutes[100]:
+                assert_equal(
+                    self.shared_data_portal.get_history_window(
+                        assets, dt, 5, frequency, field, 'minute',
+                    ),
+                    self.data_portal.get_history_window(
+                        assets, dt, 5, frequency, field, 'minute',
+                    ),
+                )
+
+    def test_spot_value_matches_bundle(self):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        dt = self.trading_calendar.minutes_for_session(
+            pd.Timestamp('2016-01-20', tz='UTC'),
+        )[10]
+        for field in 'open', 'high', 'low', 'close', 'volume', 'price':
+            assert_equal(
+                self.shared_data_portal.get_spot_value(
+                    assets, field, dt, 'minute',
+                ),
+                self.data_portal.get_spot_value(assets, field, dt, 'minute'),
+            )
+
+        session = pd.Timestamp('2016-01-12', tz='utc')
+        assert_equal(
+            self.shared_data_portal.get_splits(assets, session),
+            self.data_portal.get_splits(assets, session),
+        )
@@ -19,11 +19,13 @@ from unittest import TestCase
 import warnings
 
 from nose_parameterized import parameterized
+import numpy as np
 import pandas as pd
 from six import iteritems
 from six.moves import range, map
 from trading_calendars import get_calendar
 
+from zipline.testing.predicates import assert_equal
 import zipline.utils.events
 from zipline.utils.events import (
     EventRule,
@@ -48,7 +50,10 @@ from zipline.utils.events import (
     MAX_MONTH_RANGE,
     MAX_WEEK_RANGE,
     TradingDayOfMonthRule,
-    TradingDayOfWeekRule
+    TradingDayOfWeekRule,
+    date_rules,
+    make_eventrule,
+    time_rules,
 )
 
 
@@ -168,6 +173,116 @@ class TestEventManager(TestCase):
 
         self.assertEqual(CountingRule.count, 5)
 
+    def test_next_trigger(self):
+        minutes = pd.date_range('2014-01-02 14:31', periods=10, freq='min')
+
+        class AtMinute(StatelessRule):
+            def __init__(self, idx):
+                self.idx = idx
+
+            def should_trigger(self, dt):
+                return dt == minutes[self.idx]
+
+        self.assertEqual(self.em.next_trigger(minutes, 0), 10)
+
+        self.em.add_event(Event(AtMinute(7)))
+        self.em.add_event(Event(AtMinute(3)))
+        self.assertEqual(self.em.next_trigger(minutes, 0), 3)
+        self.assertEqual(self.em.next_trigger(minutes, 4), 7)
+        self.assertEqual(self.em.next_trigger(minutes, 8), 10)
+
+        self.em.add_event(Event(Always()))
+        self.assertEqual(self.em.next_trigger(minutes, 4), 4)
+
+    def test_precompute_triggers(self):
+        cal = get_calendar('NYSE')
+        minutes = cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-06-30', tz='UTC'),
+            pd.Timestamp('2014-07-08', tz='UTC'),
+        )
+
+        class EveryHour(StatelessRule):
+            def should_trigger(self, dt):
+                return dt.minute == 0
+
+        def make_events(calls):
+            def callback(name):
+                return lambda context, data: calls.append((name, context.dt))
+
+            return [
+                Event(
+                    make_eventrule(
+                        date_rules.week_start(),
+                        time_rules.market_open(minutes=30),
+                        cal,
+                    ),
+                    callback('week_start'),
+                ),
+                Event(
+                    make_eventrule(
+                        date_rules.every_day(),
+                        time_rules.market_close(hours=1),
+                        cal,
+                        half_days=False,
+                    ),
+                    callback('every_day'),
+                ),
+                # custom rules can't be precomputed
+                Event(EveryHour(), callback('every_hour')),
+                Event(Always(), callback('always')),
+            ]
+
+        def run(em, calls):
+            context = type('Context', (object,), {})()
+            for dt in minutes:
+                context.dt = dt
+                em.handle_data(context, None, dt)
+            return calls
+
+        expected_calls = []
+        for event in make_events(expected_calls):
+            self.em.add_event(event)
+        run(self.em, expected_calls)
+
+        calls = []
+        em = EventManager()
+        for event in make_events(calls):
+            em.add_event(event)
+        em.precompute_triggers(minutes)
+        self.assertEqual(len(em._triggers), 2)
+
+        # events added afterwards fall back to evaluating their rules
+        late_event = Event(NotHalfDay() & BeforeClose(minutes=5))
+        late_event.rule.cal = cal
+        em.add_event(late_event)
+        self.assertNotIn(id(late_event), em._triggers)
+
+        self.assertEqual(run(em, calls), expected_calls)
+        self.assertIn(
+            ('week_start', pd.Timestamp('2014-07-07 14:00', tz='UTC')),
+            calls,
+        )
+
+    def test_precompute_triggers_next_trigger(self):
+        cal = get_calendar('NYSE')
+        minutes = cal.minutes_for_session(pd.Timestamp('2014-07-07', tz='UTC'))
+
+        self.em.add_event(
+            Event(
+                make_eventrule(
+                    date_rules.every_day(),
+                    time_rules.market_open(minutes=30),
+                    cal,
+                ),
+            ),
+        )
+        self.em.add_event(Event(Never()))
+        self.em.precompute_triggers(minutes)
+
+        self.assertEqual(self.em.next_trigger(minutes, 0), 29)
+        self.assertEqual(self.em.next_trigger(minutes, 29), 29)
+        self.assertEqual(self.em.next_trigger(minutes, 30), len(minutes))
+
 
 class TestEventRule(TestCase):
     def test_is_abstract(self):
@@ -438,6 +553,77 @@ class StatelessRulesTests(RuleTestCase):
             self.assertIs(composed.second, rule2)
             self.assertFalse(any(map(should_trigger, minute)))
 
+    def test_next_trigger(self):
+        def make_rules():
+            return [
+                Always(),
+                Never(),
+                AfterOpen(minutes=30),
+                BeforeClose(hours=1),
+                NthTradingDayOfWeek(1) & AfterOpen(hours=1),
+                NotHalfDay() & BeforeClose(minutes=10),
+            ]
+
+        rules = make_rules()
+        expected_rules = make_rules()
+        for rule in rules + expected_rules:
+            rule.cal = self.cal
+
+        for session in self.sept_sessions[:10]:
+            minutes = self.cal.minutes_for_session(session)
+            for rule, expected_rule in zip(rules, expected_rules):
+                triggers = [
+                    idx for idx, minute in enumerate(minutes)
+                    if expected_rule.should_trigger(minute)
+                ]
+                for start in 0, 29, 30, 100, len(minutes) - 1:
+                    expected = next(
+                        (idx for idx in triggers if idx >= start),
+                        len(minutes),
+                    )
+                    self.assertEqual(
+                        rule.next_trigger(minutes, start),
+                        expected,
+                    )
+
+    def test_trigger_mask(self):
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-06-25', tz='UTC'),
+            pd.Timestamp('2014-07-10', tz='UTC'),
+        )
+
+        def make_rules():
+            return [
+                Always(),
+                Never(),
+                AfterOpen(minutes=30),
+                BeforeClose(hours=1),
+                NotHalfDay(),
+                NthTradingDayOfWeek(1),
+                NDaysBeforeLastTradingDayOfWeek(0),
+                NthTradingDayOfMonth(3),
+                NDaysBeforeLastTradingDayOfMonth(2),
+                NthTradingDayOfWeek(0) & AfterOpen(hours=1),
+                Always() & NotHalfDay() & BeforeClose(minutes=10),
+            ]
+
+        for rule, expected_rule in zip(make_rules(), make_rules()):
+            rule.cal = expected_rule.cal = self.cal
+            assert_equal(
+                rule.trigger_mask(minutes),
+                np.array([expected_rule.should_trigger(m) for m in minutes]),
+                msg=str(rule),
+            )
+
+    def test_trigger_mask_custom_rule(self):
+        class Custom(StatelessRule):
+            def should_trigger(self, dt):
+                return True
+
+        minutes = self.cal.minutes_for_session(self.sept_sessions[1])
+        self.assertIsNone(Custom().trigger_mask(minutes))
+        self.assertIsNone((Always() & Custom()).trigger_mask(minutes))
+
     @parameterized.expand([
         ('month_start', NthTradingDayOfMonth),
         ('month_end', NDaysBeforeLastTradingDayOfMonth),
@@ -502,3 +688,45 @@ class StatefulRulesTests(RuleTestCase):
                 rule.should_trigger(minute)
 
             self.assertEqual(rule.count, 1)
+
+    def test_OncePerDay_next_trigger(self):
+        rule = OncePerDay(AfterOpen(minutes=30))
+        rule.cal = self.cal
+        minutes = self.cal.minutes_for_session(
+            pd.Timestamp('2014-09-24', tz='UTC'),
+        )
+
+        self.assertEqual(rule.next_trigger(minutes, 0), 29)
+        for minute in minutes[:29]:
+            self.assertFalse(rule.should_trigger(minute))
+        self.assertEqual(rule.next_trigger(minutes, 29), 29)
+        self.assertTrue(rule.should_trigger(minutes[29]))
+
+        # we've already triggered today
+        self.assertEqual(rule.next_trigger(minutes, 30), len(minutes))
+
+    def test_OncePerDay_trigger_mask(self):
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-06-25', tz='UTC'),
+            pd.Timestamp('2014-07-10', tz='UTC'),
+        )
+
+        def make_rules():
+            return [
+                OncePerDay(),
+                OncePerDay(Never()),
+                OncePerDay(AfterOpen(minutes=30)),
+                OncePerDay(NthTradingDayOfWeek(2) & BeforeClose(minutes=1)),
+            ]
+
+        for rule, expected_rule in zip(make_rules(), make_rules()):
+            rule.cal = expected_rule.cal = self.cal
+            assert_equal(
+                rule.trigger_mask(minutes),
+                np.array([
+                    bool(expected_rule.should_trigger(m)) for m in minutes
+                ]),
+            )
+
+            # we can't compute triggers once the rule has state
+            self.assertIsNone(expected_rule.trigger_mask(minutes))
@@ -0,0 +1,215 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+
+from zipline.assets import ExchangeInfo, Future
+from zipline.finance._finance_ext import (
+    PositionStats,
+    calculate_position_tracker_stats,
+)
+from zipline.finance.ledger import Ledger, PositionTracker
+from zipline.finance.transaction import Transaction
+from zipline.testing import str_to_seconds
+from zipline.testing.fixtures import WithDataPortal, ZiplineTestCase
+from zipline.testing.predicates import assert_equal
+
+STATS_FIELDS = (
+    'gross_exposure',
+    'gross_value',
+    'long_exposure',
+    'long_value',
+    'net_exposure',
+    'net_value',
+    'short_exposure',
+    'short_value',
+    'longs_count',
+    'shorts_count',
+)
+
+
+class PositionTrackerTestCase(WithDataPortal, ZiplineTestCase):
+    START_DATE = pd.Timestamp('2016-01-04', tz='utc')
+    END_DATE = pd.Timestamp('2016-01-08', tz='utc')
+    ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
+    SPLIT_SID = 2
+
+    @classmethod
+    def make_splits_data(cls):
+        return pd.DataFrame([
+            {
+                'effective_date': str_to_seconds('2016-01-06'),
+                'ratio': 0.5,
+                'sid': cls.SPLIT_SID,
+            },
+        ])
+
+    def init_instance_fixtures(self):
+        super(PositionTrackerTestCase, self).init_instance_fixtures()
+        self.equities = self.asset_finder.retrieve_all(
+            self.ASSET_FINDER_EQUITY_SIDS,
+        )
+        self.tracker = tracker = PositionTracker('minute')
+        for equity, amount in zip(self.equities, [100, -50, 25]):
+            tracker.update_position(equity, amount=amount, cost_basis=10.0)
+
+    def test_sync_last_sale_prices(self):
+        minute = self.trading_calendar.minutes_for_session(
+            self.START_DATE,
+        )[10]
+        self.tracker.sync_last_sale_prices(minute, self.data_portal)
+
+        for equity in self.equities:
+            position = self.tracker.positions[equity]
+            assert_equal(
+                position.last_sale_price,
+                self.data_portal.get_scalar_asset_spot_value(
+                    equity, 'price', minute, 'minute',
+                ),
+            )
+            assert_equal(position.last_sale_date, minute)
+
+    def test_sync_last_sale_prices_non_market_minutes(self):
+        session = pd.Timestamp('2016-01-06', tz='utc')
+        dt = self.trading_calendar.session_open(session) - pd.Timedelta('1H')
+        previous_minute = self.trading_calendar.previous_minute(dt)
+        self.tracker.sync_last_sale_prices(
+            dt,
+            self.data_portal,
+            handle_non_market_minutes=True,
+        )
+
+        for equity in self.equities:
+            expected = self.data_portal.get_adjusted_value(
+                equity, 'price', previous_minute, dt, 'minute',
+            )
+            if equity.sid == self.SPLIT_SID:
+                # the split takes effect between the previous close and dt
+                assert_equal(
+                    expected,
+                    self.data_portal.get_scalar_asset_spot_value(
+                        equity, 'price', previous_minute, 'minute',
+                    ) * 0.5,
+                )
+            assert_equal(
+                self.tracker.positions[equity].last_sale_price,
+                expected,
+            )
+
+    def test_stats(self):
+        future = Future(
+            1000,
+            exchange_info=ExchangeInfo('CMES', 'CMES', 'US'),
+            root_symbol='CL',
+            multiplier=100,
+        )
+        tracker = self.tracker
+        tracker.update_position(future, amount=-3, last_sale_price=40.0)
+        for equity, price in zip(self.equities, [10.0, 20.0, 30.0]):
+            tracker.update_position(equity, last_sale_price=price)
+
+        stats = tracker.stats
+        expected = PositionStats.new()
+        calculate_position_tracker_stats(tracker.positions, expected)
+
+        for field in STATS_FIELDS:
+            assert_equal(getattr(stats, field), getattr(expected, field))
+        assert_equal(
+            stats.position_exposure_series,
+            expected.position_exposure_series,
+        )
+
+        assert_equal(stats.long_value, 100 * 10.0 + 25 * 30.0)
+        assert_equal(stats.short_value, -50 * 20.0)
+        assert_equal(stats.short_exposure, -50 * 20.0 - 3 * 40.0 * 100)
+
+    def test_close_position(self):
+        tracker = self.tracker
+        first, second, third = self.equities
+        dt = self.trading_calendar.minutes_for_session(self.START_DATE)[10]
+
+        protocol_positions = tracker.get_positions()
+        tracker.execute_transaction(
+            Transaction(second, 50, dt, 15.0, order_id=None),
+        )
+        assert_equal(list(tracker.positions), [first, third])
+        assert_equal(list(protocol_positions), [first, third])
+        assert_equal(
+            list(tracker.stats.position_exposure_series.index),
+            [first.sid, third.sid],
+        )
+
+        # reopened positions go to the end
+        tracker.execute_transaction(
+            Transaction(second, 10, dt, 15.0, order_id=None),
+        )
+        assert_equal(list(tracker.positions), [first, third, second])
+        assert_equal(tracker.positions[second].amount, 10)
+        assert_equal(tracker.positions[second].last_sale_price, 15.0)
+        assert_equal(
+            list(tracker.stats.position_exposure_series.index),
+            [first.sid, third.sid, second.sid],
+        )
+
+    def test_close_positions_before_sync(self):
+        tracker = self.tracker
+        first, second, third = self.equities
+        dt = self.trading_calendar.minutes_for_session(self.START_DATE)[10]
+
+        # close and reopen positions without reading the positions in between
+        tracker.execute_transaction(
+            Transaction(first, -100, dt, 15.0, order_id=None),
+        )
+        tracker.execute_transaction(
+            Transaction(third, 25, dt, 15.0, order_id=None),
+        )
+        tracker.execute_transaction(
+            Transaction(third, -25, dt, 15.0, order_id=None),
+        )
+        tracker.execute_transaction(
+            Transaction(first, 20, dt, 15.0, order_id=None),
+        )
+
+        assert_equal(list(tracker.positions), [second, first])
+        assert_equal(tracker.positions[first].amount, 20)
+        assert_equal(tracker.amount_and_last_sale_price(first), (20, 15.0))
+        assert_equal(
+            list(tracker.stats.position_exposure_series.index),
+            [second.sid, first.sid],
+        )
+
+    def test_portfolio_positions(self):
+        sessions = self.trading_calendar.sessions_in_range(
+            self.START_DATE,
+            self.END_DATE,
+        )
+        ledger = Ledger(sessions, 10000.0, 'minute')
+        equity = self.equities[0]
+        minutes = self.trading_calendar.minutes_for_session(self.START_DATE)
+
+        ledger.process_transaction(
+            Transaction(equity, 10, minutes[0], 15.0, order_id=None),
+        )
+        position = ledger.portfolio.positions[equity]
+        assert_equal(position.amount, 10)
+
+        ledger.sync_last_sale_prices(minutes[10], self.data_portal)
+        assert_equal(
+            ledger.portfolio.positions[equity].last_sale_price,
+            self.data_portal.get_scalar_asset_spot_value(
+                equity, 'price', minutes[10], 'minute',
+            ),
+        )
+        # the protocol positions are updated in place
+        assert_equal(position.last_sale_date, minutes[10])
@@ -1,3 +1,4 @@
+import empyrical
 import numpy as np
 import pandas as pd
 
@@ -6,6 +7,14 @@ from zipline.assets import Equity, Future
 from zipline.assets.synthetic import make_commodity_future_info
 from zipline.data.data_portal import DataPortal
 from zipline.data.resample import MinuteResampleSessionBarReader
+from zipline.finance.metrics import (
+    AlphaBeta,
+    ReturnsStatistic,
+    StreamingAlphaBeta,
+    StreamingReturnsStatistic,
+    _ReturnsDrawdown,
+    _ReturnsMoments,
+)
 from zipline.testing import (
     parameter_space,
     prices_generating_returns,
@@ -2332,3 +2341,134 @@ class TestFixedReturns(WithMakeAlgo, WithWerror, ZiplineTestCase):
             check_names=False,
             check_dtype=False,
         )
+
+
+class _ReturnsLedger(object):
+    """A ledger which only tracks the daily returns of the algorithm.
+    """
+    def __init__(self, num_sessions):
+        self.daily_returns_array = np.full(num_sessions, np.nan)
+
+
+class _ReturnsBenchmarkSource(object):
+    """A benchmark source which only provides daily returns.
+    """
+    def __init__(self, returns):
+        self._returns = returns
+
+    def daily_returns(self, start, end):
+        return self._returns[start:end]
+
+
+class TestStreamingMetrics(ZiplineTestCase):
+
+    @parameter_space(
+        bars_per_session=[1, 3],
+        with_nans=[True, False],
+        __fail_fast=True,
+    )
+    def test_matches_default_metrics(self, bars_per_session, with_nans):
+        rand = np.random.RandomState(1337)
+        num_sessions = 40
+        sessions = pd.date_range(
+            '2014-01-02',
+            periods=num_sessions,
+            freq='B',
+            tz='utc',
+        )
+
+        # The returns of the algorithm as of each bar of each session. The
+        # return of a session changes until its last bar.
+        algo_returns = rand.normal(
+            0.0005,
+            0.01,
+            (num_sessions, bars_per_session),
+        )
+        benchmark_returns = pd.Series(
+            rand.normal(0.0003, 0.008, num_sessions),
+            index=sessions,
+        )
+        if with_nans:
+            algo_returns[5, -1] = np.nan
+            benchmark_returns.iloc[9] = np.nan
+
+        pairs = [
+            (
+                ReturnsStatistic(
+                    empyrical.annual_volatility,
+                    'algo_volatility',
+                ),
+                StreamingReturnsStatistic(
+                    _ReturnsMoments,
+                    'annual_volatility',
+                    'algo_volatility',
+                ),
+            ),
+            (
+                ReturnsStatistic(empyrical.sharpe_ratio, 'sharpe'),
+                StreamingReturnsStatistic(
+                    _ReturnsMoments,
+                    'sharpe_ratio',
+                    'sharpe',
+                ),
+            ),
+            (
+                ReturnsStatistic(empyrical.sortino_ratio, 'sortino'),
+                StreamingReturnsStatistic(
+                    _ReturnsMoments,
+                    'sortino_ratio',
+                    'sortino',
+                ),
+            ),
+            (
+                ReturnsStatistic(empyrical.max_drawdown),
+                StreamingReturnsStatistic(_ReturnsDrawdown, 'max_drawdown'),
+            ),
+            (AlphaBeta(), StreamingAlphaBeta()),
+        ]
+
+        ledger = _ReturnsLedger(num_sessions)
+        benchmark_source = _ReturnsBenchmarkSource(benchmark_returns)
+        for pair in pairs:
+            for metric in pair:
+                start_of_simulation = getattr(
+                    metric,
+                    'start_of_simulation',
+                    None,
+                )
+                if start_of_simulation is not None:
+                    start_of_simulation(
+                        ledger,
+                        'minute',
+                        None,
+                        sessions,
+                        benchmark_source,
+                    )
+
+        for session_ix, session in enumerate(sessions):
+            for bar_ix in range(bars_per_session):
+                ledger.daily_returns_array[session_ix] = (
+                    algo_returns[session_ix, bar_ix]
+                )
+                for default_metric, streaming_metric in pairs:
+                    expected = {'cumulative_risk_metrics': {}}
+                    actual = {'cumulative_risk_metrics': {}}
+                    default_metric.end_of_bar(
+                        expected,
+                        ledger,
+                        session,
+                        session_ix,
+                        None,
+                    )
+                    streaming_metric.end_of_bar(
+                        actual,
+                        ledger,
+                        session,
+                        session_ix,
+                        None,
+                    )
+                    assert_equal(
+                        actual,
+                        expected,
+                        msg='session=%d bar=%d' % (session_ix, bar_ix),
+                    )
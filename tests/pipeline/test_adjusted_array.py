@@ -11,6 +11,7 @@ from numpy import (
     arange,
     array,
     asarray,
+    concatenate,
     dtype,
     full,
 )
@@ -658,6 +659,83 @@ class AdjustedArrayTestCase(TestCase):
             for yielded, expected_yield in zip_longest(window_iter, expected):
                 check_arrays(yielded, expected_yield)
 
+    @parameterized.expand(
+        case for case in chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(int64_dtype),
+            _gen_overwrite_adjustment_cases(datetime64ns_dtype),
+        )
+        if case.perspective_offset == 0
+    )
+    def test_traverse_blocks(self,
+                             name,
+                             baseline,
+                             lookback,
+                             adjustments,
+                             missing_value,
+                             perspective_offset,
+                             expected):
+        array = AdjustedArray(baseline, adjustments, missing_value)
+
+        for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
+            blocks = array.traverse_blocks(lookback)
+            self.assertEqual(blocks.nrows, len(expected))
+
+            bounds = [0] + blocks.boundaries + [blocks.nrows]
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                windows = blocks.windows(start, stop)
+                self.assertEqual(len(windows), stop - start)
+                for window, expected_window in zip(windows,
+                                                   expected[start:stop]):
+                    check_arrays(window, expected_window)
+
+    def test_traverse_blocks_offset(self):
+        data = arange(30, dtype=float).reshape(6, 5)
+        adjustments = {
+            1: [Float64Multiply(0, 0, 0, 4, 2.0)],
+            3: [Float64Multiply(0, 2, 1, 1, 3.0)],
+            4: [Float64Overwrite(3, 3, 2, 2, -1.0)],
+        }
+        adj_array = AdjustedArray(data, adjustments, float('nan'))
+
+        expected = list(adj_array.traverse(2, offset=1))
+        blocks = adj_array.traverse_blocks(2, offset=1)
+        self.assertEqual(blocks.nrows, len(expected))
+        # The windows ending on rows 3 and 4 are the first to see the
+        # adjustments known on those rows.
+        self.assertEqual(blocks.boundaries, [1, 2])
+
+        # A block can't span a boundary.
+        with self.assertRaises(ValueError):
+            blocks.windows(0, 2)
+
+        actual = concatenate([
+            blocks.windows(0, 1),
+            blocks.windows(1, 2),
+            blocks.windows(2, 4),
+        ])
+        check_arrays(actual, array(expected))
+
+        # Blocks can only move forward.
+        with self.assertRaises(ValueError):
+            blocks.windows(0, 1)
+
+    def test_traverse_blocks_arent_writable(self):
+        data = arange(30, dtype=float).reshape(6, 5)
+        adj_array = AdjustedArray(data, {}, float('nan'))
+
+        windows = adj_array.traverse_blocks(3).windows(0, 4)
+        with self.assertRaises(ValueError):
+            windows[0, 0, 0] = 5.0
+
+    def test_traverse_blocks_categorical(self):
+        data = LabelArray(
+            arange(6).reshape(3, 2).astype(unicode).astype(object),
+            u'',
+        )
+        with self.assertRaises(TypeError):
+            AdjustedArray(data, {}, u'').traverse_blocks(2)
+
     def test_invalid_lookback(self):
 
         data = arange(30, dtype=float).reshape(6, 5)
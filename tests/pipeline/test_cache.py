@@ -0,0 +1,224 @@
+"""
+Tests for zipline.pipeline.cache
+"""
+import os
+
+import numpy as np
+from pandas import Timestamp
+
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.cache import DiskTermCache, fingerprint
+from zipline.pipeline.data import EquityPricing, USEquityPricing
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import Returns, SimpleMovingAverage
+from zipline.pipeline.loaders import USEquityPricingLoader
+from zipline.testing import tmp_dir
+import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+
+
+# Kept at module scope because class attributes are part of a term's
+# fingerprint, so recording calls on the class would change its cache key.
+COUNTING_FACTOR_CALLS = []
+
+
+class CountingFactor(CustomFactor):
+    inputs = [USEquityPricing.close]
+    window_length = 5
+
+    def compute(self, today, assets, out, close):
+        COUNTING_FACTOR_CALLS.append(today)
+        out[:] = close.mean(axis=0)
+
+
+class FingerprintTestCase(zf.ZiplineTestCase):
+
+    def test_equal_terms_have_equal_fingerprints(self):
+        a = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+        )
+        b = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+        )
+        assert_equal(fingerprint(a), fingerprint(b))
+
+    def test_different_terms_have_different_fingerprints(self):
+        terms = [
+            SimpleMovingAverage(
+                inputs=[USEquityPricing.close],
+                window_length=10,
+            ),
+            SimpleMovingAverage(
+                inputs=[USEquityPricing.close],
+                window_length=11,
+            ),
+            SimpleMovingAverage(
+                inputs=[USEquityPricing.open],
+                window_length=10,
+            ),
+            SimpleMovingAverage(
+                inputs=[EquityPricing.close],
+                window_length=10,
+            ),
+            Returns(window_length=10),
+            Returns(window_length=10).rank(),
+            Returns(window_length=10).rank(ascending=False),
+        ]
+        fingerprints = set(map(fingerprint, terms))
+        assert_equal(len(fingerprints), len(terms))
+
+    def test_compute_body_changes_fingerprint(self):
+
+        def make_factor(multiplier):
+            class F(CustomFactor):
+                inputs = [USEquityPricing.close]
+                window_length = 2
+
+                if multiplier == 1:
+                    def compute(self, today, assets, out, close):
+                        out[:] = close[-1]
+                else:
+                    def compute(self, today, assets, out, close):
+                        out[:] = close[-1] * 2
+            return F()
+
+        self.assertNotEqual(
+            fingerprint(make_factor(1)),
+            fingerprint(make_factor(2)),
+        )
+
+
+class DiskTermCacheTestCase(zf.WithAdjustmentReader,
+                            zf.WithTradingSessions,
+                            zf.ZiplineTestCase):
+
+    START_DATE = Timestamp('2015-01-05', tz='UTC')
+    END_DATE = Timestamp('2015-06-30', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(DiskTermCacheTestCase, cls).init_class_fixtures()
+        cls.loader = USEquityPricingLoader(
+            cls.bcolz_equity_daily_bar_reader,
+            cls.adjustment_reader,
+        )
+
+    def init_instance_fixtures(self):
+        super(DiskTermCacheTestCase, self).init_instance_fixtures()
+        self.cache_dir = self.enter_instance_context(tmp_dir())
+        del COUNTING_FACTOR_CALLS[:]
+
+    def make_engine(self, cache):
+        return SimplePipelineEngine(
+            get_loader=lambda column: self.loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            term_cache=cache,
+        )
+
+    def run_pipeline(self, engine, pipe):
+        return engine.run_pipeline(
+            pipe,
+            self.trading_days[20],
+            self.trading_days[-1],
+        )
+
+    def test_cached_terms_are_not_recomputed(self):
+        cache = DiskTermCache(self.cache_dir.path)
+        factor = CountingFactor()
+        pipe = Pipeline(
+            columns={
+                'counting': factor,
+                'rank': factor.rank(),
+            },
+            domain=US_EQUITIES,
+        )
+
+        expected = self.run_pipeline(self.make_engine(None), pipe)
+        num_calls = len(COUNTING_FACTOR_CALLS)
+        self.assertGreater(num_calls, 0)
+
+        first = self.run_pipeline(self.make_engine(cache), pipe)
+        assert_equal(first, expected)
+        assert_equal(len(COUNTING_FACTOR_CALLS), 2 * num_calls)
+        self.assertTrue(os.listdir(self.cache_dir.path))
+
+        # A new cache object pointing at the same directory should be able to
+        # serve every term, so the factor shouldn't be computed again.
+        second = self.run_pipeline(
+            self.make_engine(DiskTermCache(self.cache_dir.path)),
+            pipe,
+        )
+        assert_equal(second, expected)
+        assert_equal(len(COUNTING_FACTOR_CALLS), 2 * num_calls)
+
+    def test_only_new_terms_are_computed(self):
+        cache = DiskTermCache(self.cache_dir.path)
+        engine = self.make_engine(cache)
+        factor = CountingFactor()
+
+        self.run_pipeline(
+            engine,
+            Pipeline({'counting': factor}, domain=US_EQUITIES),
+        )
+        num_calls = len(COUNTING_FACTOR_CALLS)
+
+        pipe = Pipeline(
+            columns={
+                'counting': factor,
+                'returns': Returns(window_length=5),
+            },
+            domain=US_EQUITIES,
+        )
+        result = self.run_pipeline(engine, pipe)
+        assert_equal(len(COUNTING_FACTOR_CALLS), num_calls)
+        assert_equal(result, self.run_pipeline(self.make_engine(None), pipe))
+
+    def test_eviction(self):
+        pipe = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=[USEquityPricing.close],
+                    window_length=5,
+                ),
+                'returns': Returns(window_length=5),
+            },
+            domain=US_EQUITIES,
+        )
+
+        unbounded = DiskTermCache(self.cache_dir.path)
+        self.run_pipeline(self.make_engine(unbounded), pipe)
+        sizes = [
+            os.path.getsize(os.path.join(self.cache_dir.path, name))
+            for name in os.listdir(self.cache_dir.path)
+        ]
+        self.assertGreater(len(sizes), 1)
+
+        unbounded.clear()
+        assert_equal(os.listdir(self.cache_dir.path), [])
+
+        bounded = DiskTermCache(self.cache_dir.path, max_size=max(sizes))
+        self.run_pipeline(self.make_engine(bounded), pipe)
+        total = sum(
+            os.path.getsize(os.path.join(self.cache_dir.path, name))
+            for name in os.listdir(self.cache_dir.path)
+        )
+        self.assertLessEqual(total, max(sizes))
+
+    def test_get_missing_key(self):
+        cache = DiskTermCache(self.cache_dir.path)
+        self.assertIsNone(cache.get('not-a-key'))
+
+    def test_set_and_get(self):
+        cache = DiskTermCache(self.cache_dir.path)
+        value = np.arange(12, dtype=float).reshape(3, 4)
+        cache.set('key', value)
+        assert_equal(cache.get('key'), value)
+
+        # Object arrays can't be stored without pickling, so they're skipped.
+        cache.set('object', value.astype(object))
+        self.assertIsNone(cache.get('object'))
@@ -3,7 +3,9 @@ Tests for SimplePipelineEngine
 """
 from __future__ import division
 from collections import OrderedDict
+import os
 from itertools import product
+from multiprocessing.pool import ThreadPool
 from operator import add, sub
 from unittest import skipIf
 
@@ -63,6 +65,7 @@ from zipline.pipeline.factors import (
     MaxDrawdown,
     Returns,
     SimpleMovingAverage,
+    VWAP,
 )
 from zipline.pipeline.loaders.equity_pricing_loader import (
     EquityPricingLoader,
@@ -74,7 +77,8 @@ from zipline.pipeline.loaders.synthetic import (
     expected_bar_values_2d,
 )
 from zipline.pipeline.sentinels import NotSpecified
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.spill import WorkspaceSpiller
+from zipline.pipeline.term import AssetExists, InputDates
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
@@ -84,6 +88,7 @@ from zipline.testing import (
     OpenPrice,
     parameter_space,
     product_upper_triangle,
+    tmp_dir,
 )
 import zipline.testing.fixtures as zf
 from zipline.utils.exploding_object import NamedExplodingObject
@@ -91,7 +96,17 @@ from zipline.testing.core import create_simple_domain
 from zipline.testing.predicates import assert_equal
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import bool_dtype, datetime64ns_dtype
-from zipline.utils.pandas_utils import new_pandas, skip_pipeline_new_pandas
+from zipline.utils.pool import SequentialPool
+from zipline.utils.pandas_utils import (
+    categorical_df_concat,
+    new_pandas,
+    skip_pipeline_new_pandas,
+)
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 
 class RollingSumDifference(CustomFactor):
@@ -1290,6 +1305,93 @@ class ParameterizedFactorTestCase(zf.WithAssetFinder,
 
         assert_frame_equal(results['dv5_nan'].unstack(), expected_5_nan)
 
+    @parameterized.expand([(1,), (3,), (5,)])
+    def test_batch_compute(self, window_length):
+        # Overriding ``compute`` opts subclasses back out of
+        # ``compute_batch``, which gives us per-row reference values.
+        class RowSMA(SimpleMovingAverage):
+            def compute(self, today, assets, out, data):
+                out[:] = np.nanmean(data, axis=0)
+
+        class RowVWAP(VWAP):
+            def compute(self, today, assets, out, close, volume):
+                out[:] = (
+                    np.nansum(close * volume, axis=0) /
+                    np.nansum(volume, axis=0)
+                )
+
+        class RowADV(AverageDollarVolume):
+            def compute(self, today, assets, out, close, volume):
+                out[:] = np.nansum(close * volume, axis=0) / len(close)
+
+        self.assertTrue(SimpleMovingAverage(
+            inputs=[EquityPricing.open],
+            window_length=window_length,
+        )._batched)
+        self.assertFalse(RowSMA(
+            inputs=[EquityPricing.open],
+            window_length=window_length,
+        )._batched)
+
+        mask = EquityPricing.close.latest > 20
+        inputs = [EquityPricing.open, EquityPricing.volume]
+        columns = {'mask': mask}
+        for name, batched, row in [('sma', SimpleMovingAverage, RowSMA),
+                                   ('vwap', VWAP, RowVWAP),
+                                   ('adv', AverageDollarVolume, RowADV)]:
+            kwargs = {
+                'inputs': inputs[:1] if name == 'sma' else inputs,
+                'window_length': window_length,
+                'mask': mask,
+            }
+            columns[name] = batched(**kwargs)
+            columns[name + '_expected'] = row(**kwargs)
+            columns[name + '_downsampled'] = batched(**kwargs).downsample(
+                'week_start',
+            )
+            columns[name + '_downsampled_expected'] = row(**kwargs).downsample(
+                'week_start',
+            )
+
+        results = self.engine.run_pipeline(
+            Pipeline(columns=columns),
+            self.dates[5],
+            self.dates[-1],
+        )
+        for name in ('sma', 'vwap', 'adv'):
+            for suffix in ('', '_downsampled'):
+                assert_almost_equal(
+                    results[name + suffix].values,
+                    results[name + suffix + '_expected'].values,
+                    err_msg=name + suffix,
+                )
+            self.assertTrue(results[name][~results['mask']].isnull().all())
+            self.assertFalse(results[name][results['mask']].isnull().all())
+
+    def test_super_compute_of_batch_factor(self):
+        # Subclasses of built-in factors that define ``compute_batch`` can
+        # still extend them through ``compute``.
+        class DoubledSMA(SimpleMovingAverage):
+            def compute(self, today, assets, out, data):
+                super(DoubledSMA, self).compute(today, assets, out, data)
+                out *= 2
+
+        kwargs = {'inputs': [EquityPricing.open], 'window_length': 3}
+        self.assertFalse(DoubledSMA(**kwargs)._batched)
+
+        results = self.engine.run_pipeline(
+            Pipeline(columns={
+                'sma': SimpleMovingAverage(**kwargs),
+                'doubled': DoubledSMA(**kwargs),
+            }),
+            self.dates[5],
+            self.dates[-1],
+        )
+        assert_almost_equal(
+            results['doubled'].values,
+            results['sma'].values * 2,
+        )
+
 
 class StringColumnTestCase(zf.WithSeededRandomPipelineEngine,
                            zf.ZiplineTestCase):
@@ -1535,6 +1637,490 @@ class ChunkedPipelineTestCase(zf.WithUSEquityPricingPipelineEngine,
         )
         self.assertTrue(chunked_result.equals(pipeline_result))
 
+    @parameterized.expand([
+        ('one_pending', 2, 1),
+        ('default_pending', 2, None),
+        ('more_processes_than_chunks', 32, None),
+    ])
+    def test_run_chunked_pipeline_in_processes(self,
+                                               name,
+                                               processes,
+                                               max_pending_chunks):
+        pipe = Pipeline(
+            columns={
+                'close': EquityPricing.close.latest,
+                'returns': Returns(window_length=2),
+                'categorical': EquityPricing.close.latest.quantiles(5)
+            },
+            domain=US_EQUITIES,
+        )
+        serial_result = self.pipeline_engine.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+        )
+        parallel_result = self.pipeline_engine.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+            processes=processes,
+            max_pending_chunks=max_pending_chunks,
+        )
+        self.assertTrue(parallel_result.equals(serial_result))
+
+    @parameterized.expand([
+        ('serial', None),
+        ('processes', 2),
+    ])
+    def test_run_pipeline_iter(self, name, processes):
+        pipe = Pipeline(
+            columns={
+                'close': EquityPricing.close.latest,
+                'returns': Returns(window_length=2),
+                'categorical': EquityPricing.close.latest.quantiles(5)
+            },
+            domain=US_EQUITIES,
+        )
+        chunks = self.pipeline_engine.run_pipeline_iter(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+            processes=processes,
+        )
+        self.assertNotIsInstance(chunks, list)
+
+        chunks = list(chunks)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            dates = chunk.index.get_level_values(0).unique()
+            self.assertLessEqual(len(dates), 23)
+
+        expected = self.pipeline_engine.run_pipeline(
+            pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+        )
+        result = categorical_df_concat(chunks)
+        self.assertTrue(result.equals(expected))
+
+    def test_run_pipeline_iter_close_early(self):
+        pipe = Pipeline(
+            columns={'close': EquityPricing.close.latest},
+            domain=US_EQUITIES,
+        )
+        chunks = self.pipeline_engine.run_pipeline_iter(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=5,
+            processes=2,
+        )
+        first = next(chunks)
+        self.assertEqual(
+            first.index.get_level_values(0)[0],
+            self.PIPELINE_START_DATE,
+        )
+        chunks.close()
+        with self.assertRaises(StopIteration):
+            next(chunks)
+
+    def test_run_chunks_in_processes_no_chunks(self):
+        pipe = Pipeline(
+            columns={'close': EquityPricing.close.latest},
+            domain=US_EQUITIES,
+        )
+        chunks = self.pipeline_engine._run_chunks_in_processes(
+            pipe,
+            [],
+            processes=2,
+            max_pending_chunks=None,
+        )
+        self.assertEqual(list(chunks), [])
+
+    def test_run_chunked_pipeline_bad_processes(self):
+        pipe = Pipeline(
+            columns={'close': EquityPricing.close.latest},
+            domain=US_EQUITIES,
+        )
+        for kwargs in ({'processes': 0},
+                       {'processes': 2, 'max_pending_chunks': 0}):
+            with self.assertRaises(ValueError):
+                self.pipeline_engine.run_chunked_pipeline(
+                    pipeline=pipe,
+                    start_date=self.PIPELINE_START_DATE,
+                    end_date=self.END_DATE,
+                    chunksize=22,
+                    **kwargs
+                )
+
+
+class ConcurrentPipelineTestCase(zf.WithSeededRandomPipelineEngine,
+                                 zf.ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = tuple(range(1, 21))
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(ConcurrentPipelineTestCase, cls).init_class_fixtures()
+        cls.domain = EquitySessionDomain(
+            cls.trading_days,
+            cls.ASSET_FINDER_COUNTRY_CODE,
+        )
+
+    def make_engine(self, pool):
+        return SimplePipelineEngine(
+            get_loader=lambda column: self.seeded_random_loader,
+            asset_finder=self.asset_finder,
+            default_domain=self.domain,
+            pool=pool,
+        )
+
+    def make_pipeline(self):
+        f = TestingDataSet.float_col.latest
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=10,
+        )
+        return Pipeline(
+            columns={
+                'f': f,
+                'sma': sma,
+                'zscore': sma.zscore(mask=f.notnull()),
+                'rank': (f - sma).rank(),
+                'ewma': EWMA(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                    decay_rate=0.5,
+                ),
+                'bool': TestingDataSet.bool_col.latest,
+                'cat': TestingDataSet.categorical_col.latest,
+            },
+            screen=TestingDataSet.bool_col.latest | f.top(10),
+            domain=self.domain,
+        )
+
+    @parameterized.expand([
+        ('sequential', SequentialPool),
+        ('threaded', lambda: ThreadPool(4)),
+    ])
+    def test_concurrent_matches_serial(self, name, make_pool):
+        pool = make_pool()
+        self.add_instance_callback(pool.close)
+
+        pipe = self.make_pipeline()
+        start_date = self.trading_days[-30]
+        end_date = self.trading_days[-1]
+
+        expected = self.run_pipeline(pipe, start_date, end_date)
+        result = self.make_engine(pool).run_pipeline(
+            pipe,
+            start_date,
+            end_date,
+        )
+        assert_frame_equal(result.sort_index(axis=1),
+                           expected.sort_index(axis=1))
+
+    def test_concurrent_compute_error(self):
+
+        class Broken(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 2
+
+            def compute(self, today, assets, out, col):
+                raise ValueError('broken')
+
+        pool = ThreadPool(2)
+        self.add_instance_callback(pool.close)
+
+        pipe = Pipeline(columns={'broken': Broken()}, domain=self.domain)
+        with self.assertRaisesRegexp(ValueError, 'broken'):
+            self.make_engine(pool).run_pipeline(
+                pipe,
+                self.trading_days[-5],
+                self.trading_days[-1],
+            )
+
+
+class MemoryBudgetPipelineTestCase(zf.WithSeededRandomPipelineEngine,
+                                   zf.ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = tuple(range(1, 21))
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MemoryBudgetPipelineTestCase, cls).init_class_fixtures()
+        cls.domain = EquitySessionDomain(
+            cls.trading_days,
+            cls.ASSET_FINDER_COUNTRY_CODE,
+        )
+
+    def make_pipeline(self):
+        f = TestingDataSet.float_col.latest
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=10,
+        )
+        return Pipeline(
+            columns={
+                'sma': sma,
+                'zscore': sma.zscore(mask=f.notnull()),
+                'rank': (f - sma).rank(),
+                'ewma': EWMA(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                    decay_rate=0.5,
+                ),
+                'cat': TestingDataSet.categorical_col.latest,
+            },
+            screen=TestingDataSet.bool_col.latest | f.top(10),
+            domain=self.domain,
+        )
+
+    @parameterized.expand([
+        ('spill_everything', 0),
+        ('spill_some', 2000),
+        ('no_spill', 2 ** 40),
+    ])
+    def test_budget_matches_unbudgeted(self, name, memory_budget):
+        spill_dir = self.enter_instance_context(tmp_dir()).path
+        engine = SimplePipelineEngine(
+            get_loader=lambda column: self.seeded_random_loader,
+            asset_finder=self.asset_finder,
+            default_domain=self.domain,
+            memory_budget=memory_budget,
+            spill_dir=spill_dir,
+        )
+
+        pipe = self.make_pipeline()
+        start_date = self.trading_days[-30]
+        end_date = self.trading_days[-1]
+
+        expected = self.run_pipeline(pipe, start_date, end_date)
+        result = engine.run_pipeline(pipe, start_date, end_date)
+        assert_frame_equal(result.sort_index(axis=1),
+                           expected.sort_index(axis=1))
+
+        # Spill files are removed once the chunk has been computed.
+        assert_equal(os.listdir(spill_dir), [])
+
+    def test_budget_with_pool(self):
+        with self.assertRaises(ValueError):
+            SimplePipelineEngine(
+                get_loader=lambda column: self.seeded_random_loader,
+                asset_finder=self.asset_finder,
+                default_domain=self.domain,
+                pool=SequentialPool(),
+                memory_budget=0,
+            )
+
+    def test_memory_aware_execution_order(self):
+        graph = self.make_pipeline().to_execution_plan(
+            self.domain,
+            AssetExists(),
+            self.trading_days[-30],
+            self.trading_days[-1],
+        )
+        refcounts = graph.initial_refcounts([])
+        nbytes = {term: 8 for term in graph.graph}
+        loadable = sorted(graph.loadable_terms, key=repr)
+        batches = {term: loadable for term in loadable}
+
+        order = list(
+            graph.memory_aware_execution_order(refcounts, nbytes, batches)
+        )
+
+        # Only one term is emitted for each batch.
+        assert_equal(len([t for t in order if t in graph.loadable_terms]), 1)
+        assert_equal(
+            len(order),
+            len(graph.graph) - len(graph.loadable_terms) + 1,
+        )
+
+        # Every term comes after its dependencies.
+        position = {term: i for i, term in enumerate(order)}
+        load_position = min(position[t] for t in loadable if t in position)
+
+        def produced_at(term):
+            if term in batches:
+                return load_position
+            return position[term]
+
+        for parent, child in graph.graph.edges():
+            self.assertLess(produced_at(parent), produced_at(child))
+
+    def test_spill(self):
+        spill_dir = self.enter_instance_context(tmp_dir()).path
+        small = np.arange(5, dtype=float)
+        large = np.arange(100, dtype=float)
+        view = large[10:]
+        workspace = {'small': small, 'large': large, 'view': view}
+
+        budget = small.nbytes + view.nbytes
+        with WorkspaceSpiller(budget, dir=spill_dir) as spiller:
+            spiller.spill(workspace, ['small', 'large', 'view'])
+            assert_equal(spiller.spilled, ['large'])
+            self.assertIsInstance(workspace['large'], np.memmap)
+            self.assertIs(workspace['small'], small)
+            assert_equal(np.array(workspace['large']), large)
+            assert_equal(len(os.listdir(spill_dir)), 1)
+
+        assert_equal(os.listdir(spill_dir), [])
+
+
+class ProfilePipelineTestCase(zf.WithSeededRandomPipelineEngine,
+                              zf.ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = tuple(range(1, 11))
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(ProfilePipelineTestCase, cls).init_class_fixtures()
+        cls.domain = EquitySessionDomain(
+            cls.trading_days,
+            cls.ASSET_FINDER_COUNTRY_CODE,
+        )
+
+    @parameterized.expand([
+        ('serial', None),
+        ('concurrent', SequentialPool),
+    ])
+    def test_profile_pipeline(self, name, make_pool):
+        engine = SimplePipelineEngine(
+            get_loader=lambda column: self.seeded_random_loader,
+            asset_finder=self.asset_finder,
+            default_domain=self.domain,
+            pool=make_pool and make_pool(),
+        )
+        f = TestingDataSet.float_col.latest
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=10,
+        )
+        pipe = Pipeline(
+            columns={'sma': sma, 'rank': (f - sma).rank()},
+            domain=self.domain,
+        )
+        start_date = self.trading_days[-10]
+        end_date = self.trading_days[-1]
+
+        result, profile = engine.profile_pipeline(pipe, start_date, end_date)
+        assert_frame_equal(
+            result,
+            engine.run_pipeline(pipe, start_date, end_date),
+        )
+
+        frame = profile.to_frame()
+        assert_equal(list(frame.columns), list(profile.columns))
+        self.assertTrue((frame.seconds >= 0).all())
+        self.assertTrue((frame['result_nbytes'] > 0).all())
+
+        computed = frame[frame.kind == 'compute']
+        computed_terms = set(computed.term)
+        for term in (f, sma, pipe.columns['rank']):
+            self.assertIn(term, computed_terms)
+        extra_rows = profile.graph.extra_rows
+        for term, shape in zip(computed['term'], computed['array_shape']):
+            assert_equal(
+                shape,
+                (len(result.index.levels[0]) + extra_rows[term], 10),
+            )
+
+        loads = frame[frame.kind == 'load']
+        assert_equal(len(loads), 1)
+        assert_equal(loads.loader.iloc[0], 'SeededRandomLoader')
+        assert_equal(
+            loads.term.iloc[0],
+            (TestingDataSet.float_col.specialize(self.domain),),
+        )
+
+        heat = profile.heat()
+        assert_equal(set(heat), computed_terms | set(loads.term.iloc[0]))
+        assert_equal(max(heat.values()), 1.0)
+        self.assertTrue(all(0 <= v <= 1 for v in heat.values()))
+
+
+class DensePipelineTestCase(zf.WithSeededRandomPipelineEngine,
+                            zf.ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = tuple(range(1, 11))
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(DensePipelineTestCase, cls).init_class_fixtures()
+        cls.domain = EquitySessionDomain(
+            cls.trading_days,
+            cls.ASSET_FINDER_COUNTRY_CODE,
+        )
+        cls.engine = SimplePipelineEngine(
+            get_loader=lambda column: cls.seeded_random_loader,
+            asset_finder=cls.asset_finder,
+            default_domain=cls.domain,
+        )
+
+    def make_pipeline(self):
+        f = TestingDataSet.float_col.latest
+        return Pipeline(
+            columns={
+                'f': f,
+                'sma': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                ),
+                'bool': TestingDataSet.bool_col.latest,
+                'cat': TestingDataSet.categorical_col.latest,
+            },
+            screen=f.top(5),
+            domain=self.domain,
+        )
+
+    def test_dense_matches_narrow(self):
+        pipe = self.make_pipeline()
+        start_date = self.trading_days[-10]
+        end_date = self.trading_days[-1]
+
+        dense = self.engine.run_dense_pipeline(pipe, start_date, end_date)
+        narrow = self.engine.run_pipeline(pipe, start_date, end_date)
+
+        assert_equal(sorted(dense), ['bool', 'cat', 'f', 'sma'])
+        assert_equal(dense.dates.values, self.trading_days[-10:].values)
+        assert_equal(list(dense.sids), list(self.ASSET_FINDER_EQUITY_SIDS))
+        assert_equal(dense.screen.shape, (10, 10))
+        assert_equal(dense.screen.sum(axis=1), np.full(10, 5))
+
+        for name in ('f', 'sma', 'bool'):
+            assert_equal(dense[name].shape, (10, 10))
+            assert_equal(dense[name][dense.screen], narrow[name].values)
+        assert_equal(
+            dense['cat'][dense.screen].as_categorical(),
+            narrow['cat'].values,
+        )
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_to_arrow(self):
+        pipe = self.make_pipeline()
+        start_date = self.trading_days[-10]
+        end_date = self.trading_days[-1]
+
+        dense = self.engine.run_dense_pipeline(pipe, start_date, end_date)
+        narrow = self.engine.run_pipeline(pipe, start_date, end_date)
+
+        table = dense.to_arrow()
+        assert_equal(
+            table.column_names,
+            ['date', 'sid', 'bool', 'cat', 'f', 'sma'],
+        )
+        assert_equal(table.num_rows, len(narrow))
+        frame = table.to_pandas()
+        assert_equal(
+            frame['sid'].values,
+            np.array([a.sid for a in narrow.index.get_level_values(1)]),
+        )
+        for name in ('f', 'sma', 'bool'):
+            assert_equal(frame[name].values, narrow[name].values)
+
+        full = dense.to_arrow(apply_screen=False)
+        assert_equal(full.num_rows, 100)
+        assert_equal(full.column_names[-1], 'screen')
+
 
 class MaximumRegressionTest(zf.WithSeededRandomPipelineEngine,
                             zf.ZiplineTestCase):
@@ -0,0 +1,86 @@
+"""
+Tests for zipline.pipeline.incremental
+"""
+from itertools import repeat
+
+from nose_parameterized import parameterized
+from pandas import Timestamp
+from pandas.util.testing import assert_frame_equal
+
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import EquityPricing
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.factors import Returns, SimpleMovingAverage
+from zipline.pipeline.incremental import IncrementalPipelineRunner
+import zipline.testing.fixtures as zf
+
+
+class IncrementalPipelineRunnerTestCase(zf.WithUSEquityPricingPipelineEngine,
+                                        zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-02-01', tz='UTC')
+    END_DATE = Timestamp('2006-06-30', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_pipeline(self):
+        close = EquityPricing.close.latest
+        sma = SimpleMovingAverage(
+            inputs=[EquityPricing.close],
+            window_length=10,
+        )
+        return Pipeline(
+            columns={
+                'close': close,
+                'sma': sma,
+                'returns': Returns(window_length=5),
+                'rank': (close - sma).rank(),
+                'quantiles': close.quantiles(3),
+            },
+            screen=close > 0,
+            domain=US_EQUITIES,
+        )
+
+    @parameterized.expand([
+        ('one_session', 0),
+        ('week', 5),
+        ('longer_than_run', 500),
+    ])
+    def test_matches_run_pipeline(self, name, block_size):
+        pipe = self.make_pipeline()
+        sessions = self.trading_days[
+            self.trading_days.slice_indexer(
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+            )
+        ]
+        runner = IncrementalPipelineRunner(
+            self.pipeline_engine,
+            pipe,
+            sessions[-1],
+            repeat(block_size),
+        )
+        for session in sessions[::7]:
+            expected = self.pipeline_engine.run_pipeline(
+                pipe,
+                session,
+                session,
+            )
+            result = runner.run_session(session)
+            assert_frame_equal(
+                result.sort_index(axis=1),
+                expected.sort_index(axis=1),
+            )
+
+    def test_sessions_must_increase(self):
+        pipe = self.make_pipeline()
+        runner = IncrementalPipelineRunner(
+            self.pipeline_engine,
+            pipe,
+            self.END_DATE,
+            repeat(5),
+        )
+        sessions = self.trading_days
+        start = sessions.get_loc(self.PIPELINE_START_DATE)
+        runner.run_session(sessions[start + 1])
+        with self.assertRaises(ValueError):
+            runner.run_session(sessions[start])
@@ -0,0 +1,199 @@
+"""
+Tests for zipline.pipeline.optimize
+"""
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import EquitySessionDomain
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.expression import NumericalExpression
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.factors.factor import NumExprFactor
+from zipline.pipeline.filters import NumExprFilter
+from zipline.pipeline.optimize import optimize_terms
+import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+from zipline.utils.numpy_utils import bool_dtype, float64_dtype
+
+
+def make_custom_factor():
+    # Build a new class on each call, as happens when a CustomFactor is
+    # redefined in a notebook cell.
+    class Spread(CustomFactor):
+        inputs = [TestingDataSet.float_col]
+        window_length = 3
+
+        def compute(self, today, assets, out, col):
+            out[:] = col.max(axis=0) - col.min(axis=0)
+
+    return Spread()
+
+
+class OptimizeTermsTestCase(zf.WithSeededRandomPipelineEngine,
+                            zf.ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = tuple(range(1, 11))
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(OptimizeTermsTestCase, cls).init_class_fixtures()
+        cls.domain = EquitySessionDomain(
+            cls.trading_days,
+            cls.ASSET_FINDER_COUNTRY_CODE,
+        )
+
+    def run_both(self, pipe):
+        """Run ``pipe`` with and without optimization.
+        """
+        results = []
+        for optimize in (False, True):
+            engine = SimplePipelineEngine(
+                get_loader=lambda column: self.seeded_random_loader,
+                asset_finder=self.asset_finder,
+                default_domain=self.domain,
+                optimize=optimize,
+            )
+            results.append(engine.run_pipeline(
+                pipe,
+                self.trading_days[-10],
+                self.trading_days[-1],
+            ))
+        return results
+
+    def test_fuse_expressions(self):
+        f = TestingDataSet.float_col.latest
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        # Operators fuse expressions as they're built, so build a chain that
+        # numexpr would evaluate in two steps directly.
+        inner = NumExprFactor(
+            expr='x_0 - x_1',
+            binds=(f, sma),
+            dtype=float64_dtype,
+        )
+        outer = NumExprFilter(
+            expr='(x_0 * 2) > x_1',
+            binds=(inner, f),
+            dtype=bool_dtype,
+        )
+
+        terms, rewrites = optimize_terms({'out': outer}, self.domain)
+        fused = terms['out']
+        self.assertIsInstance(fused, NumExprFilter)
+        assert_equal(set(fused.inputs), {f, sma})
+        assert_equal(len(rewrites), 1)
+        kind, original, replacement = rewrites[0]
+        assert_equal(kind, 'fuse')
+        self.assertIs(original, inner)
+        self.assertIs(replacement, fused)
+
+        pipe = Pipeline({'out': outer, 'f': f}, domain=self.domain)
+        expected, result = self.run_both(pipe)
+        assert_equal(result, expected)
+
+    def test_fusion_respects_numexpr_operand_limit(self):
+        smas = [
+            SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=n,
+            )
+            for n in range(2, 37)
+        ]
+
+        def sum_of(binds):
+            return NumExprFactor(
+                expr=' + '.join('x_%d' % i for i in range(len(binds))),
+                binds=tuple(binds),
+                dtype=float64_dtype,
+            )
+
+        # Fusing would produce an expression with 35 inputs and an output,
+        # which is more than numexpr can evaluate.
+        inner = sum_of(smas[:20])
+        outer = sum_of([inner] + smas[20:])
+
+        terms, rewrites = optimize_terms({'out': outer}, self.domain)
+        assert_equal(len(terms['out'].inputs), 16)
+        assert_equal([r.kind for r in rewrites if r.kind == 'fuse'], [])
+
+    def test_shared_expressions_are_not_fused(self):
+        f = TestingDataSet.float_col.latest
+        inner = NumExprFactor(
+            expr='x_0 + 1',
+            binds=(f,),
+            dtype=float64_dtype,
+        )
+        outer = NumExprFactor(
+            expr='x_0 * 2',
+            binds=(inner,),
+            dtype=float64_dtype,
+        )
+
+        # ``inner`` is an output, so it has to be computed anyway.
+        terms, rewrites = optimize_terms(
+            {'inner': inner, 'outer': outer},
+            self.domain,
+        )
+        self.assertIs(terms['inner'], inner)
+        self.assertIs(terms['outer'], outer)
+        assert_equal(rewrites, [])
+
+    def test_dedupe_equivalent_terms(self):
+        generic = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        specialized = SimpleMovingAverage(
+            inputs=[TestingDataSet.specialize(self.domain).float_col],
+            window_length=5,
+        )
+        custom_1 = make_custom_factor()
+        custom_2 = make_custom_factor()
+        self.assertIsNot(generic, specialized)
+        self.assertIsNot(custom_1, custom_2)
+
+        columns = {
+            'generic': generic,
+            'specialized': specialized,
+            'custom_1': custom_1,
+            'custom_2': custom_2,
+            'diff': custom_1 - custom_2,
+        }
+        terms, rewrites = optimize_terms(columns, self.domain)
+        self.assertIs(terms['generic'], terms['specialized'])
+        self.assertIs(terms['custom_1'], terms['custom_2'])
+        self.assertIsInstance(terms['diff'], NumericalExpression)
+        self.assertEqual(terms['diff'].inputs, (terms['custom_1'],))
+        assert_equal(
+            sorted(r.kind for r in rewrites),
+            ['dedupe', 'dedupe'],
+        )
+
+        pipe = Pipeline(columns, domain=self.domain)
+        expected, result = self.run_both(pipe)
+        assert_equal(result, expected)
+
+    def test_execution_plan_records_rewrites(self):
+        f = TestingDataSet.float_col.latest
+        a = make_custom_factor()
+        b = make_custom_factor()
+        pipe = Pipeline({'a': a, 'b': b, 'f': f}, domain=self.domain)
+
+        def make_plan(optimize):
+            return pipe.to_execution_plan(
+                self.domain,
+                f.notnull(),
+                self.trading_days[-10],
+                self.trading_days[-1],
+                optimize=optimize,
+            )
+
+        plan = make_plan(optimize=False)
+        assert_equal(plan.rewrites, [])
+        self.assertIn(a, plan.graph)
+        self.assertIn(b, plan.graph)
+
+        plan = make_plan(optimize=True)
+        assert_equal(len(plan.rewrites), 1)
+        self.assertIs(plan.outputs['a'], plan.outputs['b'])
+        self.assertNotEqual(a in plan.graph, b in plan.graph)
@@ -304,13 +304,20 @@ class ClosesAndVolumes(WithMakeAlgo, ZiplineTestCase):
         with self.assertRaises(NoSuchPipeline):
             algo.run()
 
-    @parameterized.expand([('default', None),
-                           ('day', 1),
-                           ('week', 5),
-                           ('year', 252),
-                           ('all_but_one_day', 'all_but_one_day'),
-                           ('custom_iter', 'custom_iter')])
-    def test_assets_appear_on_correct_days(self, test_name, chunks):
+    @parameterized.expand([('default', None, False),
+                           ('day', 1, False),
+                           ('week', 5, False),
+                           ('year', 252, False),
+                           ('all_but_one_day', 'all_but_one_day', False),
+                           ('custom_iter', 'custom_iter', False),
+                           ('incremental_default', None, True),
+                           ('incremental_day', 1, True),
+                           ('incremental_year', 252, True),
+                           ('incremental_custom_iter', 'custom_iter', True)])
+    def test_assets_appear_on_correct_days(self,
+                                           test_name,
+                                           chunks,
+                                           incremental):
         """
         Assert that assets appear at correct times during a backtest, with
         correctly-adjusted close price values.
@@ -334,7 +341,12 @@ class ClosesAndVolumes(WithMakeAlgo, ZiplineTestCase):
                 remaining -= chunk
 
         def initialize(context):
-            p = attach_pipeline(Pipeline(), 'test', chunks=chunks)
+            p = attach_pipeline(
+                Pipeline(),
+                'test',
+                chunks=chunks,
+                incremental=incremental,
+            )
             p.add(USEquityPricing.close.latest, 'close')
 
         def handle_data(context, data):
@@ -594,10 +606,12 @@ class PipelineAlgorithmTestCase(WithMakeAlgo,
         return vwaps
 
     @parameterized.expand([
-        (True,),
-        (False,),
+        (True, False),
+        (False, False),
+        (True, True),
+        (False, True),
     ])
-    def test_handle_adjustment(self, set_screen):
+    def test_handle_adjustment(self, set_screen, incremental):
         AAPL, MSFT, BRK_A = assets = self.assets
 
         window_lengths = [1, 2, 5, 10]
@@ -620,7 +634,7 @@ class PipelineAlgorithmTestCase(WithMakeAlgo,
             if set_screen:
                 pipeline.set_screen(filter_)
 
-            attach_pipeline(pipeline, 'test')
+            attach_pipeline(pipeline, 'test', incremental=incremental)
 
         def handle_data(context, data):
             today = normalize_date(get_datetime())
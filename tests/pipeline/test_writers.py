@@ -0,0 +1,142 @@
+"""
+Tests for zipline.pipeline.writers
+"""
+import os
+from unittest import skipIf
+
+import pandas as pd
+from pandas import Timestamp
+
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import EquityPricing
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.factors import Returns
+from zipline.pipeline.writers import (
+    flatten_pipeline_result,
+    write_pipeline_results,
+)
+from zipline.testing import tmp_dir
+import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+try:
+    import tables
+except ImportError:
+    tables = None
+
+
+class WritePipelineResultsTestCase(zf.WithUSEquityPricingPipelineEngine,
+                                   zf.ZiplineTestCase):
+
+    PIPELINE_START_DATE = Timestamp('2006-01-05', tz='UTC')
+    END_DATE = Timestamp('2006-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def init_instance_fixtures(self):
+        super(WritePipelineResultsTestCase, self).init_instance_fixtures()
+        self.dir = self.enter_instance_context(tmp_dir())
+
+    def make_pipeline(self):
+        return Pipeline(
+            columns={
+                'close': EquityPricing.close.latest,
+                'returns': Returns(window_length=2),
+                'quantile': EquityPricing.close.latest.quantiles(5),
+            },
+            domain=US_EQUITIES,
+        )
+
+    def expected(self):
+        return flatten_pipeline_result(self.pipeline_engine.run_pipeline(
+            self.make_pipeline(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        ))
+
+    def chunks(self):
+        return self.pipeline_engine.run_pipeline_iter(
+            self.make_pipeline(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=10,
+        )
+
+    def test_flatten_pipeline_result(self):
+        result = self.pipeline_engine.run_pipeline(
+            self.make_pipeline(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        )
+        flat = flatten_pipeline_result(result)
+        assert_equal(
+            list(flat.columns),
+            ['date', 'sid', 'close', 'quantile', 'returns'],
+        )
+        assert_equal(len(flat), len(result))
+        assert_equal(
+            flat.sid.values,
+            result.index.get_level_values(1).map(int).values,
+        )
+        assert_equal(flat.close.values, result.close.values)
+
+    def test_flatten_categorical(self):
+        index = pd.MultiIndex.from_product([
+            pd.date_range('2014-01-02', periods=2, tz='UTC'),
+            self.asset_finder.retrieve_all(self.asset_finder.sids[:2]),
+        ])
+        frame = pd.DataFrame(
+            {'c': pd.Categorical(['a', 'b', None, 'a'])},
+            index=index,
+        )
+        flat = flatten_pipeline_result(frame)
+        assert_equal(flat.c.dtype, object)
+        assert_equal(list(flat.c.values), ['a', 'b', None, 'a'])
+        assert_equal(list(flat.sid), list(self.asset_finder.sids[:2]) * 2)
+
+    @skipIf(pq is None, 'pyarrow is not installed')
+    def test_write_parquet(self):
+        path = self.dir.getpath('results.parquet')
+        rows = write_pipeline_results(self.chunks(), path)
+
+        expected = self.expected()
+        assert_equal(rows, len(expected))
+        result = pq.read_table(path).to_pandas()
+        assert_equal(len(result), len(expected))
+        for name in expected.columns:
+            assert_equal(
+                list(result[name].values),
+                list(expected[name].values),
+                msg=name,
+            )
+
+    @skipIf(tables is None, 'PyTables is not installed')
+    def test_write_hdf5(self):
+        path = self.dir.getpath('results.h5')
+        rows = write_pipeline_results(self.chunks(), path)
+
+        expected = self.expected()
+        assert_equal(rows, len(expected))
+        result = pd.read_hdf(path, 'pipeline')
+        assert_equal(len(result), len(expected))
+        for name in ('sid', 'close', 'quantile', 'returns'):
+            assert_equal(result[name].values, expected[name].values)
+
+        # Writing again replaces the previous results.
+        write_pipeline_results(self.chunks(), path)
+        assert_equal(len(pd.read_hdf(path, 'pipeline')), len(expected))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            write_pipeline_results([], self.dir.getpath('results.csv'))
+        with self.assertRaises(ValueError):
+            write_pipeline_results(
+                [],
+                self.dir.getpath('results.parquet'),
+                format='csv',
+            )
+        self.assertFalse(os.listdir(self.dir.path))
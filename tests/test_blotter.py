@@ -19,7 +19,7 @@ import pandas as pd
 from zipline.assets import Equity
 from zipline.finance.blotter import SimulationBlotter
 from zipline.finance.cancel_policy import EODCancel, NeverCancel
-from zipline.finance.commission import PerTrade
+from zipline.finance.commission import PerDollar, PerShare, PerTrade
 from zipline.finance.execution import (
     LimitOrder,
     MarketOrder,
@@ -29,10 +29,12 @@ from zipline.finance.execution import (
 from zipline.finance.order import ORDER_STATUS, Order
 from zipline.finance.slippage import (
     DEFAULT_EQUITY_VOLUME_SLIPPAGE_BAR_LIMIT,
+    FixedBasisPointsSlippage,
     FixedSlippage,
     VolumeShareSlippage,
 )
 from zipline.gens.sim_engine import BAR, SESSION_END
+from zipline.testing import parameter_space
 from zipline.testing.fixtures import (
     WithCreateBarData,
     WithDataPortal,
@@ -410,3 +412,80 @@ class BlotterTestCase(WithCreateBarData,
             bar_data.current(future_txn.asset, 'price') + 1.0,
         )
         self.assertEqual(commissions[1]['cost'], 2.0)
+
+    @parameter_space(
+        slippage=[
+            (VolumeShareSlippage, {}),
+            (FixedBasisPointsSlippage, {}),
+            (FixedSlippage, {'spread': 0.1}),
+        ],
+        commission=[
+            (PerShare, {'cost': 0.01, 'min_trade_cost': 1.0}),
+            (PerDollar, {}),
+            (PerTrade, {'cost': 2.0}),
+        ],
+    )
+    def test_batch_fills_match_per_order_fills(self, slippage, commission):
+        slippage_type, slippage_kwargs = slippage
+        commission_type, commission_kwargs = commission
+
+        def per_order(model_type):
+            # The blotter fills the orders of subclasses of the models one
+            # at a time.
+            return type('PerOrder' + model_type.__name__, (model_type,), {})
+
+        blotters = [
+            SimulationBlotter(
+                equity_slippage=slippage_type(**slippage_kwargs),
+                equity_commission=commission_type(**commission_kwargs),
+            ),
+            SimulationBlotter(
+                equity_slippage=per_order(slippage_type)(**slippage_kwargs),
+                equity_commission=per_order(commission_type)(
+                    **commission_kwargs
+                ),
+            ),
+        ]
+        order_ids = []
+        for blotter in blotters:
+            order_ids.append([
+                blotter.order(self.asset_24, 5, MarketOrder()),
+                blotter.order(self.asset_24, -30, MarketOrder()),
+                blotter.order(self.asset_24, 25, MarketOrder()),
+                blotter.order(self.asset_25, 12, MarketOrder()),
+                blotter.order(self.asset_25, -8, LimitOrder(45)),
+            ])
+
+        bar_data = self.create_bardata(
+            simulation_dt_func=lambda: self.sim_params.sessions[-1],
+        )
+
+        # Fill over a few bars to exercise partially filled orders.
+        for _ in range(3):
+            results = []
+            for blotter, ids in zip(blotters, order_ids):
+                position = {order_id: i for i, order_id in enumerate(ids)}
+                txns, commissions, closed_orders = blotter.get_transactions(
+                    bar_data,
+                )
+                blotter.prune_orders(closed_orders)
+                results.append((
+                    [
+                        (position[txn.order_id], txn.asset, txn.amount,
+                         txn.price)
+                        for txn in txns
+                    ],
+                    [
+                        (position[c['order'].id], c['asset'], c['cost'])
+                        for c in commissions
+                    ],
+                    [position[order.id] for order in closed_orders],
+                    [
+                        (blotter.orders[order_id].filled,
+                         blotter.orders[order_id].commission)
+                        for order_id in ids
+                    ],
+                ))
+
+            batch, per_order = results
+            self.assertEqual(batch, per_order)
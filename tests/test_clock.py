@@ -178,3 +178,57 @@ class TestClock(TestCase):
                 self.sessions[i],
                 all_events[(i * 392): ((i + 1) * 392)]
             )
+
+    def test_next_bar_func(self):
+        calls = []
+
+        def next_bar_func(minutes, start):
+            calls.append(start)
+            # skip to minute 100, and then to the end of the session
+            return 100 if start <= 100 else len(minutes)
+
+        clock = MinuteSimulationClock(
+            self.sessions,
+            self.opens,
+            self.closes,
+            days_at_time(self.sessions, time(11, 45), "US/Eastern"),
+            next_bar_func=next_bar_func,
+        )
+
+        all_events = list(clock)
+        self.assertEqual(len(all_events), 3 * 6)
+
+        for i, session_label in enumerate(self.sessions):
+            minutes = self.nyse_calendar.minutes_for_session(session_label)
+            bts_dt = pd.Timestamp(
+                '{} 11:45'.format(session_label.date()),
+                tz='US/Eastern',
+            )
+
+            # The first and last minutes are always emitted, and we can't
+            # skip over before_trading_start.
+            self.assertEqual(
+                all_events[i * 6:(i + 1) * 6],
+                [
+                    (session_label, SESSION_START),
+                    (minutes[0], BAR),
+                    (minutes[100], BAR),
+                    (bts_dt, BEFORE_TRADING_START_BAR),
+                    (minutes[-1], BAR),
+                    (minutes[-1], SESSION_END),
+                ],
+            )
+
+        # we look for the next bar again after before_trading_start
+        self.assertEqual(calls, [1, 101, 134] * 3)
+
+    def test_next_bar_func_with_minute_emission(self):
+        with self.assertRaises(ValueError):
+            MinuteSimulationClock(
+                self.sessions,
+                self.opens,
+                self.closes,
+                days_at_time(self.sessions, time(8, 45), "US/Eastern"),
+                minute_emission=True,
+                next_bar_func=lambda minutes, start: start,
+            )
@@ -398,6 +398,39 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    @parameter_space(data_frequency=['daily', 'minute'])
+    def test_get_spot_value_multiple_assets_matches_scalar(self,
+                                                           data_frequency):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        trading_calendar = self.trading_calendars[Equity]
+        if data_frequency == 'minute':
+            dts = trading_calendar.minutes_for_session(self.trading_days[2])
+            dts = dts[[0, 1, 100]]
+        else:
+            dts = self.trading_days[:4]
+
+        for dt in dts:
+            for field in OHLCV_FIELDS | {'price'}:
+                expected = [
+                    self.data_portal.get_spot_value(
+                        asset,
+                        field,
+                        dt,
+                        data_frequency,
+                    )
+                    for asset in assets
+                ]
+                assert_equal(
+                    self.data_portal.get_spot_value(
+                        assets,
+                        field,
+                        dt,
+                        data_frequency,
+                    ),
+                    expected,
+                    msg='field={} dt={}'.format(field, dt),
+                )
+
     @parameter_space(data_frequency=['daily', 'minute'],
                      field=['close', 'price'])
     def test_get_adjustments(self, data_frequency, field):
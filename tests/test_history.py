@@ -23,6 +23,7 @@ from six import iteritems
 
 from zipline._protocol import handle_non_market_minutes, BarData
 from zipline.assets import Asset, Equity
+from zipline.data.adjustment_factors import AdjustmentFactors
 from zipline.errors import (
     HistoryInInitialize,
     HistoryWindowStartsBeforeData,
@@ -1672,6 +1673,45 @@ class NoPrefetchMinuteEquityHistoryTestCase(MinuteEquityHistoryTestCase):
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = 0
 
 
+class FactorAdjustedMinuteEquityHistoryTestCase(MinuteEquityHistoryTestCase):
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(FactorAdjustedMinuteEquityHistoryTestCase, cls).\
+            init_class_fixtures()
+        cls.adjustment_reader.factors = \
+            AdjustmentFactors.from_adjustment_reader(cls.adjustment_reader)
+
+
+class BudgetedCacheMinuteEquityHistoryTestCase(MinuteEquityHistoryTestCase):
+    # Small enough that only the most recently used window is kept.
+    DATA_PORTAL_HISTORY_CACHE_BYTES = 1
+
+    def test_history_cache_stats(self):
+        assets = [self.ASSET1, self.ASSET2]
+        minute = self.trading_calendar.minutes_for_session(
+            self.trading_days[1],
+        )[10]
+
+        self.data_portal.get_history_window(
+            assets, minute, 5, '1m', 'close', 'minute',
+        )
+        stats = self.data_portal.get_history_cache_stats()
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.misses, 2)
+        self.assertEqual(stats.evictions, 1)
+        self.assertGreater(stats.nbytes, 0)
+
+        # Only the window for ASSET2 is still cached.
+        self.data_portal.get_history_window(
+            assets, minute, 5, '1m', 'close', 'minute',
+        )
+        stats = self.data_portal.get_history_cache_stats()
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 3)
+        self.assertEqual(stats.evictions, 2)
+
+
 class DailyEquityHistoryTestCase(WithHistory, zf.ZiplineTestCase):
     CREATE_BARDATA_DATA_FREQUENCY = 'daily'
 
@@ -2170,6 +2210,16 @@ class NoPrefetchDailyEquityHistoryTestCase(DailyEquityHistoryTestCase):
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = 0
 
 
+class FactorAdjustedDailyEquityHistoryTestCase(DailyEquityHistoryTestCase):
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(FactorAdjustedDailyEquityHistoryTestCase, cls).\
+            init_class_fixtures()
+        cls.adjustment_reader.factors = \
+            AdjustmentFactors.from_adjustment_reader(cls.adjustment_reader)
+
+
 class MinuteEquityHistoryFuturesCalendarTestCase(MinuteEquityHistoryTestCase):
     TRADING_CALENDAR_STRS = ('NYSE', 'us_futures')
     TRADING_CALENDAR_PRIMARY_CAL = 'us_futures'
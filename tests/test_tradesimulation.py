@@ -17,12 +17,15 @@ import pandas as pd
 
 from zipline.gens.sim_engine import BEFORE_TRADING_START_BAR
 
+from zipline.algorithm import TradingAlgorithm
 from zipline.finance.asset_restrictions import NoRestrictions
 from zipline.finance import metrics
 from zipline.finance.trading import SimulationParameters
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline.testing.core import parameter_space
 import zipline.testing.fixtures as zf
+from zipline.testing.predicates import assert_equal
+from zipline.utils.events import date_rules, time_rules
 
 
 class TestBeforeTradingStartTiming(zf.WithMakeAlgo,
@@ -124,3 +127,93 @@ def initialize(context):
         # since the clock only ever emitted a single before_trading_start
         # event, we can check that the simulation_dt was properly set
         self.assertEqual(dt, algo_simulator.simulation_dt)
+
+
+class TestSkipIdleMinutes(zf.WithMakeAlgo, zf.ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = (1, 2)
+    START_DATE = pd.Timestamp('2016-01-04', tz='UTC')
+    END_DATE = pd.Timestamp('2016-01-08', tz='UTC')
+    SIM_PARAMS_DATA_FREQUENCY = 'minute'
+    SIM_PARAMS_EMISSION_RATE = 'daily'
+
+    def run_skipping(self, skip_idle_minutes):
+        bar_dts = []
+        rebalance_dts = []
+
+        class RecordingAlgorithm(TradingAlgorithm):
+            def on_dt_changed(self, dt):
+                bar_dts.append(dt)
+                super(RecordingAlgorithm, self).on_dt_changed(dt)
+
+        def initialize(context):
+            context.asset = context.sid(1)
+            context.schedule_function(
+                rebalance,
+                date_rules.every_day(),
+                time_rules.market_open(minutes=30),
+            )
+            context.schedule_function(
+                close,
+                date_rules.week_start(days_offset=2),
+                time_rules.market_close(minutes=10),
+            )
+
+        def rebalance(context, data):
+            rebalance_dts.append(context.get_datetime())
+            context.order(context.asset, 10)
+
+        def close(context, data):
+            context.order_target(context.asset, 0)
+
+        capital_change_dt = self.trading_calendar.minutes_for_session(
+            self.sim_params.sessions[1],
+        )[200]
+        perf = self.run_algorithm(
+            algo_class=RecordingAlgorithm,
+            initialize=initialize,
+            capital_changes={
+                capital_change_dt: {'type': 'delta', 'value': 1000.0},
+            },
+            skip_idle_minutes=skip_idle_minutes,
+        )
+        return perf, bar_dts, rebalance_dts, capital_change_dt
+
+    def test_matches_every_minute(self):
+        perf, bar_dts, rebalance_dts, capital_change_dt = \
+            self.run_skipping(skip_idle_minutes=False)
+        (skipped_perf,
+         skipped_bar_dts,
+         skipped_rebalance_dts,
+         _) = self.run_skipping(skip_idle_minutes=True)
+
+        # order ids are random, so compare the fills instead of the orders
+        ignored = ['orders', 'transactions']
+        assert_equal(
+            skipped_perf.drop(ignored, axis=1),
+            perf.drop(ignored, axis=1),
+        )
+
+        def fills(perf):
+            return [
+                (txn['dt'], txn['amount'], txn['price'])
+                for txns in perf.transactions
+                for txn in txns
+            ]
+
+        assert_equal(fills(skipped_perf), fills(perf))
+        assert_equal(skipped_rebalance_dts, rebalance_dts)
+        self.assertEqual(len(rebalance_dts), len(self.sim_params.sessions))
+
+        # the skipped bars are a subset of the bars...
+        self.assertLess(set(skipped_bar_dts), set(bar_dts))
+        # ... which includes the capital change, the bar before it, and the
+        # bars on which the orders fill
+        self.assertIn(capital_change_dt, skipped_bar_dts)
+        self.assertIn(
+            capital_change_dt - pd.Timedelta('1 min'),
+            skipped_bar_dts,
+        )
+        for dt in rebalance_dts:
+            self.assertIn(dt + pd.Timedelta('1 min'), skipped_bar_dts)
+        self.assertLess(len(skipped_bar_dts), len(bar_dts) / 10)
@@ -2,7 +2,12 @@ from unittest import TestCase
 
 from pandas import Timestamp, Timedelta
 
-from zipline.utils.cache import CachedObject, Expired, ExpiringCache
+from zipline.utils.cache import (
+    ByteBudgetLRU,
+    CachedObject,
+    Expired,
+    ExpiringCache,
+)
 
 
 class CachedObjectTestCase(TestCase):
@@ -65,3 +70,51 @@ class ExpiringCacheTestCase(TestCase):
         with self.assertRaises(KeyError) as e:
             self.assertEqual(cache.get('baz', expiry_3))
         self.assertEqual(e.exception.args, ('baz',))
+
+
+class ByteBudgetLRUTestCase(TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = ByteBudgetLRU(len, max_bytes=6)
+
+        cache['a'] = 'xx'
+        cache['b'] = 'yy'
+        cache['c'] = 'zz'
+        self.assertEqual(cache.nbytes, 6)
+        self.assertEqual(cache.evictions, 0)
+
+        # Reading 'a' makes 'b' the least recently used item.
+        self.assertEqual(cache['a'], 'xx')
+        cache['d'] = 'w'
+        self.assertEqual(sorted(cache), ['a', 'c', 'd'])
+        self.assertEqual(cache.nbytes, 5)
+        self.assertEqual(cache.evictions, 1)
+
+        # Replacing an item updates its size.
+        cache['a'] = 'x'
+        self.assertEqual(cache.nbytes, 4)
+        self.assertEqual(cache.evictions, 1)
+
+        del cache['c']
+        self.assertEqual(sorted(cache), ['a', 'd'])
+        self.assertEqual(cache.nbytes, 2)
+
+    def test_keeps_most_recent_item_over_budget(self):
+        cache = ByteBudgetLRU(len, max_bytes=2)
+
+        cache['a'] = 'xx'
+        cache['b'] = 'yyyy'
+        self.assertEqual(list(cache), ['b'])
+        self.assertEqual(cache.nbytes, 4)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_max_items(self):
+        cache = ByteBudgetLRU(len, max_items=2)
+
+        for key in 'abc':
+            cache[key] = key * 10
+        self.assertEqual(list(cache), ['b', 'c'])
+        self.assertEqual(cache.evictions, 1)
+
+        with self.assertRaises(KeyError):
+            cache['a']
@@ -6,6 +6,7 @@ from six import itervalues
 from unittest import TestCase
 
 from numpy import (
+    arange,
     array,
     float16,
     float32,
@@ -13,7 +14,12 @@ from numpy import (
     int16,
     int32,
     int64,
+    inf,
+    logspace,
+    nan,
+    nansum,
 )
+from numpy.testing import assert_allclose, assert_array_equal
 from pandas import Timestamp
 from toolz import concat, keyfilter
 from toolz import curry
@@ -28,6 +34,9 @@ from zipline.utils.numpy_utils import (
     make_datetime64ns,
     NaTns,
     NaTD,
+    rolling_nansum,
+    rolling_window,
+    window_span,
 )
 
 
@@ -92,3 +101,60 @@ class TypeCheckTestCase(TestCase):
 
         for bad_value in everything_but(datetime, CASES):
             self.assertFalse(is_datetime(bad_value))
+
+
+class RollingTestCase(TestCase):
+
+    def test_window_span(self):
+        data = arange(24, dtype=float).reshape(8, 3)
+        for length in range(1, 8):
+            span = window_span(rolling_window(data, length))
+            assert_array_equal(span, data)
+
+        with self.assertRaises(ValueError):
+            window_span(array([data[:2], data[4:6]]))
+
+    def test_rolling_nansum(self):
+        data = arange(40, dtype=float).reshape(10, 4)
+        data[[1, 5, 6], 0] = nan
+        data[:, 1] = nan
+        data[3, 2] = inf
+        data[6, 2] = -inf
+        data[8, 3] = inf
+
+        for length in range(1, 11):
+            expected = array([
+                nansum(data[i:i + length], axis=0)
+                for i in range(len(data) - length + 1)
+            ])
+            assert_allclose(rolling_nansum(data, length), expected)
+
+    def test_rolling_nansum_large_values(self):
+        # Prices that fall from 1e9 to 1e-3 over a long history. A running
+        # total over the whole array would swamp the later, smaller windows.
+        data = logspace(9, -3, 4000).reshape(1000, 4)
+        for length in (7, 252, 999):
+            expected = array([
+                nansum(data[i:i + length], axis=0)
+                for i in range(len(data) - length + 1)
+            ])
+            assert_allclose(
+                rolling_nansum(data, length),
+                expected,
+                rtol=1e-12,
+            )
+
+    def test_rolling_nansum_int(self):
+        data = arange(20).reshape(10, 2)
+        result = rolling_nansum(data, 3)
+        self.assertEqual(result.dtype.kind, 'i')
+        assert_array_equal(
+            result,
+            [data[i:i + 3].sum(axis=0) for i in range(8)],
+        )
+
+    def test_rolling_nansum_bad_length(self):
+        data = arange(20, dtype=float).reshape(10, 2)
+        for length in (0, 11):
+            with self.assertRaises(ValueError):
+                rolling_nansum(data, length)
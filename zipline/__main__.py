@@ -337,7 +337,20 @@ def zipline_magic(line, cell=None):
     default=True,
     help='Print progress information to the terminal.'
 )
-def ingest(bundle, assets_version, show_progress):
+@click.option(
+    '-p',
+    '--processes',
+    type=click.IntRange(min=1),
+    default=None,
+    metavar='N',
+    help='Write the minute bars of N sids at a time in worker processes.',
+)
+@click.option(
+    '--resume/--no-resume',
+    default=False,
+    help='Resume the last ingestion of the bundle, if it was interrupted.',
+)
+def ingest(bundle, assets_version, show_progress, processes, resume):
     """Ingest the data for the given bundle.
     """
     bundles_module.ingest(
@@ -346,6 +359,8 @@ def ingest(bundle, assets_version, show_progress):
         pd.Timestamp.utcnow(),
         assets_version,
         show_progress,
+        processes=processes,
+        resume=resume,
     )
 
 
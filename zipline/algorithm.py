@@ -26,6 +26,7 @@ from itertools import chain, repeat
 
 from six import (
     exec_,
+    get_unbound_function,
     iteritems,
     itervalues,
     string_types,
@@ -89,6 +90,7 @@ from zipline.pipeline.engine import (
     ExplodingPipelineEngine,
     SimplePipelineEngine,
 )
+from zipline.pipeline.incremental import IncrementalPipelineRunner
 from zipline.utils.api_support import (
     api_method,
     require_initialized,
@@ -137,7 +139,10 @@ from zipline.zipline_warnings import ZiplineDeprecationWarning
 log = logbook.Logger("ZiplineLog")
 
 # For creating and storing pipeline instances
-AttachedPipeline = namedtuple('AttachedPipeline', 'pipe chunks eager')
+AttachedPipeline = namedtuple(
+    'AttachedPipeline',
+    'pipe chunks eager incremental',
+)
 
 
 class TradingAlgorithm(object):
@@ -197,6 +202,11 @@ class TradingAlgorithm(object):
         execution of all events that are scheduled for a bar.
         This function will be passed the data for the bar and should
         return the actual context manager that will be entered.
+    skip_idle_minutes : bool, optional
+        When simulating minute data with daily emission, only emit the
+        minutes on which something can happen: scheduled functions are due,
+        orders are open or capital changes are processed. Algorithms which
+        define ``handle_data`` still run on every minute. default: False
     history_container_class : type, optional
         The type of history container to use. default: HistoryContainer
     platform : str, optional
@@ -232,6 +242,7 @@ class TradingAlgorithm(object):
                  capital_changes=None,
                  get_pipeline_loader=None,
                  create_event_context=None,
+                 skip_idle_minutes=False,
                  **initialize_kwargs):
         # List of trading controls to be used to validate orders.
         self.trading_controls = []
@@ -301,6 +312,7 @@ class TradingAlgorithm(object):
         # Initialize Pipeline API data.
         self.init_engine(get_pipeline_loader)
         self._pipelines = {}
+        self._incremental_pipelines = {}
 
         # Create an already-expired cache so that we compute the first time
         # data is requested.
@@ -361,7 +373,7 @@ class TradingAlgorithm(object):
             exec_(code, self.namespace)
 
             self._initialize = self.namespace.get('initialize', noop)
-            self._handle_data = self.namespace.get('handle_data', noop)
+            self._handle_data = self.namespace.get('handle_data')
             self._before_trading_start = self.namespace.get(
                 'before_trading_start',
             )
@@ -374,9 +386,19 @@ class TradingAlgorithm(object):
             self._before_trading_start = before_trading_start
             self._analyze = analyze
 
+        # An algorithm without handle_data has nothing to run on every bar,
+        # which is what allows the clock to skip idle minutes.
+        if self._handle_data or (
+            get_unbound_function(type(self).handle_data) is not
+            get_unbound_function(TradingAlgorithm.handle_data)
+        ):
+            handle_data_rule = zipline.utils.events.Always()
+        else:
+            handle_data_rule = zipline.utils.events.Never()
+
         self.event_manager.add_event(
             zipline.utils.events.Event(
-                zipline.utils.events.Always(),
+                handle_data_rule,
                 # We pass handle_data.__func__ to get the unbound method.
                 # We will explicitly pass the algorithm to bind it again.
                 self.handle_data.__func__,
@@ -394,6 +416,8 @@ class TradingAlgorithm(object):
 
         self.benchmark_sid = benchmark_sid
 
+        self._skip_idle_minutes = skip_idle_minutes
+
         # A dictionary of capital changes, keyed by timestamp, indicating the
         # target/delta of the capital changes, along with values
         self.capital_changes = capital_changes or {}
@@ -517,14 +541,77 @@ class TradingAlgorithm(object):
             "US/Eastern"
         )
 
-        return MinuteSimulationClock(
+        if (
+            self._skip_idle_minutes and
+            self.sim_params.data_frequency == 'minute' and
+            not minutely_emission
+        ):
+            self._capital_change_dts = pd.DatetimeIndex(
+                sorted(self.capital_changes),
+            )
+            next_bar_func = self._next_active_bar
+        else:
+            next_bar_func = None
+
+        clock = MinuteSimulationClock(
             self.sim_params.sessions,
             execution_opens,
             execution_closes,
             before_trading_start_minutes,
             minute_emission=minutely_emission,
+            next_bar_func=next_bar_func,
         )
 
+        # The scheduled functions have been added by initialize, so we can
+        # work out up front when they will trigger.
+        self.event_manager.precompute_triggers(clock.all_minutes())
+
+        return clock
+
+    def _next_active_bar(self, minutes, start):
+        """
+        Find the next minute of a session on which the simulation needs a bar
+        when skipping idle minutes.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes of the current session.
+        start : int
+            The position in ``minutes`` to search from.
+
+        Returns
+        -------
+        idx : int
+            The position in ``minutes`` of the first minute at or after
+            ``start`` on which an event might trigger, an order might fill or
+            a capital change is processed, or which precedes a capital change.
+            ``len(minutes)`` if there is no such minute.
+        """
+        if self.blotter.open_orders:
+            # Open orders may fill on any bar.
+            return start
+
+        next_idx = self.event_manager.next_trigger(minutes, start)
+
+        capital_change_dts = self._capital_change_dts
+        if next_idx > start and len(capital_change_dts):
+            pos = capital_change_dts.searchsorted(minutes[start])
+            if pos < len(capital_change_dts):
+                # Capital changes are processed before the algorithm moves to
+                # their minute, so they're applied to the portfolio as of the
+                # previous bar. Emit that bar too, so that the portfolio isn't
+                # valued at the prices of an earlier, stale bar.
+                next_idx = min(
+                    next_idx,
+                    max(
+                        minutes.searchsorted(capital_change_dts[pos]) - 1,
+                        start,
+                    ),
+                )
+
+        return next_idx
+
     def _create_benchmark_source(self):
         if self.benchmark_sid is not None:
             benchmark_asset = self.asset_finder.retrieve_asset(
@@ -2225,7 +2312,12 @@ class TradingAlgorithm(object):
         name=string_types,
         chunks=(int, Iterable, type(None)),
     )
-    def attach_pipeline(self, pipeline, name, chunks=None, eager=True):
+    def attach_pipeline(self,
+                        pipeline,
+                        name,
+                        chunks=None,
+                        eager=True,
+                        incremental=False):
         """Register a pipeline to be computed at the start of each day.
 
         Parameters
@@ -2243,6 +2335,11 @@ class TradingAlgorithm(object):
         eager : bool, optional
             Whether or not to compute this pipeline prior to
             before_trading_start.
+        incremental : bool, optional
+            Whether to compute this pipeline one session at a time instead of
+            computing ``chunks`` sessions at once. Raw data is still prefetched
+            in blocks of ``chunks`` sessions, but terms are only computed for
+            sessions that are actually requested. Default is False.
 
         Returns
         -------
@@ -2263,7 +2360,9 @@ class TradingAlgorithm(object):
         if name in self._pipelines:
             raise DuplicatePipelineName(name=name)
 
-        self._pipelines[name] = AttachedPipeline(pipeline, iter(chunks), eager)
+        self._pipelines[name] = AttachedPipeline(
+            pipeline, iter(chunks), eager, incremental,
+        )
 
         # Return the pipeline to allow expressions like
         # p = attach_pipeline(Pipeline(), 'name')
@@ -2297,12 +2396,16 @@ class TradingAlgorithm(object):
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
         try:
-            pipe, chunks, _ = self._pipelines[name]
+            pipe, chunks, _, incremental = self._pipelines[name]
         except KeyError:
             raise NoSuchPipeline(
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
+        # Incremental execution relies on the internals of
+        # SimplePipelineEngine. Other engines always compute in chunks.
+        if incremental and isinstance(self.engine, SimplePipelineEngine):
+            return self._incremental_pipeline_output(pipe, chunks, name)
         return self._pipeline_output(pipe, chunks, name)
 
     def _pipeline_output(self, pipeline, chunks, name):
@@ -2327,6 +2430,35 @@ class TradingAlgorithm(object):
             # day.
             return pd.DataFrame(index=[], columns=data.columns)
 
+    def _incremental_pipeline_output(self, pipeline, chunks, name):
+        """
+        Internal implementation of `pipeline_output` for pipelines attached
+        with ``incremental=True``.
+        """
+        today = normalize_date(self.get_datetime())
+        try:
+            data = self._pipeline_cache.get(name, today)
+        except KeyError:
+            try:
+                runner = self._incremental_pipelines[name]
+            except KeyError:
+                runner = self._incremental_pipelines[name] = \
+                    IncrementalPipelineRunner(
+                        self.engine,
+                        pipeline,
+                        self.sim_params.end_session,
+                        chunks,
+                    )
+            data = runner.run_session(today)
+            self._pipeline_cache.set(name, data, today)
+
+        try:
+            return data.loc[today]
+        except KeyError:
+            # This happens if no assets passed the pipeline screen on a given
+            # day.
+            return pd.DataFrame(index=[], columns=data.columns)
+
     def run_pipeline(self, pipeline, start_session, chunksize):
         """
         Compute `pipeline`, providing values for at least `start_date`.
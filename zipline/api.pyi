@@ -9,7 +9,7 @@ from zipline.utils.events import EventRule
 from zipline.utils.security_list import SecurityList
 
 
-def attach_pipeline(pipeline, name, chunks=None, eager=True):
+def attach_pipeline(pipeline, name, chunks=None, eager=True, incremental=False):
     """Register a pipeline to be computed at the start of each day.
 
     Parameters
@@ -27,6 +27,11 @@ def attach_pipeline(pipeline, name, chunks=None, eager=True):
     eager : bool, optional
         Whether or not to compute this pipeline prior to
         before_trading_start.
+    incremental : bool, optional
+        Whether to compute this pipeline one session at a time instead of
+        computing ``chunks`` sessions at once. Raw data is still prefetched
+        in blocks of ``chunks`` sessions, but terms are only computed for
+        sessions that are actually requested. Default is False.
 
     Returns
     -------
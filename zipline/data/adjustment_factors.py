@@ -0,0 +1,203 @@
+"""
+Cumulative Adjustment Factors
+-----------------------------
+A compact table of the cumulative price and volume adjustment factor of each
+sid over time.
+
+The cumulative factor of a sid at time ``t`` is the product of the ratios of
+all of the sid's adjustments which take effect after ``t``. The raw value of
+a sid at ``t``, adjusted for every adjustment known at a later time ``p``, is
+then::
+
+    raw(t) * factor(t) / factor(p)
+
+so applying adjustments to a window of raw data is a single multiplication,
+rather than a series of mutations by adjustment objects.
+
+Factors are stored as a row per (sid, effective date), sorted by sid and
+date, holding the factor in effect up to that date. They can be written to
+and read from a ``.npz`` file, which bundle ingestion writes next to the
+adjustments database.
+"""
+import os
+
+import numpy as np
+from six import iteritems
+
+from zipline.data.adjustments import AdjustmentIndex
+from zipline.utils.numpy_utils import float64_dtype, int64_dtype
+
+# Map from the kind of factor to the adjustment tables which contribute to it,
+# and whether the table's ratios are inverted.
+FACTOR_TABLES = {
+    'price': (('splits', False), ('mergers', False), ('dividends', False)),
+    'volume': (('splits', True),),
+}
+
+
+def factor_kind(field):
+    """
+    Get the kind of factor which adjusts ``field``.
+    """
+    return 'volume' if field == 'volume' else 'price'
+
+
+class AdjustmentFactors(object):
+    """
+    Cumulative price and volume adjustment factors.
+
+    Parameters
+    ----------
+    tables : dict[str -> (np.array[int64], np.array[int64], np.array[float64])]
+        Map from the kind of factor to arrays of sids, effective dates as
+        nanoseconds since the epoch, and the factor in effect before each
+        date, sorted by sid and date. Use :meth:`from_adjustment_reader` to
+        build this.
+    """
+    def __init__(self, tables):
+        self._tables = tables
+
+    @classmethod
+    def from_adjustment_reader(cls, adjustment_reader):
+        """
+        Compute the factors for the adjustments in an adjustments database.
+
+        Parameters
+        ----------
+        adjustment_reader : SQLiteAdjustmentReader
+            The reader of the adjustments. Its preloaded index is used if it
+            has one.
+        """
+        index = adjustment_reader.index
+        if index is None:
+            index = AdjustmentIndex.from_sqlite(adjustment_reader.conn)
+
+        tables = {}
+        for kind, table_names in iteritems(FACTOR_TABLES):
+            sids = []
+            dates = []
+            ratios = []
+            for table_name, invert in table_names:
+                sids.append(index.column(table_name, 'sid'))
+                dates.append(index.column(table_name, 'effective_date'))
+                ratio = index.column(table_name, 'ratio')
+                ratios.append(1.0 / ratio if invert else ratio)
+
+            tables[kind] = cls._cumulate(
+                np.concatenate(sids).astype(int64_dtype),
+                np.concatenate(dates).astype(int64_dtype) * int(1e9),
+                np.concatenate(ratios).astype(float64_dtype),
+            )
+
+        return cls(tables)
+
+    @staticmethod
+    def _cumulate(sids, dates, ratios):
+        """
+        Combine the adjustments for each sid and date, and compute the
+        cumulative factor in effect before each date.
+        """
+        if not len(sids):
+            return sids, dates, ratios
+
+        order = np.lexsort((dates, sids))
+        sids, dates, ratios = sids[order], dates[order], ratios[order]
+
+        # Combine adjustments to the same sid on the same date.
+        starts = np.flatnonzero(np.concatenate((
+            [True],
+            (sids[1:] != sids[:-1]) | (dates[1:] != dates[:-1]),
+        )))
+        sids, dates = sids[starts], dates[starts]
+        ratios = np.multiply.reduceat(ratios, starts)
+
+        # The factor before each date is the product of the ratios on and
+        # after that date.
+        factors = np.empty_like(ratios)
+        sid_starts = np.flatnonzero(np.concatenate((
+            [True],
+            sids[1:] != sids[:-1],
+        )))
+        sid_ends = np.append(sid_starts[1:], len(sids))
+        for start, end in zip(sid_starts, sid_ends):
+            factors[start:end] = np.cumprod(ratios[start:end][::-1])[::-1]
+
+        return sids, dates, factors
+
+    @classmethod
+    def read(cls, path):
+        """
+        Read factors written by :meth:`write`.
+        """
+        with np.load(path) as data:
+            return cls({
+                kind: (
+                    data[kind + '_sids'],
+                    data[kind + '_dates'],
+                    data[kind + '_factors'],
+                )
+                for kind in FACTOR_TABLES
+            })
+
+    def write(self, path):
+        """
+        Write the factors to a ``.npz`` file.
+        """
+        arrays = {}
+        for kind, (sids, dates, factors) in iteritems(self._tables):
+            arrays[kind + '_sids'] = sids
+            arrays[kind + '_dates'] = dates
+            arrays[kind + '_factors'] = factors
+
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load_or_build(cls, adjustment_reader, path):
+        """
+        Read the factors persisted at ``path``, computing and writing them
+        first if they don't exist yet.
+        """
+        if os.path.exists(path):
+            return cls.read(path)
+
+        factors = cls.from_adjustment_reader(adjustment_reader)
+        factors.write(path)
+        return factors
+
+    def cumulative_factors(self, field, sids, dts):
+        """
+        Get the cumulative adjustment factor of each sid at each dt.
+
+        Parameters
+        ----------
+        field : str
+            The OHLCV field being adjusted.
+        sids : iterable[int]
+            The sids for which to get factors.
+        dts : pd.DatetimeIndex
+            The dts for which to get factors.
+
+        Returns
+        -------
+        factors : np.array[float64]
+            An array of shape (len(dts), len(sids)).
+        """
+        all_sids, all_dates, all_factors = self._tables[factor_kind(field)]
+        dts = np.asarray(dts.asi8)
+
+        out = np.ones((len(dts), len(sids)), dtype=float64_dtype)
+        for i, sid in enumerate(sids):
+            start = all_sids.searchsorted(sid, side='left')
+            end = all_sids.searchsorted(sid, side='right')
+            if start == end:
+                continue
+
+            # The factor at dt is the one in effect before the first date
+            # after dt, or 1.0 if there are no adjustments after dt.
+            factors = np.append(all_factors[start:end], 1.0)
+            out[:, i] = factors[
+                all_dates[start:end].searchsorted(dts, side='right')
+            ]
+
+        return out
@@ -1,6 +1,8 @@
 from collections import namedtuple
 from errno import ENOENT
+from functools import partial
 from os import remove
+from os.path import join
 
 from logbook import Logger
 import numpy as np
@@ -8,6 +10,7 @@ from numpy import integer as any_integer
 import pandas as pd
 from pandas import Timestamp
 import six
+from six import iteritems
 import sqlite3
 
 from zipline.utils.input_validation import preprocess
@@ -17,6 +20,7 @@ from zipline.utils.numpy_utils import (
     uint32_dtype,
     uint64_dtype,
 )
+from zipline.utils.paths import ensure_directory
 from zipline.utils.sqlite_utils import group_into_chunks, coerce_string_to_conn
 from ._adjustments import load_adjustments_from_sqlite
 
@@ -71,6 +75,226 @@ SQLITE_STOCK_DIVIDEND_PAYOUT_COLUMN_DTYPES = {
 }
 
 
+# Map from table name to the column by which its rows are looked up by date,
+# and the other columns loaded into an AdjustmentIndex.
+ADJUSTMENT_INDEX_COLUMNS = {
+    'splits': ('effective_date', ('ratio',)),
+    'mergers': ('effective_date', ('ratio',)),
+    'dividends': ('effective_date', ('ratio',)),
+    'dividend_payouts': ('ex_date', ('amount', 'pay_date')),
+    'stock_dividend_payouts': (
+        'ex_date',
+        ('payment_sid', 'ratio', 'pay_date'),
+    ),
+}
+
+ADJUSTMENT_INDEX_DTYPES = {
+    'sid': int64_dtype,
+    'effective_date': int64_dtype,
+    'ex_date': int64_dtype,
+    'pay_date': int64_dtype,
+    'payment_sid': int64_dtype,
+    'ratio': float64_dtype,
+    'amount': float64_dtype,
+}
+
+# The keys under which each table of an AdjustmentIndex stores the order of
+# its rows by date, and its dates in that order.
+DATE_ORDER = 'date_order'
+DATES_BY_DATE = 'dates_by_date'
+
+
+def index_array_path(path, table_name, column):
+    return join(path, '{}.{}.npy'.format(table_name, column))
+
+
+class AdjustmentIndex(object):
+    """
+    An in-memory index of the tables in an adjustments database.
+
+    The rows of each table are stored in read-only arrays sorted by sid,
+    date, and then the table's other columns, so the rows for a sid can be
+    found by binary search. Each table
+    also stores the order of its rows by date, so the rows on a date can be
+    found by binary search as well.
+
+    Unlike a sqlite3 connection, an index can be pickled, and the memory
+    behind its arrays is shared by processes forked after it's loaded. It
+    can also be written to disk with :meth:`write`, and memory-mapped by
+    unrelated processes with :meth:`read`.
+
+    Parameters
+    ----------
+    tables : dict[str -> dict[str -> np.ndarray]]
+        Map from table name to a map from column name to the sorted values
+        of the column. Use :meth:`from_frames` or :meth:`from_sqlite` to
+        build this.
+    """
+    def __init__(self, tables):
+        self._tables = tables
+
+    @classmethod
+    def from_frames(cls, frames):
+        """
+        Build an index from frames of the rows of each table.
+
+        Parameters
+        ----------
+        frames : dict[str -> pd.DataFrame]
+            Map from table name to a frame with the columns of the table, as
+            stored by SQLiteAdjustmentWriter.
+        """
+        tables = {}
+        for table_name, (date_column, value_columns) in iteritems(
+                ADJUSTMENT_INDEX_COLUMNS):
+            frame = frames[table_name]
+            columns = ('sid', date_column) + value_columns
+            values = {
+                column: frame[column].values.astype(
+                    ADJUSTMENT_INDEX_DTYPES[column],
+                )
+                for column in columns
+            }
+
+            # Break ties between rows with the same sid and date by their
+            # values, so that rows are returned in a deterministic order.
+            # np.lexsort sorts by its last key first.
+            order = np.lexsort(
+                tuple(values[column] for column in reversed(columns)),
+            )
+            table = {column: values[column][order] for column in columns}
+            table[DATE_ORDER] = np.lexsort(
+                (table['sid'], table[date_column]),
+            )
+            table[DATES_BY_DATE] = table[date_column][table[DATE_ORDER]]
+            for array in table.values():
+                array.setflags(write=False)
+            tables[table_name] = table
+
+        return cls(tables)
+
+    @classmethod
+    def from_sqlite(cls, conn):
+        """
+        Build an index from the tables of an adjustments database.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            A connection to a database written by SQLiteAdjustmentWriter.
+            Tables which were never written are treated as empty.
+        """
+        existing_tables = {
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'",
+            )
+        }
+        frames = {}
+        for table_name, (date_column, value_columns) in iteritems(
+                ADJUSTMENT_INDEX_COLUMNS):
+            columns = ('sid', date_column) + value_columns
+            if table_name not in existing_tables:
+                frames[table_name] = pd.DataFrame(columns=columns)
+                continue
+            frames[table_name] = pd.read_sql(
+                'SELECT {} FROM "{}"'.format(', '.join(columns), table_name),
+                conn,
+            )
+        return cls.from_frames(frames)
+
+    @classmethod
+    def read(cls, path, mmap_mode='r'):
+        """
+        Read an index written by :meth:`write`.
+
+        Parameters
+        ----------
+        path : str
+            The directory containing the index.
+        mmap_mode : {'r', None}, optional
+            How to load the arrays. By default they're memory-mapped
+            read-only, so processes reading the same index share its pages.
+        """
+        tables = {}
+        for table_name, (date_column, value_columns) in iteritems(
+                ADJUSTMENT_INDEX_COLUMNS):
+            columns = (
+                ('sid', date_column) +
+                value_columns +
+                (DATE_ORDER, DATES_BY_DATE)
+            )
+            tables[table_name] = {
+                column: np.load(
+                    index_array_path(path, table_name, column),
+                    mmap_mode=mmap_mode,
+                )
+                for column in columns
+            }
+        return cls(tables)
+
+    def write(self, path):
+        """
+        Write the index to a directory, as a ``.npy`` file per array.
+        """
+        ensure_directory(path)
+        for table_name, table in iteritems(self._tables):
+            for column, values in iteritems(table):
+                np.save(index_array_path(path, table_name, column), values)
+
+    def column(self, table_name, column):
+        """
+        Get the values of a column, sorted by sid and date.
+        """
+        return self._tables[table_name][column]
+
+    def rows_for_sid(self, table_name, sid):
+        """
+        Get a slice of the rows of a table for a sid.
+
+        Returns
+        -------
+        rows : slice
+            The rows for ``sid``, ordered by date.
+        """
+        sids = self._tables[table_name]['sid']
+        return slice(
+            sids.searchsorted(sid, side='left'),
+            sids.searchsorted(sid, side='right'),
+        )
+
+    def rows_on_date(self, table_name, date, sids=None):
+        """
+        Get the indices of the rows of a table on a date.
+
+        Parameters
+        ----------
+        table_name : str
+            The table to search.
+        date : int
+            The date, in seconds since the epoch.
+        sids : iterable[int], optional
+            If provided, only return rows for these sids.
+
+        Returns
+        -------
+        rows : np.array[int64]
+            The indices of the rows on ``date``, ordered by sid.
+        """
+        table = self._tables[table_name]
+        order = table[DATE_ORDER]
+        dates = table[DATES_BY_DATE]
+        rows = order[
+            dates.searchsorted(date, side='left'):
+            dates.searchsorted(date, side='right')
+        ]
+        if sids is not None:
+            rows = rows[np.in1d(
+                table['sid'][rows],
+                np.array([int(sid) for sid in sids], dtype=int64_dtype),
+            )]
+        return rows
+
+
 class SQLiteAdjustmentReader(object):
     """
     Loads adjustments based on corporate actions from a SQLite database.
@@ -81,6 +305,17 @@ class SQLiteAdjustmentReader(object):
     ----------
     conn : str or sqlite3.Connection
         Connection from which to load data.
+    preload : bool, optional
+        If True, load the adjustments for each sid and date into an
+        :class:`AdjustmentIndex` up front, and answer lookups from it instead
+        of querying the database on every call. Default is False.
+    index : AdjustmentIndex, optional
+        A preloaded index to use for lookups, for example one shared by
+        several readers of the same database. Implies ``preload``.
+    factors : AdjustmentFactors, optional
+        Cumulative adjustment factors computed from this database. If
+        provided, history windows are adjusted by scaling with these
+        factors instead of by applying adjustment objects.
 
     See Also
     --------
@@ -88,9 +323,14 @@ class SQLiteAdjustmentReader(object):
     """
 
     @preprocess(conn=coerce_string_to_conn(require_exists=True))
-    def __init__(self, conn):
+    def __init__(self, conn, preload=False, index=None, factors=None):
         self.conn = conn
 
+        if index is None and preload:
+            index = AdjustmentIndex.from_sqlite(conn)
+        self.index = index
+        self.factors = factors
+
         # Given the tables in the adjustments.db file, dict which knows which
         # col names contain dates that have been coerced into ints.
         self._datetime_int_cols = {
@@ -121,6 +361,13 @@ class SQLiteAdjustmentReader(object):
         )
 
     def get_adjustments_for_sid(self, table_name, sid):
+        if self.index is not None:
+            rows = self.index.rows_for_sid(table_name, int(sid))
+            dates = self.index.column(table_name, 'effective_date')[rows]
+            ratios = self.index.column(table_name, 'ratio')[rows]
+            return [[Timestamp(date, unit='s', tz='UTC'), ratio]
+                    for date, ratio in zip(dates.tolist(), ratios.tolist())]
+
         t = (sid,)
         c = self.conn.cursor()
         adjustments_for_sid = c.execute(
@@ -132,8 +379,59 @@ class SQLiteAdjustmentReader(object):
                 for adjustment in
                 adjustments_for_sid]
 
+    def get_adjustments_with_effective_date(self, table_name, date):
+        """
+        Get the adjustments in a table which take effect on a date.
+
+        Parameters
+        ----------
+        table_name : {'splits', 'mergers', 'dividends'}
+            The table from which to read adjustments.
+        date : pd.Timestamp
+            The effective date, as midnight UTC.
+
+        Returns
+        -------
+        adjustments : list[(int, float)]
+            A (sid, ratio) pair for each adjustment.
+        """
+        seconds = int(date.value / 1e9)
+
+        if self.index is not None:
+            rows = self.index.rows_on_date(table_name, seconds)
+            return list(zip(
+                self.index.column(table_name, 'sid')[rows].tolist(),
+                self.index.column(table_name, 'ratio')[rows].tolist(),
+            ))
+
+        return self.conn.execute(
+            "SELECT sid, ratio FROM %s WHERE effective_date = ?" % table_name,
+            (seconds,),
+        ).fetchall()
+
     def get_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
+
+        if self.index is not None:
+            rows = self.index.rows_on_date(
+                'dividend_payouts',
+                seconds,
+                sids=assets,
+            )
+            column = partial(self.index.column, 'dividend_payouts')
+            return [
+                Dividend(
+                    asset_finder.retrieve_asset(sid),
+                    amount,
+                    Timestamp(pay_date, unit='s', tz='UTC'),
+                )
+                for sid, amount, pay_date in zip(
+                    column('sid')[rows].tolist(),
+                    column('amount')[rows].tolist(),
+                    column('pay_date')[rows].tolist(),
+                )
+            ]
+
         c = self.conn.cursor()
 
         divs = []
@@ -156,6 +454,29 @@ class SQLiteAdjustmentReader(object):
 
     def get_stock_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
+
+        if self.index is not None:
+            rows = self.index.rows_on_date(
+                'stock_dividend_payouts',
+                seconds,
+                sids=assets,
+            )
+            column = partial(self.index.column, 'stock_dividend_payouts')
+            return [
+                StockDividend(
+                    asset_finder.retrieve_asset(sid),
+                    asset_finder.retrieve_asset(payment_sid),
+                    ratio,
+                    Timestamp(pay_date, unit='s', tz='UTC'),
+                )
+                for sid, payment_sid, ratio, pay_date in zip(
+                    column('sid')[rows].tolist(),
+                    column('payment_sid')[rows].tolist(),
+                    column('ratio')[rows].tolist(),
+                    column('pay_date')[rows].tolist(),
+                )
+            ]
+
         c = self.conn.cursor()
 
         stock_divs = []
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+import numpy as np
 from six import with_metaclass
 
 
@@ -40,6 +42,18 @@ class NoDataForSid(Exception):
 OHLCV = ('open', 'high', 'low', 'close', 'volume')
 
 
+def empty_values(field, count):
+    """
+    Make an array of ``count`` missing values for ``field``, in the format
+    returned by ``BarReader.get_values``.
+
+    Missing prices are nan, and missing volumes are 0.
+    """
+    if field == 'volume':
+        return np.zeros(count, dtype=np.int64)
+    return np.full(count, np.nan)
+
+
 class BarReader(with_metaclass(ABCMeta, object)):
     @abstractproperty
     def data_frequency(self):
@@ -125,6 +139,49 @@ class BarReader(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the values of several fields for several assets at a single
+        dt.
+
+        The default implementation calls ``get_value`` for each sid and
+        field. Readers should override it when they can look up many sids at
+        once.
+
+        Parameters
+        ----------
+        sids : list[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data.
+        fields : list[str]
+            The OHLCV names for the desired data.
+
+        Returns
+        -------
+        values : list[np.ndarray]
+            A list with an entry per field of arrays with a value per sid.
+            OHLC values are float64, and volumes are int64. Sids with no data
+            on ``dt`` because it's outside of their lifetime get nan for OHLC
+            and 0 for volume.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given dt is not a valid market minute (in minute mode) or
+            session (in daily mode) according to this reader's tradingcalendar.
+        """
+        out = []
+        for field in fields:
+            values = empty_values(field, len(sids))
+            for i, sid in enumerate(sids):
+                try:
+                    values[i] = self.get_value(sid, dt, field)
+                except (NoDataBeforeDate, NoDataAfterDate):
+                    pass
+            out.append(values)
+        return out
+
     @abstractmethod
     def get_last_traded_dt(self, asset, dt):
         """
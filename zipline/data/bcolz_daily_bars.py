@@ -38,6 +38,7 @@ from zipline.data.session_bars import SessionBarReader
 from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
+    NoDataForSid,
     NoDataOnDate,
 )
 from zipline.utils.functional import apply
@@ -675,6 +676,61 @@ class BcolzDailyBarReader(SessionBarReader):
                     day, sid))
         return ix
 
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the values of several fields for several assets on a single
+        day.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        try:
+            day_loc = self.sessions.get_loc(dt)
+        except KeyError:
+            raise NoDataOnDate("day={0} is outside of calendar={1}".format(
+                dt, self.sessions))
+
+        sids = [int(sid) for sid in sids]
+        missing_sids = [sid for sid in sids if sid not in self._first_rows]
+        if missing_sids:
+            raise NoDataForSid(
+                'Assets not contained in daily pricing file: {}'.format(
+                    missing_sids
+                )
+            )
+
+        first_rows = array([self._first_rows[sid] for sid in sids],
+                           dtype=np.int64)
+        last_rows = array([self._last_rows[sid] for sid in sids],
+                          dtype=np.int64)
+        offsets = array([self._calendar_offsets[sid] for sid in sids],
+                        dtype=np.int64)
+
+        ixs = first_rows + day_loc - offsets
+        # Sids which aren't alive on ``dt`` have no value.
+        alive = (day_loc >= offsets) & (ixs <= last_rows)
+        alive_ixs = ixs[alive]
+
+        out = []
+        for field in fields:
+            if field == 'volume':
+                values = np.zeros(len(sids), dtype=np.int64)
+            else:
+                values = full(len(sids), nan)
+            if len(alive_ixs):
+                raw = self._spot_col(field)[alive_ixs]
+                if field == 'volume':
+                    values[alive] = raw
+                else:
+                    values[alive] = np.where(
+                        raw == 0,
+                        nan,
+                        raw * self.PRICE_ADJUSTMENT_FACTOR,
+                    )
+            out.append(values)
+        return out
+
     def get_value(self, sid, dt, field):
         """
         Parameters
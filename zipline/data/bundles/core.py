@@ -10,9 +10,11 @@ import pandas as pd
 from trading_calendars import get_calendar
 from toolz import curry, complement, take
 
+from ..adjustment_factors import AdjustmentFactors
 from ..adjustments import SQLiteAdjustmentReader, SQLiteAdjustmentWriter
 from ..bcolz_daily_bars import BcolzDailyBarReader, BcolzDailyBarWriter
 from ..minute_bars import (
+    BcolzMinuteBarMetadata,
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
 )
@@ -20,7 +22,7 @@ from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.assets.asset_db_migrations import downgrade
 from zipline.utils.cache import (
     dataframe_cache,
-    working_dir,
+    resumable_working_dir,
     working_file,
 )
 from zipline.utils.compat import mappingproxy
@@ -57,6 +59,13 @@ def adjustment_db_path(bundle_name, timestr, environ=None):
     )
 
 
+def adjustment_factors_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        adjustment_factors_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
 def cache_path(bundle_name, environ=None):
     return pth.data_path(
         cache_relative(bundle_name, environ),
@@ -64,14 +73,29 @@ def cache_path(bundle_name, environ=None):
     )
 
 
+def incomplete_path(bundle_name, environ=None):
+    return pth.data_path(
+        incomplete_relative(bundle_name, environ),
+        environ=environ,
+    )
+
+
 def adjustment_db_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'adjustments.sqlite'
 
 
+def adjustment_factors_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'adjustment_factors.npz'
+
+
 def cache_relative(bundle_name, timestr, environ=None):
     return bundle_name, '.cache'
 
 
+def incomplete_relative(bundle_name, environ=None):
+    return bundle_name, '.incomplete'
+
+
 def daily_equity_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'daily_equities.bcolz'
 
@@ -119,6 +143,38 @@ def from_bundle_ingest_dirname(cs):
     return pd.Timestamp(cs.replace(';', ':'))
 
 
+def interrupted_ingestion(bundle, environ=None):
+    """Get the name of the directory of the bundle's most recent ingestion
+    which was interrupted before it finished.
+
+    Parameters
+    ----------
+    bundle : str
+        The name of the bundle.
+    environ : mapping, optional
+        The environment variables.
+
+    Returns
+    -------
+    timestr : str or None
+        The name of the ingestion's directory, or None if there is no
+        interrupted ingestion to resume.
+    """
+    try:
+        candidates = os.listdir(
+            os.path.join(incomplete_path(bundle, environ=environ), bundle),
+        )
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+        return None
+
+    candidates = list(filter(complement(pth.hidden), candidates))
+    if not candidates:
+        return None
+    return max(candidates, key=from_bundle_ingest_dirname)
+
+
 def ingestions_for_bundle(bundle, environ=None):
     return sorted(
         (from_bundle_ingest_dirname(ing)
@@ -335,7 +391,9 @@ def _make_bundle_core():
                environ=os.environ,
                timestamp=None,
                assets_versions=(),
-               show_progress=False):
+               show_progress=False,
+               processes=None,
+               resume=False):
         """Ingest data for a given bundle.
 
         Parameters
@@ -351,6 +409,22 @@ def _make_bundle_core():
             Versions of the assets db to which to downgrade.
         show_progress : bool, optional
             Tell the ingest function to display the progress where possible.
+        processes : int, optional
+            The number of worker processes the minute bar writer uses to
+            write sids in parallel.
+        resume : bool, optional
+            Resume the most recent ingestion of the bundle which was
+            interrupted, instead of starting a new one. The interrupted
+            ingestion's timestamp is used in place of ``timestamp``, and minute
+            bars which were completely written are not rewritten. If there is
+            no interrupted ingestion, a new one is started.
+
+        Notes
+        -----
+        The data written by the bundle's writers is kept in a hidden
+        directory of the bundle until the ingestion succeeds, so that an
+        ingestion which fails or is interrupted can be resumed. Starting a
+        new ingestion without ``resume`` discards it.
         """
         try:
             bundle = bundles[name]
@@ -373,6 +447,15 @@ def _make_bundle_core():
         timestamp = timestamp.tz_convert('utc').tz_localize(None)
 
         timestr = to_bundle_ingest_dirname(timestamp)
+        incompletepath = incomplete_path(name, environ=environ)
+        resumed_timestr = (
+            interrupted_ingestion(name, environ=environ) if resume else None
+        )
+        if resumed_timestr is not None:
+            timestr = resumed_timestr
+        elif os.path.exists(incompletepath):
+            shutil.rmtree(incompletepath)
+
         cachepath = cache_path(name, environ=environ)
         pth.ensure_directory(pth.data_path([name, timestr], environ=environ))
         pth.ensure_directory(cachepath)
@@ -381,9 +464,12 @@ def _make_bundle_core():
             # we use `cleanup_on_failure=False` so that we don't purge the
             # cache directory if the load fails in the middle
             if bundle.create_writers:
-                wd = stack.enter_context(working_dir(
-                    pth.data_path([], environ=environ))
-                )
+                # Write into a working dir which is kept if the ingestion is
+                # interrupted, so that it can be resumed.
+                wd = stack.enter_context(resumable_working_dir(
+                    pth.data_path([], environ=environ),
+                    incompletepath,
+                ))
                 daily_bars_path = wd.ensure_dir(
                     *daily_equity_relative(
                         name, timestr, environ=environ,
@@ -401,18 +487,33 @@ def _make_bundle_core():
                 # that it can compute the adjustment ratios for the dividends.
 
                 daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(
-                        name, timestr, environ=environ)
-                    ),
-                    calendar,
-                    start_session,
-                    end_session,
-                    minutes_per_day=bundle.minutes_per_day,
+                minute_bars_path = wd.ensure_dir(*minute_equity_relative(
+                    name, timestr, environ=environ)
                 )
+                if resumed_timestr is not None and os.path.exists(
+                        BcolzMinuteBarMetadata.metadata_path(minute_bars_path),
+                ):
+                    minute_bar_writer = BcolzMinuteBarWriter.open(
+                        minute_bars_path,
+                        resume=True,
+                        processes=processes,
+                    )
+                else:
+                    minute_bar_writer = BcolzMinuteBarWriter(
+                        minute_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        minutes_per_day=bundle.minutes_per_day,
+                        processes=processes,
+                    )
                 assets_db_path = wd.getpath(*asset_db_relative(
                     name, timestr, environ=environ,
                 ))
+                if os.path.exists(assets_db_path):
+                    # The asset db writer appends to existing tables, so
+                    # rewrite the assets of a resumed ingestion from scratch.
+                    os.remove(assets_db_path)
                 asset_db_writer = AssetDBWriter(assets_db_path)
 
                 adjustment_db_writer = stack.enter_context(
@@ -454,6 +555,18 @@ def _make_bundle_core():
                     shutil.copy2(assets_db_path, wf.path)
                     downgrade(wf.path, version)
 
+        if bundle.create_writers:
+            # Precompute the cumulative adjustment factors used to adjust
+            # history windows, now that the adjustments db is complete.
+            with SQLiteAdjustmentReader(
+                    adjustment_db_path(name, timestr, environ=environ),
+            ) as adjustment_reader, working_file(
+                adjustment_factors_path(name, timestr, environ=environ),
+            ) as wf:
+                AdjustmentFactors.from_adjustment_reader(
+                    adjustment_reader,
+                ).write(wf.path)
+
     def most_recent_data(bundle_name, timestamp, environ=None):
         """Get the path to the most recent data after ``date``for the
         given bundle.
@@ -514,6 +627,15 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+
+        # Bundles ingested before adjustment factors were precomputed don't
+        # have them, and are adjusted with adjustment objects instead.
+        factors_path = adjustment_factors_path(name, timestr, environ=environ)
+        if os.path.exists(factors_path):
+            adjustment_factors = AdjustmentFactors.read(factors_path)
+        else:
+            adjustment_factors = None
+
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
@@ -526,6 +648,7 @@ def _make_bundle_core():
             ),
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
+                factors=adjustment_factors,
             ),
         )
 
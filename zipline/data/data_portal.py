@@ -50,9 +50,11 @@ from zipline.data.resample import (
 )
 from zipline.data.history_loader import (
     DailyHistoryLoader,
+    HistoryCacheStats,
     MinuteHistoryLoader,
+    history_window_cache,
 )
-from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.bar_reader import NoDataOnDate, empty_values
 from zipline.utils.math_utils import (
     nansum,
     nanmean,
@@ -137,6 +139,11 @@ class DataPortal(object):
         The last session to make available in session-level data.
     last_available_minute : pd.Timestamp, optional
         The last minute to make available in minute-level data.
+    history_cache_bytes : int, optional
+        The total size of the sliding windows cached to serve history calls,
+        above which the least recently used windows are evicted. If not
+        provided, the number of cached windows is bounded instead of their
+        size. See :meth:`get_history_cache_stats`.
     """
     def __init__(self,
                  asset_finder,
@@ -150,7 +157,8 @@ class DataPortal(object):
                  last_available_session=None,
                  last_available_minute=None,
                  minute_history_prefetch_length=_DEF_M_HIST_PREFETCH,
-                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH):
+                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH,
+                 history_cache_bytes=None):
 
         self.trading_calendar = trading_calendar
 
@@ -264,6 +272,15 @@ class DataPortal(object):
             _dispatch_minute_reader,
             self.trading_calendar
         )
+        # The daily and minute history loaders share one cache of sliding
+        # windows, so that history_cache_bytes bounds both.
+        if history_cache_bytes is not None:
+            self._history_window_cache = history_window_cache(
+                max_bytes=history_cache_bytes,
+            )
+        else:
+            self._history_window_cache = None
+
         self._history_loader = DailyHistoryLoader(
             self.trading_calendar,
             _dispatch_session_reader,
@@ -271,6 +288,7 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=daily_history_prefetch_length,
+            window_cache=self._history_window_cache,
         )
         self._minute_history_loader = MinuteHistoryLoader(
             self.trading_calendar,
@@ -279,6 +297,7 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=minute_history_prefetch_length,
+            window_cache=self._history_window_cache,
         )
 
         self._first_trading_day = first_trading_day
@@ -512,6 +531,7 @@ class DataPortal(object):
                     "Unexpected 'assets' value of type {}."
                     .format(type(assets))
                 )
+            assets = list(assets)
 
         session_label = self.trading_calendar.minute_to_session_label(dt)
 
@@ -523,6 +543,16 @@ class DataPortal(object):
                 dt,
                 data_frequency,
             )
+        elif field in OHLCVP_FIELDS and all(
+                isinstance(asset, (Asset, ContinuousFuture))
+                for asset in assets):
+            return self._get_spot_values(
+                session_label,
+                assets,
+                field,
+                dt,
+                data_frequency,
+            )
         else:
             get_single_asset_value = self._get_single_asset_value
             return [
@@ -536,6 +566,51 @@ class DataPortal(object):
                 for asset in assets
             ]
 
+    def _get_spot_values(self,
+                         session_label,
+                         assets,
+                         field,
+                         dt,
+                         data_frequency):
+        """
+        Get the spot values of an OHLCV or price field for many assets with a
+        single call to the pricing reader's ``get_values``.
+
+        Assets without a price at ``dt`` fall back to the forward filling
+        done by ``_get_single_asset_value``.
+        """
+        column = 'close' if field == 'price' else field
+        values = empty_values(column, len(assets))
+
+        # Assets which aren't alive at ``dt`` have no value.
+        alive_ixs = [
+            i for i, asset in enumerate(assets)
+            if not (dt < asset.start_date or session_label > asset.end_date)
+        ]
+        if alive_ixs:
+            reader = self._get_pricing_reader(data_frequency)
+            try:
+                values[alive_ixs] = reader.get_values(
+                    [assets[i].sid for i in alive_ixs],
+                    session_label if data_frequency == 'daily' else dt,
+                    [column],
+                )[0]
+            except NoDataOnDate:
+                pass
+
+        if field == 'price':
+            for i in alive_ixs:
+                if isnull(values[i]):
+                    values[i] = self._get_single_asset_value(
+                        session_label,
+                        assets[i],
+                        field,
+                        dt,
+                        data_frequency,
+                    )
+
+        return values.tolist()
+
     def get_scalar_asset_spot_value(self, asset, field, dt, data_frequency):
         """
         Public API method that returns a scalar value representing the value
@@ -912,6 +987,34 @@ class DataPortal(object):
             columns=assets
         )
 
+    def get_history_cache_stats(self):
+        """
+        Get statistics about the cache of sliding windows used to serve
+        history calls, for sizing ``history_cache_bytes``.
+
+        Returns
+        -------
+        stats : HistoryCacheStats
+            The number of asset windows served from the cache and loaded
+            anew, the number of windows evicted, and the total size in bytes
+            of the cached windows, across daily and minute history.
+        """
+        daily = self._history_loader.cache_stats()
+        minute = self._minute_history_loader.cache_stats()
+        if self._history_window_cache is not None:
+            evictions = self._history_window_cache.evictions
+            nbytes = self._history_window_cache.nbytes
+        else:
+            evictions = daily.evictions + minute.evictions
+            nbytes = daily.nbytes + minute.nbytes
+
+        return HistoryCacheStats(
+            hits=daily.hits + minute.hits,
+            misses=daily.misses + minute.misses,
+            evictions=evictions,
+            nbytes=nbytes,
+        )
+
     def get_history_window(self,
                            assets,
                            end_dt,
@@ -1175,13 +1278,10 @@ class DataPortal(object):
         if self._adjustment_reader is None or not assets:
             return []
 
-        # convert dt to # of seconds since epoch, because that's what we use
-        # in the adjustments db
-        seconds = int(dt.value / 1e9)
-
-        splits = self._adjustment_reader.conn.execute(
-            "SELECT sid, ratio FROM SPLITS WHERE effective_date = ?",
-            (seconds,)).fetchall()
+        splits = self._adjustment_reader.get_adjustments_with_effective_date(
+            'splits',
+            dt,
+        )
 
         splits = [split for split in splits if split[0] in assets]
         splits = [(self.asset_finder.retrieve_asset(split[0]), split[1])
@@ -22,6 +22,7 @@ from numpy import (
 )
 from six import iteritems, with_metaclass
 
+from zipline.data.bar_reader import NoDataOnDate
 from zipline.utils.memoize import lazyval
 
 
@@ -96,6 +97,46 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_value(asset, dt, field)
 
+    def get_values(self, sids, dt, fields):
+        asset_types = self._asset_types
+        sid_groups = {t: [] for t in asset_types}
+        out_pos = {t: [] for t in asset_types}
+
+        assets = self._asset_finder.retrieve_all(sids)
+
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            sid_groups[t].append(asset)
+            out_pos[t].append(i)
+
+        batched_values = {}
+        no_data = None
+        for t in asset_types:
+            if not sid_groups[t]:
+                continue
+            try:
+                batched_values[t] = self._readers[t].get_values(
+                    sid_groups[t], dt, fields,
+                )
+            except NoDataOnDate as e:
+                # ``dt`` may be a market minute for some asset types but not
+                # for others, e.g. futures trade overnight. Leave the values
+                # of the asset types without data at ``dt`` missing, as
+                # ``DataPortal`` does when looking up a single asset.
+                no_data = e
+
+        if no_data is not None and not batched_values:
+            raise no_data
+
+        results = []
+        for i, field in enumerate(fields):
+            out = self._make_raw_array_out(field, len(sids))
+            for t, values in iteritems(batched_values):
+                out[out_pos[t]] = values[i]
+            results.append(out)
+
+        return results
+
     def get_last_traded_dt(self, asset, dt):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
@@ -692,6 +692,40 @@ class HDF5DailyBarReader(SessionBarReader):
 
         return value
 
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the values of several fields for several assets on a single
+        day.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        sids = np.array([int(sid) for sid in sids], dtype='int64')
+        self._validate_assets(sids)
+        self._validate_timestamp(dt)
+
+        sid_ixs = self.sids.searchsorted(sids)
+        dt_ix = self.dates.searchsorted(dt.asm8)
+        alive = (
+            (self.asset_start_dates[sid_ixs] <= dt.asm8) &
+            (self.asset_end_dates[sid_ixs] >= dt.asm8)
+        )
+
+        out = []
+        for field in fields:
+            # Read the values for every sid on ``dt``, then select the
+            # requested sids, since h5py only supports increasing indices.
+            column = self._country_group[DATA][field][:, dt_ix]
+            values = self._postprocessors[field](column[sid_ixs])
+            if field == VOLUME:
+                values = values.astype('int64')
+                values[~alive] = 0
+            else:
+                values[~alive] = np.nan
+            out.append(values)
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         """
         Get the latest day on or before ``dt`` in which ``asset`` traded.
@@ -920,6 +954,19 @@ class MultiCountryDailyBarReader(SessionBarReader):
             )
         return self._readers[country_code].get_value(sid, dt, field)
 
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the values of several fields for several assets on a single
+        day.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        sids = [int(sid) for sid in sids]
+        country_code = self._country_code_for_assets(sids)
+        return self._readers[country_code].get_values(sids, dt, fields)
+
     def get_last_traded_dt(self, asset, dt):
         """
         Get the latest day on or before ``dt`` in which ``asset`` traded.
@@ -0,0 +1,884 @@
+"""
+HDF5 Minute Pricing File Format
+-------------------------------
+Unlike the bcolz minute bar format, which stores a table per sid, this
+format stores each OHLCV field as a single 2D array with a row per minute
+and a column per sid, so that reading a window of minutes for many sids is
+a single read per field.
+
+As in the bcolz format, each session occupies ``minutes_per_day`` rows
+starting at its market open, and sessions that close early leave the rows
+after their close empty.
+
+``/data``
+^^^^^^^^^
+Each field (OHLCV) is stored as a uint32 dataset of shape
+``(sessions * minutes_per_day, sids)``. Prices are multiplied by the ratio
+for their sid before being stored, and 0 represents missing data.
+
+By default, each dataset is chunked so that each chunk contains every
+minute of a session for a block of sids, and each chunk is compressed
+independently. The blocks of sids are small enough that a chunk fits in
+h5py's default chunk cache, so that repeated reads from the same session
+don't decompress the chunk again. When written without compression, the
+datasets are stored contiguously, and readers memory-map them instead of
+reading through HDF5.
+
+.. code-block:: none
+
+   /data
+     /open
+     /high
+     /low
+     /close
+     /volume
+
+``/index``
+^^^^^^^^^^
+Contains the sids aligned to the columns of each field, and the ratio used
+to convert the prices for each sid to integers.
+
+.. code-block:: none
+
+   /index
+     /sid
+     /ohlc_ratio
+
+The file's attributes record the format version, the name of the trading
+calendar, the first and last sessions, and the number of minutes per day.
+"""
+import h5py
+import logbook
+import numpy as np
+import pandas as pd
+from trading_calendars import get_calendar
+
+from zipline.data.bar_reader import NoDataForSid, NoDataOnDate
+from zipline.data.bcolz_daily_bars import UINT32_MAX
+from zipline.data.minute_bars import (
+    MinuteBarReader,
+    OHLC_RATIO,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.utils.input_validation import expect_element
+from zipline.utils.memoize import lazyval
+from zipline.utils.pandas_utils import check_indexes_all_same
+
+
+log = logbook.Logger('HDF5MinuteBars')
+
+VERSION = 0
+
+DATA = 'data'
+INDEX = 'index'
+
+SID = 'sid'
+OHLC_RATIO_KEY = 'ohlc_ratio'
+
+OPEN = 'open'
+HIGH = 'high'
+LOW = 'low'
+CLOSE = 'close'
+VOLUME = 'volume'
+
+PRICE_FIELDS = (OPEN, HIGH, LOW, CLOSE)
+FIELDS = PRICE_FIELDS + (VOLUME,)
+
+CALENDAR_NAME = 'calendar_name'
+START_SESSION = 'start_session'
+END_SESSION = 'end_session'
+MINUTES_PER_DAY = 'minutes_per_day'
+
+# The most bytes of data in a chunk of a compressed dataset. This is half of
+# the size of h5py's default chunk cache.
+CHUNK_BYTES = 2 ** 19
+
+# The most bytes of float64 data for each field to convert and write at once.
+WRITE_BLOCK_BYTES = 2 ** 25
+
+# The number of rows of (sid, df) pairs to combine into each write.
+WRITE_BATCH_ROWS = 2 ** 20
+
+
+def _schedule_minutes(calendar, start_session, end_session):
+    """
+    Get the market opens and closes of each session between
+    ``start_session`` and ``end_session``, as minutes since the epoch.
+    """
+    slicer = calendar.schedule.index.slice_indexer(start_session, end_session)
+    schedule = calendar.schedule[slicer]
+    opens = schedule.market_open.values.astype('datetime64[m]')
+    closes = schedule.market_close.values.astype('datetime64[m]')
+    return opens.astype(np.int64), closes.astype(np.int64)
+
+
+def _create_contiguous_dataset(group, name, shape, dtype):
+    """
+    Create a contiguous dataset of zeros, with its storage allocated
+    immediately.
+
+    HDF5 allocates contiguous datasets lazily by default, and a dataset
+    without storage has no offset at which to memory-map it. h5py's
+    ``create_dataset`` doesn't expose the allocation time, so this uses the
+    low-level API.
+    """
+    dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+    dcpl.set_layout(h5py.h5d.CONTIGUOUS)
+    dcpl.set_alloc_time(h5py.h5d.ALLOC_TIME_EARLY)
+    # Set the fill value explicitly so that it's written to the file when
+    # space is allocated.
+    dcpl.set_fill_value(np.array(0, dtype=dtype))
+    h5py.h5d.create(
+        group.id,
+        name.encode('ascii'),
+        h5py.h5t.py_create(np.dtype(dtype)),
+        h5py.h5s.create_simple(shape),
+        dcpl=dcpl,
+    )
+
+
+def _chunk_shape(minutes_per_day, sid_count, itemsize):
+    """
+    Get the shape of the chunks of a compressed dataset: every minute of a
+    session, for as many sids as fit in ``CHUNK_BYTES``.
+    """
+    sids_per_chunk = max(CHUNK_BYTES // (minutes_per_day * itemsize), 1)
+    return minutes_per_day, min(sid_count, sids_per_chunk)
+
+
+def minute_positions(market_opens, minutes, minutes_per_day):
+    """
+    Get the row of each of ``minutes`` in a minute bar file.
+
+    Parameters
+    ----------
+    market_opens : np.array[int64]
+        The market open of each session in the file, in minutes since the
+        epoch.
+    minutes : np.array[int64]
+        The minutes to look up, in minutes since the epoch.
+    minutes_per_day : int
+        The number of rows used by each session.
+
+    Returns
+    -------
+    positions : np.array[int64]
+        The row of each minute.
+
+    Raises
+    ------
+    NoDataOnDate
+        If any of ``minutes`` isn't within ``minutes_per_day`` minutes of the
+        open of a session in the file.
+    """
+    session_ixs = market_opens.searchsorted(minutes, side='right') - 1
+    offsets = minutes - market_opens[session_ixs.clip(0)]
+    invalid = (session_ixs < 0) | (offsets >= minutes_per_day)
+    if invalid.any():
+        raise NoDataOnDate(
+            'Minutes are not market minutes: {}'.format(
+                pd.to_datetime(minutes[invalid], unit='m', utc=True),
+            )
+        )
+    return session_ixs * minutes_per_day + offsets
+
+
+class HDF5MinuteBarWriter(object):
+    """
+    Class capable of writing minute OHLCV data to disk in a format that
+    can be read efficiently by HDF5MinuteBarReader.
+
+    Parameters
+    ----------
+    filename : str
+        The location at which we should write our output. Any existing file
+        is overwritten.
+    calendar : trading_calendars.TradingCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : pd.Timestamp
+        The first trading session in the data set.
+    end_session : pd.Timestamp
+        The last trading session in the data set.
+    sids : iterable[int]
+        The sids that may be written to the file.
+    minutes_per_day : int, optional
+        The number of minutes per each period. Defaults to 390, the mode of
+        minutes in NYSE trading days.
+    default_ohlc_ratio : int, optional
+        The default ratio by which to multiply the pricing data to convert
+        from floats to integers that fit within np.uint32. Default is
+        OHLC_RATIO (1000).
+    ohlc_ratios_per_sid : dict[int, int], optional
+        A dict mapping sids to the ratio to use instead of
+        ``default_ohlc_ratio``.
+    compression : {'lzf', 'gzip', None}, optional
+        The compression filter to apply to each session of data. If None,
+        data is stored uncompressed and contiguously, so that readers can
+        memory-map it. Default is 'lzf'.
+
+    See Also
+    --------
+    zipline.data.hdf5_minute_bars.HDF5MinuteBarReader
+    """
+    def __init__(self,
+                 filename,
+                 calendar,
+                 start_session,
+                 end_session,
+                 sids,
+                 minutes_per_day=US_EQUITIES_MINUTES_PER_DAY,
+                 default_ohlc_ratio=OHLC_RATIO,
+                 ohlc_ratios_per_sid=None,
+                 compression='lzf'):
+        self._filename = filename
+        self._calendar = calendar
+        self._minutes_per_day = minutes_per_day
+        self._market_opens, _ = _schedule_minutes(
+            calendar,
+            start_session,
+            end_session,
+        )
+
+        sids = np.unique(np.asarray(list(sids), dtype=np.int64))
+        ratios_per_sid = ohlc_ratios_per_sid or {}
+        ohlc_ratios = np.array(
+            [ratios_per_sid.get(sid, default_ohlc_ratio) for sid in sids],
+            dtype=np.int64,
+        )
+
+        self._sids = sids
+        self._ohlc_ratios = ohlc_ratios
+
+        shape = (len(self._market_opens) * minutes_per_day, len(sids))
+        # Contiguous datasets can be memory-mapped by readers. h5py crashes if
+        # we provide chunks for empty data.
+        contiguous = compression is None or not len(sids)
+
+        with self.h5_file(mode='w') as h5_file:
+            h5_file.attrs['version'] = VERSION
+            h5_file.attrs[CALENDAR_NAME] = calendar.name
+            h5_file.attrs[START_SESSION] = start_session.value
+            h5_file.attrs[END_SESSION] = end_session.value
+            h5_file.attrs[MINUTES_PER_DAY] = minutes_per_day
+
+            index_group = h5_file.create_group(INDEX)
+            index_group.create_dataset(SID, data=sids)
+            index_group.create_dataset(OHLC_RATIO_KEY, data=ohlc_ratios)
+
+            data_group = h5_file.create_group(DATA)
+            for field in FIELDS:
+                if contiguous:
+                    _create_contiguous_dataset(
+                        data_group,
+                        field,
+                        shape,
+                        np.uint32,
+                    )
+                else:
+                    data_group.create_dataset(
+                        field,
+                        shape=shape,
+                        dtype=np.uint32,
+                        fillvalue=0,
+                        chunks=_chunk_shape(
+                            minutes_per_day,
+                            len(sids),
+                            np.dtype(np.uint32).itemsize,
+                        ),
+                        compression=compression,
+                        shuffle=True,
+                    )
+
+            log.debug(
+                'Created minute bar file {} for {} sids',
+                self._filename,
+                len(sids),
+            )
+
+    @classmethod
+    def open(cls, filename):
+        """
+        Open an existing file for writing.
+
+        Parameters
+        ----------
+        filename : str
+            The path to a file created by HDF5MinuteBarWriter.
+        """
+        self = cls.__new__(cls)
+        self._filename = filename
+        with self.h5_file(mode='r') as h5_file:
+            attrs = h5_file.attrs
+            self._calendar = get_calendar(attrs[CALENDAR_NAME])
+            self._minutes_per_day = int(attrs[MINUTES_PER_DAY])
+            self._market_opens, _ = _schedule_minutes(
+                self._calendar,
+                pd.Timestamp(attrs[START_SESSION], tz='UTC'),
+                pd.Timestamp(attrs[END_SESSION], tz='UTC'),
+            )
+            self._sids = h5_file[INDEX][SID][:].astype(np.int64)
+            self._ohlc_ratios = h5_file[INDEX][OHLC_RATIO_KEY][:]
+        return self
+
+    def h5_file(self, mode):
+        return h5py.File(self._filename, mode)
+
+    @property
+    def sids(self):
+        return self._sids
+
+    @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
+    def write(self, frames, invalid_data_behavior='warn'):
+        """
+        Write minute OHLCV data for many sids at once.
+
+        Parameters
+        ----------
+        frames : dict[str, pd.DataFrame]
+            A dict mapping each OHLCV field to a dataframe with a row for
+            each market minute and a column for each sid. The dataframes need
+            to have the same index and columns.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            What to do when a price is too large to be stored as a uint32.
+            Unless this is 'raise', minutes with invalid prices are written
+            as missing for every field.
+
+        Notes
+        -----
+        Existing data for the written minutes and sids is overwritten. Data
+        for other sids is preserved. Writes are fastest when they cover
+        whole sessions for every sid in each chunk of the file.
+
+        The data is written a few sessions at a time, so that at most about
+        ``WRITE_BLOCK_BYTES`` of each field is converted and held in memory
+        at once. If ``invalid_data_behavior`` is 'raise', the sessions before
+        the one with the invalid value have already been written when the
+        error is raised.
+        """
+        frames = {field: frames[field] for field in FIELDS}
+        check_indexes_all_same(
+            [frame.index for frame in frames.values()],
+            message='Frames have mismatched minutes.',
+        )
+        check_indexes_all_same(
+            [frame.columns for frame in frames.values()],
+            message='Frames have mismatched sids.',
+        )
+        index = frames[CLOSE].index
+        columns = np.asarray(frames[CLOSE].columns, dtype=np.int64)
+        if not len(index) or not len(columns):
+            return
+
+        sid_ixs = self._sids.searchsorted(columns)
+        unknown = np.in1d(columns, self._sids, invert=True)
+        if unknown.any():
+            raise ValueError(
+                'Sids are not in minute bar file {}: {}'.format(
+                    self._filename,
+                    columns[unknown],
+                )
+            )
+
+        minutes = index.values.astype('datetime64[m]').astype(np.int64)
+        positions = minute_positions(
+            self._market_opens,
+            minutes,
+            self._minutes_per_day,
+        )
+
+        # Sort the minutes and sids, so that each block of sessions is a
+        # range of rows, and each block of sids is a range of columns.
+        row_order = positions.argsort(kind='mergesort')
+        positions = positions[row_order]
+        col_order = sid_ixs.argsort(kind='mergesort')
+        sid_ixs = sid_ixs[col_order]
+
+        with self.h5_file(mode='a') as h5_file:
+            data_group = h5_file[DATA]
+            chunks = data_group[CLOSE].chunks
+            if chunks is None:
+                # Contiguous datasets have no chunks to keep whole, so we
+                # read back the span of the sids being written.
+                sids_per_chunk = None
+                read_width = sid_ixs[-1] - sid_ixs[0] + 1
+            else:
+                sids_per_chunk = chunks[1]
+                read_width = sids_per_chunk
+
+            # Write a bounded number of sessions at a time, so that the
+            # converted data and the regions read back from the file stay
+            # small.
+            sessions = positions // self._minutes_per_day
+            sessions_per_block = self._sessions_per_block(
+                max(len(sid_ixs), read_width),
+            )
+            lo = 0
+            while lo < len(positions):
+                hi = sessions.searchsorted(
+                    sessions[lo] + sessions_per_block,
+                )
+                block = np.ix_(row_order[lo:hi], col_order)
+                values = {
+                    field: frames[field].values[block] for field in FIELDS
+                }
+                self._write_block(
+                    data_group,
+                    positions[lo:hi],
+                    sid_ixs,
+                    self._convert(values, sid_ixs, invalid_data_behavior),
+                    sids_per_chunk,
+                )
+                lo = hi
+
+            log.debug(
+                'Wrote {} minutes for {} sids to {}',
+                len(positions),
+                len(columns),
+                self._filename,
+            )
+
+    def _sessions_per_block(self, sid_count):
+        """
+        Get the number of sessions of data for ``sid_count`` sids that fit
+        in ``WRITE_BLOCK_BYTES`` as float64.
+        """
+        session_bytes = self._minutes_per_day * sid_count * 8
+        return max(WRITE_BLOCK_BYTES // session_bytes, 1)
+
+    def _convert(self, values, sid_ixs, invalid_data_behavior):
+        """
+        Convert blocks of OHLCV data for the sids at ``sid_ixs`` to the
+        integers stored in the file.
+        """
+        converted = {}
+        exclude = None
+        ratios = self._ohlc_ratios[sid_ixs]
+        for field in FIELDS:
+            field_values = np.nan_to_num(values[field].astype(np.float64))
+            if field != VOLUME:
+                field_values = (field_values * ratios).round()
+            invalid = (field_values >= UINT32_MAX) | (field_values < 0)
+            if invalid.any():
+                if invalid_data_behavior == 'raise':
+                    raise ValueError(
+                        "Values for column '{}' are too large for uint32 "
+                        "(max={})".format(field, field_values.max())
+                    )
+                elif invalid_data_behavior == 'warn':
+                    log.warn(
+                        'Values for col={} contain some too large for uint32 '
+                        '(max={}), filtering them out',
+                        field,
+                        field_values.max(),
+                    )
+                exclude = invalid if exclude is None else exclude | invalid
+            converted[field] = field_values.astype(np.uint32)
+
+        if exclude is not None:
+            for field_values in converted.values():
+                field_values[exclude] = 0
+        return converted
+
+    def _write_block(self,
+                     data_group,
+                     positions,
+                     sid_ixs,
+                     converted,
+                     sids_per_chunk):
+        """
+        Write converted data for sorted ``positions`` and ``sid_ixs``.
+
+        Only the rows of the sessions and the columns of the chunks being
+        written are read back from the file. Regions that are entirely
+        overwritten aren't read at all.
+        """
+        minutes_per_day = self._minutes_per_day
+        start = positions[0] // minutes_per_day * minutes_per_day
+        stop = (positions[-1] // minutes_per_day + 1) * minutes_per_day
+        rows = positions - start
+
+        sid_count = len(self._sids)
+        if sids_per_chunk is None:
+            regions = [(0, len(sid_ixs), sid_ixs[0], sid_ixs[-1] + 1)]
+        else:
+            # Write whole chunks, so that HDF5 doesn't have to read them
+            # back again for a partial write.
+            chunk_ixs = sid_ixs // sids_per_chunk
+            bounds = np.r_[
+                0,
+                np.flatnonzero(np.diff(chunk_ixs)) + 1,
+                len(sid_ixs),
+            ]
+            regions = [
+                (
+                    col_start,
+                    col_stop,
+                    chunk_ixs[col_start] * sids_per_chunk,
+                    min((chunk_ixs[col_start] + 1) * sids_per_chunk,
+                        sid_count),
+                )
+                for col_start, col_stop in zip(bounds[:-1], bounds[1:])
+            ]
+
+        for col_start, col_stop, region_start, region_stop in regions:
+            cols = sid_ixs[col_start:col_stop] - region_start
+            whole_region = (
+                len(rows) == stop - start and
+                len(cols) == region_stop - region_start
+            )
+            for field in FIELDS:
+                dataset = data_group[field]
+                if whole_region:
+                    region = np.empty(
+                        (stop - start, region_stop - region_start),
+                        dtype=np.uint32,
+                    )
+                else:
+                    region = dataset[start:stop, region_start:region_stop]
+                region[np.ix_(rows, cols)] = (
+                    converted[field][:, col_start:col_stop]
+                )
+                dataset[start:stop, region_start:region_stop] = region
+
+    def write_from_sid_df_pairs(self, data, invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid and
+            a dataframe of OHLCV data for that asset, indexed by minute.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            See :meth:`write`.
+
+        Notes
+        -----
+        ``data`` is consumed in batches of about ``WRITE_BATCH_ROWS`` rows,
+        so it doesn't need to fit in memory at once.
+        """
+        batch = []
+        batch_rows = 0
+        for sid, df in data:
+            if not len(df):
+                continue
+            batch.append((sid, df))
+            batch_rows += len(df)
+            if batch_rows >= WRITE_BATCH_ROWS:
+                self._write_pairs(batch, invalid_data_behavior)
+                batch = []
+                batch_rows = 0
+        if batch:
+            self._write_pairs(batch, invalid_data_behavior)
+
+    def _write_pairs(self, data, invalid_data_behavior):
+        sids, frames = zip(*data)
+        ohlcv_frame = pd.concat(frames)
+
+        # Repeat each sid for each row in its corresponding frame.
+        sid_ix = np.repeat(sids, [len(f) for f in frames])
+
+        # Add id to the index, so the frame is indexed by (minute, id).
+        ohlcv_frame.set_index(sid_ix, append=True, inplace=True)
+
+        # Unstack a bounded number of sessions at a time, so that the dense
+        # frames passed to ``write`` stay small.
+        minutes = ohlcv_frame.index.get_level_values(0).values.astype(
+            'datetime64[m]',
+        ).astype(np.int64)
+        sessions = minute_positions(
+            self._market_opens,
+            minutes,
+            self._minutes_per_day,
+        ) // self._minutes_per_day
+        blocks = (
+            (sessions - sessions.min()) //
+            self._sessions_per_block(len(set(sids)))
+        )
+        for _, block in ohlcv_frame.groupby(blocks):
+            self.write(
+                {field: block[field].unstack() for field in FIELDS},
+                invalid_data_behavior,
+            )
+
+
+class HDF5MinuteBarReader(MinuteBarReader):
+    """
+    Reader for data written by HDF5MinuteBarWriter.
+
+    Parameters
+    ----------
+    h5_file : h5py.File
+        An HDF5 minute pricing file.
+
+    See Also
+    --------
+    zipline.data.hdf5_minute_bars.HDF5MinuteBarWriter
+    """
+    def __init__(self, h5_file):
+        attrs = h5_file.attrs
+        if attrs['version'] != VERSION:
+            raise ValueError(
+                'mismatched version: file is of version %s, expected %s' % (
+                    attrs['version'],
+                    VERSION,
+                ),
+            )
+
+        self._h5_file = h5_file
+        self.calendar = get_calendar(attrs[CALENDAR_NAME])
+        self._start_session = pd.Timestamp(attrs[START_SESSION], tz='UTC')
+        self._end_session = pd.Timestamp(attrs[END_SESSION], tz='UTC')
+        self._minutes_per_day = int(attrs[MINUTES_PER_DAY])
+
+        self._market_opens, self._market_closes = _schedule_minutes(
+            self.calendar,
+            self._start_session,
+            self._end_session,
+        )
+
+        self.sids = h5_file[INDEX][SID][:].astype(np.int64)
+        self._ohlc_inverses = 1.0 / h5_file[INDEX][OHLC_RATIO_KEY][:]
+
+        self._last_get_value_dt_value = None
+        self._last_get_value_dt_position = None
+
+    @classmethod
+    def from_path(cls, path):
+        """
+        Construct from a file path.
+
+        Parameters
+        ----------
+        path : str
+            The path to an HDF5 minute pricing file.
+        """
+        return cls(h5py.File(path, 'r'))
+
+    @lazyval
+    def _arrays(self):
+        """
+        Map from field to the array from which to read it.
+
+        Uncompressed, contiguous datasets are memory-mapped. Otherwise, the
+        h5py datasets are read directly.
+        """
+        out = {}
+        for field in FIELDS:
+            dataset = self._h5_file[DATA][field]
+            offset = None
+            if dataset.chunks is None and dataset.compression is None:
+                offset = dataset.id.get_offset()
+            if offset is None:
+                out[field] = dataset
+            else:
+                out[field] = np.memmap(
+                    self._h5_file.filename,
+                    dtype=dataset.dtype,
+                    mode='r',
+                    offset=offset,
+                    shape=dataset.shape,
+                )
+        return out
+
+    @property
+    def trading_calendar(self):
+        return self.calendar
+
+    @lazyval
+    def last_available_dt(self):
+        _, close = self.calendar.open_and_close_for_session(self._end_session)
+        return close
+
+    @property
+    def first_trading_day(self):
+        return self._start_session
+
+    @lazyval
+    def _session_lengths(self):
+        return self._market_closes - self._market_opens + 1
+
+    def _positions(self, dts):
+        minutes = np.asarray(
+            pd.DatetimeIndex(dts).values.astype('datetime64[m]'),
+        ).astype(np.int64)
+        return minute_positions(
+            self._market_opens,
+            minutes,
+            self._minutes_per_day,
+        )
+
+    def _sid_indices(self, sids):
+        sids = np.asarray(sids, dtype=np.int64)
+        sid_ixs = self.sids.searchsorted(sids)
+        unknown = np.in1d(sids, self.sids, invert=True)
+        if unknown.any():
+            raise NoDataForSid(
+                'No minute data for sids {}.'.format(sids[unknown])
+            )
+        return sid_ixs
+
+    def _market_rows(self, start_pos, end_pos):
+        """
+        Get a mask of the rows in ``[start_pos, end_pos]`` that are market
+        minutes, or None if they all are.
+
+        Sessions that close early leave empty rows between their close and
+        the end of their block of ``minutes_per_day`` rows.
+        """
+        positions = np.arange(start_pos, end_pos + 1)
+        session_ixs, offsets = np.divmod(positions, self._minutes_per_day)
+        mask = offsets < self._session_lengths[session_ixs]
+        if mask.all():
+            return None
+        return mask
+
+    def _postprocess(self, field, raw, sid_ixs):
+        if field == VOLUME:
+            return raw
+        return np.where(
+            raw == 0,
+            np.nan,
+            raw * self._ohlc_inverses[sid_ixs],
+        )
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        start_pos, end_pos = self._positions([start_dt, end_dt])
+        sid_ixs = self._sid_indices(sids)
+        market_rows = self._market_rows(start_pos, end_pos)
+
+        out = []
+        for field in fields:
+            # Every session is stored contiguously for every sid, so read
+            # all of the rows in the window at once, then select sids.
+            block = self._arrays[field][start_pos:end_pos + 1]
+            if market_rows is not None:
+                block = block[market_rows]
+            out.append(self._postprocess(field, block[:, sid_ixs], sid_ixs))
+        return out
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+        dt : datetime-like
+            The datetime at which the trade occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : float|int
+            The market data for the given sid, dt, and field coordinates.
+            OHLC values are nan and volume is 0 if no trade occurred.
+        """
+        if self._last_get_value_dt_value == dt.value:
+            pos = self._last_get_value_dt_position
+        else:
+            pos = self._positions([dt])[0]
+            self._last_get_value_dt_value = dt.value
+            self._last_get_value_dt_position = pos
+
+        sid_ix = self._sid_indices([sid])[0]
+        value = self._arrays[field][pos, sid_ix]
+        if field == VOLUME:
+            return int(value)
+        if value == 0:
+            return np.nan
+        return value * self._ohlc_inverses[sid_ix]
+
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the pricing info for the given sids, dt, and fields.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        pos = self._positions([dt])[0]
+        sid_ixs = self._sid_indices([int(sid) for sid in sids])
+
+        # Only read the span of columns holding the requested sids, so that
+        # we don't decompress the chunks of every other sid.
+        if len(sid_ixs):
+            lo, hi = sid_ixs.min(), sid_ixs.max() + 1
+        else:
+            lo = hi = 0
+
+        out = []
+        for field in fields:
+            raw = self._arrays[field][pos, lo:hi][sid_ixs - lo]
+            if field == VOLUME:
+                out.append(raw.astype(np.int64))
+            else:
+                out.append(self._postprocess(field, raw, sid_ixs))
+        return out
+
+    def get_last_traded_dt(self, asset, dt):
+        """
+        Get the latest minute on or before ``dt`` in which ``asset`` traded.
+
+        If there are no trades on or before ``dt``, returns ``pd.NaT``.
+        """
+        sid_ix = self._sid_indices([asset.sid])[0]
+        minutes_per_day = self._minutes_per_day
+        opens = self._market_opens
+
+        dt_minute = dt.value // (60 * 10 ** 9)
+        session_ix = opens.searchsorted(dt_minute, side='right') - 1
+        if session_ix < 0:
+            return pd.NaT
+        offset = min(
+            dt_minute - opens[session_ix],
+            self._session_lengths[session_ix] - 1,
+        )
+        stop = session_ix * minutes_per_day + offset + 1
+
+        # Don't look before the session in which the asset started.
+        start_minute = asset.start_date.value // (60 * 10 ** 9)
+        first = max(opens.searchsorted(start_minute, side='right') - 1, 0)
+        lower_bound = first * minutes_per_day
+
+        # Search backwards a few sessions at a time, so that recent trades
+        # are found with a single read.
+        volumes = self._arrays[VOLUME]
+        step = minutes_per_day * 20
+        while stop > lower_bound:
+            start = max(stop - step, lower_bound)
+            traded = np.flatnonzero(volumes[start:stop, sid_ix])
+            # Ignore anything written after an early close.
+            market_rows = self._market_rows(start, stop - 1)
+            if market_rows is not None:
+                traded = traded[market_rows[traded]]
+            if len(traded):
+                pos = start + traded[-1]
+                session_ix, offset = divmod(pos, minutes_per_day)
+                return pd.Timestamp(
+                    opens[session_ix] + offset,
+                    unit='m',
+                    tz='UTC',
+                )
+            stop = start
+        return pd.NaT
@@ -17,9 +17,9 @@ from abc import (
     abstractmethod,
     abstractproperty,
 )
+from collections import namedtuple
 
-from numpy import concatenate
-from lru import LRU
+from numpy import asarray, concatenate, newaxis, shares_memory
 from pandas import isnull
 from toolz import sliding_window
 
@@ -30,7 +30,7 @@ from zipline.assets.continuous_futures import ContinuousFuture
 from zipline.lib._int64window import AdjustedArrayWindow as Int64Window
 from zipline.lib._float64window import AdjustedArrayWindow as Float64Window
 from zipline.lib.adjustment import Float64Multiply, Float64Add
-from zipline.utils.cache import ExpiringCache
+from zipline.utils.cache import ByteBudgetLRU, ExpiringCache
 from zipline.utils.math_utils import number_of_decimal_places
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import float64_dtype
@@ -255,6 +255,40 @@ class ContinuousFutureAdjustmentReader(object):
         return adjs
 
 
+HistoryCacheStats = namedtuple(
+    'HistoryCacheStats',
+    'hits misses evictions nbytes',
+)
+
+
+def _cached_window_nbytes(cached):
+    return cached._unsafe_get_value().nbytes
+
+
+def history_window_cache(max_bytes=None, max_items=None):
+    """
+    Create a cache for the sliding windows of HistoryLoaders.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The total size of the windows above which the least recently used
+        windows are evicted.
+    max_items : int, optional
+        The number of windows above which the least recently used windows are
+        evicted.
+
+    Returns
+    -------
+    cache : ByteBudgetLRU
+    """
+    return ByteBudgetLRU(
+        _cached_window_nbytes,
+        max_bytes=max_bytes,
+        max_items=max_items,
+    )
+
+
 class SlidingWindow(object):
     """
     Wrapper around an AdjustedArrayWindow which supports monotonically
@@ -276,6 +310,19 @@ class SlidingWindow(object):
         self.offset = offset
         self.most_recent_ix = self.cal_start + size
 
+    @property
+    def nbytes(self):
+        """
+        The number of bytes held by the window.
+        """
+        data = asarray(self.window.data)
+        nbytes = data.nbytes
+        # ``current`` is usually a view into the window's data, which is
+        # already counted.
+        if not shares_memory(self.current, data):
+            nbytes += self.current.nbytes
+        return nbytes
+
     def get(self, end_ix):
         """
         Returns
@@ -293,6 +340,87 @@ class SlidingWindow(object):
         return self.current
 
 
+class FactorAdjustedWindow(object):
+    """
+    Sliding window over raw pricing data, which applies adjustments by
+    scaling each row by the ratio of its cumulative adjustment factor to the
+    factor at the window's perspective.
+
+    Supports the same requests as SlidingWindow, but doesn't need to copy and
+    mutate the data as the window moves past adjustments.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Raw pricing data with prefetched values beyond the current simulation
+        dt, with shape (n, 1).
+    factors : np.ndarray
+        Cumulative adjustment factor of each row of ``data``, followed by the
+        factor of the row after the data if the window is viewed after its
+        last dt.
+    size : int
+        Number of rows in the window.
+    cal_start : int
+        Index in the overall calendar at which the data starts.
+    perspective_offset : int
+        1 if the window is viewed after its last dt, otherwise 0.
+    rounding_places : int
+        Number of decimal places to which adjusted values are rounded.
+
+    See Also
+    --------
+    zipline.data.adjustment_factors.AdjustmentFactors
+    """
+
+    def __init__(self,
+                 data,
+                 factors,
+                 size,
+                 cal_start,
+                 perspective_offset,
+                 rounding_places):
+        self.data = data
+        self.factors = factors
+        self.size = size
+        self.cal_start = cal_start
+        self.perspective_offset = perspective_offset
+        self.rounding_places = rounding_places
+        self.most_recent_ix = cal_start + size - 1
+        self.current = self._window(self.most_recent_ix)
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes held by the window.
+        """
+        return self.data.nbytes + self.factors.nbytes + self.current.nbytes
+
+    def _window(self, end_ix):
+        end = end_ix - self.cal_start + 1
+        perspective = min(
+            end - 1 + self.perspective_offset,
+            len(self.factors) - 1,
+        )
+        scale = self.factors[end - self.size:end] / self.factors[perspective]
+        out = (self.data[end - self.size:end] * scale[:, newaxis]).round(
+            self.rounding_places,
+        )
+        out.setflags(write=False)
+        return out
+
+    def get(self, end_ix):
+        """
+        Returns
+        -------
+        out : A np.ndarray of the equity pricing up to end_ix after adjustments
+              and rounding have been applied.
+        """
+        if self.most_recent_ix != end_ix:
+            self.current = self._window(end_ix)
+            self.most_recent_ix = end_ix
+        return self.current
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -304,7 +432,18 @@ class HistoryLoader(with_metaclass(ABCMeta)):
     reader : DailyBarReader, MinuteBarReader
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
-        Reader for adjustment data.
+        Reader for adjustment data. If it has cumulative adjustment factors,
+        equity windows are adjusted with those instead of with adjustment
+        objects.
+    sid_cache_size : int, optional
+        The number of windows to cache per field, if ``window_cache`` isn't
+        provided.
+    prefetch_length : int, optional
+        The number of bars past the end of a window to load when creating
+        the window.
+    window_cache : ByteBudgetLRU, optional
+        The cache in which to store sliding windows, which may be shared by
+        several loaders. See :func:`history_window_cache`.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume', 'sid')
 
@@ -312,11 +451,15 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                  asset_finder,
                  roll_finders=None,
                  sid_cache_size=1000,
-                 prefetch_length=0):
+                 prefetch_length=0,
+                 window_cache=None):
         self.trading_calendar = trading_calendar
         self._asset_finder = asset_finder
         self._reader = reader
         self._adjustment_readers = {}
+        self._equity_adjustment_factors = getattr(
+            equity_adjustment_reader, 'factors', None,
+        )
         if equity_adjustment_reader is not None:
             self._adjustment_readers[Equity] = \
                 HistoryCompatibleUSEquityAdjustmentReader(
@@ -328,10 +471,14 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                                                  reader,
                                                  roll_finders,
                                                  self._frequency)
-        self._window_blocks = {
-            field: ExpiringCache(LRU(sid_cache_size))
-            for field in self.FIELDS
-        }
+        if window_cache is None:
+            window_cache = history_window_cache(
+                max_items=sid_cache_size * len(self.FIELDS),
+            )
+        self._window_cache = window_cache
+        self._window_blocks = ExpiringCache(window_cache)
+        self.cache_hits = 0
+        self.cache_misses = 0
         self._prefetch_length = prefetch_length
 
     @abstractproperty
@@ -361,6 +508,30 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
+    def _window_key(self, asset, size, field, is_perspective_after):
+        # Include the frequency, so that daily and minute loaders can share a
+        # cache.
+        return (self._frequency, field, asset, size, is_perspective_after)
+
+    def cache_stats(self):
+        """
+        Get statistics about this loader's cache of sliding windows.
+
+        Returns
+        -------
+        stats : HistoryCacheStats
+            The number of requests for a window which were served from the
+            cache and which required loading a new window, the number of
+            windows evicted, and the total size of the cached windows. If the
+            cache is shared, evictions and size cover every loader using it.
+        """
+        return HistoryCacheStats(
+            hits=self.cache_hits,
+            misses=self.cache_misses,
+            evictions=self._window_cache.evictions,
+            nbytes=self._window_cache.nbytes,
+        )
+
     def _ensure_sliding_windows(self, assets, dts, field,
                                 is_perspective_after):
         """
@@ -402,8 +573,10 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         for asset in assets:
             try:
-                window = self._window_blocks[field].get(
-                    (asset, size, is_perspective_after), end)
+                window = self._window_blocks.get(
+                    self._window_key(asset, size, field, is_perspective_after),
+                    end,
+                )
             except KeyError:
                 needed_assets.append(asset)
             else:
@@ -415,6 +588,9 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                 else:
                     asset_windows[asset] = window
 
+        self.cache_misses += len(needed_assets)
+        self.cache_hits += len(assets) - len(needed_assets)
+
         if needed_assets:
             offset = 0
             start_ix = find_in_sorted_index(cal, dts[0])
@@ -439,7 +615,39 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             if field == 'volume':
                 array = array.astype(float64_dtype)
 
+            factors = {}
+            if self._equity_adjustment_factors is not None and \
+                    field != 'sid':
+                equities = [asset for asset in needed_assets
+                            if isinstance(asset, Equity)]
+                factors = dict(zip(
+                    equities,
+                    self._equity_adjustment_factors.cumulative_factors(
+                        field,
+                        [asset.sid for asset in equities],
+                        adj_dts,
+                    ).T,
+                ))
+
             for i, asset in enumerate(needed_assets):
+                if asset in factors:
+                    sliding_window = FactorAdjustedWindow(
+                        array[:, i].reshape(prefetch_len, 1),
+                        factors[asset],
+                        size,
+                        start_ix,
+                        int(is_perspective_after),
+                        self._decimal_places_for_asset(asset, dts[-1]),
+                    )
+                    asset_windows[asset] = sliding_window
+                    self._window_blocks.set(
+                        self._window_key(
+                            asset, size, field, is_perspective_after,
+                        ),
+                        sliding_window,
+                        prefetch_end)
+                    continue
+
                 adj_reader = None
                 try:
                     adj_reader = self._adjustment_readers[type(asset)]
@@ -461,8 +669,8 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                 )
                 sliding_window = SlidingWindow(window, size, start_ix, offset)
                 asset_windows[asset] = sliding_window
-                self._window_blocks[field].set(
-                    (asset, size, is_perspective_after),
+                self._window_blocks.set(
+                    self._window_key(asset, size, field, is_perspective_after),
                     sliding_window,
                     prefetch_end)
 
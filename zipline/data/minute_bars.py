@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
+from collections import deque
+import errno
 import json
 import os
 from glob import glob
 from os.path import join
+import shutil
 from textwrap import dedent
+import uuid
 
 from lru import LRU
 import bcolz
@@ -43,6 +47,7 @@ from zipline.data.bcolz_daily_bars import check_uint32_safe
 from zipline.utils.cli import maybe_show_progress
 from zipline.utils.compat import mappingproxy
 from zipline.utils.memoize import lazyval
+from zipline.utils.pool import fork_pool
 
 
 logger = logbook.Logger('MinuteBars')
@@ -54,6 +59,10 @@ DEFAULT_EXPECTEDLEN = US_EQUITIES_MINUTES_PER_DAY * 252 * 15
 
 OHLC_RATIO = 1000
 
+# The name of the file in a minute bar directory which lists the sids that
+# have been completely written, one per line.
+CHECKPOINT_FILENAME = 'written_sids'
+
 
 class BcolzMinuteOverlappingData(Exception):
     pass
@@ -349,6 +358,24 @@ class BcolzMinuteBarMetadata(object):
             json.dump(metadata, fp)
 
 
+# Map from key -> BcolzMinuteBarWriter for writes being done in worker
+# processes. Entries are added before the workers are forked so that they are
+# inherited by the workers instead of being pickled.
+_WRITE_JOBS = {}
+
+
+def _write_sid_in_worker(key, sid, df, invalid_data_behavior):
+    """
+    Write the data for a single sid with a writer registered in
+    ``_WRITE_JOBS``.
+
+    This is the unit of work submitted to worker processes by
+    :meth:`BcolzMinuteBarWriter._write_in_processes`.
+    """
+    _WRITE_JOBS[key].write_sid(sid, df, invalid_data_behavior)
+    return sid
+
+
 class BcolzMinuteBarWriter(object):
     """
     Class capable of writing minute OHLCV data to disk into bcolz format.
@@ -392,6 +419,10 @@ class BcolzMinuteBarWriter(object):
         If True, writes the minute bar metadata (on init of the writer).
         If False, no metadata is written (existing metadata is
         retained). Default is True.
+    processes : int, optional
+        The number of worker processes among which :meth:`write` divides
+        the sids. By default, all of the sids are written in the current
+        process.
 
     Notes
     -----
@@ -401,6 +432,12 @@ class BcolzMinuteBarWriter(object):
     Each individual asset's data is stored as a bcolz table with a column for
     each pricing field: (open, high, low, close, volume)
 
+    Each ``(sid, df)`` pair written by :meth:`write` is recorded in a
+    checkpoint file in the root directory, along with the last minute of
+    ``df``, once its data has been flushed. An interrupted write can be
+    finished by opening the directory with ``open(rootdir, resume=True)`` and
+    writing the same data again.
+
     The open, high, low, and close columns are integers which are 1000 times
     the quoted price, so that the data can represented and stored as an
     np.uint32, supporting market prices quoted up to the thousands place.
@@ -449,7 +486,13 @@ class BcolzMinuteBarWriter(object):
                  default_ohlc_ratio=OHLC_RATIO,
                  ohlc_ratios_per_sid=None,
                  expectedlen=DEFAULT_EXPECTEDLEN,
-                 write_metadata=True):
+                 write_metadata=True,
+                 processes=None):
+
+        if processes is not None and processes < 1:
+            raise ValueError(
+                "processes must be at least 1, got %r" % (processes,)
+            )
 
         self._rootdir = rootdir
         self._start_session = start_session
@@ -463,6 +506,8 @@ class BcolzMinuteBarWriter(object):
         self._expectedlen = expectedlen
         self._default_ohlc_ratio = default_ohlc_ratio
         self._ohlc_ratios_per_sid = ohlc_ratios_per_sid
+        self._processes = processes
+        self._resumed_dts = {}
 
         self._minute_index = _calc_minute_index(
             self._schedule.market_open, self._minutes_per_day)
@@ -479,7 +524,7 @@ class BcolzMinuteBarWriter(object):
             metadata.write(self._rootdir)
 
     @classmethod
-    def open(cls, rootdir, end_session=None):
+    def open(cls, rootdir, end_session=None, resume=False, processes=None):
         """
         Open an existing ``rootdir`` for writing.
 
@@ -487,9 +532,16 @@ class BcolzMinuteBarWriter(object):
         ----------
         end_session : Timestamp (optional)
             When appending, the intended new ``end_session``.
+        resume : bool, optional
+            Finish an interrupted write. Data which was written before the
+            interruption is skipped by :meth:`write`. Anything written after
+            the last checkpoint of each sid, which may be incomplete, is
+            removed.
+        processes : int, optional
+            The number of worker processes used by :meth:`write`.
         """
         metadata = BcolzMinuteBarMetadata.read(rootdir)
-        return BcolzMinuteBarWriter(
+        writer = BcolzMinuteBarWriter(
             rootdir,
             metadata.calendar,
             metadata.start_session,
@@ -497,8 +549,69 @@ class BcolzMinuteBarWriter(object):
             metadata.minutes_per_day,
             metadata.default_ohlc_ratio,
             metadata.ohlc_ratios_per_sid,
-            write_metadata=end_session is not None
+            write_metadata=end_session is not None,
+            processes=processes,
         )
+        if resume:
+            writer._resume()
+        return writer
+
+    @property
+    def _checkpoint_path(self):
+        return join(self._rootdir, CHECKPOINT_FILENAME)
+
+    def checkpoints(self):
+        """
+        Get the last minute written by :meth:`write` for each sid.
+
+        Returns
+        -------
+        checkpoints : dict[int -> pd.Timestamp]
+        """
+        checkpoints = {}
+        try:
+            with open(self._checkpoint_path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    sid, dt = line.split()
+                    # the minutes of each sid are written in order, so the
+                    # last checkpoint of a sid is its latest
+                    checkpoints[int(sid)] = pd.Timestamp(int(dt), tz='UTC')
+        except IOError as e:
+            if e.errno != errno.ENOENT:
+                raise
+        return checkpoints
+
+    def _checkpoint(self, sid, dt):
+        with open(self._checkpoint_path, 'a') as f:
+            f.write('%d %d\n' % (sid, pd.Timestamp(dt).value))
+
+    def _resume(self):
+        """
+        Prepare to finish an interrupted write.
+        """
+        written = self.checkpoints()
+        for path in glob(join(self._rootdir, '*', '*', '*.bcolz')):
+            sid = int(os.path.basename(path)[:-len('.bcolz')])
+            try:
+                dt = written[sid]
+            except KeyError:
+                logger.info('Removing partially written sid {}.', sid)
+                shutil.rmtree(path)
+                continue
+
+            # drop whatever was written after the last checkpoint
+            end = self._minute_index.get_loc(dt) + 1
+            table = bcolz.ctable(rootdir=path, mode='a')
+            if len(table) > end:
+                logger.info(
+                    'Truncating sid {} after its last checkpoint {}.',
+                    sid,
+                    dt,
+                )
+                table.resize(end)
+        self._resumed_dts = written
 
     @property
     def first_trading_day(self):
@@ -665,7 +778,11 @@ class BcolzMinuteBarWriter(object):
         for k, v in kwargs.items():
             table.attrs[k] = v
 
-    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+    def write(self,
+              data,
+              show_progress=False,
+              invalid_data_behavior='warn',
+              processes=None):
         """Write a stream of minute data.
 
         Parameters
@@ -684,17 +801,112 @@ class BcolzMinuteBarWriter(object):
             the dates must be strictly increasing.
         show_progress : bool, optional
             Whether or not to show a progress bar while writing.
+        processes : int, optional
+            The number of worker processes among which to divide the sids.
+            Defaults to the ``processes`` the writer was created with.
+
+        Notes
+        -----
+        If the writer was opened with ``resume=True``, the minutes of each
+        sid up to the last one written before the write was interrupted are
+        skipped.
         """
+        if processes is None:
+            processes = self._processes
+        elif processes < 1:
+            raise ValueError(
+                "processes must be at least 1, got %r" % (processes,)
+            )
+
         ctx = maybe_show_progress(
             data,
             show_progress=show_progress,
             item_show_func=lambda e: e if e is None else str(e[0]),
             label="Merging minute equity files:",
         )
-        write_sid = self.write_sid
         with ctx as it:
-            for e in it:
-                write_sid(*e, invalid_data_behavior=invalid_data_behavior)
+            if self._resumed_dts:
+                it = self._skip_resumed_data(it)
+
+            if processes is None or processes == 1:
+                write_sid = self.write_sid
+                checkpoint = self._checkpoint
+                for sid, df in it:
+                    write_sid(
+                        sid,
+                        df,
+                        invalid_data_behavior=invalid_data_behavior,
+                    )
+                    checkpoint(sid, df.index[-1])
+            else:
+                self._write_in_processes(it, processes, invalid_data_behavior)
+
+    def _skip_resumed_data(self, data):
+        resumed_dts = self._resumed_dts
+        for sid, df in data:
+            try:
+                dt = resumed_dts[sid]
+            except KeyError:
+                yield sid, df
+                continue
+
+            df = df[df.index.values > dt.to_datetime64()]
+            if df.empty:
+                logger.debug(
+                    'Skipping data for sid {}, which is already written.',
+                    sid,
+                )
+                continue
+            yield sid, df
+
+    def _write_in_processes(self, data, processes, invalid_data_behavior):
+        """
+        Write each ``(sid, df)`` pair in ``data`` in a pool of forked worker
+        processes.
+
+        Each sid is written to its own table, so different sids are written
+        concurrently. Writes of the same sid are kept in order by waiting for
+        a sid's pending write to finish before submitting the next one.
+
+        The writer is not pickled. Instead, it is stored in a module-level
+        registry before the workers are forked, and each task only carries
+        the registry key and the data of its sid.
+        """
+        key = uuid.uuid4().hex
+        _WRITE_JOBS[key] = self
+        try:
+            pool = fork_pool(processes)
+            try:
+                # Bound the number of frames waiting to be written so that
+                # we don't read all of ``data`` into memory.
+                max_pending = 2 * processes
+                pending = deque()
+                pending_sids = set()
+                for sid, df in data:
+                    while len(pending) >= max_pending or sid in pending_sids:
+                        self._finish_pending_write(pending, pending_sids)
+                    pending.append((sid, df.index[-1], pool.apply_async(
+                        _write_sid_in_worker,
+                        (key, sid, df, invalid_data_behavior),
+                    )))
+                    pending_sids.add(sid)
+                while pending:
+                    self._finish_pending_write(pending, pending_sids)
+            except BaseException:
+                pool.terminate()
+                raise
+            else:
+                pool.close()
+            finally:
+                pool.join()
+        finally:
+            del _WRITE_JOBS[key]
+
+    def _finish_pending_write(self, pending, pending_sids):
+        sid, dt, result = pending.popleft()
+        result.get()
+        pending_sids.remove(sid)
+        self._checkpoint(sid, dt)
 
     def write_sid(self, sid, df, invalid_data_behavior='warn'):
         """
@@ -988,6 +1200,29 @@ class BcolzMinuteBarReader(MinuteBarReader):
         # fallback to the default.
         return self._default_ohlc_inverse
 
+    @lazyval
+    def _ohlc_inverses_table(self):
+        """
+        The sids with their own OHLC ratio, sorted, and their ratio inverses.
+        """
+        inverses = self._ohlc_inverses_per_sid or {}
+        sids = np.array(sorted(inverses), dtype=np.int64)
+        return sids, np.array([inverses[sid] for sid in sids], dtype=float)
+
+    def _ohlc_ratio_inverses_for_sids(self, sids):
+        """
+        Get the OHLC ratio inverse of each of ``sids`` as an array.
+        """
+        sids = np.fromiter(map(int, sids), dtype=np.int64, count=len(sids))
+        out = np.full(len(sids), self._default_ohlc_inverse)
+
+        known_sids, inverses = self._ohlc_inverses_table
+        if len(known_sids):
+            ixs = known_sids.searchsorted(sids).clip(max=len(known_sids) - 1)
+            found = known_sids[ixs] == sids
+            out[found] = inverses[ixs[found]]
+        return out
+
     def _minutes_to_exclude(self):
         """
         Calculate the minutes which should be excluded when a window
@@ -1123,17 +1358,7 @@ class BcolzMinuteBarReader(MinuteBarReader):
             Returns the integer value of the volume.
             (A volume of 0 signifies no trades for the given dt.)
         """
-        if self._last_get_value_dt_value == dt.value:
-            minute_pos = self._last_get_value_dt_position
-        else:
-            try:
-                minute_pos = self._find_position_of_minute(dt)
-            except ValueError:
-                raise NoDataOnDate()
-
-            self._last_get_value_dt_value = dt.value
-            self._last_get_value_dt_position = minute_pos
-
+        minute_pos = self._get_value_position(dt)
         try:
             value = self._open_minute_file(field, sid)[minute_pos]
         except IndexError:
@@ -1148,6 +1373,60 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def _get_value_position(self, dt):
+        """
+        Get the position of ``dt``, caching the most recent lookup, since
+        spot values are usually read for many sids at the same dt.
+        """
+        if self._last_get_value_dt_value == dt.value:
+            return self._last_get_value_dt_position
+
+        try:
+            minute_pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        # Minutes before the first session don't raise a ValueError, but
+        # they get a negative position.
+        if minute_pos < 0:
+            raise NoDataOnDate()
+
+        self._last_get_value_dt_value = dt.value
+        self._last_get_value_dt_position = minute_pos
+        return minute_pos
+
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the pricing info for the given sids, dt, and fields.
+
+        Each sid's field is stored in its own carray, so values are still
+        read one sid at a time, but ``dt`` is only located once and prices
+        are converted for every sid at once.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        minute_pos = self._get_value_position(dt)
+
+        ohlc_inverses = None
+        out = []
+        for field in fields:
+            raw = np.zeros(len(sids), dtype=np.uint32)
+            for i, sid in enumerate(sids):
+                carray = self._open_minute_file(field, sid)
+                # Sids whose data ends before ``dt`` have no value.
+                if minute_pos < len(carray):
+                    raw[i] = carray[minute_pos]
+
+            if field == 'volume':
+                out.append(raw.astype(np.int64))
+            else:
+                if ohlc_inverses is None:
+                    ohlc_inverses = self._ohlc_ratio_inverses_for_sids(sids)
+                out.append(np.where(raw == 0, np.nan, raw * ohlc_inverses))
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
@@ -1250,46 +1529,57 @@ class BcolzMinuteBarReader(MinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        num_minutes = (end_idx - start_idx + 1)
+        num_positions = end_idx - start_idx + 1
+        market_rows = self._market_rows_for_range(start_idx, end_idx)
 
-        results = []
+        ohlc_inverses = self._ohlc_ratio_inverses_for_sids(sids)
 
-        indices_to_exclude = self._exclusion_indices_for_range(
-            start_idx, end_idx)
-        if indices_to_exclude is not None:
-            for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
+        results = []
+        for field in fields:
+            # Read each sid's values into a column of a single buffer, then
+            # drop the positions excluded by early closes from every sid at
+            # once. Positions past the end of a sid's data are left as 0.
+            raw = np.zeros((num_positions, len(sids)), dtype=np.uint32)
+            for i, sid in enumerate(sids):
+                values = self._open_minute_file(field, sid)[
+                    start_idx:end_idx + 1
+                ]
+                raw[:len(values), i] = values
 
-        shape = num_minutes, len(sids)
+            if market_rows is not None:
+                raw = raw[market_rows]
 
-        for field in fields:
             if field != 'volume':
-                out = np.full(shape, np.nan)
+                out = np.where(raw == 0, np.nan, raw * ohlc_inverses)
             else:
-                out = np.zeros(shape, dtype=np.uint32)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
+                out = raw
 
             results.append(out)
         return results
 
+    def _market_rows_for_range(self, start_idx, end_idx):
+        """
+        Get the rows of a window of positions from ``start_idx`` to
+        ``end_idx`` that aren't excluded because of early closes.
+
+        Returns
+        -------
+        rows : np.array[int64] or None
+            The indices, relative to ``start_idx``, of the positions to
+            keep, or None if no positions in the range are excluded.
+        """
+        indices_to_exclude = self._exclusion_indices_for_range(
+            start_idx, end_idx)
+        if indices_to_exclude is None:
+            return None
+
+        keep = np.ones(end_idx - start_idx + 1, dtype=bool)
+        for excl_start, excl_stop in indices_to_exclude:
+            keep[
+                max(excl_start - start_idx, 0):excl_stop - start_idx + 1
+            ] = False
+        return np.flatnonzero(keep)
+
 
 class MinuteBarUpdateReader(with_metaclass(ABCMeta, object)):
     """
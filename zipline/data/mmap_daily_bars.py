@@ -0,0 +1,539 @@
+"""
+Memory-Mapped Daily Pricing Format
+----------------------------------
+A directory containing an uncompressed file per OHLCV field and a JSON
+metadata file.
+
+Each field is stored as a raw 2D array with a row per session and a column
+per sid, in C order. Prices are stored as float64, with nan for missing
+values, and volumes are stored as uint32, so the stored values are exactly
+the values returned by the reader. Each array starts at the beginning of its
+own file, so it's page-aligned, and reading a range of sessions for a run of
+consecutive sids doesn't require any decoding or copying.
+
+.. code-block:: none
+
+   /metadata.json
+   /open.dat
+   /high.dat
+   /low.dat
+   /close.dat
+   /volume.dat
+
+The metadata contains the format version, the name of the trading calendar,
+the first and last sessions, the sids aligned to the columns of each array,
+and the indices of the first and last sessions with data for each sid.
+
+Because the data is memory-mapped read-only, processes reading the same
+files share the operating system's page cache instead of each holding a
+private copy of the data.
+"""
+import json
+import os
+from os.path import join
+
+import logbook
+import numpy as np
+import pandas as pd
+from trading_calendars import get_calendar
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.bcolz_daily_bars import UINT32_MAX
+from zipline.data.hdf5_daily_bars import compute_asset_lifetimes
+from zipline.data.session_bars import SessionBarReader
+from zipline.utils.input_validation import expect_element
+from zipline.utils.memoize import lazyval
+from zipline.utils.pandas_utils import check_indexes_all_same
+
+
+log = logbook.Logger('MMapDailyBars')
+
+VERSION = 0
+
+METADATA_FILENAME = 'metadata.json'
+
+OPEN = 'open'
+HIGH = 'high'
+LOW = 'low'
+CLOSE = 'close'
+VOLUME = 'volume'
+
+FIELDS = (OPEN, HIGH, LOW, CLOSE, VOLUME)
+
+FIELD_DTYPES = {
+    OPEN: np.dtype('float64'),
+    HIGH: np.dtype('float64'),
+    LOW: np.dtype('float64'),
+    CLOSE: np.dtype('float64'),
+    VOLUME: np.dtype('uint32'),
+}
+
+MISSING_VALUES = {
+    OPEN: np.nan,
+    HIGH: np.nan,
+    LOW: np.nan,
+    CLOSE: np.nan,
+    VOLUME: 0,
+}
+
+
+def field_path(rootdir, field):
+    return join(rootdir, field + '.dat')
+
+
+class MMapDailyBarWriter(object):
+    """
+    Class capable of writing daily OHLCV data to disk in a format that
+    can be read by MMapDailyBarReader without copying.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory in which to write the data. It's created if it
+        doesn't exist, and any existing data in it is replaced.
+    calendar : trading_calendars.TradingCalendar
+        Calendar to use to compute asset calendar offsets.
+    start_session : pd.Timestamp
+        The first trading session in the data set.
+    end_session : pd.Timestamp
+        The last trading session in the data set.
+
+    See Also
+    --------
+    zipline.data.mmap_daily_bars.MMapDailyBarReader
+    """
+    def __init__(self, rootdir, calendar, start_session, end_session):
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+
+    @lazyval
+    def _sessions(self):
+        return self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+
+    @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
+    def write(self, frames, invalid_data_behavior='warn'):
+        """
+        Write OHLCV data for every sid at once.
+
+        Parameters
+        ----------
+        frames : dict[str, pd.DataFrame]
+            A dict mapping each OHLCV field to a dataframe with a row for
+            each session and a column for each sid. The dataframes need to
+            have the same index and columns. Sessions without a row are
+            written as missing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            What to do when a volume is too large to be stored as a uint32.
+            Unless this is 'raise', invalid volumes are written as 0.
+        """
+        frames = {field: frames[field] for field in FIELDS}
+        check_indexes_all_same(
+            [frame.index for frame in frames.values()],
+            message='Frames have mismatched days.',
+        )
+        check_indexes_all_same(
+            [frame.columns for frame in frames.values()],
+            message='Frames have mismatched sids.',
+        )
+        for field in FIELDS:
+            frames[field] = frames[field].sort_index(axis='columns')
+
+        days = frames[CLOSE].index.values
+        sids = frames[CLOSE].columns.values.astype(np.int64)
+
+        session_values = self._sessions.values
+        day_ixs = session_values.searchsorted(days)
+        in_range = day_ixs < len(session_values)
+        if not in_range.all() or (session_values[day_ixs] != days).any():
+            raise ValueError(
+                'Frames contain days that are not sessions between {} and {}'
+                ' in the {} calendar.'.format(
+                    self._start_session.date(),
+                    self._end_session.date(),
+                    self._calendar.name,
+                )
+            )
+
+        if not os.path.exists(self._rootdir):
+            os.makedirs(self._rootdir)
+
+        # Remove the metadata first, so that a partially written directory
+        # can't be read.
+        metadata_path = join(self._rootdir, METADATA_FILENAME)
+        if os.path.exists(metadata_path):
+            os.remove(metadata_path)
+
+        shape = (len(session_values), len(sids))
+        for field in FIELDS:
+            values = frames[field].values
+            if field == VOLUME:
+                values = np.nan_to_num(values.astype(np.float64))
+                invalid = (values > UINT32_MAX) | (values < 0)
+                if invalid.any():
+                    if invalid_data_behavior == 'raise':
+                        raise ValueError(
+                            '%d values out of bounds for uint32' % (
+                                invalid.sum(),
+                            ),
+                        )
+                    elif invalid_data_behavior == 'warn':
+                        log.warn(
+                            'Ignoring {} volumes because they are out of '
+                            'bounds for uint32',
+                            invalid.sum(),
+                        )
+                    values[invalid] = 0
+
+            self._write_field(field, shape, day_ixs, values)
+
+        start_date_ixs, end_date_ixs = compute_asset_lifetimes(frames)
+        metadata = {
+            'version': VERSION,
+            'calendar_name': self._calendar.name,
+            'start_session_ns': self._start_session.value,
+            'end_session_ns': self._end_session.value,
+            'sids': sids.tolist(),
+            # Lifetimes are computed relative to the frames' index, so
+            # convert them to indices into the calendar's sessions.
+            'start_date_ixs': day_ixs[start_date_ixs].tolist(),
+            'end_date_ixs': day_ixs[end_date_ixs].tolist(),
+        }
+        with open(metadata_path, 'w') as fp:
+            json.dump(metadata, fp)
+
+        log.debug(
+            'Wrote daily bars for {} sids to {}',
+            len(sids),
+            self._rootdir,
+        )
+
+    def _write_field(self, field, shape, day_ixs, values):
+        path = field_path(self._rootdir, field)
+        if not np.prod(shape):
+            # np.memmap can't map empty files.
+            open(path, 'wb').close()
+            return
+
+        out = np.memmap(path, dtype=FIELD_DTYPES[field], mode='w+',
+                        shape=shape)
+        out[:] = MISSING_VALUES[field]
+        out[day_ixs] = values
+        out.flush()
+        del out
+
+    def write_from_sid_df_pairs(self, data, invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and the data for that asset, indexed by session.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}
+            See :meth:`write`.
+        """
+        data = list(data)
+        if not data:
+            empty_frame = pd.DataFrame(
+                data=None,
+                index=np.array([], dtype='datetime64[ns]'),
+                columns=np.array([], dtype='int64'),
+            )
+            return self.write(
+                {f: empty_frame.copy() for f in FIELDS},
+                invalid_data_behavior,
+            )
+
+        sids, frames = zip(*data)
+        ohlcv_frame = pd.concat(frames)
+
+        # Repeat each sid for each row in its corresponding frame.
+        sid_ix = np.repeat(sids, [len(f) for f in frames])
+
+        # Add id to the index, so the frame is indexed by (date, id).
+        ohlcv_frame.set_index(sid_ix, append=True, inplace=True)
+
+        frames = {
+            field: ohlcv_frame[field].unstack()
+            for field in FIELDS
+        }
+
+        return self.write(frames, invalid_data_behavior)
+
+
+class MMapDailyBarReader(SessionBarReader):
+    """
+    Reader for data written by MMapDailyBarWriter.
+
+    ``load_raw_arrays`` returns read-only views of the memory-mapped files
+    when the requested assets are a run of consecutive sids in the file,
+    which is the case when reading every sid. Other requests are copied out
+    of the files.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the data.
+
+    See Also
+    --------
+    zipline.data.mmap_daily_bars.MMapDailyBarWriter
+    """
+    def __init__(self, rootdir):
+        self._rootdir = rootdir
+
+        with open(join(rootdir, METADATA_FILENAME)) as fp:
+            metadata = json.load(fp)
+
+        if metadata['version'] != VERSION:
+            raise ValueError(
+                'mismatched version: file is of version %s, expected %s' % (
+                    metadata['version'],
+                    VERSION,
+                ),
+            )
+
+        self._calendar = get_calendar(metadata['calendar_name'])
+        self._start_session = pd.Timestamp(
+            metadata['start_session_ns'],
+            tz='UTC',
+        )
+        self._end_session = pd.Timestamp(metadata['end_session_ns'], tz='UTC')
+        self.sids = np.array(metadata['sids'], dtype=np.int64)
+        self._start_date_ixs = np.array(
+            metadata['start_date_ixs'],
+            dtype=np.int64,
+        )
+        self._end_date_ixs = np.array(
+            metadata['end_date_ixs'],
+            dtype=np.int64,
+        )
+
+    @lazyval
+    def _arrays(self):
+        shape = (len(self.dates), len(self.sids))
+        out = {}
+        for field in FIELDS:
+            dtype = FIELD_DTYPES[field]
+            if not np.prod(shape):
+                array = np.empty(shape, dtype=dtype)
+            else:
+                array = np.memmap(
+                    field_path(self._rootdir, field),
+                    dtype=dtype,
+                    mode='r',
+                    shape=shape,
+                )
+            # Slices of np.memmap are also np.memmap instances, as are the
+            # results of ufuncs applied to them. Return plain ndarray views
+            # of the mapped data instead.
+            out[field] = array.view(np.ndarray)
+        return out
+
+    @lazyval
+    def sessions(self):
+        return self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+
+    @lazyval
+    def dates(self):
+        return self.sessions.values
+
+    @lazyval
+    def asset_start_dates(self):
+        return self.dates[self._start_date_ixs]
+
+    @lazyval
+    def asset_end_dates(self):
+        return self.dates[self._end_date_ixs]
+
+    @property
+    def trading_calendar(self):
+        return self._calendar
+
+    @property
+    def last_available_dt(self):
+        return self._end_session
+
+    @property
+    def first_trading_day(self):
+        return self._start_session
+
+    def _session_index(self, dt):
+        try:
+            return self.sessions.get_loc(dt)
+        except KeyError:
+            raise NoDataOnDate(dt)
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        """
+        Parameters
+        ----------
+        columns : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_date: Timestamp
+           Beginning of the window range.
+        end_date: Timestamp
+           End of the window range.
+        assets : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (sessions in range, sids) containing the values for the
+            respective field over start and end dt range. OHLC values are
+            float64 and volumes are uint32. The arrays may be read-only
+            views of the underlying files.
+        """
+        date_slice = slice(
+            self._session_index(start_date),
+            self._session_index(end_date) + 1,
+        )
+
+        assets = np.asarray(assets, dtype=np.int64)
+        sid_ixs = self.sids.searchsorted(assets)
+        known = np.in1d(assets, self.sids)
+        if not known.any():
+            raise ValueError('At least one valid asset id is required.')
+
+        if known.all() and (np.diff(sid_ixs) == 1).all():
+            # The assets are consecutive columns, so we can return views.
+            col_indexer = slice(sid_ixs[0], sid_ixs[-1] + 1)
+            return [
+                self._arrays[column][date_slice, col_indexer]
+                for column in columns
+            ]
+
+        out = []
+        for column in columns:
+            data = self._arrays[column][date_slice]
+            buf = np.full(
+                (len(data), len(assets)),
+                MISSING_VALUES[column],
+                dtype=FIELD_DTYPES[column],
+            )
+            buf[:, known] = data[:, sid_ixs[known]]
+            out.append(buf)
+        return out
+
+    def _sid_index(self, sid):
+        sid_ix = self.sids.searchsorted(sid)
+        if sid_ix == len(self.sids) or self.sids[sid_ix] != sid:
+            raise NoDataForSid(
+                'Asset not contained in daily pricing file: {}'.format(sid)
+            )
+        return sid_ix
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the value at the given coordinates.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : pd.Timestamp
+            The session for the desired data point.
+        field : string
+            The OHLVC name for the desired data point.
+
+        Returns
+        -------
+        value : float|int
+            The value at the given coordinates, ``float`` for OHLC, ``int``
+            for 'volume'.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given dt is not a session in this reader's calendar, or if
+            it is outside of the lifetime of the asset.
+        """
+        sid_ix = self._sid_index(sid)
+        dt_ix = self._session_index(dt)
+
+        if dt_ix < self._start_date_ixs[sid_ix]:
+            raise NoDataBeforeDate()
+        if dt_ix > self._end_date_ixs[sid_ix]:
+            raise NoDataAfterDate()
+
+        value = self._arrays[field][dt_ix, sid_ix]
+        if field == VOLUME:
+            return int(value)
+        return float(value)
+
+    def get_values(self, sids, dt, fields):
+        """
+        Retrieve the values of several fields for several assets on a single
+        session.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        sid_ixs = np.array(
+            [self._sid_index(sid) for sid in sids],
+            dtype=np.int64,
+        )
+        dt_ix = self._session_index(dt)
+        alive = (
+            (self._start_date_ixs[sid_ixs] <= dt_ix) &
+            (self._end_date_ixs[sid_ixs] >= dt_ix)
+        )
+
+        out = []
+        for field in fields:
+            values = self._arrays[field][dt_ix, sid_ixs]
+            if field == VOLUME:
+                values = values.astype(np.int64)
+            values[~alive] = MISSING_VALUES[field]
+            out.append(values)
+        return out
+
+    def get_last_traded_dt(self, asset, dt):
+        """
+        Get the latest day on or before ``dt`` in which ``asset`` traded.
+
+        If there are no trades on or before ``dt``, returns ``pd.NaT``.
+
+        Parameters
+        ----------
+        asset : zipline.asset.Asset
+            The asset for which to get the last traded day.
+        dt : pd.Timestamp
+            The dt at which to start searching for the last traded day.
+
+        Returns
+        -------
+        last_traded : pd.Timestamp
+            The day of the last trade for the given asset, using the
+            input dt as a vantage point.
+        """
+        sid_ix = self._sid_index(asset.sid)
+        start_ix = self._start_date_ixs[sid_ix]
+        stop_ix = min(
+            self.dates.searchsorted(dt.asm8, side='right'),
+            self._end_date_ixs[sid_ix] + 1,
+        )
+        if stop_ix <= start_ix:
+            return pd.NaT
+
+        traded = np.flatnonzero(
+            self._arrays[VOLUME][start_ix:stop_ix, sid_ix],
+        )
+        if not len(traded):
+            return pd.NaT
+        return self.sessions[start_ix + traded[-1]]
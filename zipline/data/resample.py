@@ -16,7 +16,7 @@ from abc import ABCMeta, abstractmethod
 
 import numpy as np
 import pandas as pd
-from six import with_metaclass
+from six import iteritems, with_metaclass
 
 from zipline.data._resample import (
     _minute_to_session_open,
@@ -25,7 +25,7 @@ from zipline.data._resample import (
     _minute_to_session_close,
     _minute_to_session_volume,
 )
-from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.bar_reader import NoDataOnDate, empty_values
 from zipline.data.minute_bars import MinuteBarReader
 from zipline.data.session_bars import SessionBarReader
 from zipline.utils.memoize import lazyval
@@ -100,6 +100,61 @@ def minute_to_session(column, close_locs, data, out):
     return out
 
 
+def _first_valid(window):
+    """
+    Get the first non-nan value in each column of ``window``, and whether
+    each column has one.
+    """
+    valid = ~np.isnan(window)
+    first = window[valid.argmax(axis=0), np.arange(window.shape[1])]
+    return first, valid.any(axis=0)
+
+
+def _combine_open(opens, window):
+    first, has_first = _first_valid(window)
+    return np.where(np.isnan(opens) & has_first, first, opens)
+
+
+def _combine_close(closes, window):
+    last, has_last = _first_valid(window[::-1])
+    return np.where(has_last, last, closes)
+
+
+def _combine_volume(volumes, window):
+    return volumes + np.nansum(window, axis=0).astype(np.int64)
+
+
+# Map from field to a function which folds a window of minute data into the
+# running aggregates for its columns.
+_COMBINE = {
+    'open': _combine_open,
+    'high': lambda highs, window: np.fmax(highs, np.fmax.reduce(window)),
+    'low': lambda lows, window: np.fmin(lows, np.fmin.reduce(window)),
+    'close': _combine_close,
+    'volume': _combine_volume,
+}
+
+_AGGREGATE_DTYPES = OrderedDict((
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.int64),
+))
+
+# The aggregate of each field before any minutes have been seen, which is
+# also the aggregate for assets which aren't alive.
+_EMPTY_AGGREGATES = {
+    'open': np.nan,
+    'high': np.nan,
+    'low': np.nan,
+    'close': np.nan,
+    'volume': 0,
+}
+
+_NOT_VISITED = np.iinfo(np.int64).min
+
+
 class DailyHistoryAggregator(object):
     """
     Converts minute pricing data into a daily summary, to be used for the
@@ -111,7 +166,13 @@ class DailyHistoryAggregator(object):
 
     Provides aggregation for `open`, `high`, `low`, `close`, and `volume`.
     The aggregation rules for each price type is documented in their respective
+    methods.
 
+    The running aggregate of each field is stored in an array with an entry
+    per asset requested during the current session, along with the last dt
+    for which each entry was computed. Each request reads only the minutes
+    after that dt, for all of the requested assets at once, and folds them
+    into the running aggregates.
     """
 
     def __init__(self, market_opens, minute_reader, trading_calendar):
@@ -119,50 +180,110 @@ class DailyHistoryAggregator(object):
         self._minute_reader = minute_reader
         self._trading_calendar = trading_calendar
 
-        # The caches are structured as (date, market_open, entries), where
-        # entries is a dict of asset -> (last_visited_dt, value)
-        #
-        # Whenever an aggregation method determines the current value,
-        # the entry for the respective asset should be overwritten with a new
-        # entry for the current dt.value (int) and aggregation value.
-        #
-        # When the requested dt's date is different from date the cache is
-        # flushed, so that the cache entries do not grow unbounded.
-        #
-        # Example cache:
-        # cache = (date(2016, 3, 17),
-        #          pd.Timestamp('2016-03-17 13:31', tz='UTC'),
-        #          {
-        #              1: (1458221460000000000, np.nan),
-        #              2: (1458221460000000000, 42.0),
-        #         })
-        self._caches = {
-            'open': None,
-            'high': None,
-            'low': None,
-            'close': None,
-            'volume': None
-        }
+        # The state is reset when the requested dt's session is different
+        # from the current session, so that it does not grow unbounded.
+        self._session = None
 
         # The int value is used for deltas to avoid extra computation from
         # creating new Timestamps.
         self._one_min = pd.Timedelta('1 min').value
 
-    def _prelude(self, dt, field):
+    def _reset(self, session):
+        self._session = session
+        self._market_open = self._market_opens.loc[session].tz_localize('UTC')
+
+        # The assets requested during the session, the position of each in
+        # the state arrays, and whether each is alive for the session.
+        self._assets = []
+        self._asset_ixs = {}
+        self._alive = np.empty(0, dtype=bool)
+
+        # Map from field to arrays of the running aggregate for each asset,
+        # and the dt value of the last minute included in it.
+        self._states = {
+            field: (
+                np.full(0, _EMPTY_AGGREGATES[field], dtype=dtype),
+                np.full(0, _NOT_VISITED, dtype=np.int64),
+            )
+            for field, dtype in iteritems(_AGGREGATE_DTYPES)
+        }
+
+    def _prelude(self, assets, dt):
+        """
+        Get the positions of ``assets`` in the state arrays, adding any
+        assets which haven't been requested yet this session.
+        """
         session = self._trading_calendar.minute_to_session_label(dt)
+        if session != self._session:
+            self._reset(session)
+
+        asset_ixs = self._asset_ixs
+        new_assets = [asset for asset in OrderedDict.fromkeys(assets)
+                      if asset not in asset_ixs]
+        if new_assets:
+            for asset in new_assets:
+                asset_ixs[asset] = len(self._assets)
+                self._assets.append(asset)
+
+            self._alive = np.append(
+                self._alive,
+                [asset.is_alive_for_session(session) for asset in new_assets],
+            )
+            for field, (values, last_visited) in iteritems(self._states):
+                self._states[field] = (
+                    np.append(
+                        values,
+                        np.full(
+                            len(new_assets),
+                            _EMPTY_AGGREGATES[field],
+                            dtype=values.dtype,
+                        ),
+                    ),
+                    np.append(
+                        last_visited,
+                        np.full(len(new_assets), _NOT_VISITED, np.int64),
+                    ),
+                )
+
+        return np.array([asset_ixs[asset] for asset in assets], dtype=np.intp)
+
+    def _aggregate(self, field, assets, dt):
+        ixs = self._prelude(assets, dt)
+        values, last_visited = self._states[field]
         dt_value = dt.value
-        cache = self._caches[field]
-        if cache is None or cache[0] != session:
-            market_open = self._market_opens.loc[session]
-            cache = self._caches[field] = (session, market_open, {})
-
-        _, market_open, entries = cache
-        market_open = market_open.tz_localize('UTC')
-        if dt != market_open:
-            prev_dt = dt_value - self._one_min
-        else:
-            prev_dt = None
-        return market_open, prev_dt, dt_value, entries
+
+        # Entries computed for a later dt are recomputed from the open.
+        rewound = ixs[last_visited[ixs] > dt_value]
+        values[rewound] = _EMPTY_AGGREGATES[field]
+        last_visited[rewound] = _NOT_VISITED
+
+        alive = self._alive[ixs]
+        stale = alive & (last_visited[ixs] != dt_value)
+        if field == 'open':
+            # Once an asset's open has been seen, it doesn't change.
+            stale &= np.isnan(values[ixs])
+        stale_ixs = np.unique(ixs[stale])
+
+        if len(stale_ixs):
+            starts = np.where(
+                last_visited[stale_ixs] == _NOT_VISITED,
+                self._market_open.value,
+                last_visited[stale_ixs] + self._one_min,
+            )
+            # Assets which were last visited at the same dt are read
+            # together, which is usually every asset.
+            for start in np.unique(starts):
+                group = stale_ixs[starts == start]
+                window = self._minute_reader.load_raw_arrays(
+                    [field],
+                    pd.Timestamp(start, tz='UTC'),
+                    dt,
+                    [self._assets[ix] for ix in group],
+                )[0]
+                values[group] = _COMBINE[field](values[group], window)
+
+        last_visited[ixs[alive]] = dt_value
+        return values[ixs]
 
     def opens(self, assets, dt):
         """
@@ -177,64 +298,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'open')
-
-        opens = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                opens.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'open')
-                entries[asset] = (dt_value, val)
-                opens.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, first_open = entries[asset]
-                    if last_visited_dt == dt_value:
-                        opens.append(first_open)
-                        continue
-                    elif not pd.isnull(first_open):
-                        opens.append(first_open)
-                        entries[asset] = (dt_value, first_open)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['open'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        nonnan = window[~pd.isnull(window)]
-                        if len(nonnan):
-                            val = nonnan[0]
-                        else:
-                            val = np.nan
-                        entries[asset] = (dt_value, val)
-                        opens.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['open'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    nonnan = window[~pd.isnull(window)]
-                    if len(nonnan):
-                        val = nonnan[0]
-                    else:
-                        val = np.nan
-                    entries[asset] = (dt_value, val)
-                    opens.append(val)
-                    continue
-        return np.array(opens)
+        return self._aggregate('open', assets, dt)
 
     def highs(self, assets, dt):
         """
@@ -246,64 +310,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'high')
-
-        highs = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                highs.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'high')
-                entries[asset] = (dt_value, val)
-                highs.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_max = entries[asset]
-                    if last_visited_dt == dt_value:
-                        highs.append(last_max)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'high')
-                        if pd.isnull(curr_val):
-                            val = last_max
-                        elif pd.isnull(last_max):
-                            val = curr_val
-                        else:
-                            val = max(last_max, curr_val)
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['high'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmax(np.append(window, last_max))
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['high'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmax(window)
-                    entries[asset] = (dt_value, val)
-                    highs.append(val)
-                    continue
-        return np.array(highs)
+        return self._aggregate('high', assets, dt)
 
     def lows(self, assets, dt):
         """
@@ -315,59 +322,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'low')
-
-        lows = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                lows.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'low')
-                entries[asset] = (dt_value, val)
-                lows.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_min = entries[asset]
-                    if last_visited_dt == dt_value:
-                        lows.append(last_min)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'low')
-                        val = np.nanmin([last_min, curr_val])
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['low'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmin(np.append(window, last_min))
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['low'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmin(window)
-                    entries[asset] = (dt_value, val)
-                    lows.append(val)
-                    continue
-        return np.array(lows)
+        return self._aggregate('low', assets, dt)
 
     def closes(self, assets, dt):
         """
@@ -381,69 +336,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'close')
-
-        closes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        def _get_filled_close(asset):
-            """
-            Returns the most recent non-nan close for the asset in this
-            session. If there has been no data in this session on or before the
-            `dt`, returns `nan`
-            """
-            window = self._minute_reader.load_raw_arrays(
-                ['close'],
-                market_open,
-                dt,
-                [asset],
-            )[0]
-            try:
-                return window[~np.isnan(window)][-1]
-            except IndexError:
-                return np.NaN
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                closes.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'close')
-                entries[asset] = (dt_value, val)
-                closes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_close = entries[asset]
-                    if last_visited_dt == dt_value:
-                        closes.append(last_close)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = last_close
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                    else:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = _get_filled_close(asset)
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                except KeyError:
-                    val = self._minute_reader.get_value(
-                        asset, dt, 'close')
-                    if pd.isnull(val):
-                        val = _get_filled_close(asset)
-                    entries[asset] = (dt_value, val)
-                    closes.append(val)
-                    continue
-        return np.array(closes)
+        return self._aggregate('close', assets, dt)
 
     def volumes(self, assets, dt):
         """
@@ -455,59 +348,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=int64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'volume')
-
-        volumes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                volumes.append(0)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'volume')
-                entries[asset] = (dt_value, val)
-                volumes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_total = entries[asset]
-                    if last_visited_dt == dt_value:
-                        volumes.append(last_total)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'volume')
-                        val += last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['volume'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        val = np.nansum(window) + last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['volume'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    val = np.nansum(window)
-                    entries[asset] = (dt_value, val)
-                    volumes.append(val)
-                    continue
-        return np.array(volumes)
+        return self._aggregate('volume', assets, dt)
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
@@ -575,6 +416,13 @@ class MinuteResampleSessionBarReader(SessionBarReader):
         # for real world use.
         return self._get_resampled([colname], session, session, [sid])[0][0][0]
 
+    def get_values(self, sids, session, fields):
+        results = self._get_resampled(fields, session, session, sids)
+        return [
+            result[0].astype('int64') if field == 'volume' else result[0]
+            for field, result in zip(fields, results)
+        ]
+
     @lazyval
     def sessions(self):
         cal = self._calendar
@@ -659,6 +507,13 @@ class ReindexBarReader(with_metaclass(ABCMeta)):
             else:
                 return np.nan
 
+    def get_values(self, sids, dt, fields):
+        # Give empty results if no data is present.
+        try:
+            return self._reader.get_values(sids, dt, fields)
+        except NoDataOnDate:
+            return [empty_values(field, len(sids)) for field in fields]
+
     @abstractmethod
     def _outer_dts(self, start_dt, end_dt):
         raise NotImplementedError
@@ -0,0 +1,218 @@
+"""
+Shared Bundle Snapshots
+-----------------------
+A directory holding a read-only copy of a bundle's equity bars and
+adjustments, in formats that readers memory-map instead of loading into
+each process.
+
+A host process writes the snapshot once with :func:`write_shared_bundle`.
+Each worker then attaches to it with :class:`SharedBundle`, whose readers
+map the same files, so the workers share a single copy of the data in the
+operating system's page cache instead of each decoding and caching its own.
+
+.. code-block:: none
+
+   /daily_equities/            MMapDailyBarWriter output
+   /minute_equities.h5         HDF5MinuteBarWriter output, uncompressed
+   /adjustments.sqlite         copy of the adjustments database
+   /adjustment_index/          AdjustmentIndex arrays
+   /adjustment_factors.npz     AdjustmentFactors
+"""
+from os import remove
+from os.path import exists, join
+import sqlite3
+
+import logbook
+import pandas as pd
+from toolz import partition_all
+
+from zipline.data.adjustment_factors import AdjustmentFactors
+from zipline.data.adjustments import AdjustmentIndex, SQLiteAdjustmentReader
+from zipline.data.data_portal import DataPortal
+from zipline.data.hdf5_minute_bars import (
+    HDF5MinuteBarReader,
+    HDF5MinuteBarWriter,
+)
+from zipline.data.minute_bars import US_EQUITIES_MINUTES_PER_DAY
+from zipline.data.mmap_daily_bars import MMapDailyBarReader, MMapDailyBarWriter
+from zipline.utils.paths import ensure_directory
+
+log = logbook.Logger('SharedBundle')
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+DAILY_EQUITIES = 'daily_equities'
+MINUTE_EQUITIES = 'minute_equities.h5'
+ADJUSTMENTS = 'adjustments.sqlite'
+ADJUSTMENT_INDEX = 'adjustment_index'
+ADJUSTMENT_FACTORS = 'adjustment_factors.npz'
+
+
+def _write_daily_bars(rootdir, reader, sids):
+    sessions = reader.sessions
+    arrays = reader.load_raw_arrays(FIELDS, sessions[0], sessions[-1], sids)
+    MMapDailyBarWriter(
+        rootdir,
+        reader.trading_calendar,
+        sessions[0],
+        sessions[-1],
+    ).write({
+        field: pd.DataFrame(array, index=sessions, columns=sids)
+        for field, array in zip(FIELDS, arrays)
+    })
+
+
+def _write_minute_bars(path,
+                       reader,
+                       sids,
+                       minutes_per_day,
+                       ohlc_ratios_per_sid,
+                       sessions_per_write):
+    calendar = reader.trading_calendar
+    sessions = calendar.sessions_in_range(
+        reader.first_trading_day,
+        calendar.minute_to_session_label(reader.last_available_dt),
+    )
+    writer = HDF5MinuteBarWriter(
+        path,
+        calendar,
+        sessions[0],
+        sessions[-1],
+        sids,
+        minutes_per_day=minutes_per_day,
+        ohlc_ratios_per_sid=ohlc_ratios_per_sid,
+        compression=None,
+    )
+
+    # Copy a block of sessions at a time, to bound the memory used.
+    for chunk in partition_all(sessions_per_write, sessions):
+        minutes = calendar.minutes_for_sessions_in_range(chunk[0], chunk[-1])
+        arrays = reader.load_raw_arrays(FIELDS, minutes[0], minutes[-1], sids)
+        writer.write({
+            field: pd.DataFrame(array, index=minutes, columns=sids)
+            for field, array in zip(FIELDS, arrays)
+        })
+        log.debug('Copied minute bars through {}', chunk[-1].date())
+
+
+def write_shared_bundle(rootdir,
+                        bundle_data,
+                        sids=None,
+                        minutes_per_day=US_EQUITIES_MINUTES_PER_DAY,
+                        ohlc_ratios_per_sid=None,
+                        sessions_per_write=20):
+    """
+    Write a snapshot of a bundle which workers can attach to with
+    :class:`SharedBundle`.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory in which to write the snapshot. Any existing snapshot
+        in it is replaced.
+    bundle_data : BundleData
+        The bundle to copy.
+    sids : iterable[int], optional
+        The equities to copy. Defaults to every equity in the bundle.
+    minutes_per_day : int, optional
+        The number of minutes per session in the minute bars.
+    ohlc_ratios_per_sid : dict[int, int], optional
+        Ratios to use instead of the default when storing minute prices
+        for particular sids.
+    sessions_per_write : int, optional
+        The number of sessions of minute bars to copy at a time.
+    """
+    ensure_directory(rootdir)
+    if sids is None:
+        sids = bundle_data.asset_finder.equities_sids
+    sids = sorted(sids)
+
+    _write_daily_bars(
+        join(rootdir, DAILY_EQUITIES),
+        bundle_data.equity_daily_bar_reader,
+        sids,
+    )
+    _write_minute_bars(
+        join(rootdir, MINUTE_EQUITIES),
+        bundle_data.equity_minute_bar_reader,
+        sids,
+        minutes_per_day,
+        ohlc_ratios_per_sid,
+        sessions_per_write,
+    )
+
+    adjustment_reader = bundle_data.adjustment_reader
+    adjustments_path = join(rootdir, ADJUSTMENTS)
+    if exists(adjustments_path):
+        remove(adjustments_path)
+    dest = sqlite3.connect(adjustments_path)
+    try:
+        dest.executescript('\n'.join(adjustment_reader.conn.iterdump()))
+    finally:
+        dest.close()
+
+    index = adjustment_reader.index
+    if index is None:
+        index = AdjustmentIndex.from_sqlite(adjustment_reader.conn)
+    index.write(join(rootdir, ADJUSTMENT_INDEX))
+
+    factors = adjustment_reader.factors
+    if factors is None:
+        factors = AdjustmentFactors.from_adjustment_reader(adjustment_reader)
+    factors.write(join(rootdir, ADJUSTMENT_FACTORS))
+
+
+class SharedBundle(object):
+    """
+    Read-only readers over a snapshot written by :func:`write_shared_bundle`.
+
+    The bar readers and the adjustment index memory-map their files, so
+    attaching is cheap, and the data isn't copied into each process.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the snapshot.
+    """
+    def __init__(self, rootdir):
+        self.equity_daily_bar_reader = MMapDailyBarReader(
+            join(rootdir, DAILY_EQUITIES),
+        )
+        self.equity_minute_bar_reader = HDF5MinuteBarReader.from_path(
+            join(rootdir, MINUTE_EQUITIES),
+        )
+        self.adjustment_reader = SQLiteAdjustmentReader(
+            join(rootdir, ADJUSTMENTS),
+            index=AdjustmentIndex.read(join(rootdir, ADJUSTMENT_INDEX)),
+            factors=AdjustmentFactors.read(join(rootdir, ADJUSTMENT_FACTORS)),
+        )
+
+    def data_portal(self, asset_finder, trading_calendar, **kwargs):
+        """
+        Create a DataPortal which reads equity data from this snapshot.
+
+        Parameters
+        ----------
+        asset_finder : AssetFinder
+            The asset finder of the bundle.
+        trading_calendar : TradingCalendar
+            The trading calendar of the simulation.
+        **kwargs
+            Forwarded to DataPortal.
+
+        Returns
+        -------
+        data_portal : DataPortal
+        """
+        kwargs.setdefault(
+            'first_trading_day',
+            self.equity_minute_bar_reader.first_trading_day,
+        )
+        return DataPortal(
+            asset_finder,
+            trading_calendar,
+            equity_daily_reader=self.equity_daily_bar_reader,
+            equity_minute_reader=self.equity_minute_bar_reader,
+            adjustment_reader=self.adjustment_reader,
+            **kwargs
+        )
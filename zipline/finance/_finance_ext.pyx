@@ -11,32 +11,6 @@ from zipline._protocol cimport InnerPosition
 from zipline.assets._assets cimport Future
 
 
-cpdef update_position_last_sale_prices(positions, get_price, dt):
-    """Update the positions' last sale prices.
-
-    Parameters
-    ----------
-    positions : OrderedDict
-        The positions to update.
-    get_price : callable[Asset, float]
-        The function to retrieve the price for the asset.
-    dt : pd.Timestamp
-        The dt to set as the last sale date if the price is not nan.
-    """
-    cdef InnerPosition inner_position
-    cdef np.float64_t last_sale_price
-
-    for outer_position in itervalues(positions):
-        inner_position = outer_position.inner_position
-
-        last_sale_price = get_price(inner_position.asset)
-
-        # inline ~isnan because this gets called once per position per minute
-        if last_sale_price == last_sale_price:
-            inner_position.last_sale_price = last_sale_price
-            inner_position.last_sale_date = dt
-
-
 @cython.final
 cdef class PositionStats:
     """Computed values from the current positions.
@@ -112,20 +86,10 @@ cdef class PositionStats:
         return self
 
 
-cpdef calculate_position_tracker_stats(positions, PositionStats stats):
-    """Calculate various stats about the current positions.
-
-    Parameters
-    ----------
-    positions : OrderedDict
-        The ordered dictionary of positions.
-
-    Returns
-    -------
-    position_stats : PositionStats
-        The computed statistics.
+cdef _exposure_buffers(PositionStats stats, Py_ssize_t npos):
+    """Get the arrays to write the sids and exposures of ``npos`` positions
+    into, reusing the memory of the old exposure series where possible.
     """
-    cdef Py_ssize_t npos = len(positions)
     cdef np.ndarray[np.int64_t] index
     cdef np.ndarray[np.float64_t] position_exposure
 
@@ -134,22 +98,6 @@ cpdef calculate_position_tracker_stats(positions, PositionStats stats):
         stats.underlying_value_array
     )
 
-    cdef np.float64_t value
-    cdef np.float64_t exposure
-
-    cdef np.float64_t net_value
-    cdef np.float64_t gross_value
-    cdef np.float64_t long_value = 0.0
-    cdef np.float64_t short_value = 0.0
-
-    cdef np.float64_t net_exposure
-    cdef np.float64_t gross_exposure
-    cdef np.float64_t long_exposure = 0.0
-    cdef np.float64_t short_exposure = 0.0
-
-    cdef np.uint64_t longs_count = 0
-    cdef np.uint64_t shorts_count = 0
-
     # attempt to reuse the memory of the old exposure series
     if len(old_index) < npos:
         # we don't have enough space in the cached buffer, allocate a new
@@ -159,36 +107,74 @@ cpdef calculate_position_tracker_stats(positions, PositionStats stats):
             npos,
             dtype='float64',
         )
-
-        stats.position_exposure_array = position_exposure
-        # create a new series to expose the arrays
-        stats.position_exposure_series = pd.Series(
-            position_exposure,
-            index=index,
-        )
     elif len(old_index) > npos:
         # we have more space than needed, slice off the extra but leave it
         # available
         index = old_index[:npos]
         position_exposure = old_position_exposure[:npos]
-
-        stats.position_exposure_array = position_exposure
-        # create a new series with the sliced arrays
-        stats.position_exposure_series = pd.Series(
-            position_exposure,
-            index=index,
-        )
     else:
         # we have exactly the right amount of space, no slicing or allocation
         # needed
         index = old_index
         position_exposure = old_position_exposure
 
-        stats.position_exposure_array = position_exposure
-        stats.position_exposure_series = pd.Series(
-            position_exposure,
-            index=index,
-        )
+    stats.position_exposure_array = position_exposure
+    # create a new series to expose the arrays
+    stats.position_exposure_series = pd.Series(
+        position_exposure,
+        index=index,
+    )
+
+    return index, position_exposure
+
+
+cdef _set_totals(PositionStats stats,
+                 np.float64_t long_value,
+                 np.float64_t short_value,
+                 np.float64_t long_exposure,
+                 np.float64_t short_exposure,
+                 np.uint64_t longs_count,
+                 np.uint64_t shorts_count):
+    stats.gross_exposure = long_exposure - short_exposure
+    stats.gross_value = long_value - short_value
+    stats.long_exposure = long_exposure
+    stats.long_value = long_value
+    stats.longs_count = longs_count
+    stats.net_exposure = long_exposure + short_exposure
+    stats.net_value = long_value + short_value
+    stats.short_exposure = short_exposure
+    stats.short_value = short_value
+    stats.shorts_count = shorts_count
+
+
+cpdef calculate_position_tracker_stats(positions, PositionStats stats):
+    """Calculate various stats about the current positions.
+
+    Parameters
+    ----------
+    positions : OrderedDict
+        The ordered dictionary of positions.
+
+    Returns
+    -------
+    position_stats : PositionStats
+        The computed statistics.
+    """
+    cdef np.ndarray[np.int64_t] index
+    cdef np.ndarray[np.float64_t] position_exposure
+    index, position_exposure = _exposure_buffers(stats, len(positions))
+
+    cdef np.float64_t value
+    cdef np.float64_t exposure
+
+    cdef np.float64_t long_value = 0.0
+    cdef np.float64_t short_value = 0.0
+
+    cdef np.float64_t long_exposure = 0.0
+    cdef np.float64_t short_exposure = 0.0
+
+    cdef np.uint64_t longs_count = 0
+    cdef np.uint64_t shorts_count = 0
 
     cdef InnerPosition position
     cdef Py_ssize_t ix = 0
@@ -226,22 +212,91 @@ cpdef calculate_position_tracker_stats(positions, PositionStats stats):
 
         ix += 1
 
-    net_value = long_value + short_value
-    gross_value = long_value - short_value
+    _set_totals(
+        stats,
+        long_value,
+        short_value,
+        long_exposure,
+        short_exposure,
+        longs_count,
+        shorts_count,
+    )
 
-    net_exposure = long_exposure + short_exposure
-    gross_exposure = long_exposure - short_exposure
 
-    stats.gross_exposure = gross_exposure
-    stats.gross_value = gross_value
-    stats.long_exposure = long_exposure
-    stats.long_value = long_value
-    stats.longs_count = longs_count
-    stats.net_exposure = net_exposure
-    stats.net_value = net_value
-    stats.short_exposure = short_exposure
-    stats.short_value = short_value
-    stats.shorts_count = shorts_count
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef calculate_position_array_stats(
+        np.ndarray[np.int64_t] sids,
+        np.ndarray[np.int64_t] amounts,
+        np.ndarray[np.float64_t] last_sale_prices,
+        np.ndarray[np.float64_t] exposure_multipliers,
+        np.ndarray[np.uint8_t, cast=True] has_value,
+        PositionStats stats):
+    """Calculate various stats about the current positions from arrays with
+    one entry per position.
+
+    Parameters
+    ----------
+    sids : np.ndarray[int64]
+        The sid of each position's asset.
+    amounts : np.ndarray[int64]
+        The amount of each position.
+    last_sale_prices : np.ndarray[float64]
+        The last sale price of each position.
+    exposure_multipliers : np.ndarray[float64]
+        The multiplier from the notional value of each position to its
+        exposure, e.g. the price multiplier of a future.
+    has_value : np.ndarray[bool]
+        Whether each position has an inherent value. Futures don't.
+    stats : PositionStats
+        The stats to update.
+    """
+    cdef Py_ssize_t npos = len(sids)
+    cdef np.ndarray[np.int64_t] index
+    cdef np.ndarray[np.float64_t] position_exposure
+    index, position_exposure = _exposure_buffers(stats, npos)
+
+    cdef np.float64_t value
+    cdef np.float64_t exposure
+
+    cdef np.float64_t long_value = 0.0
+    cdef np.float64_t short_value = 0.0
+
+    cdef np.float64_t long_exposure = 0.0
+    cdef np.float64_t short_exposure = 0.0
+
+    cdef np.uint64_t longs_count = 0
+    cdef np.uint64_t shorts_count = 0
+
+    cdef Py_ssize_t ix
+
+    for ix in range(npos):
+        exposure = (
+            amounts[ix] * last_sale_prices[ix] * exposure_multipliers[ix]
+        )
+        value = exposure if has_value[ix] else 0
+
+        if exposure > 0:
+            longs_count += 1
+            long_value += value
+            long_exposure += exposure
+        elif exposure < 0:
+            shorts_count += 1
+            short_value += value
+            short_exposure += exposure
+
+        index[ix] = sids[ix]
+        position_exposure[ix] = exposure
+
+    _set_totals(
+        stats,
+        long_value,
+        short_value,
+        long_exposure,
+        short_exposure,
+        longs_count,
+        shorts_count,
+    )
 
 
 cpdef minute_annual_volatility(np.ndarray[np.int64_t] date_labels,
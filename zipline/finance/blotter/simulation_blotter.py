@@ -16,6 +16,7 @@ from logbook import Logger
 from collections import defaultdict
 from copy import copy
 
+import numpy as np
 from six import iteritems
 
 from zipline.assets import Equity, Future, Asset
@@ -26,18 +27,33 @@ from zipline.finance.slippage import (
     DEFAULT_FUTURE_VOLUME_SLIPPAGE_BAR_LIMIT,
     VolatilityVolumeShare,
     FixedBasisPointsSlippage,
+    FixedSlippage,
+    VolumeShareSlippage,
 )
 from zipline.finance.commission import (
     DEFAULT_PER_CONTRACT_COST,
     FUTURE_EXCHANGE_FEES_BY_SYMBOL,
     PerContract,
+    PerDollar,
     PerShare,
 )
+from zipline.finance.transaction import create_transaction
 from zipline.utils.input_validation import expect_types
+from zipline.utils.numpy_utils import float64_dtype
 
 log = Logger('Blotter')
 warning_logger = Logger('AlgoWarning')
 
+# The slippage and commission models which can process a batch of orders at
+# once. Subclasses may change how orders are processed, so only these exact
+# types are batched.
+BATCH_SLIPPAGE_MODELS = frozenset([
+    FixedBasisPointsSlippage,
+    FixedSlippage,
+    VolumeShareSlippage,
+])
+BATCH_COMMISSION_MODELS = frozenset([PerDollar, PerShare])
+
 
 @register(Blotter, 'default')
 class SimulationBlotter(Blotter):
@@ -338,14 +354,15 @@ class SimulationBlotter(Blotter):
         commissions = []
 
         if self.open_orders:
-            for asset, asset_orders in iteritems(self.open_orders):
-                slippage = self.slippage_models[type(asset)]
+            batch_fills = self._get_batch_fills(bar_data)
 
-                for order, txn in \
-                        slippage.simulate(bar_data, asset, asset_orders):
-                    commission = self.commission_models[type(asset)]
-                    additional_commission = commission.calculate(order, txn)
+            for asset, asset_orders in iteritems(self.open_orders):
+                try:
+                    fills = batch_fills[asset]
+                except KeyError:
+                    fills = self._get_fills(bar_data, asset, asset_orders)
 
+                for order, txn, additional_commission in fills:
                     if additional_commission > 0:
                         commissions.append({
                             "asset": order.asset,
@@ -365,6 +382,151 @@ class SimulationBlotter(Blotter):
 
         return transactions, commissions, closed_orders
 
+    def _get_fills(self, bar_data, asset, asset_orders):
+        """
+        Fill the open orders for a single asset, one order at a time.
+
+        Returns
+        -------
+        fills : iterable[(Order, Transaction, float)]
+            The order, transaction and commission of each fill.
+        """
+        slippage = self.slippage_models[type(asset)]
+        commission = self.commission_models[type(asset)]
+
+        for order, txn in slippage.simulate(bar_data, asset, asset_orders):
+            yield order, txn, commission.calculate(order, txn)
+
+    def _get_batch_fills(self, bar_data):
+        """
+        Fill the open market orders of every asset whose slippage model can
+        process a batch of orders, reading the prices and volumes of all of
+        those assets at once.
+
+        Returns
+        -------
+        fills : dict[Asset -> list[(Order, Transaction, float)]]
+            The order, transaction and commission of each fill, by asset.
+            Assets which are missing must be filled by ``_get_fills``.
+        """
+        assets_by_type = defaultdict(list)
+        for asset, asset_orders in iteritems(self.open_orders):
+            if type(self.slippage_models[type(asset)]) not in \
+                    BATCH_SLIPPAGE_MODELS:
+                continue
+
+            # Stop and limit orders are left to the slippage model, which
+            # only checks their triggers while the bar has volume left.
+            if all(order.stop is None and order.limit is None
+                   for order in asset_orders):
+                assets_by_type[type(asset)].append(asset)
+
+        fills = {}
+        for asset_type, assets in iteritems(assets_by_type):
+            fills.update(self._fill_orders(bar_data, asset_type, assets))
+        return fills
+
+    def _fill_orders(self, bar_data, asset_type, assets):
+        """
+        Fill the open market orders for ``assets``, which all have the type
+        ``asset_type``, as a batch.
+        """
+        slippage = self.slippage_models[asset_type]
+        commission = self.commission_models[asset_type]
+
+        asset_volumes = np.asarray(
+            bar_data.current(assets, 'volume'),
+            dtype=float64_dtype,
+        )
+        asset_prices = np.asarray(
+            bar_data.current(assets, 'close'),
+            dtype=float64_dtype,
+        )
+
+        fills = {}
+        orders = []
+        starts = []
+        prices = []
+        volumes = []
+        for asset, price, volume in zip(assets, asset_prices, asset_volumes):
+            # The slippage models don't expect a missing volume, leave those
+            # assets to them.
+            if np.isnan(volume):
+                continue
+
+            fills[asset] = []
+
+            # Without volume or a price in this bar, there is nothing to fill.
+            if volume == 0 or np.isnan(price):
+                continue
+
+            asset_orders = [
+                order for order in self.open_orders[asset]
+                if order.open_amount != 0
+            ]
+            if asset_orders:
+                starts.append(len(orders))
+                orders.extend(asset_orders)
+                prices.extend([price] * len(asset_orders))
+                volumes.extend([volume] * len(asset_orders))
+
+        if not orders:
+            return fills
+
+        amounts = np.array(
+            [order.amount for order in orders],
+            dtype=float64_dtype,
+        )
+        filled = np.array(
+            [order.filled for order in orders],
+            dtype=float64_dtype,
+        )
+        execution_prices, execution_volumes = slippage._process_orders(
+            np.array(prices, dtype=float64_dtype),
+            np.array(volumes, dtype=float64_dtype),
+            amounts,
+            amounts - filled,
+            np.array(
+                [order.direction for order in orders],
+                dtype=float64_dtype,
+            ),
+            np.array(starts, dtype=np.intp),
+        )
+
+        executed = np.flatnonzero(execution_volumes)
+        execution_prices = execution_prices[executed]
+        execution_volumes = execution_volumes[executed]
+
+        if type(commission) in BATCH_COMMISSION_MODELS:
+            additional_commissions = commission._calculate_batch(
+                np.array(
+                    [orders[ix].commission for ix in executed],
+                    dtype=float64_dtype,
+                ),
+                filled[executed],
+                np.trunc(execution_volumes),
+                execution_prices,
+            ).tolist()
+        else:
+            additional_commissions = None
+
+        dt = bar_data.current_dt
+        for i, (ix, price, volume) in enumerate(zip(
+                executed.tolist(),
+                execution_prices.tolist(),
+                execution_volumes.tolist())):
+            order = orders[ix]
+            txn = create_transaction(order, dt, price, volume)
+
+            if additional_commissions is None:
+                additional_commission = commission.calculate(order, txn)
+            else:
+                additional_commission = additional_commissions[i]
+
+            fills[order.asset].append((order, txn, additional_commission))
+
+        return fills
+
     def prune_orders(self, closed_orders):
         """
         Removes all given orders from the blotter's open_orders list.
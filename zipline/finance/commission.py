@@ -15,6 +15,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 
+import numpy as np
 from six import with_metaclass
 from toolz import merge
 
@@ -138,6 +139,46 @@ def calculate_per_unit_commission(order,
             return per_unit_total - order.commission
 
 
+def calculate_per_unit_commissions(commissions,
+                                   filled,
+                                   amounts,
+                                   cost_per_unit,
+                                   initial_commission,
+                                   min_trade_cost):
+    """
+    Vectorized :func:`calculate_per_unit_commission` over a batch of orders,
+    each with a single transaction.
+
+    Parameters
+    ----------
+    commissions : np.ndarray[float64]
+        The commission already charged on each order.
+    filled : np.ndarray[float64]
+        The amount of each order filled before its transaction.
+    amounts : np.ndarray[float64]
+        The amount of each order's transaction.
+    """
+    additional_commissions = np.abs(amounts * cost_per_unit)
+    per_unit_totals = (
+        np.abs(filled * cost_per_unit) +
+        additional_commissions +
+        initial_commission
+    )
+
+    return np.where(
+        commissions == 0,
+        np.maximum(
+            min_trade_cost,
+            additional_commissions + initial_commission,
+        ),
+        np.where(
+            per_unit_totals < min_trade_cost,
+            0.0,
+            per_unit_totals - commissions,
+        ),
+    )
+
+
 class PerShare(EquityCommissionModel):
     """
     Calculates a commission for a transaction based on a per share cost with
@@ -177,6 +218,31 @@ class PerShare(EquityCommissionModel):
             min_trade_cost=self.min_trade_cost,
         )
 
+    def _calculate_batch(self, commissions, filled, amounts, prices):
+        """
+        Calculate the commissions of a batch of orders, each with a single
+        transaction, at once.
+
+        Parameters
+        ----------
+        commissions : np.ndarray[float64]
+            The commission already charged on each order.
+        filled : np.ndarray[float64]
+            The amount of each order filled before its transaction.
+        amounts : np.ndarray[float64]
+            The amount of each order's transaction.
+        prices : np.ndarray[float64]
+            The price of each order's transaction.
+        """
+        return calculate_per_unit_commissions(
+            commissions=commissions,
+            filled=filled,
+            amounts=amounts,
+            cost_per_unit=self.cost_per_share,
+            initial_commission=0,
+            min_trade_cost=self.min_trade_cost,
+        )
+
 
 class PerContract(FutureCommissionModel):
     """
@@ -367,3 +433,10 @@ class PerDollar(EquityCommissionModel):
         """
         cost_per_share = transaction.price * self.cost_per_dollar
         return abs(transaction.amount) * cost_per_share
+
+    def _calculate_batch(self, commissions, filled, amounts, prices):
+        """
+        Calculate the commissions of a batch of orders at once. See
+        :meth:`PerShare._calculate_batch`.
+        """
+        return np.abs(amounts) * (prices * self.cost_per_dollar)
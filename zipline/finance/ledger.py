@@ -16,7 +16,6 @@
 from __future__ import division
 
 from collections import namedtuple, OrderedDict
-from functools import partial
 from math import isnan
 
 import logbook
@@ -24,20 +23,44 @@ import numpy as np
 import pandas as pd
 from six import iteritems, itervalues, PY2
 
-from zipline.assets import Future
+from zipline.assets import Equity, Future
 from zipline.finance.transaction import Transaction
 import zipline.protocol as zp
+from zipline.utils.numpy_utils import (
+    bool_dtype,
+    float64_dtype,
+    int64_dtype,
+)
 from zipline.utils.sentinel import sentinel
 from .position import Position
 from ._finance_ext import (
     PositionStats,
-    calculate_position_tracker_stats,
-    update_position_last_sale_prices,
+    calculate_position_array_stats,
 )
 
 log = logbook.Logger('Performance')
 
 
+# The fields of the rows of ``PositionTracker``'s position array.
+_position_dtype = np.dtype(
+    [
+        ('sid', int64_dtype),
+        ('amount', int64_dtype),
+        ('cost_basis', float64_dtype),
+        ('last_sale_price', float64_dtype),
+        ('last_sale_date', object),
+        # the multiplier from the notional value of the position to its
+        # exposure, e.g. the price multiplier of a future
+        ('exposure_multiplier', float64_dtype),
+        # futures don't have an inherent position value
+        ('has_value', bool_dtype),
+        # equity prices need to be adjusted outside of market hours
+        ('is_equity', bool_dtype),
+    ],
+    align=True,
+)
+
+
 class PositionTracker(object):
     """The current state of the positions held.
 
@@ -45,9 +68,32 @@ class PositionTracker(object):
     ----------
     data_frequency : {'daily', 'minute'}
         The data frequency of the simulation.
+
+    Notes
+    -----
+    The positions are stored as rows of an array, in the order in which they
+    were opened, so that the last sale prices of all of the positions can be
+    synced with a single read from the data portal and the stats can be
+    computed without touching a Python object per position.
+
+    Closing a position only marks its row as closed so that it doesn't cost
+    time proportional to the number of open positions. The closed rows are
+    dropped the next time all of the rows are read.
+
+    The :class:`~zipline.finance.position.Position` objects in ``positions``
+    share their values with the protocol positions in the portfolio. They are
+    only brought up to date with the array when they are accessed.
     """
     def __init__(self, data_frequency):
-        self.positions = OrderedDict()
+        # the asset of each row of ``_position_array``, or None if the
+        # position in the row has been closed
+        self._assets = []
+        self._rows = {}
+        self._closed_rows = 0
+        self._position_array = np.empty(0, dtype=_position_dtype)
+
+        self._positions = OrderedDict()
+        self._dirty_positions = False
 
         self._unpaid_dividends = {}
         self._unpaid_stock_dividends = {}
@@ -59,6 +105,159 @@ class PositionTracker(object):
         self._dirty_stats = True
         self._stats = PositionStats.new()
 
+    @property
+    def positions(self):
+        """The positions held, keyed by asset, in the order in which they were
+        opened.
+        """
+        if self._dirty_positions:
+            self._update_positions()
+        return self._positions
+
+    def _update_positions(self):
+        """Bring the Position objects up to date with the position array.
+        """
+        self._compact()
+        array = self._position_array[:len(self._assets)]
+        for position, amount, cost_basis, price, date in zip(
+                itervalues(self._positions),
+                array['amount'].tolist(),
+                array['cost_basis'].tolist(),
+                array['last_sale_price'].tolist(),
+                array['last_sale_date']):
+            inner = position.inner_position
+            inner.amount = amount
+            inner.cost_basis = cost_basis
+            inner.last_sale_price = price
+            inner.last_sale_date = date
+
+        self._dirty_positions = False
+
+    def _open_position(self, asset):
+        """Add a row and a Position object for a new position in ``asset``.
+        """
+        if len(self._assets) == len(self._position_array):
+            self._compact()
+
+        row = len(self._assets)
+        if row == len(self._position_array):
+            # grow the array geometrically so that opening many positions
+            # doesn't copy it each time
+            array = np.empty(max(2 * row, 16), dtype=_position_dtype)
+            array[:row] = self._position_array
+            self._position_array = array
+
+        is_future = type(asset) is Future
+        self._position_array[row] = (
+            asset.sid,
+            0,
+            0.0,
+            0.0,
+            None,
+            asset.price_multiplier if is_future else 1.0,
+            not is_future,
+            isinstance(asset, Equity),
+        )
+
+        self._assets.append(asset)
+        self._rows[asset] = row
+
+        self._positions[asset] = position = Position(asset)
+        self._positions_store[asset] = position.protocol_position
+        return row
+
+    def _close_position(self, asset):
+        """Remove the row and Position object of the position in ``asset``.
+        """
+        row = self._rows.pop(asset)
+
+        # leave the row in place until the next compaction; a zero amount
+        # keeps it out of the stats in the meantime
+        self._assets[row] = None
+        self._position_array['amount'][row] = 0
+        self._closed_rows += 1
+
+        del self._positions[asset]
+
+        try:
+            # if this position exists in our user-facing dictionary,
+            # remove it as well.
+            del self._positions_store[asset]
+        except KeyError:
+            pass
+
+    def _compact(self):
+        """Drop the rows of the closed positions, keeping the open positions
+        in the order in which they were opened.
+        """
+        if not self._closed_rows:
+            return
+
+        is_open = np.array(
+            [asset is not None for asset in self._assets],
+            dtype=bool,
+        )
+        assets = [asset for asset in self._assets if asset is not None]
+        count = len(is_open)
+        open_count = len(assets)
+
+        array = self._position_array
+        array[:open_count] = array[:count][is_open]
+        array['last_sale_date'][open_count:count] = None
+
+        self._assets = assets
+        self._rows = {asset: row for row, asset in enumerate(assets)}
+        self._closed_rows = 0
+
+    def _get_position(self, asset, open_position=False):
+        """Get the row and up to date Position object of the position in
+        ``asset``.
+
+        Parameters
+        ----------
+        asset : Asset
+            The asset of the position.
+        open_position : bool, optional
+            Open a position if we don't hold ``asset``. Otherwise, raise a
+            KeyError.
+        """
+        try:
+            row = self._rows[asset]
+        except KeyError:
+            if not open_position:
+                raise
+            row = self._open_position(asset)
+
+        position = self._positions[asset]
+        values = self._position_array[row]
+        inner = position.inner_position
+        inner.amount = values['amount']
+        inner.cost_basis = values['cost_basis']
+        inner.last_sale_price = values['last_sale_price']
+        inner.last_sale_date = values['last_sale_date']
+        return row, position
+
+    def _store_position(self, row, position):
+        """Write the values of a Position object back to its row.
+        """
+        array = self._position_array
+        array['amount'][row] = position.amount
+        array['cost_basis'][row] = position.cost_basis
+        array['last_sale_price'][row] = position.last_sale_price
+        array['last_sale_date'][row] = position.last_sale_date
+
+    def amount_and_last_sale_price(self, asset):
+        """Get the amount and last sale price of the position in ``asset``
+        without bringing the Position objects up to date.
+
+        Raises
+        ------
+        KeyError
+            Raised when we don't hold ``asset``.
+        """
+        values = self._position_array[self._rows[asset]]
+        return int(values['amount']), float(values['last_sale_price'])
+
     def update_position(self,
                         asset,
                         amount=None,
@@ -67,11 +266,7 @@ class PositionTracker(object):
                         cost_basis=None):
         self._dirty_stats = True
 
-        if asset not in self.positions:
-            position = Position(asset)
-            self.positions[asset] = position
-        else:
-            position = self.positions[asset]
+        row, position = self._get_position(asset, open_position=True)
 
         if amount is not None:
             position.amount = amount
@@ -82,34 +277,28 @@ class PositionTracker(object):
         if cost_basis is not None:
             position.cost_basis = cost_basis
 
+        self._store_position(row, position)
+
     def execute_transaction(self, txn):
         self._dirty_stats = True
 
         asset = txn.asset
-
-        if asset not in self.positions:
-            position = Position(asset)
-            self.positions[asset] = position
-        else:
-            position = self.positions[asset]
+        row, position = self._get_position(asset, open_position=True)
 
         position.update(txn)
 
         if position.amount == 0:
-            del self.positions[asset]
-
-            try:
-                # if this position exists in our user-facing dictionary,
-                # remove it as well.
-                del self._positions_store[asset]
-            except KeyError:
-                pass
+            self._close_position(asset)
+        else:
+            self._store_position(row, position)
 
     def handle_commission(self, asset, cost):
         # Adjust the cost basis of the stock if we own it
-        if asset in self.positions:
+        if asset in self._rows:
             self._dirty_stats = True
-            self.positions[asset].adjust_commission_cost_basis(asset, cost)
+            row, position = self._get_position(asset)
+            position.adjust_commission_cost_basis(asset, cost)
+            self._store_position(row, position)
 
     def handle_splits(self, splits):
         """Processes a list of splits by modifying any positions as needed.
@@ -127,13 +316,14 @@ class PositionTracker(object):
         total_leftover_cash = 0
 
         for asset, ratio in splits:
-            if asset in self.positions:
+            if asset in self._rows:
                 self._dirty_stats = True
 
                 # Make the position object handle the split. It returns the
                 # leftover cash from a fractional share, if there is any.
-                position = self.positions[asset]
+                row, position = self._get_position(asset)
                 leftover_cash = position.handle_split(asset, ratio)
+                self._store_position(row, position)
                 total_leftover_cash += leftover_cash
 
         return total_leftover_cash
@@ -155,9 +345,8 @@ class PositionTracker(object):
 
             # Store the earned dividends so that they can be paid on the
             # dividends' pay_dates.
-            div_owed = self.positions[cash_dividend.asset].earn_dividend(
-                cash_dividend,
-            )
+            _, position = self._get_position(cash_dividend.asset)
+            div_owed = position.earn_dividend(cash_dividend)
             try:
                 self._unpaid_dividends[cash_dividend.pay_date].append(div_owed)
             except KeyError:
@@ -166,9 +355,8 @@ class PositionTracker(object):
         for stock_dividend in stock_dividends:
             self._dirty_stats = True  # only mark dirty if we pay a dividend
 
-            div_owed = self.positions[
-                stock_dividend.asset
-            ].earn_stock_dividend(stock_dividend)
+            _, position = self._get_position(stock_dividend.asset)
+            div_owed = position.earn_stock_dividend(stock_dividend)
             try:
                 self._unpaid_stock_dividends[stock_dividend.pay_date].append(
                     div_owed,
@@ -210,28 +398,26 @@ class PositionTracker(object):
             share_count = stock_payment['share_count']
             # note we create a Position for stock dividend if we don't
             # already own the asset
-            if payment_asset in self.positions:
-                position = self.positions[payment_asset]
-            else:
-                position = self.positions[payment_asset] = Position(
-                    payment_asset,
-                )
-
+            row, position = self._get_position(
+                payment_asset,
+                open_position=True,
+            )
             position.amount += share_count
+            self._store_position(row, position)
 
         return net_cash_payment
 
     def maybe_create_close_position_transaction(self, asset, dt, data_portal):
-        if not self.positions.get(asset):
+        if asset not in self._rows:
             return None
 
-        amount = self.positions.get(asset).amount
+        amount, last_sale_price = self.amount_and_last_sale_price(asset)
         price = data_portal.get_spot_value(
             asset, 'price', dt, self.data_frequency)
 
         # Get the last traded price if price is no longer available
         if isnan(price):
-            price = self.positions.get(asset).last_sale_price
+            price = last_sale_price
 
         return Transaction(
             asset=asset,
@@ -242,14 +428,11 @@ class PositionTracker(object):
         )
 
     def get_positions(self):
-        positions = self._positions_store
-
-        for asset, pos in iteritems(self.positions):
-            # Adds the new position if we didn't have one before, or overwrite
-            # one we have currently
-            positions[asset] = pos.protocol_position
-
-        return positions
+        # The protocol positions share their values with our Position
+        # objects, so we only need to bring those up to date.
+        if self._dirty_positions:
+            self._update_positions()
+        return self._positions_store
 
     def get_position_list(self):
         return [
@@ -264,25 +447,50 @@ class PositionTracker(object):
                               handle_non_market_minutes=False):
         self._dirty_stats = True
 
+        self._compact()
+        assets = self._assets
+        if not assets:
+            return
+
+        array = self._position_array[:len(assets)]
         if handle_non_market_minutes:
             previous_minute = data_portal.trading_calendar.previous_minute(dt)
-            get_price = partial(
-                data_portal.get_adjusted_value,
-                field='price',
-                dt=previous_minute,
-                perspective_dt=dt,
-                data_frequency=self.data_frequency,
+            prices = np.array(
+                data_portal.get_spot_value(
+                    assets,
+                    'price',
+                    previous_minute,
+                    self.data_frequency,
+                ),
+                dtype=float64_dtype,
             )
 
+            # apply the adjustments known at ``dt`` to the equity prices, as
+            # ``DataPortal.get_adjusted_value`` would
+            is_equity = array['is_equity']
+            if is_equity.any():
+                prices[is_equity] *= data_portal.get_adjustments(
+                    [asset for asset, eq in zip(assets, is_equity) if eq],
+                    'price',
+                    previous_minute,
+                    dt,
+                )
         else:
-            get_price = partial(
-                data_portal.get_scalar_asset_spot_value,
-                field='price',
-                dt=dt,
-                data_frequency=self.data_frequency,
+            prices = np.array(
+                data_portal.get_spot_value(
+                    assets,
+                    'price',
+                    dt,
+                    self.data_frequency,
+                ),
+                dtype=float64_dtype,
             )
 
-        update_position_last_sale_prices(self.positions, get_price, dt)
+        has_price = ~np.isnan(prices)
+        array['last_sale_price'][has_price] = prices[has_price]
+        array['last_sale_date'][has_price] = dt
+
+        self._dirty_positions = True
 
     @property
     def stats(self):
@@ -299,7 +507,16 @@ class PositionTracker(object):
         the stats may have changed.
         """
         if self._dirty_stats:
-            calculate_position_tracker_stats(self.positions, self._stats)
+            self._compact()
+            array = self._position_array[:len(self._assets)]
+            calculate_position_array_stats(
+                array['sid'],
+                array['amount'],
+                array['last_sale_price'],
+                array['exposure_multiplier'],
+                array['has_value'],
+                self._stats,
+            )
             self._dirty_stats = False
 
         return self._stats
@@ -398,6 +615,10 @@ class Ledger(object):
 
         self.position_tracker = PositionTracker(data_frequency)
 
+        # The positions are only built when they are accessed through the
+        # portfolio.
+        self._portfolio._get_positions = self.position_tracker.get_positions
+
         self._processed_transactions = {}
 
         self._orders_by_modified = {}
@@ -491,8 +712,9 @@ class Ledger(object):
             except KeyError:
                 self._payout_last_sale_prices[asset] = transaction.price
             else:
-                position = self.position_tracker.positions[asset]
-                amount = position.amount
+                amount, _ = self.position_tracker.amount_and_last_sale_price(
+                    asset,
+                )
                 price = transaction.price
 
                 self._cash_flow(
@@ -682,15 +904,17 @@ class Ledger(object):
     def positions(self):
         return self.position_tracker.get_position_list()
 
-    def _get_payout_total(self, positions):
+    def _get_payout_total(self, position_tracker):
         calculate_payout = self._calculate_payout
         payout_last_sale_prices = self._payout_last_sale_prices
+        amount_and_last_sale_price = (
+            position_tracker.amount_and_last_sale_price
+        )
 
         total = 0
         for asset, old_price in iteritems(payout_last_sale_prices):
-            position = positions[asset]
-            payout_last_sale_prices[asset] = price = position.last_sale_price
-            amount = position.amount
+            amount, price = amount_and_last_sale_price(asset)
+            payout_last_sale_prices[asset] = price
             total += calculate_payout(
                 asset.price_multiplier,
                 amount,
@@ -709,14 +933,13 @@ class Ledger(object):
         portfolio = self._portfolio
         pt = self.position_tracker
 
-        portfolio.positions = pt.get_positions()
         position_stats = pt.stats
 
         portfolio.positions_value = position_value = (
             position_stats.net_value
         )
         portfolio.positions_exposure = position_stats.net_exposure
-        self._cash_flow(self._get_payout_total(pt.positions))
+        self._cash_flow(self._get_payout_total(pt))
 
         start_value = portfolio.portfolio_value
 
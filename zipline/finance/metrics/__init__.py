@@ -36,7 +36,11 @@ from .metric import (
     ReturnsStatistic,
     SimpleLedgerField,
     StartOfPeriodLedgerField,
+    StreamingAlphaBeta,
+    StreamingReturnsStatistic,
     Transactions,
+    _ReturnsDrawdown,
+    _ReturnsMoments,
     _ConstantCumulativeRiskMetric,
     _ClassicRiskMetrics,
 )
@@ -107,6 +111,30 @@ def default_metrics():
     }
 
 
+@register('streaming')
+def streaming_metrics():
+    """The default metrics, with the cumulative risk metrics updated from
+    running state on each bar instead of recomputed from the whole returns
+    history.
+    """
+    metrics = {
+        metric for metric in default_metrics()
+        if not isinstance(metric, (ReturnsStatistic, AlphaBeta))
+    }
+    metrics.update({
+        StreamingReturnsStatistic(
+            _ReturnsMoments,
+            'annual_volatility',
+            'algo_volatility',
+        ),
+        StreamingAlphaBeta(),
+        StreamingReturnsStatistic(_ReturnsMoments, 'sharpe_ratio', 'sharpe'),
+        StreamingReturnsStatistic(_ReturnsMoments, 'sortino_ratio', 'sortino'),
+        StreamingReturnsStatistic(_ReturnsDrawdown, 'max_drawdown'),
+    })
+    return metrics
+
+
 @register('classic')
 @deprecated(
     'The original risk packet has been deprecated and will be removed in a '
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from copy import copy
 import datetime
 from functools import partial
 import operator as op
@@ -464,6 +465,241 @@ class AlphaBeta(object):
     end_of_session = end_of_bar
 
 
+# The number of daily returns per year used by empyrical to annualize the
+# risk metrics.
+_ANNUALIZATION_FACTOR = 252
+
+
+class _ReturnsMoments(object):
+    """The running moments of a series of returns.
+
+    Mirrors the NaN handling of empyrical: NaN returns count towards the
+    length of the series, but are skipped by the moments.
+    """
+    def __init__(self):
+        self.length = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.downside_m2 = 0.0
+
+    def update(self, r):
+        self.length += 1
+        if r != r:
+            return
+
+        self.count += 1
+        delta = r - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (r - self.mean)
+        if r < 0:
+            self.downside_m2 += r * r
+
+    def _std(self):
+        if self.count < 2:
+            return np.nan
+        return np.sqrt(self.m2 / (self.count - 1))
+
+    def annual_volatility(self):
+        if self.length < 2:
+            return np.nan
+        return self._std() * np.sqrt(_ANNUALIZATION_FACTOR)
+
+    def sharpe_ratio(self):
+        if self.length < 2:
+            return np.nan
+        std = self._std()
+        if not std:
+            return np.nan
+        return self.mean / std * np.sqrt(_ANNUALIZATION_FACTOR)
+
+    def sortino_ratio(self):
+        if self.length < 2 or not self.count:
+            return np.nan
+        downside_risk = (
+            np.sqrt(self.downside_m2 / self.count) *
+            np.sqrt(_ANNUALIZATION_FACTOR)
+        )
+        if not downside_risk:
+            return np.nan
+        return self.mean * _ANNUALIZATION_FACTOR / downside_risk
+
+
+class _ReturnsDrawdown(object):
+    """The running drawdown of a series of returns.
+
+    Like empyrical, the cumulative value starts at 100 and treats NaN
+    returns as 0.
+    """
+    def __init__(self):
+        self.length = 0
+        self.cumulative = 1.0
+        self.peak = 100.0
+        self.drawdown = 0.0
+
+    def update(self, r):
+        self.length += 1
+        if r != r:
+            r = 0.0
+
+        self.cumulative *= 1 + r
+        value = self.cumulative * 100
+        self.peak = np.fmax(self.peak, value)
+        self.drawdown = np.fmin(self.drawdown, (value - self.peak) / self.peak)
+
+    def max_drawdown(self):
+        if self.length < 1:
+            return np.nan
+        return self.drawdown
+
+
+class _ReturnsRegression(object):
+    """The running regression of a series of returns on the returns of a
+    factor.
+
+    Like empyrical, pairs where either return is NaN are skipped.
+    """
+    def __init__(self):
+        self.length = 0
+        self.count = 0
+        self.factor_mean = 0.0
+        self.mean = 0.0
+        self.factor_m2 = 0.0
+        self.co_moment = 0.0
+
+    def update(self, r, factor_r):
+        self.length += 1
+        if r != r or factor_r != factor_r:
+            return
+
+        self.count += 1
+        factor_delta = factor_r - self.factor_mean
+        self.factor_mean += factor_delta / self.count
+        self.mean += (r - self.mean) / self.count
+        self.factor_m2 += factor_delta * (factor_r - self.factor_mean)
+        self.co_moment += factor_delta * (r - self.mean)
+
+    def beta(self):
+        if self.length < 2 or not self.count:
+            return np.nan
+        if self.factor_m2 / self.count < 1.0e-30:
+            return np.nan
+        return self.co_moment / self.factor_m2
+
+    def alpha_beta(self):
+        beta = self.beta()
+        if self.length < 2 or np.isnan(beta):
+            return np.nan, beta
+        # empyrical annualizes the mean excess return arithmetically, not by
+        # compounding it.
+        alpha = (
+            (self.mean - beta * self.factor_mean) * _ANNUALIZATION_FACTOR
+        )
+        return alpha, beta
+
+
+class StreamingReturnsStatistic(object):
+    """A metric that reports a statistic of the algorithm returns, like
+    :class:`ReturnsStatistic`, but which updates the statistic from running
+    state instead of recomputing it from the whole returns history on each
+    bar.
+
+    The returns of each session are folded into the running state once the
+    session is over. Until then, the statistic is computed from a copy of the
+    state which includes the session's return so far.
+
+    Parameters
+    ----------
+    state_type : type
+        The type of the running state, ``_ReturnsMoments`` or
+        ``_ReturnsDrawdown``.
+    statistic : str
+        The name of the method of the state which computes the statistic.
+    field_name : str, optional
+        The name of the field. If not provided, it will be ``statistic``.
+    """
+    def __init__(self, state_type, statistic, field_name=None):
+        if field_name is None:
+            field_name = statistic
+
+        self._state_type = state_type
+        self._statistic = statistic
+        self._field_name = field_name
+
+    def start_of_simulation(self, *args):
+        self._state = self._state_type()
+        self._folded_sessions = 0
+
+    def end_of_bar(self,
+                   packet,
+                   ledger,
+                   dt,
+                   session_ix,
+                   data_portal):
+        returns = ledger.daily_returns_array
+        state = self._state
+        while self._folded_sessions < session_ix:
+            state.update(returns[self._folded_sessions])
+            self._folded_sessions += 1
+
+        current = copy(state)
+        current.update(returns[session_ix])
+        res = getattr(current, self._statistic)()
+        if not np.isfinite(res):
+            res = None
+        packet['cumulative_risk_metrics'][self._field_name] = res
+
+    end_of_session = end_of_bar
+
+
+class StreamingAlphaBeta(object):
+    """Alpha and beta to the benchmark, like :class:`AlphaBeta`, but updated
+    from a running regression instead of recomputed from the whole returns
+    history on each bar.
+    """
+    def start_of_simulation(self,
+                            ledger,
+                            emission_rate,
+                            trading_calendar,
+                            sessions,
+                            benchmark_source):
+        self._daily_returns_array = benchmark_source.daily_returns(
+            sessions[0],
+            sessions[-1],
+        ).values
+        self._regression = _ReturnsRegression()
+        self._folded_sessions = 0
+
+    def end_of_bar(self,
+                   packet,
+                   ledger,
+                   dt,
+                   session_ix,
+                   data_portal):
+        returns = ledger.daily_returns_array
+        benchmark_returns = self._daily_returns_array
+        regression = self._regression
+        while self._folded_sessions < session_ix:
+            ix = self._folded_sessions
+            regression.update(returns[ix], benchmark_returns[ix])
+            self._folded_sessions += 1
+
+        current = copy(regression)
+        current.update(returns[session_ix], benchmark_returns[session_ix])
+        alpha, beta = current.alpha_beta()
+
+        if np.isnan(alpha):
+            alpha = None
+        if np.isnan(beta):
+            beta = None
+
+        risk = packet['cumulative_risk_metrics']
+        risk['alpha'] = alpha
+        risk['beta'] = beta
+
+    end_of_session = end_of_bar
+
+
 class MaxLeverage(object):
     """Tracks the maximum account leverage.
     """
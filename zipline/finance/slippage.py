@@ -80,6 +80,42 @@ def fill_price_worse_than_limit_price(fill_price, order):
     return False
 
 
+def fill_in_turn(max_volumes, open_amounts, starts):
+    """
+    Compute the fills of a batch of orders when the orders for each asset are
+    filled in turn until the asset's volume limit is used up.
+
+    Parameters
+    ----------
+    max_volumes : np.ndarray[float64]
+        The most shares of each order's asset which can be filled in the bar.
+    open_amounts : np.ndarray[float64]
+        The absolute open amount of each order.
+    starts : np.ndarray[intp]
+        The index of the first order of each asset. The orders for an asset
+        are contiguous.
+
+    Returns
+    -------
+    filled : np.ndarray[float64]
+        The number of shares filled for each order.
+    total_filled : np.ndarray[float64]
+        The number of shares of the order's asset filled by the order and the
+        orders before it.
+    """
+    cumulative = np.cumsum(open_amounts)
+    previous = cumulative - open_amounts
+
+    # restart the running totals at the first order of each asset
+    lengths = np.diff(np.append(starts, len(open_amounts)))
+    offsets = np.repeat(previous[starts], lengths)
+    cumulative -= offsets
+    previous -= offsets
+
+    total_filled = np.minimum(cumulative, max_volumes)
+    return total_filled - np.minimum(previous, max_volumes), total_filled
+
+
 class SlippageModel(with_metaclass(FinancialModelMeta)):
     """Abstract interface for defining a slippage model.
     """
@@ -269,6 +305,52 @@ class VolumeShareSlippage(SlippageModel):
             math.copysign(cur_volume, order.direction)
         )
 
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        starts):
+        """
+        Process a batch of market orders at once, as ``process_order`` would
+        process each of them in turn.
+
+        Parameters
+        ----------
+        prices : np.ndarray[float64]
+            The close price of each order's asset.
+        volumes : np.ndarray[float64]
+            The volume of each order's asset.
+        amounts : np.ndarray[float64]
+            The amount of each order.
+        open_amounts : np.ndarray[float64]
+            The open amount of each order.
+        directions : np.ndarray[float64]
+            The direction of each order.
+        starts : np.ndarray[intp]
+            The index of the first order of each asset.
+
+        Returns
+        -------
+        execution_prices : np.ndarray[float64]
+            The price at which to fill each order.
+        execution_volumes : np.ndarray[float64]
+            The signed number of shares to fill for each order, or 0 if the
+            order can't be filled.
+        """
+        filled, total_filled = fill_in_turn(
+            np.floor(self.volume_limit * volumes),
+            np.abs(open_amounts),
+            starts,
+        )
+        volume_shares = np.minimum(total_filled / volumes, self.volume_limit)
+        simulated_impacts = volume_shares ** 2 \
+            * np.copysign(self.price_impact, directions) \
+            * prices
+
+        return prices + simulated_impacts, filled * directions
+
 
 class FixedSlippage(SlippageModel):
     """
@@ -296,6 +378,19 @@ class FixedSlippage(SlippageModel):
             order.amount
         )
 
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        starts):
+        """
+        Process a batch of market orders at once. See
+        :meth:`VolumeShareSlippage._process_orders`.
+        """
+        return prices + (self.spread / 2.0 * directions), amounts
+
 
 class MarketImpactBase(SlippageModel):
     """
@@ -581,3 +676,24 @@ class FixedBasisPointsSlippage(SlippageModel):
             price + price * (self.percentage * order.direction),
             shares_to_fill * order.direction
         )
+
+    def _process_orders(self,
+                        prices,
+                        volumes,
+                        amounts,
+                        open_amounts,
+                        directions,
+                        starts):
+        """
+        Process a batch of market orders at once. See
+        :meth:`VolumeShareSlippage._process_orders`.
+        """
+        filled, _ = fill_in_turn(
+            np.floor(self.volume_limit * volumes),
+            np.abs(open_amounts),
+            starts,
+        )
+        return (
+            prices + prices * (self.percentage * directions),
+            filled * directions,
+        )
@@ -30,7 +30,30 @@ cpdef enum:
     BEFORE_TRADING_START_BAR = 4
 
 cdef class MinuteSimulationClock:
+    """
+    Emits the sessions, bars and before_trading_start events of a
+    simulation.
+
+    Parameters
+    ----------
+    sessions : pd.DatetimeIndex
+        The sessions to simulate.
+    market_opens, market_closes : pd.Series
+        The first and last minutes over which to emit bars in each session.
+    before_trading_start_minutes : pd.Series
+        The minute at which to emit before_trading_start in each session.
+    minute_emission : bool, optional
+        Whether to emit a MINUTE_END after each bar.
+    next_bar_func : callable[(pd.DatetimeIndex, int) -> int], optional
+        Called with the minutes of the current session and the position of
+        the minute after the last emitted bar. Returns the position of the
+        next minute which needs a bar, so that idle minutes are skipped.
+        The first and last minutes of every session are always emitted, and
+        the function is called again after before_trading_start. This
+        can't be combined with ``minute_emission``.
+    """
     cdef bool minute_emission
+    cdef object next_bar_func
     cdef np.int64_t[:] market_opens_nanos, market_closes_nanos, bts_nanos, \
         sessions_nanos
     cdef dict minutes_by_session
@@ -40,8 +63,15 @@ cdef class MinuteSimulationClock:
                  market_opens,
                  market_closes,
                  before_trading_start_minutes,
-                 minute_emission=False):
+                 minute_emission=False,
+                 next_bar_func=None):
+        if minute_emission and next_bar_func is not None:
+            raise ValueError(
+                'Cannot skip bars when emitting a message for every minute.'
+            )
+
         self.minute_emission = minute_emission
+        self.next_bar_func = next_bar_func
 
         self.market_opens_nanos = market_opens.values.astype(np.int64)
         self.market_closes_nanos = market_closes.values.astype(np.int64)
@@ -70,8 +100,25 @@ cdef class MinuteSimulationClock:
             )
         return minutes_by_session
 
+    def all_minutes(self):
+        """
+        Every minute on which a bar is emitted when none are skipped.
+
+        Returns
+        -------
+        minutes : pd.DatetimeIndex
+        """
+        return pd.to_datetime(
+            np.concatenate([
+                self.minutes_by_session[session_nano].asi8
+                for session_nano in self.sessions_nanos
+            ]),
+            utc=True,
+        )
+
     def __iter__(self):
         minute_emission = self.minute_emission
+        next_bar_func = self.next_bar_func
 
         for idx, session_nano in enumerate(self.sessions_nanos):
             yield pd.Timestamp(session_nano, tz='UTC'), SESSION_START
@@ -79,7 +126,14 @@ cdef class MinuteSimulationClock:
             bts_minute = pd.Timestamp(self.bts_nanos[idx], tz='UTC')
             regular_minutes = self.minutes_by_session[session_nano]
 
-            if bts_minute > regular_minutes[-1]:
+            if next_bar_func is not None:
+                for minute, evt in self._get_active_minutes(
+                    regular_minutes,
+                    bts_minute,
+                    next_bar_func,
+                ):
+                    yield minute, evt
+            elif bts_minute > regular_minutes[-1]:
                 # before_trading_start is after the last close,
                 # so don't emit it
                 for minute, evt in self._get_minutes_for_list(
@@ -115,3 +169,39 @@ cdef class MinuteSimulationClock:
             yield minute, BAR
             if minute_emission:
                 yield minute, MINUTE_END
+
+    def _get_active_minutes(self, minutes, bts_minute, next_bar_func):
+        cdef Py_ssize_t last_idx = len(minutes) - 1
+        cdef Py_ssize_t minute_idx = 0
+        cdef Py_ssize_t bts_idx
+
+        if bts_minute > minutes[-1]:
+            # before_trading_start is after the last close,
+            # so don't emit it
+            bts_idx = -1
+        else:
+            bts_idx = minutes.searchsorted(bts_minute)
+
+        while True:
+            if minute_idx == bts_idx:
+                yield bts_minute, BEFORE_TRADING_START_BAR
+                bts_idx = -1
+
+                if 0 < minute_idx < last_idx:
+                    # before_trading_start may have placed orders, so look
+                    # again for the next minute that needs a bar
+                    minute_idx = min(
+                        max(next_bar_func(minutes, minute_idx), minute_idx),
+                        last_idx,
+                    )
+
+            yield minutes[minute_idx], BAR
+            if minute_idx == last_idx:
+                break
+
+            minute_idx = min(
+                max(next_bar_func(minutes, minute_idx + 1), minute_idx + 1),
+                last_idx,
+            )
+            if 0 <= bts_idx < minute_idx:
+                minute_idx = bts_idx
@@ -13,6 +13,7 @@ from numpy import (
     uint32,
     uint8,
 )
+from numpy.lib.stride_tricks import as_strided
 from zipline.errors import (
     WindowLengthNotPositive,
     WindowLengthTooLong,
@@ -217,6 +218,39 @@ class AdjustedArray(object):
             rounding_places=None,
         )
 
+    def traverse_blocks(self, window_length, offset=0):
+        """
+        Produce an object providing stacks of rolling windows over our data.
+
+        Unlike :meth:`traverse`, which yields one window at a time, the
+        returned :class:`WindowBlocks` provides zero-copy 3D views over runs
+        of consecutive windows that share the same adjustments.
+
+        Parameters
+        ----------
+        window_length : int
+            The number of rows in each window.
+        offset : int, optional
+            Number of rows to skip before the first window.  Default is 0.
+
+        Returns
+        -------
+        blocks : WindowBlocks
+        """
+        if isinstance(self._data, LabelArray):
+            raise TypeError(
+                "Can't traverse blocks of windows over a categorical array."
+            )
+        data = self._data.copy()
+        _check_window_params(data, window_length)
+        return WindowBlocks(
+            data,
+            self._view_kwargs,
+            self.adjustments,
+            offset,
+            window_length,
+        )
+
     def inspect(self):
         """
         Return a string representation of the data stored in this array.
@@ -238,6 +272,129 @@ class AdjustedArray(object):
         )
 
 
+class WindowBlocks(object):
+    """
+    Stacks of rolling windows over an AdjustedArray.
+
+    Row ``i`` of the output of a windowed computation is computed from the
+    window ending at row ``i + offset + window_length - 1`` of the data, as
+    seen after applying the adjustments known on that row. Between two rows
+    at which new adjustments become known, consecutive windows are views over
+    the same buffer, so they can be exposed as a single strided array of
+    shape ``(nrows, window_length) + data.shape[1:]`` without copying.
+
+    This object stores a copy of the data from the AdjustedArray over which
+    it's iterating, and mutates it as adjustments are applied. Blocks must be
+    requested in order, and a block is invalidated by requesting a block
+    after the next boundary.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        A copy of the array's buffer.
+    view_kwargs : dict
+        Arguments to pass to ``data.view`` to get user-facing values.
+    adjustments : dict[int -> list[Adjustment]]
+        The adjustments to apply, keyed by the row on which they're known.
+    offset : int
+        Number of rows to skip before the first window.
+    window_length : int
+        The number of rows in each window.
+
+    Attributes
+    ----------
+    nrows : int
+        The number of windows.
+    boundaries : list[int]
+        The indices of the windows, other than the first, for which new
+        adjustments are applied. A single call to :meth:`windows` can't span
+        a boundary.
+    """
+    def __init__(self, data, view_kwargs, adjustments, offset, window_length):
+        self._data = data
+        if view_kwargs:
+            self._view = data.view(**view_kwargs)
+        else:
+            self._view = data
+        self._adjustments = adjustments
+        self._pending = sorted(adjustments)
+        self.window_length = window_length
+
+        # The (exclusive) end row of the first window.
+        self._first_anchor = window_length + offset
+        self.nrows = len(data) - self._first_anchor + 1
+        self._next_row = 0
+
+        # An adjustment known on row ``k`` is first visible in the window
+        # ending on row ``k``, which is window ``k + 1 - first_anchor``.
+        self.boundaries = [
+            k + 1 - self._first_anchor for k in self._pending
+            if 0 < k + 1 - self._first_anchor < self.nrows
+        ]
+
+    def windows(self, start, stop):
+        """
+        Get the windows with indices in ``[start, stop)``.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first window. Must be no less than the ``stop``
+            of the previous call.
+        stop : int
+            One past the index of the last window. There must be no
+            boundary in ``(start, stop)``.
+
+        Returns
+        -------
+        windows : np.ndarray
+            A read-only array of shape
+            ``(stop - start, window_length) + data.shape[1:]``.
+        """
+        if start < self._next_row:
+            raise ValueError(
+                'Can not access data after window has passed.'
+            )
+        if not 0 <= start < stop <= self.nrows:
+            raise ValueError(
+                'Invalid window range [%d, %d) for %d windows.' % (
+                    start, stop, self.nrows,
+                )
+            )
+
+        # Apply the adjustments known on or before the end of window
+        # ``start``.
+        anchor = self._first_anchor + start
+        pending = self._pending
+        while pending and pending[0] < anchor:
+            for adjustment in self._adjustments[pending.pop(0)]:
+                adjustment.mutate(self._data)
+
+        if pending and pending[0] + 1 - self._first_anchor < stop:
+            raise ValueError(
+                'Window range [%d, %d) spans an adjustment.' % (start, stop)
+            )
+        self._next_row = stop
+
+        view = self._view
+        window_length = self.window_length
+        out = as_strided(
+            view[anchor - window_length:],
+            shape=(stop - start, window_length) + view.shape[1:],
+            strides=(view.strides[0],) + view.strides,
+        )
+        out.setflags(write=False)
+        return out
+
+    def __repr__(self):
+        return "<%s: window_length=%d, nrows=%d, boundaries=%s>" % (
+            type(self).__name__,
+            self.window_length,
+            self.nrows,
+            self.boundaries,
+        )
+
+
 def ensure_adjusted_array(ndarray_or_adjusted_array, missing_value):
     if isinstance(ndarray_or_adjusted_array, AdjustedArray):
         return ndarray_or_adjusted_array
@@ -0,0 +1,454 @@
+"""
+Persistent, content-addressed storage for computed pipeline terms.
+"""
+import errno
+import hashlib
+import os
+import types
+
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+import zipline
+from zipline.assets import Asset
+from zipline.utils.cache import working_file
+from zipline.utils.compat import Mapping
+from zipline.utils.paths import ensure_directory
+
+from .data.dataset import DataSetMeta
+from .term import ComputableTerm
+
+#: The default maximum size of a :class:`DiskTermCache`, in bytes.
+DEFAULT_MAX_CACHE_SIZE = 2 ** 30
+
+_SUFFIX = '.npy'
+_TMP_PREFIX = '.tmp-'
+
+# Top-level modules whose classes are fingerprinted by name only.
+_TRUSTED_MODULES = frozenset({'zipline', 'builtins', '__builtin__'})
+
+# Class attributes that don't affect the behavior of instances.
+_IGNORED_CLASS_ATTRIBUTES = frozenset({
+    '__dict__',
+    '__doc__',
+    '__module__',
+    '__qualname__',
+    '__weakref__',
+})
+
+# Class attribute prefixes that don't affect the behavior of instances. ABCMeta
+# stores its registry and caches in ``_abc_*`` attributes, which hold WeakSets.
+_IGNORED_CLASS_ATTRIBUTE_PREFIXES = ('_abc_',)
+
+# Descriptors created for ``__slots__`` entries. They carry no state of their
+# own; the values they manage are fingerprinted on the instance.
+_SLOT_DESCRIPTOR_TYPES = (
+    types.MemberDescriptorType,
+    types.GetSetDescriptorType,
+)
+
+
+class Uncacheable(Exception):
+    """Raised when we can't compute a stable fingerprint for an object.
+    """
+
+
+def _digest(*parts):
+    h = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = part.encode('utf-8')
+        h.update(part)
+        # Separate the parts so that ('ab', 'c') and ('a', 'bc') differ.
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _code_fingerprint(code):
+    """Fingerprint a code object by its bytecode, names and constants.
+    """
+    consts = [
+        _code_fingerprint(c) if isinstance(c, types.CodeType) else repr(c)
+        for c in code.co_consts
+    ]
+    return _digest(code.co_code, repr(code.co_names), *consts)
+
+
+def _qualname(obj):
+    return '{}.{}'.format(
+        obj.__module__,
+        getattr(obj, '__qualname__', obj.__name__),
+    )
+
+
+def _class_fingerprint(cls, memo):
+    """Fingerprint a class.
+
+    Classes defined inside of zipline are identified by name only, along with
+    the zipline version. Classes defined elsewhere, like user-defined
+    CustomFactors, also include their class attributes and the bytecode of
+    their methods so that editing a ``compute`` function invalidates
+    previously cached results.
+
+    Specializations of a DataSet share their parent's name, so DataSets also
+    include their domain.
+    """
+    parts = [_qualname(cls)]
+    if isinstance(cls, DataSetMeta):
+        parts.append(fingerprint(cls.domain, memo))
+    for base in cls.__mro__:
+        if base.__module__.split('.')[0] in _TRUSTED_MODULES:
+            continue
+        for name, attr in sorted(iteritems(vars(base))):
+            if (name in _IGNORED_CLASS_ATTRIBUTES or
+                    name.startswith(_IGNORED_CLASS_ATTRIBUTE_PREFIXES) or
+                    isinstance(attr, _SLOT_DESCRIPTOR_TYPES)):
+                continue
+            parts.append(name)
+            parts.append(fingerprint(attr, memo))
+    return _digest(*parts)
+
+
+def fingerprint(obj, _memo=None):
+    """
+    Compute a fingerprint for ``obj`` that is stable across processes.
+
+    Parameters
+    ----------
+    obj : object
+        The object to fingerprint. This is usually a
+        :class:`~zipline.pipeline.term.Term` or a
+        :class:`~zipline.pipeline.domain.Domain`.
+
+    Returns
+    -------
+    fingerprint : str
+        A hex digest identifying ``obj``.
+
+    Raises
+    ------
+    Uncacheable
+        Raised if ``obj`` contains a value without a stable representation.
+
+    Notes
+    -----
+    Terms are fingerprinted by their type and by the attributes set on them
+    at construction, which are derived from the term's ``_static_identity``.
+    Inputs and masks are fingerprinted recursively.
+    """
+    if _memo is None:
+        _memo = {}
+
+    try:
+        return _memo[id(obj)][1]
+    except KeyError:
+        pass
+
+    if isinstance(obj, type):
+        # Guard against classes whose attributes refer back to the class.
+        _memo[id(obj)] = obj, _digest('class', _qualname(obj))
+        out = _class_fingerprint(obj, _memo)
+    elif isinstance(obj, Asset):
+        out = _digest('Asset', str(obj.sid))
+    elif isinstance(obj, np.dtype):
+        out = _digest('dtype', obj.str)
+    elif isinstance(obj, (np.ndarray, pd.Index)):
+        values = np.asarray(obj)
+        if values.dtype == object:
+            out = _digest('object-array', *(
+                fingerprint(v, _memo) for v in values.ravel()
+            ))
+        else:
+            out = _digest(
+                'array',
+                values.dtype.str,
+                repr(values.shape),
+                np.ascontiguousarray(values).tobytes(),
+            )
+    elif isinstance(obj, (tuple, list, frozenset, set)):
+        items = [fingerprint(v, _memo) for v in obj]
+        if isinstance(obj, (frozenset, set)):
+            items.sort()
+        out = _digest(type(obj).__name__, *items)
+    elif isinstance(obj, Mapping):
+        out = _digest('mapping', *sorted(
+            _digest(fingerprint(k, _memo), fingerprint(v, _memo))
+            for k, v in iteritems(obj)
+        ))
+    elif isinstance(obj, (types.FunctionType, types.MethodType)):
+        func = getattr(obj, '__func__', obj)
+        closure = func.__closure__ or ()
+        out = _digest(
+            'function',
+            _qualname(func),
+            _code_fingerprint(func.__code__),
+            fingerprint(func.__defaults__ or (), _memo),
+            fingerprint(tuple(cell.cell_contents for cell in closure), _memo),
+        )
+    elif isinstance(obj, (staticmethod, classmethod)):
+        out = _digest(type(obj).__name__, fingerprint(obj.__func__, _memo))
+    elif isinstance(obj, property):
+        out = _digest('property', *(
+            fingerprint(f, _memo) for f in (obj.fget, obj.fset, obj.fdel)
+        ))
+    elif hasattr(obj, '__dict__') and not isinstance(obj, types.ModuleType):
+        # Terms, domains, and other simple objects are identified by their
+        # type and their instance attributes.
+        out = _digest(
+            fingerprint(type(obj), _memo),
+            *(
+                _digest(name, fingerprint(value, _memo))
+                for name, value in sorted(iteritems(vars(obj)))
+            )
+        )
+    else:
+        r = repr(obj)
+        if ' at 0x' in r:
+            raise Uncacheable(obj)
+        out = _digest(type(obj).__name__, r)
+
+    # Keep a reference to ``obj`` so that its id can't be reused by another
+    # object while the memo is alive.
+    _memo[id(obj)] = obj, out
+    return out
+
+
+class DiskTermCache(object):
+    """
+    A content-addressed, on-disk cache of computed pipeline terms.
+
+    Entries are keyed by a fingerprint of the term, the pipeline's domain, the
+    dates for which the term was computed, the assets, and the lifetimes
+    matrix for those dates. ``DiskTermCache`` can be passed to
+    :class:`~zipline.pipeline.engine.SimplePipelineEngine` as ``term_cache``
+    to seed the initial workspace with previously computed terms and to write
+    newly computed terms back to disk.
+
+    Parameters
+    ----------
+    path : str
+        The directory in which to store cached terms.
+    max_size : int, optional
+        The maximum total size of the cache in bytes. When the cache grows
+        beyond this size, the least recently used entries are deleted.
+
+    Notes
+    -----
+    The cache does not track changes to the data provided by pipeline
+    loaders. Use a separate cache directory for each data bundle ingestion.
+
+    Only terms computing plain, non-object numpy arrays are cached. Terms
+    producing :class:`~zipline.lib.labelarray.LabelArray` are always
+    recomputed.
+    """
+    def __init__(self, path, max_size=DEFAULT_MAX_CACHE_SIZE):
+        self.path = path
+        self.max_size = max_size
+        ensure_directory(path)
+        self._size = sum(size for _, _, size in self._entries())
+
+    def _keypath(self, key):
+        return os.path.join(self.path, key + _SUFFIX)
+
+    def _entries(self):
+        """Yield (path, mtime, size) for each entry in the cache.
+        """
+        for name in os.listdir(self.path):
+            if name.startswith(_TMP_PREFIX) or not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                # Another process may have evicted this entry.
+                if e.errno != errno.ENOENT:
+                    raise
+                continue
+            yield path, stat.st_mtime, stat.st_size
+
+    def keys_for_plan(self,
+                      root_mask_term,
+                      execution_plan,
+                      dates,
+                      assets,
+                      root_mask_values):
+        """
+        Compute cache keys for the cacheable terms in ``execution_plan``.
+
+        Parameters
+        ----------
+        root_mask_term : Term
+            The root mask term, normally ``AssetExists()``.
+        execution_plan : ExecutionPlan
+            The execution plan for the pipeline being run.
+        dates : pd.DatetimeIndex
+            All of the dates being computed, including extra rows.
+        assets : pd.Int64Index
+            All of the assets being computed.
+        root_mask_values : np.ndarray[bool]
+            The values of the root mask term.
+
+        Returns
+        -------
+        keys : dict[Term, str]
+            A map from each cacheable term to its cache key.
+        """
+        memo = {}
+        try:
+            context = _digest(
+                zipline.__version__,
+                fingerprint(execution_plan.domain, memo),
+                fingerprint(assets, memo),
+            )
+        except Uncacheable:
+            return {}
+
+        extra_rows = execution_plan.extra_rows
+        root_extra_rows = extra_rows[root_mask_term]
+
+        # Terms computed with the same number of extra rows share the same
+        # dates and lifetimes, so only hash those once per offset.
+        rows_fingerprints = {}
+
+        keys = {}
+        for term in execution_plan.graph:
+            if not isinstance(term, ComputableTerm):
+                continue
+
+            offset = root_extra_rows - extra_rows[term]
+            try:
+                rows = rows_fingerprints[offset]
+            except KeyError:
+                rows = rows_fingerprints[offset] = _digest(
+                    fingerprint(dates[offset:]),
+                    fingerprint(root_mask_values[offset:]),
+                )
+
+            try:
+                keys[term] = _digest(context, rows, fingerprint(term, memo))
+            except Uncacheable:
+                continue
+        return keys
+
+    def populate_initial_workspace(self,
+                                   initial_workspace,
+                                   root_mask_term,
+                                   execution_plan,
+                                   dates,
+                                   assets,
+                                   keys=None):
+        """
+        Seed ``initial_workspace`` with any cached terms needed to compute
+        ``execution_plan``.
+
+        This has the same signature as
+        :func:`zipline.pipeline.engine.default_populate_initial_workspace`,
+        with an optional ``keys`` argument to reuse keys already computed by
+        :meth:`keys_for_plan`.
+
+        Terms are looked up starting from the pipeline's outputs. When a term
+        is found in the cache, its inputs are not looked up, because they no
+        longer need to be computed.
+        """
+        if keys is None:
+            keys = self.keys_for_plan(
+                root_mask_term,
+                execution_plan,
+                dates,
+                assets,
+                initial_workspace[root_mask_term],
+            )
+        workspace = initial_workspace.copy()
+
+        graph = execution_plan.graph
+        seen = set()
+        stack = list(execution_plan.outputs.values())
+        while stack:
+            term = stack.pop()
+            if term in seen or term in workspace:
+                continue
+            seen.add(term)
+
+            key = keys.get(term)
+            if key is not None:
+                value = self.get(key)
+                if value is not None:
+                    workspace[term] = value
+                    continue
+
+            stack.extend(dep for dep, _ in graph.in_edges([term]))
+
+        return workspace
+
+    def get(self, key):
+        """
+        Load the array stored under ``key``.
+
+        Returns
+        -------
+        value : np.ndarray or None
+            The cached array, or None if ``key`` is not in the cache.
+        """
+        path = self._keypath(key)
+        try:
+            value = np.load(path, allow_pickle=False)
+            # Mark this entry as recently used.
+            os.utime(path, None)
+        except (IOError, OSError) as e:
+            if e.errno != errno.ENOENT:
+                raise
+            return None
+        return value
+
+    def set(self, key, value):
+        """
+        Store ``value`` under ``key``.
+
+        Values which can't be stored without pickling are ignored.
+        """
+        if type(value) is not np.ndarray or value.dtype == object:
+            return
+
+        path = self._keypath(key)
+        if os.path.exists(path):
+            return
+
+        with working_file(path,
+                          dir=self.path,
+                          prefix=_TMP_PREFIX,
+                          suffix=_SUFFIX) as f:
+            np.save(f.path, value, allow_pickle=False)
+
+        self._size += os.path.getsize(path)
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self):
+        """
+        Delete the least recently used entries until the cache is no larger
+        than ``max_size``.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        size = sum(e[2] for e in entries)
+        for path, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        """Remove all entries from the cache.
+        """
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+        self._size = 0
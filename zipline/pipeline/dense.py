@@ -0,0 +1,128 @@
+"""
+Dense, columnar pipeline results.
+"""
+import numpy as np
+from six import iteritems
+
+from zipline.lib.labelarray import LabelArray
+
+
+class DensePipelineResult(object):
+    """
+    The results of a pipeline as 2D arrays of (date, asset) values.
+
+    Unlike the frames returned by
+    :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline`, the
+    arrays in a ``DensePipelineResult`` aren't filtered by the pipeline's
+    screen. The screen is provided separately, so consumers that don't need a
+    narrow ``(date, asset)`` DataFrame can skip building one.
+
+    Parameters
+    ----------
+    columns : dict[str, np.ndarray or LabelArray]
+        Map from column name to an array of shape ``(len(dates), len(sids))``.
+    screen : np.ndarray[bool]
+        The value of the pipeline's screen for each (date, asset) pair.
+    dates : pd.DatetimeIndex
+        The row labels of each array.
+    sids : pd.Int64Index
+        The column labels of each array.
+
+    Attributes
+    ----------
+    columns
+    screen
+    dates
+    sids
+    """
+    def __init__(self, columns, screen, dates, sids):
+        self.columns = columns
+        self.screen = screen
+        self.dates = dates
+        self.sids = sids
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __repr__(self):
+        return '<{}: {} dates x {} assets, columns={}>'.format(
+            type(self).__name__,
+            len(self.dates),
+            len(self.sids),
+            sorted(self.columns),
+        )
+
+    def to_arrow(self, apply_screen=True):
+        """
+        Convert the results into a :class:`pyarrow.Table`.
+
+        The table is in long format, with a ``date`` and a ``sid`` column
+        followed by one column per pipeline column.
+
+        Parameters
+        ----------
+        apply_screen : bool, optional
+            If True, the default, only rows that pass the pipeline's screen
+            are kept, which requires copying each column. Otherwise, every
+            (date, asset) pair is kept and numeric columns are passed to
+            arrow without copying, along with a boolean ``screen`` column.
+
+        Returns
+        -------
+        table : pyarrow.Table
+
+        Notes
+        -----
+        Columns computed as :class:`~zipline.lib.labelarray.LabelArray` are
+        converted to dictionary-encoded columns.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "DensePipelineResult.to_arrow requires pyarrow, which is "
+                "not installed."
+            )
+
+        nassets = len(self.sids)
+        ndates = len(self.dates)
+        dates = np.repeat(self.dates.values, nassets)
+        sids = np.tile(self.sids.values.astype(np.int64), ndates)
+        screen = self.screen.ravel()
+
+        if apply_screen:
+            def select(values):
+                return values[screen]
+        else:
+            def select(values):
+                return values
+
+        names = ['date', 'sid']
+        arrays = [pa.array(select(dates)), pa.array(select(sids))]
+        for name, values in sorted(iteritems(self.columns)):
+            names.append(name)
+            arrays.append(_to_arrow_array(pa, select(values.ravel())))
+
+        if not apply_screen:
+            names.append('screen')
+            arrays.append(pa.array(screen))
+
+        return pa.Table.from_arrays(arrays, names=names)
+
+
+def _to_arrow_array(pa, values):
+    if isinstance(values, LabelArray):
+        codes = values.as_int_array()
+        # Arrow requires signed dictionary indices.
+        indices_dtype = np.int32 if codes.dtype.itemsize < 4 else np.int64
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes.astype(indices_dtype)),
+            pa.array(values.categories, from_pandas=True),
+        )
+    return pa.array(values)
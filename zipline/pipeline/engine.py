@@ -56,10 +56,13 @@ implements the following algorithm for executing pipelines:
    screen. This logic lives in SimplePipelineEngine._to_narrow.
 """
 from abc import ABCMeta, abstractmethod
-from six import iteritems, with_metaclass, viewkeys
+from collections import deque
+import uuid
+from six import iteritems, itervalues, with_metaclass, viewkeys
+from six.moves.queue import Queue
 from numpy import array
 from pandas import DataFrame, MultiIndex
-from toolz import groupby
+from toolz import groupby, valmap
 
 from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
 from zipline.errors import NoFurtherDataError
@@ -72,14 +75,52 @@ from zipline.utils.numpy_utils import (
 from zipline.utils.pandas_utils import explode
 
 from .domain import Domain, GENERIC
+from .dense import DensePipelineResult
 from .graph import maybe_specialize
+from .profile import PipelineProfile
+from .spill import WorkspaceSpiller
 from .term import AssetExists, InputDates, LoadableTerm
 
 from zipline.utils.date_utils import compute_date_range_chunks
 from zipline.utils.pandas_utils import categorical_df_concat
+from zipline.utils.pool import fork_pool
 from zipline.utils.sharedoc import copydoc
 
 
+def _run_and_report(queue, key, f, args):
+    """
+    Call ``f(*args)`` and put ``(key, successful, value)`` onto ``queue``.
+
+    This is the unit of work submitted to the pool by
+    :meth:`SimplePipelineEngine._compute_concurrently`. Exceptions are
+    reported through the queue instead of being raised so that the scheduling
+    thread is never left waiting on a task that failed.
+    """
+    try:
+        result = f(*args)
+    except Exception as e:
+        queue.put((key, False, e))
+    else:
+        queue.put((key, True, result))
+
+
+# Map from key -> (engine, pipeline) for chunked pipelines being computed in
+# worker processes. Entries are added before the workers are forked so that
+# they are inherited by the workers instead of being pickled.
+_CHUNK_JOBS = {}
+
+
+def _run_pipeline_chunk(key, start_date, end_date):
+    """
+    Run a single chunk of a pipeline registered in ``_CHUNK_JOBS``.
+
+    This is the unit of work submitted to worker processes by
+    :meth:`SimplePipelineEngine._run_chunks_in_processes`.
+    """
+    engine, pipeline = _CHUNK_JOBS[key]
+    return engine.run_pipeline(pipeline, start_date, end_date)
+
+
 class PipelineEngine(with_metaclass(ABCMeta)):
 
     @abstractmethod
@@ -116,7 +157,13 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         raise NotImplementedError("run_pipeline")
 
     @abstractmethod
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             processes=None,
+                             max_pending_chunks=None):
         """
         Compute values for `pipeline` in number of days equal to `chunksize`
         and return stitched up result. Computing in chunks is useful for
@@ -132,6 +179,20 @@ class PipelineEngine(with_metaclass(ABCMeta)):
             The end date to run the pipeline for.
         chunksize : int
             The number of days to execute at a time.
+        processes : int, optional
+            If given, compute chunks concurrently in a pool of this many
+            worker processes. Chunks are independent of one another, so each
+            worker runs a full pipeline for its date range, including any
+            lookback window. Worker processes are forked from the current
+            process, so this is only supported on platforms that provide the
+            ``fork`` start method. By default, chunks are computed one at a
+            time in the current process.
+        max_pending_chunks : int, optional
+            The maximum number of chunks that may be submitted to the worker
+            processes before their results have been collected. This bounds
+            the number of chunk results that are held in worker memory or in
+            transit at any one time. Defaults to ``processes``. Ignored if
+            ``processes`` is not given.
 
         Returns
         -------
@@ -171,7 +232,13 @@ class ExplodingPipelineEngine(PipelineEngine):
             "resources were registered."
         )
 
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             processes=None,
+                             max_pending_chunks=None):
         raise NoEngineRegistered(
             "Attempted to run a chunked pipeline but no pipeline "
             "resources were registered."
@@ -228,10 +295,41 @@ class SimplePipelineEngine(PipelineEngine):
         computing a pipeline. See
         :func:`zipline.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    pool : Pool, optional
+        A thread pool used to compute independent terms concurrently. The
+        engine only calls ``pool.apply_async(func, args)``, and ignores its
+        return value; results are reported back through a queue shared with
+        the calling thread, so the pool must run tasks in the same process,
+        for example :class:`multiprocessing.pool.ThreadPool`. When a pool is
+        given, terms are scheduled as soon as all of their inputs are
+        available in the workspace, so ``get_loader`` and the loaders it
+        returns must be safe to call from multiple threads. By default, terms
+        are computed one at a time in topological order.
+    term_cache : zipline.pipeline.cache.DiskTermCache, optional
+        A persistent cache of computed terms. Cached terms are added to the
+        initial workspace after ``populate_initial_workspace`` runs, and terms
+        computed by the engine are written back to the cache.
+    optimize : bool, optional
+        Whether to rewrite pipelines with
+        :func:`zipline.pipeline.optimize.optimize_terms` before computing
+        them. This fuses chains of numerical expressions and computes
+        equivalent terms only once. Default is False.
+    memory_budget : int, optional
+        The number of bytes of memory that the arrays computed for a chunk of
+        a pipeline may use. When a budget is given, terms are computed in an
+        order that keeps the number of live bytes low, and whenever the
+        workspace grows beyond the budget, the largest computed arrays are
+        spilled to memory-mapped temporary files. Loaded data is never
+        spilled. This can't be combined with ``pool``.
+    spill_dir : str, optional
+        The directory in which to create spill files. By default, the
+        platform's default temporary directory is used.
 
     See Also
     --------
     :func:`zipline.pipeline.engine.default_populate_initial_workspace`
+    :class:`zipline.utils.pool.SequentialPool`
+    :class:`zipline.pipeline.cache.DiskTermCache`
     """
     __slots__ = (
         '_get_loader',
@@ -239,6 +337,11 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_pool',
+        '_term_cache',
+        '_optimize',
+        '_memory_budget',
+        '_spill_dir',
     )
 
     @expect_types(
@@ -249,7 +352,16 @@ class SimplePipelineEngine(PipelineEngine):
                  get_loader,
                  asset_finder,
                  default_domain=GENERIC,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 pool=None,
+                 term_cache=None,
+                 optimize=False,
+                 memory_budget=None,
+                 spill_dir=None):
+        if pool is not None and memory_budget is not None:
+            raise ValueError(
+                "memory_budget can't be used when computing terms in a pool."
+            )
 
         self._get_loader = get_loader
         self._finder = asset_finder
@@ -261,6 +373,11 @@ class SimplePipelineEngine(PipelineEngine):
             populate_initial_workspace or default_populate_initial_workspace
         )
         self._default_domain = default_domain
+        self._pool = pool
+        self._term_cache = term_cache
+        self._optimize = optimize
+        self._memory_budget = memory_budget
+        self._spill_dir = spill_dir
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -294,6 +411,87 @@ class SimplePipelineEngine(PipelineEngine):
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         :meth:`zipline.pipeline.engine.PipelineEngine.run_chunked_pipeline`
         """
+        result, _ = self._run_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            profiled=False,
+        )
+        return result
+
+    def profile_pipeline(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, recording the time spent loading and computing
+        each term.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            A frame of computed results, as returned by
+            :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline`.
+        profile : zipline.pipeline.profile.PipelineProfile
+            The wall time, result size and result shape of each term and each
+            group of loaded terms. Use ``profile.to_frame()`` to get these as
+            a DataFrame, and ``profile.svg`` to render them as a heatmap over
+            the pipeline's graph.
+        """
+        return self._run_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            profiled=True,
+        )
+
+    def run_dense_pipeline(self, pipeline, start_date, end_date):
+        """
+        Compute a pipeline, returning its results as 2D arrays instead of as
+        a DataFrame.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+
+        Returns
+        -------
+        result : zipline.pipeline.dense.DensePipelineResult
+            The computed value of each column for every date and every asset
+            in the pipeline's domain, along with the value of the pipeline's
+            screen. Use ``result.to_arrow()`` to get a
+            :class:`pyarrow.Table`.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.SimplePipelineEngine.run_pipeline`
+        """
+        result, _ = self._run_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            profiled=False,
+            dense=True,
+        )
+        return result
+
+    def _run_pipeline(self,
+                      pipeline,
+                      start_date,
+                      end_date,
+                      profiled,
+                      dense=False):
         # See notes at the top of this module for a description of the
         # algorithm implemented here.
         if end_date < start_date:
@@ -306,7 +504,11 @@ class SimplePipelineEngine(PipelineEngine):
         domain = self.resolve_domain(pipeline)
 
         graph = pipeline.to_execution_plan(
-            domain, self._root_mask_term, start_date, end_date,
+            domain,
+            self._root_mask_term,
+            start_date,
+            end_date,
+            optimize=self._optimize,
         )
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(
@@ -324,27 +526,68 @@ class SimplePipelineEngine(PipelineEngine):
             dates,
             assets,
         )
+        # Fingerprint the graph once, both to look up cached terms and to
+        # store the terms that we compute.
+        cache_keys = self._term_cache_keys(
+            graph,
+            dates,
+            assets,
+            initial_workspace,
+        )
+        if self._term_cache is not None:
+            initial_workspace = self._term_cache.populate_initial_workspace(
+                initial_workspace,
+                self._root_mask_term,
+                graph,
+                dates,
+                assets,
+                keys=cache_keys,
+            )
 
-        results = self.compute_chunk(graph, dates, assets, initial_workspace)
-
-        return self._to_narrow(
-            graph.outputs,
-            results,
-            results.pop(graph.screen_name),
-            dates[extra_rows:],
+        profile = PipelineProfile(graph) if profiled else None
+        results = self.compute_chunk(
+            graph,
+            dates,
             assets,
+            initial_workspace,
+            profile=profile,
+            cache_keys=cache_keys,
         )
 
+        screen = results.pop(graph.screen_name)
+        if dense:
+            result = DensePipelineResult(
+                results,
+                screen,
+                dates[extra_rows:],
+                assets,
+            )
+        else:
+            result = self._to_narrow(
+                graph.outputs,
+                results,
+                screen,
+                dates[extra_rows:],
+                assets,
+            )
+        return result, profile
+
     @copydoc(PipelineEngine.run_chunked_pipeline)
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
-        domain = self.resolve_domain(pipeline)
-        ranges = compute_date_range_chunks(
-            domain.all_sessions(),
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             processes=None,
+                             max_pending_chunks=None):
+        chunks = list(self.run_pipeline_iter(
+            pipeline,
             start_date,
             end_date,
             chunksize,
-        )
-        chunks = [self.run_pipeline(pipeline, s, e) for s, e in ranges]
+            processes=processes,
+            max_pending_chunks=max_pending_chunks,
+        ))
 
         if len(chunks) == 1:
             # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
@@ -353,6 +596,131 @@ class SimplePipelineEngine(PipelineEngine):
 
         return categorical_df_concat(chunks, inplace=True)
 
+    def run_pipeline_iter(self,
+                          pipeline,
+                          start_date,
+                          end_date,
+                          chunksize,
+                          processes=None,
+                          max_pending_chunks=None):
+        """
+        Compute values for ``pipeline`` in chunks of ``chunksize`` days,
+        yielding the result for each chunk as soon as it's computed.
+
+        Unlike
+        :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_chunked_pipeline`,
+        this never holds more than one chunk's results in memory at a time
+        (or ``max_pending_chunks`` chunks when computing in worker
+        processes), so it can be used to compute a pipeline over long periods
+        and write the results to disk as they are produced. See
+        :func:`zipline.pipeline.writers.write_pipeline_results`.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int
+            The number of days to execute at a time. Pass 1 to get a frame
+            for each day.
+        processes : int, optional
+            If given, compute chunks concurrently in a pool of this many
+            worker processes. See
+            :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_chunked_pipeline`.
+        max_pending_chunks : int, optional
+            The maximum number of chunks that may be submitted to the worker
+            processes before they are yielded. Defaults to ``processes``.
+            Ignored if ``processes`` is not given.
+
+        Yields
+        ------
+        result : pd.DataFrame
+            The computed results for each chunk, in date order, in the format
+            returned by
+            :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline`.
+        """
+        domain = self.resolve_domain(pipeline)
+        ranges = compute_date_range_chunks(
+            domain.all_sessions(),
+            start_date,
+            end_date,
+            chunksize,
+        )
+        if processes is None:
+            for start, end in ranges:
+                yield self.run_pipeline(pipeline, start, end)
+        else:
+            for chunk in self._run_chunks_in_processes(pipeline,
+                                                       list(ranges),
+                                                       processes,
+                                                       max_pending_chunks):
+                yield chunk
+
+    def _run_chunks_in_processes(self,
+                                 pipeline,
+                                 ranges,
+                                 processes,
+                                 max_pending_chunks):
+        """
+        Run ``pipeline`` over each ``(start, end)`` pair in ``ranges`` in a
+        pool of forked worker processes.
+
+        The engine and pipeline are not pickled. Instead, they are stored in a
+        module-level registry before the workers are forked, and each task
+        only carries the registry key and the dates of its chunk.
+
+        The workers are stopped if the generator is closed before it's
+        exhausted.
+
+        Yields
+        ------
+        chunk : pd.DataFrame
+            The result for each entry of ``ranges``, in order.
+        """
+        if processes < 1:
+            raise ValueError(
+                "processes must be at least 1, got %r" % (processes,)
+            )
+        if max_pending_chunks is None:
+            max_pending_chunks = processes
+        elif max_pending_chunks < 1:
+            raise ValueError(
+                "max_pending_chunks must be at least 1, got %r" % (
+                    max_pending_chunks,
+                )
+            )
+        if not ranges:
+            # Don't start a pool with no workers.
+            return
+
+        key = uuid.uuid4().hex
+        _CHUNK_JOBS[key] = (self, pipeline)
+        try:
+            pool = fork_pool(min(processes, len(ranges)))
+            try:
+                pending = deque()
+                for start, end in ranges:
+                    if len(pending) >= max_pending_chunks:
+                        yield pending.popleft().get()
+                    pending.append(pool.apply_async(
+                        _run_pipeline_chunk,
+                        (key, start, end),
+                    ))
+                while pending:
+                    yield pending.popleft().get()
+            except BaseException:
+                pool.terminate()
+                raise
+            else:
+                pool.close()
+            finally:
+                pool.join()
+        finally:
+            del _CHUNK_JOBS[key]
+
     def _compute_root_mask(self, domain, start_date, end_date, extra_rows):
         """
         Compute a lifetimes matrix from our AssetFinder, then drop columns that
@@ -457,13 +825,20 @@ class SimplePipelineEngine(PipelineEngine):
 
         if term.windowed:
             # If term is windowed, then all input data should be instances of
-            # AdjustedArray.
+            # AdjustedArray. Terms that compute all of their windows at once
+            # get stacks of windows instead of one window at a time.
+            batched = getattr(term, '_batched', False)
             for input_ in specialized:
                 adjusted_array = ensure_adjusted_array(
                     workspace[input_], input_.missing_value,
                 )
+                traverse = (
+                    adjusted_array.traverse_blocks
+                    if batched else
+                    adjusted_array.traverse
+                )
                 out.append(
-                    adjusted_array.traverse(
+                    traverse(
                         window_length=term.window_length,
                         offset=offsets[term, input_],
                     )
@@ -481,7 +856,8 @@ class SimplePipelineEngine(PipelineEngine):
                 out.append(input_data)
         return out
 
-    def compute_chunk(self, graph, dates, sids, initial_workspace):
+    def compute_chunk(self, graph, dates, sids, initial_workspace,
+                      profile=None, cache_keys=None):
         """
         Compute the Pipeline terms in the graph for the requested start and end
         dates.
@@ -501,6 +877,11 @@ class SimplePipelineEngine(PipelineEngine):
             Must contain at least entry for `self._root_mask_term` whose shape
             is `(len(dates), len(assets))`, but may contain additional
             pre-computed terms for testing or optimization purposes.
+        profile : zipline.pipeline.profile.PipelineProfile, optional
+            A profile in which to record each load and compute.
+        cache_keys : dict[Term, str], optional
+            The keys under which to store computed terms in the engine's term
+            cache. Computed from ``graph`` if not given.
 
         Returns
         -------
@@ -517,6 +898,8 @@ class SimplePipelineEngine(PipelineEngine):
         refcounts = graph.initial_refcounts(workspace)
         execution_order = graph.execution_order(refcounts)
         domain = graph.domain
+        if cache_keys is None:
+            cache_keys = self._term_cache_keys(graph, dates, sids, workspace)
 
         # Many loaders can fetch data more efficiently if we ask them to
         # retrieve all their inputs at once. For example, a loader backed by a
@@ -548,55 +931,285 @@ class SimplePipelineEngine(PipelineEngine):
             (t for t in execution_order if t in will_be_loaded),
         )
 
-        for term in graph.execution_order(refcounts):
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
+        if self._pool is not None:
+            self._compute_concurrently(
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                loader_groups,
+                loader_group_key,
+                cache_keys,
+                profile,
+            )
+            return self._extract_outputs(graph, workspace)
+
+        spiller = None
+        if self._memory_budget is None:
+            execution_order = graph.execution_order(refcounts)
+        else:
+            execution_order = graph.memory_aware_execution_order(
+                refcounts,
+                self._estimate_term_sizes(graph, dates, sids, workspace),
+                {
+                    term: group
+                    for group in itervalues(loader_groups)
+                    for term in group
+                },
+            )
+            spiller = WorkspaceSpiller(self._memory_budget, self._spill_dir)
+        # Terms computed by this call, which may be spilled to disk. Terms in
+        # the initial workspace are also referenced by the caller, so spilling
+        # them wouldn't free any memory.
+        computed = set()
+
+        try:
+            for term in execution_order:
+                # `term` may have been supplied in `initial_workspace`, and in
+                # the future we may pre-compute loadable terms coming from the
+                # same dataset.  In either case, we will already have an entry
+                # for this term, which we shouldn't re-compute.
+                if term in workspace:
+                    continue
+
+                # Asset labels are always the same, but date labels vary by how
+                # many extra rows are needed.
+                mask, mask_dates = graph.mask_and_dates_for_term(
+                    term,
+                    self._root_mask_term,
+                    workspace,
+                    dates,
+                )
+
+                if isinstance(term, LoadableTerm):
+                    loader = get_loader(term)
+                    to_load = sorted(
+                        loader_groups[loader_group_key(term)],
+                        key=lambda t: t.dataset
+                    )
+                    load = loader.load_adjusted_array
+                    if profile is not None:
+                        load = profile.timed(
+                            load, 'load', tuple(to_load), loader,
+                        )
+                    loaded = load(domain, to_load, mask_dates, sids, mask)
+                    assert set(loaded) == set(to_load), (
+                        'loader did not return an AdjustedArray for each '
+                        'column\n'
+                        'expected: %r\n'
+                        'got:      %r' % (sorted(to_load), sorted(loaded))
+                    )
+                    workspace.update(loaded)
+                else:
+                    compute = term._compute
+                    if profile is not None:
+                        compute = profile.timed(compute, 'compute', term)
+                    workspace[term] = compute(
+                        self._inputs_for_term(term, workspace, graph, domain),
+                        mask_dates,
+                        sids,
+                        mask,
+                    )
+                    if term.ndim == 2:
+                        assert workspace[term].shape == mask.shape
+                    else:
+                        assert workspace[term].shape == (mask.shape[0], 1)
+
+                    if term in cache_keys:
+                        self._term_cache.set(cache_keys[term], workspace[term])
+
+                    # Decref dependencies of ``term``, and clear any terms
+                    # whose refcounts hit 0.
+                    garbage = graph.decref_dependencies(term, refcounts)
+                    for garbage_term in garbage:
+                        del workspace[garbage_term]
+
+                if spiller is not None:
+                    computed.add(term)
+                    spiller.spill(workspace, computed)
+
+            outputs = self._extract_outputs(graph, workspace)
+            if spiller is not None:
+                outputs = valmap(spiller.materialize, outputs)
+        finally:
+            if spiller is not None:
+                spiller.close()
+        return outputs
+
+    def _compute_concurrently(self,
+                              graph,
+                              dates,
+                              sids,
+                              workspace,
+                              refcounts,
+                              loader_groups,
+                              loader_group_key,
+                              cache_keys,
+                              profile):
+        """
+        Compute the terms of ``graph`` that are missing from ``workspace``,
+        submitting each term to ``self._pool`` as soon as all of its inputs
+        are available.
+
+        Inputs are always gathered from ``workspace`` on the calling thread,
+        and results are written back on the calling thread, so the workspace
+        and refcounts are never mutated concurrently. Only the calls to
+        ``loader.load_adjusted_array`` and ``term._compute`` happen on the
+        pool.
+
+        ``workspace`` and ``refcounts`` are updated in place.
+        """
+        pool = self._pool
+        get_loader = self._get_loader
+        domain = graph.domain
+        nx_graph = graph.graph
+
+        to_compute = [
+            term for term in graph.execution_order(refcounts)
+            if term not in workspace
+        ]
+        # Number of inputs of each term that have not been computed yet.
+        waiting_on = {
+            term: sum(
+                dep not in workspace
+                for dep, _ in nx_graph.in_edges([term])
+            )
+            for term in to_compute
+        }
+        dependents = {
+            term: [t for _, t in nx_graph.out_edges([term]) if t in waiting_on]
+            for term in to_compute
+        }
+
+        finished = Queue()
+        submitted = set()
+        mask_shapes = {}
+
+        def submit(term):
+            if term in submitted:
+                # Loadable terms are submitted as a group when the first
+                # member of the group becomes ready.
+                return 0
 
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
             mask, mask_dates = graph.mask_and_dates_for_term(
                 term,
                 self._root_mask_term,
                 workspace,
                 dates,
             )
-
             if isinstance(term, LoadableTerm):
                 loader = get_loader(term)
                 to_load = sorted(
                     loader_groups[loader_group_key(term)],
                     key=lambda t: t.dataset
                 )
-                loaded = loader.load_adjusted_array(
-                    domain, to_load, mask_dates, sids, mask,
+                submitted.update(to_load)
+                f = loader.load_adjusted_array
+                args = (domain, to_load, mask_dates, sids, mask)
+                key = tuple(to_load)
+                if profile is not None:
+                    f = profile.timed(f, 'load', key, loader)
+            else:
+                submitted.add(term)
+                mask_shapes[term] = mask.shape
+                f = term._compute
+                args = (
+                    self._inputs_for_term(term, workspace, graph, domain),
+                    mask_dates,
+                    sids,
+                    mask,
                 )
+                key = term
+                if profile is not None:
+                    f = profile.timed(f, 'compute', term)
+
+            pool.apply_async(_run_and_report, (finished, key, f, args))
+            return 1
+
+        outstanding = 0
+        for term in to_compute:
+            if not waiting_on[term]:
+                outstanding += submit(term)
+
+        while outstanding:
+            key, successful, value = finished.get()
+            outstanding -= 1
+            if not successful:
+                raise value
+
+            if isinstance(key, tuple):
+                to_load, loaded = key, value
                 assert set(loaded) == set(to_load), (
                     'loader did not return an AdjustedArray for each column\n'
                     'expected: %r\n'
                     'got:      %r' % (sorted(to_load), sorted(loaded))
                 )
                 workspace.update(loaded)
+                done = to_load
             else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph, domain),
-                    mask_dates,
-                    sids,
-                    mask,
-                )
+                term = key
+                workspace[term] = value
+                mask_shape = mask_shapes.pop(term)
                 if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
+                    assert value.shape == mask_shape
                 else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
+                    assert value.shape == (mask_shape[0], 1)
+
+                if term in cache_keys:
+                    self._term_cache.set(cache_keys[term], value)
 
                 # Decref dependencies of ``term``, and clear any terms whose
                 # refcounts hit 0.
                 for garbage_term in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage_term]
+                done = (term,)
+
+            for term in done:
+                for dependent in dependents[term]:
+                    waiting_on[dependent] -= 1
+                    if not waiting_on[dependent]:
+                        outstanding += submit(dependent)
+
+    def _term_cache_keys(self, graph, dates, sids, workspace):
+        """
+        Compute keys under which to store terms of ``graph`` in
+        ``self._term_cache``.
+
+        Returns an empty dict if we don't have a term cache.
+        """
+        if self._term_cache is None:
+            return {}
+        return self._term_cache.keys_for_plan(
+            self._root_mask_term,
+            graph,
+            dates,
+            sids,
+            workspace[self._root_mask_term],
+        )
 
+    def _estimate_term_sizes(self, graph, dates, sids, workspace):
+        """
+        Estimate the number of bytes needed to store each term of ``graph``
+        that isn't already in ``workspace``.
+        """
+        extra_rows = graph.extra_rows
+        root_extra_rows = extra_rows[self._root_mask_term]
+        out = {}
+        for term in graph.graph:
+            if term in workspace:
+                continue
+            nrows = len(dates) - root_extra_rows + extra_rows[term]
+            ncols = len(sids) if term.ndim == 2 else 1
+            out[term] = nrows * ncols * term.dtype.itemsize
+        return out
+
+    @staticmethod
+    def _extract_outputs(graph, workspace):
+        """
+        Pull the output terms of ``graph`` out of ``workspace``, truncating
+        off any extra rows.
+        """
         # At this point, all the output terms are in the workspace.
         out = {}
         graph_extra_rows = graph.extra_rows
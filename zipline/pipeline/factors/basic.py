@@ -4,6 +4,7 @@ from numbers import Number
 from numpy import (
     arange,
     average,
+    errstate,
     exp,
     fmax,
     full,
@@ -12,6 +13,7 @@ from numpy import (
     NINF,
     sqrt,
     sum as np_sum,
+    true_divide,
 )
 
 from zipline.pipeline.data import EquityPricing
@@ -19,13 +21,14 @@ from zipline.utils.input_validation import expect_types
 from zipline.utils.math_utils import (
     nanargmax,
     nanmax,
-    nanmean,
     nanstd,
     nansum,
 )
 from zipline.utils.numpy_utils import (
     float64_dtype,
     ignore_nanwarnings,
+    rolling_nansum,
+    window_span,
 )
 
 from .factor import CustomFactor
@@ -73,13 +76,18 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: None
     """
-    # numpy's nan functions throw warnings when passed an array containing only
-    # nans, but they still returns the desired value (nan), so we ignore the
-    # warning.
-    ctx = ignore_nanwarnings()
-
-    def compute(self, today, assets, out, data):
-        out[:] = nanmean(data, axis=0)
+    # Windows containing only nans have a count of zero, and produce nan with
+    # a division warning, which we ignore.
+    ctx = errstate(divide='ignore', invalid='ignore')
+
+    def compute_batch(self, dates, assets, out, data):
+        span = window_span(data)
+        window_length = data.shape[1]
+        true_divide(
+            rolling_nansum(span, window_length),
+            rolling_nansum(~isnan(span), window_length),
+            out=out,
+        )
 
 
 class WeightedAverageValue(CustomFactor):
@@ -90,8 +98,16 @@ class WeightedAverageValue(CustomFactor):
 
     **Default Window Length:** None
     """
-    def compute(self, today, assets, out, base, weight):
-        out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
+    ctx = errstate(divide='ignore', invalid='ignore')
+
+    def compute_batch(self, dates, assets, out, base, weight):
+        window_length = weight.shape[1]
+        base = window_span(base)
+        weight = window_span(weight)
+        out[:] = (
+            rolling_nansum(base * weight, window_length) /
+            rolling_nansum(weight, window_length)
+        )
 
 
 class VWAP(WeightedAverageValue):
@@ -136,8 +152,12 @@ class AverageDollarVolume(CustomFactor):
     """
     inputs = [EquityPricing.close, EquityPricing.volume]
 
-    def compute(self, today, assets, out, close, volume):
-        out[:] = nansum(close * volume, axis=0) / len(close)
+    def compute_batch(self, dates, assets, out, close, volume):
+        window_length = close.shape[1]
+        out[:] = rolling_nansum(
+            window_span(close) * window_span(volume),
+            window_length,
+        ) / window_length
 
 
 def exponential_weights(length, decay_rate):
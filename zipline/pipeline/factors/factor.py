@@ -1481,6 +1481,39 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
     3rd, 2014, the column of input data for asset A will have 9 leading NaNs
     for the preceding days on which data was not yet available.
 
+    Factors whose computation can be vectorized across dates may instead
+    implement a method named `compute_batch` with the following signature:
+
+    .. code-block:: python
+
+        def compute_batch(self, dates, assets, out, *inputs):
+           ...
+
+    ``compute_batch`` is called with runs of consecutive dates, which are
+    split wherever an adjustment to one of the inputs becomes known. It may
+    also be called one date at a time, for example when the factor is
+    downsampled. Its arguments are::
+
+        dates : pd.DatetimeIndex
+            The dates for which to compute values.
+        assets : np.array[int64, ndim=1]
+            Column labels for `out` and `inputs`.
+        out : np.array[self.dtype, ndim=2]
+            Output array of shape ``(len(dates), len(assets))``.
+        *inputs : tuple of np.array
+            Read-only arrays of shape
+            ``(len(dates), window_length, len(assets))``, where
+            ``inputs[i][j]`` is the window of the ``i``-th input that would
+            have been passed to ``compute`` for ``dates[j]``.
+
+    The windows in each input are strided views over the same rows, so
+    rolling statistics can be computed from
+    :func:`zipline.utils.numpy_utils.window_span` without copying each
+    window. Unlike ``compute``, ``compute_batch`` receives every asset, not
+    just the assets in ``mask``; outputs for assets outside the mask are
+    overwritten with ``missing_value`` afterwards. Inputs of
+    ``compute_batch`` can't be categorical.
+
     Examples
     --------
 
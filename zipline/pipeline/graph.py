@@ -46,6 +46,7 @@ class TermGraph(object):
     ordered()
         Return a topologically-sorted iterator over the terms in self.
     execution_order(refcounts)
+    memory_aware_execution_order(refcounts, nbytes, batches)
 
     See Also
     --------
@@ -118,6 +119,82 @@ class TermGraph(object):
             ),
         ))
 
+    def memory_aware_execution_order(self, refcounts, nbytes, batches):
+        """
+        Return an iterator over the terms in ``self`` which need to be
+        computed, ordered to keep the number of live bytes low.
+
+        Terms are scheduled greedily: among the terms whose dependencies have
+        all been computed, we pick the one that increases the size of the
+        workspace the least, counting the bytes it allocates against the bytes
+        of the dependencies it releases.
+
+        Parameters
+        ----------
+        refcounts : dict[Term -> int]
+            Dictionary of refcounts, as returned by ``initial_refcounts``.
+            This is not modified.
+        nbytes : dict[Term -> int]
+            The estimated size of the result of each term. Terms that are
+            missing are assumed to be free, for example because they were
+            supplied in the initial workspace.
+        batches : dict[Term -> iterable[Term]]
+            Map from a term to the terms that are produced along with it, for
+            example the terms loaded by the same loader call. Only the first
+            term of each batch is emitted.
+        """
+        needed = {term for term, refcount in refcounts.items() if refcount > 0}
+        subgraph = self.graph.subgraph(needed)
+        remaining_refs = dict(refcounts)
+
+        # Break ties by topological order, so that the result is stable.
+        priority = {
+            term: i for i, term in enumerate(nx.topological_sort(subgraph))
+        }
+        waiting_on = {
+            term: len(subgraph.in_edges([term])) for term in subgraph
+        }
+        ready = {term for term, count in iteritems(waiting_on) if count == 0}
+        done = set()
+
+        def released(term):
+            # Loadable terms don't release their dependencies when they're
+            # computed. See ``decref_dependencies``.
+            if isinstance(term, LoadableTerm):
+                return ()
+            return [
+                parent for parent, _ in subgraph.in_edges([term])
+                if remaining_refs[parent] == 1
+            ]
+
+        def cost(term):
+            allocated = sum(
+                nbytes.get(t, 0) for t in batches.get(term, (term,))
+                if t not in done
+            )
+            freed = sum(nbytes.get(t, 0) for t in released(term))
+            return allocated - freed, priority[term]
+
+        order = []
+        while ready:
+            term = min(ready, key=cost)
+            order.append(term)
+            if not isinstance(term, LoadableTerm):
+                for parent, _ in subgraph.in_edges([term]):
+                    remaining_refs[parent] -= 1
+
+            for produced in batches.get(term, (term,)):
+                if produced in done or produced not in subgraph:
+                    continue
+                done.add(produced)
+                ready.discard(produced)
+                for _, child in subgraph.out_edges([produced]):
+                    waiting_on[child] -= 1
+                    if waiting_on[child] == 0 and child not in done:
+                        ready.add(child)
+
+        return iter(order)
+
     def ordered(self):
         return iter(nx.topological_sort(self.graph))
 
@@ -229,6 +306,8 @@ class ExecutionPlan(TermGraph):
         The first date for which output is requested for ``terms``.
     end_date : pd.Timestamp
         The last date for which output is requested for ``terms``.
+    rewrites : list[zipline.pipeline.optimize.Rewrite], optional
+        The rewrites that were applied to ``terms`` before building the plan.
 
     Attributes
     ----------
@@ -236,6 +315,7 @@ class ExecutionPlan(TermGraph):
     extra_rows
     outputs
     offset
+    rewrites
 
     Methods
     -------
@@ -250,8 +330,10 @@ class ExecutionPlan(TermGraph):
                  terms,
                  start_date,
                  end_date,
-                 min_extra_rows=0):
+                 min_extra_rows=0,
+                 rewrites=()):
         super(ExecutionPlan, self).__init__(terms)
+        self.rewrites = list(rewrites)
 
         # Specialize all the LoadableTerms in the graph to our domain, so that
         # when the engine requests an execution order, we emit the specialized
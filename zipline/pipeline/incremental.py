@@ -0,0 +1,237 @@
+"""
+Incremental, session-at-a-time execution of Pipelines.
+
+:class:`IncrementalPipelineRunner` computes a pipeline for one session at a
+time instead of for a range of sessions at once. Raw data for each loadable
+term is prefetched in blocks of sessions, and each term gets a rolling
+:class:`~zipline.lib.adjusted_array.AdjustedArray` window over its block that
+is advanced with ``seek`` as sessions are requested. Advancing a window only
+applies the adjustments that became known since the previous session, so
+moving to a new session never reloads or re-adjusts the lookback data for the
+terms in the pipeline.
+"""
+from six import iteritems
+from toolz import groupby
+
+from zipline.utils.numpy_utils import as_column
+from zipline.utils.pandas_utils import explode
+
+
+class _PrefetchedBlock(object):
+    """
+    Raw data for every loadable term in a pipeline over a block of sessions.
+
+    Parameters
+    ----------
+    engine : zipline.pipeline.engine.SimplePipelineEngine
+        The engine providing loaders and the asset lifetimes matrix.
+    pipeline : zipline.pipeline.Pipeline
+        The pipeline being computed.
+    domain : zipline.pipeline.domain.Domain
+        The domain of ``pipeline``.
+    start_date : pd.Timestamp
+        The first session served by this block.
+    end_date : pd.Timestamp
+        The last session served by this block.
+    """
+    def __init__(self, engine, pipeline, domain, start_date, end_date):
+        root_mask_term = engine._root_mask_term
+        plan = pipeline.to_execution_plan(
+            domain,
+            root_mask_term,
+            start_date,
+            end_date,
+            optimize=engine._optimize,
+        )
+        extra_rows = plan.extra_rows[root_mask_term]
+        root_mask = engine._compute_root_mask(
+            domain, start_date, end_date, extra_rows,
+        )
+        self.dates, self.sids, self.root_mask_values = explode(root_mask)
+        self.end_date = end_date
+
+        # Load every term over the full block, including the longest lookback
+        # window required by the pipeline. Each term is then served through
+        # windows of whatever length the per-session plans ask for.
+        get_loader = engine._get_loader
+        self._arrays = arrays = {}
+        for loader, terms in iteritems(groupby(get_loader,
+                                               plan.loadable_terms)):
+            to_load = sorted(terms, key=lambda t: t.dataset)
+            loaded = loader.load_adjusted_array(
+                domain,
+                to_load,
+                self.dates,
+                self.sids,
+                self.root_mask_values,
+            )
+            assert set(loaded) == set(to_load), (
+                'loader did not return an AdjustedArray for each column\n'
+                'expected: %r\n'
+                'got:      %r' % (sorted(to_load), sorted(loaded))
+            )
+            arrays.update(loaded)
+
+        # Map from (term, window_length) -> AdjustedArrayWindow.
+        self._windows = {}
+
+    def can_serve(self, plan, root_mask_term, session):
+        """
+        Can this block provide every input needed to compute ``plan`` for
+        ``session``?
+        """
+        if session > self.end_date:
+            return False
+        try:
+            ix = self.dates.get_loc(session)
+        except KeyError:
+            return False
+        if ix < plan.extra_rows[root_mask_term]:
+            return False
+        return all(term in self._arrays for term in plan.loadable_terms)
+
+    def _window(self, term, window_length):
+        key = term, window_length
+        try:
+            return self._windows[key]
+        except KeyError:
+            window = self._windows[key] = self._arrays[term].traverse(
+                window_length,
+            )
+            return window
+
+    def initial_workspace(self, plan, root_mask_term, dates_term, session):
+        """
+        Build the initial workspace for computing ``plan`` on ``session``.
+
+        Returns
+        -------
+        dates : pd.DatetimeIndex
+            The dates of the rows in the workspace.
+        workspace : dict[Term, np.ndarray]
+            The root mask, input dates and every loadable term of ``plan``.
+        """
+        ix = self.dates.get_loc(session)
+        rows = slice(ix - plan.extra_rows[root_mask_term], ix + 1)
+        dates = self.dates[rows]
+
+        workspace = {
+            root_mask_term: self.root_mask_values[rows],
+            dates_term: as_column(dates.values),
+        }
+        for term in plan.loadable_terms:
+            window_length = plan.extra_rows[term] + 1
+            # Windows only move forward, so each session only applies the
+            # adjustments that became known since the previous session.
+            workspace[term] = self._window(term, window_length).seek(ix + 1)
+
+        return dates, workspace
+
+
+class IncrementalPipelineRunner(object):
+    """
+    Compute a pipeline one session at a time.
+
+    Parameters
+    ----------
+    engine : zipline.pipeline.engine.SimplePipelineEngine
+        The engine to use to load and compute terms.
+    pipeline : zipline.pipeline.Pipeline
+        The pipeline to compute.
+    end_date : pd.Timestamp
+        The last session that will be requested.
+    block_sizes : iterable[int]
+        The number of sessions of raw data to prefetch each time the runner
+        needs new data. A block of ``n`` sessions serves the session that
+        triggered the load and the ``n`` sessions after it, up to
+        ``end_date``.
+
+    Notes
+    -----
+    Sessions must be requested in non-decreasing order, because the rolling
+    windows over each term's data can only move forward.
+
+    The assets considered on each session are the assets that existed at any
+    point during the current block, which matches the universe used by
+    :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline` when
+    it is called over the same range as the block.
+    """
+    def __init__(self, engine, pipeline, end_date, block_sizes):
+        self._engine = engine
+        self._pipeline = pipeline
+        self._domain = engine.resolve_domain(pipeline)
+        self._sessions = self._domain.all_sessions()
+        self._end_date = end_date
+        self._block_sizes = iter(block_sizes)
+        self._block = None
+        self._last_session = None
+
+    def _load_block(self, session):
+        sessions = self._sessions
+        start_loc = sessions.get_loc(session)
+        end_loc = min(
+            start_loc + next(self._block_sizes),
+            sessions.get_loc(self._end_date),
+        )
+        return _PrefetchedBlock(
+            self._engine,
+            self._pipeline,
+            self._domain,
+            session,
+            sessions[max(start_loc, end_loc)],
+        )
+
+    def run_session(self, session):
+        """
+        Compute the pipeline for a single session.
+
+        Parameters
+        ----------
+        session : pd.Timestamp
+            The session to compute. This must not be earlier than any session
+            previously passed to this method.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            A frame of computed results with the same layout as the result of
+            :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline`
+            called with ``start_date == end_date == session``.
+        """
+        if self._last_session is not None and session < self._last_session:
+            raise ValueError(
+                "Sessions must be requested in order, but got {} after "
+                "{}.".format(session, self._last_session)
+            )
+        self._last_session = session
+
+        engine = self._engine
+        root_mask_term = engine._root_mask_term
+        plan = self._pipeline.to_execution_plan(
+            self._domain,
+            root_mask_term,
+            session,
+            session,
+            optimize=engine._optimize,
+        )
+
+        block = self._block
+        if block is None or not block.can_serve(plan, root_mask_term, session):
+            block = self._block = self._load_block(session)
+
+        dates, initial_workspace = block.initial_workspace(
+            plan,
+            root_mask_term,
+            engine._root_mask_dates_term,
+            session,
+        )
+        results = engine.compute_chunk(
+            plan, dates, block.sids, initial_workspace,
+        )
+        return engine._to_narrow(
+            plan.outputs,
+            results,
+            results.pop(plan.screen_name),
+            dates[plan.extra_rows[root_mask_term]:],
+            block.sids,
+        )
@@ -6,18 +6,22 @@ from textwrap import dedent
 from numpy import (
     array,
     full,
+    newaxis,
     recarray,
     vstack,
 )
-from pandas import NaT as pd_NaT
+from pandas import DatetimeIndex, NaT as pd_NaT
+from toolz import sliding_window
 
 from zipline.errors import (
     WindowLengthNotPositive,
     UnsupportedDataType,
     NoFurtherDataError,
 )
+from zipline.lib.adjusted_array import WindowBlocks
 from zipline.utils.context_tricks import nop_context
 from zipline.utils.input_validation import expect_types
+from zipline.utils.memoize import lazyval
 from zipline.utils.sharedoc import (
     format_docstring,
     PIPELINE_ALIAS_NAME_DOC,
@@ -102,7 +106,8 @@ class CustomTermMixin(object):
     Mixin for user-defined rolling-window Terms.
 
     Implements `_compute` in terms of a user-defined `compute` function, which
-    is mapped over the input windows.
+    is mapped over the input windows, or in terms of a user-defined
+    `compute_batch` function, which is called with stacks of windows.
 
     Used by CustomFactor, CustomFilter, CustomClassifier, etc.
     """
@@ -140,16 +145,44 @@ class CustomTermMixin(object):
             **kwargs
         )
 
-    def compute(self, today, assets, out, *arrays):
+    def compute(self, today, assets, out, *arrays, **params):
         """
         Override this method with a function that writes a value into `out`.
+
+        Terms that define `compute_batch` inherit a `compute` that calls it
+        with a single window, so that subclasses which override `compute` can
+        still call the parent's implementation.
         """
-        raise NotImplementedError(
-            "{name} must define a compute method".format(
-                name=type(self).__name__
+        compute_batch = getattr(self, 'compute_batch', None)
+        if compute_batch is None:
+            raise NotImplementedError(
+                "{name} must define a compute method".format(
+                    name=type(self).__name__
+                )
             )
+        compute_batch(
+            DatetimeIndex([today]),
+            assets,
+            out[newaxis],
+            *[array_[newaxis] for array_ in arrays],
+            **params
         )
 
+    @lazyval
+    def _batched(self):
+        """
+        Whether this term should be computed with `compute_batch`.
+
+        This is True if `compute_batch` is defined, and isn't shadowed by a
+        `compute` method defined by a subclass.
+        """
+        for cls in type(self).__mro__:
+            if 'compute_batch' in vars(cls):
+                return True
+            if 'compute' in vars(cls) and cls is not CustomTermMixin:
+                return False
+        return False
+
     def _allocate_output(self, windows, shape):
         """
         Allocate an output array whose rows should be passed to `self.compute`.
@@ -195,10 +228,15 @@ class CustomTermMixin(object):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        if windows and isinstance(windows[0], WindowBlocks):
+            return self._compute_blocks(windows, dates, assets, mask)
+
         format_inputs = self._format_inputs
         compute = self.compute
         params = self.params
         ndim = self.ndim
+        batched = self._batched
+        compute_batch = self.compute_batch if batched else None
 
         shape = (len(mask), 1) if ndim == 1 else mask.shape
         out = self._allocate_output(windows, shape)
@@ -215,10 +253,54 @@ class CustomTermMixin(object):
                 out_row = out[idx][out_mask]
                 inputs = format_inputs(windows, inputs_mask)
 
-                compute(date, masked_assets, out_row, *inputs, **params)
+                if batched:
+                    # We only get single windows when we're wrapped by
+                    # another term, e.g. when downsampled. Pass them as
+                    # stacks of one window.
+                    compute_batch(
+                        dates[idx:idx + 1],
+                        masked_assets,
+                        out_row[newaxis],
+                        *[input_[newaxis] for input_ in inputs],
+                        **params
+                    )
+                else:
+                    compute(date, masked_assets, out_row, *inputs, **params)
                 out[idx][out_mask] = out_row
         return out
 
+    def _compute_blocks(self, blocks, dates, assets, mask):
+        """
+        Call the user's `compute_batch` function on each run of dates over
+        which no new adjustments are applied to any input.
+        """
+        compute_batch = self.compute_batch
+        params = self.params
+        ndim = self.ndim
+
+        shape = (len(mask), 1) if ndim == 1 else mask.shape
+        out = self._allocate_output(blocks, shape)
+
+        boundaries = {0, len(dates)}
+        for block in blocks:
+            boundaries.update(block.boundaries)
+
+        with self.ctx:
+            for start, stop in sliding_window(2, sorted(boundaries)):
+                compute_batch(
+                    dates[start:stop],
+                    assets,
+                    out[start:stop],
+                    *[block.windows(start, stop) for block in blocks],
+                    **params
+                )
+
+        # Inputs aren't masked, so clear any outputs that ``compute`` would
+        # not have written. Never apply a mask to 1D outputs.
+        if ndim != 1:
+            out[~mask] = self.missing_value
+        return out
+
     def graph_repr(self):
         """Short repr to use when rendering Pipeline graphs."""
         return type(self).__name__ + ':\l  window_length: %d\l' % \
@@ -0,0 +1,255 @@
+"""
+Rewrite passes over the terms of a pipeline before they're compiled into an
+:class:`~zipline.pipeline.graph.ExecutionPlan`.
+
+Terms are immutable and most of them can't be rebuilt with different inputs,
+so the optimizer only rewrites the places where a term can be swapped out
+safely: the pipeline's outputs, and the inputs of
+:class:`~zipline.pipeline.expression.NumericalExpression` terms, which are
+fully described by their expression string and their inputs.
+
+Two rewrites are applied:
+
+``fuse``
+    A ``NumericalExpression`` input of a ``NumericalExpression`` that isn't
+    used anywhere else is inlined into its consumer, so the pair is evaluated
+    by a single call to numexpr and the intermediate array is never stored
+    in the workspace. Expressions are only fused while the result stays
+    within numexpr's limit on the number of operands.
+
+``dedupe``
+    Terms which compute the same values, but which aren't the same object, are
+    replaced by a single instance. This happens, for example, when a
+    CustomFactor class is redefined in a notebook, when the same term is built
+    from a generic and a domain-specific column, or when two expressions
+    combine the same inputs in a different order.
+"""
+from collections import namedtuple
+import re
+
+from zipline.utils.numpy_utils import bool_dtype, float64_dtype
+
+from .cache import Uncacheable, fingerprint
+from .domain import GENERIC
+from .expression import NumericalExpression
+from .term import LoadableTerm
+
+_VARIABLE_RE = re.compile(r'\bx_(\d+)\b')
+
+# numexpr evaluates these dtypes natively, so inlining a subexpression of one
+# of these dtypes doesn't change its result.
+_FUSABLE_DTYPES = frozenset({bool_dtype, float64_dtype})
+
+# numexpr can't evaluate an expression with more than this many operands,
+# counting the output array.
+_MAX_NUMEXPR_OPERANDS = 32
+
+
+Rewrite = namedtuple('Rewrite', 'kind original replacement')
+Rewrite.__doc__ = """
+A record of a term replaced by :func:`optimize_terms`.
+
+Attributes
+----------
+kind : {'fuse', 'dedupe'}
+    The kind of rewrite that was applied.
+original : zipline.pipeline.term.Term
+    The term as it was written.
+replacement : zipline.pipeline.term.Term
+    The term that is computed instead.
+"""
+
+
+def _consumer_counts(terms):
+    """
+    Count the number of distinct places that use each term reachable from
+    ``terms``. Each output counts as a use.
+    """
+    counts = {}
+    seen = set()
+    stack = list(terms.values())
+    for term in stack:
+        counts[term] = counts.get(term, 0) + 1
+
+    while stack:
+        term = stack.pop()
+        if term in seen:
+            continue
+        seen.add(term)
+        for dep in term.dependencies:
+            counts[dep] = counts.get(dep, 0) + 1
+            stack.append(dep)
+    return counts
+
+
+def _rebind(expr, mapping):
+    """
+    Replace each variable ``x_i`` in ``expr`` with ``mapping[i]``.
+
+    All variables are replaced in a single pass, so the replacements may
+    themselves contain variable names.
+    """
+    return _VARIABLE_RE.sub(lambda m: mapping[int(m.group(1))], expr)
+
+
+def _operand_count(*groups):
+    """
+    Count the operands of an expression whose inputs are the distinct terms
+    in ``groups``.
+    """
+    distinct = set()
+    for group in groups:
+        distinct.update(group)
+    # The output is an operand too.
+    return len(distinct) + 1
+
+
+class _Optimizer(object):
+
+    def __init__(self, terms, domain):
+        self._consumers = _consumer_counts(terms)
+        self._outputs = set(terms.values())
+        self._rewritten = {}
+        self._canonical = {}
+        self.rewrites = []
+
+        # Generic terms behave exactly like their specializations once they're
+        # executed on ``domain``, so fingerprint them as such. Values in the
+        # memo are (object, fingerprint) pairs. See ``fingerprint``.
+        memo = self._memo = {}
+        if domain is not GENERIC:
+            memo[id(GENERIC)] = GENERIC, fingerprint(domain, memo)
+            for term in self._consumers:
+                if isinstance(term, LoadableTerm):
+                    memo[id(term)] = term, fingerprint(
+                        term.specialize(domain),
+                        memo,
+                    )
+
+    def _can_fuse(self, outer, original, inner):
+        """
+        Can ``inner``, which replaces the input ``original`` of ``outer``, be
+        inlined into ``outer``?
+        """
+        return (
+            isinstance(inner, NumericalExpression) and
+            original not in self._outputs and
+            self._consumers[original] == 1 and
+            inner.mask is outer.mask and
+            inner.dtype in _FUSABLE_DTYPES and
+            outer.dtype in _FUSABLE_DTYPES
+        )
+
+    def _key(self, term):
+        return fingerprint(term, self._memo)
+
+    def _rewrite_expression(self, term):
+        rewritten = [self.rewrite(input_) for input_ in term.inputs]
+
+        # Collect the subexpression for each of our inputs, in terms of the
+        # inputs of the new expression.
+        new_inputs = []
+        subexprs = {}
+        fused = []
+
+        def add_input(input_):
+            if input_ not in new_inputs:
+                new_inputs.append(input_)
+            return '{%d}' % new_inputs.index(input_)
+
+        for i, (original, input_) in enumerate(zip(term.inputs, rewritten)):
+            # Assume that none of the remaining inputs are fused. They check
+            # the limit again when we get to them.
+            if self._can_fuse(term, original, input_) and _operand_count(
+                new_inputs,
+                input_.inputs,
+                rewritten[i + 1:],
+            ) <= _MAX_NUMEXPR_OPERANDS:
+                inner = {
+                    j: add_input(inner_input)
+                    for j, inner_input in enumerate(input_.inputs)
+                }
+                subexprs[i] = '(' + _rebind(input_._expr, inner) + ')'
+                fused.append(original)
+            else:
+                subexprs[i] = add_input(input_)
+
+        # Put inputs in a canonical order so that equivalent expressions
+        # which were built from their inputs in a different order compare
+        # equal.
+        try:
+            order = sorted(
+                range(len(new_inputs)),
+                key=lambda ix: self._key(new_inputs[ix]),
+            )
+        except Uncacheable:
+            order = list(range(len(new_inputs)))
+        position = {old: new for new, old in enumerate(order)}
+        expr = _rebind(term._expr, subexprs).format(*(
+            'x_%d' % position[ix] for ix in range(len(new_inputs))
+        ))
+
+        new_term = type(term)(
+            expr=expr,
+            binds=tuple(new_inputs[ix] for ix in order),
+            dtype=term.dtype,
+        )
+        for original in fused:
+            self.rewrites.append(Rewrite('fuse', original, new_term))
+        return new_term
+
+    def rewrite(self, term):
+        """
+        Get the term to compute in place of ``term``.
+        """
+        try:
+            return self._rewritten[term]
+        except KeyError:
+            pass
+
+        if isinstance(term, NumericalExpression):
+            new_term = self._rewrite_expression(term)
+        else:
+            new_term = term
+
+        try:
+            canonical = self._canonical.setdefault(
+                self._key(new_term),
+                new_term,
+            )
+        except Uncacheable:
+            canonical = new_term
+
+        # Generic columns are specialized by the ExecutionPlan anyway, so
+        # don't report them.
+        if canonical is not new_term and not isinstance(term, LoadableTerm):
+            self.rewrites.append(Rewrite('dedupe', term, canonical))
+
+        self._rewritten[term] = canonical
+        return canonical
+
+
+def optimize_terms(terms, domain):
+    """
+    Rewrite the terms of a pipeline so that they're cheaper to compute.
+
+    Parameters
+    ----------
+    terms : dict[str, zipline.pipeline.term.Term]
+        A map from output names to terms, including the screen.
+    domain : zipline.pipeline.domain.Domain
+        The domain on which the terms will be computed.
+
+    Returns
+    -------
+    optimized : dict[str, zipline.pipeline.term.Term]
+        A map from the same names to the terms that should be computed
+        instead.
+    rewrites : list[Rewrite]
+        The rewrites that were applied.
+    """
+    optimizer = _Optimizer(terms, domain)
+    optimized = {
+        name: optimizer.rewrite(term) for name, term in terms.items()
+    }
+    return optimized, optimizer.rewrites
@@ -10,6 +10,7 @@ from zipline.utils.input_validation import (
 from .domain import Domain, GENERIC, infer_domain
 from .graph import ExecutionPlan, TermGraph, SCREEN_NAME
 from .filters import Filter
+from .optimize import optimize_terms
 from .term import AssetExists, ComputableTerm, Term
 
 
@@ -161,7 +162,8 @@ class Pipeline(object):
                           domain,
                           default_screen,
                           start_date,
-                          end_date):
+                          end_date,
+                          optimize=False):
         """
         Compile into an ExecutionPlan.
 
@@ -178,6 +180,11 @@ class Pipeline(object):
             The first date of requested output.
         end_date : pd.Timestamp
             The last date of requested output.
+        optimize : bool, optional
+            Whether to rewrite the pipeline's terms with
+            :func:`zipline.pipeline.optimize.optimize_terms` before building
+            the plan. The applied rewrites are stored on the plan's
+            ``rewrites`` attribute.
 
         Returns
         -------
@@ -191,11 +198,17 @@ class Pipeline(object):
                 "plan with different domain {}.".format(self._domain, domain)
             )
 
+        terms = self._prepare_graph_terms(default_screen)
+        rewrites = ()
+        if optimize:
+            terms, rewrites = optimize_terms(terms, domain)
+
         return ExecutionPlan(
             domain=domain,
-            terms=self._prepare_graph_terms(default_screen),
+            terms=terms,
             start_date=start_date,
             end_date=end_date,
+            rewrites=rewrites,
         )
 
     def to_simple_graph(self, default_screen):
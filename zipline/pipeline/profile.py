@@ -0,0 +1,185 @@
+"""
+Per-term timing and memory reports for pipeline runs.
+"""
+from time import time
+
+from pandas import DataFrame
+from six import iteritems
+
+from .spill import resident_nbytes
+from .visualize import display_graph
+
+
+class PipelineProfile(object):
+    """
+    Timings and result sizes for each term computed while running a
+    pipeline.
+
+    A ``PipelineProfile`` is produced by
+    :meth:`zipline.pipeline.engine.SimplePipelineEngine.profile_pipeline`.
+
+    Parameters
+    ----------
+    graph : zipline.pipeline.graph.ExecutionPlan
+        The execution plan of the profiled pipeline.
+
+    Attributes
+    ----------
+    graph : zipline.pipeline.graph.ExecutionPlan
+        The execution plan of the profiled pipeline.
+    """
+    columns = (
+        'kind',
+        'term',
+        'loader',
+        'seconds',
+        'result_nbytes',
+        'array_shape',
+    )
+
+    def __init__(self, graph):
+        self.graph = graph
+        self._records = []
+
+    def timed(self, f, kind, term, loader=None):
+        """
+        Wrap ``f`` so that each call to it is recorded in this profile.
+
+        Parameters
+        ----------
+        f : callable
+            Either ``term._compute`` or a loader's ``load_adjusted_array``.
+        kind : {'compute', 'load'}
+            The kind of work done by ``f``.
+        term : Term or tuple[Term]
+            The term computed by ``f``, or the terms loaded by ``f``.
+        loader : PipelineLoader, optional
+            The loader used to load ``term``.
+
+        Returns
+        -------
+        timed : callable
+            A function with the same signature and result as ``f``.
+        """
+        records = self._records
+
+        def timed(*args):
+            start = time()
+            result = f(*args)
+            seconds = time() - start
+
+            if kind == 'load':
+                arrays = [result[t] for t in term]
+                nbytes = sum(map(resident_nbytes, arrays))
+                shape = arrays[0].data.shape if arrays else None
+            else:
+                nbytes = resident_nbytes(result)
+                shape = result.shape
+
+            # list.append is atomic, so this is safe to call from the threads
+            # of a concurrent engine's pool.
+            records.append((
+                kind,
+                term,
+                None if loader is None else type(loader).__name__,
+                seconds,
+                nbytes,
+                shape,
+            ))
+            return result
+
+        return timed
+
+    def to_frame(self):
+        """
+        Get the recorded timings as a DataFrame.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+            A frame with one row per call to ``term._compute`` or
+            ``load_adjusted_array``, in the order the calls finished. The
+            columns are:
+
+            kind
+                Either ``'compute'`` or ``'load'``.
+            term
+                The computed term, or a tuple of the terms loaded together.
+            loader
+                The name of the loader's type, for loads.
+            seconds
+                The wall time spent in the call.
+            result_nbytes
+                The size in bytes of the produced arrays that are held in
+                memory. This is the size of the result, not the peak memory
+                used while producing it: temporary arrays allocated during
+                the call aren't counted.
+            array_shape
+                The shape of the produced arrays. This isn't called ``shape``
+                so that it doesn't shadow ``DataFrame.shape``.
+        """
+        return DataFrame.from_records(
+            self._records,
+            columns=list(self.columns),
+        )
+
+    def seconds_by_term(self):
+        """
+        Get the total time spent producing each term.
+
+        Terms that were loaded together are each assigned the full time of
+        the load.
+
+        Returns
+        -------
+        seconds : dict[Term, float]
+        """
+        out = {}
+        for kind, terms, _, seconds, _, _ in self._records:
+            if kind != 'load':
+                terms = (terms,)
+            for term in terms:
+                out[term] = out.get(term, 0.0) + seconds
+        return out
+
+    def heat(self):
+        """
+        Get the time spent producing each term as a fraction of the time
+        spent on the slowest term.
+
+        Returns
+        -------
+        heat : dict[Term, float]
+        """
+        seconds = self.seconds_by_term()
+        longest = max(seconds.values()) if seconds else 0.0
+        if not longest:
+            return {term: 0.0 for term in seconds}
+        return {term: s / longest for term, s in iteritems(seconds)}
+
+    def display(self, format='svg', include_asset_exists=False):
+        """
+        Render the profiled pipeline's graph, with each term colored by the
+        time spent producing it.
+
+        See Also
+        --------
+        zipline.pipeline.visualize.display_graph
+        """
+        return display_graph(
+            self.graph,
+            format,
+            include_asset_exists=include_asset_exists,
+            heat=self.heat(),
+        )
+
+    @property
+    def svg(self):
+        return self.display('svg')
+
+    @property
+    def png(self):
+        return self.display('png')
+
+    def __repr__(self):
+        return '<{}: {} calls>'.format(type(self).__name__, len(self._records))
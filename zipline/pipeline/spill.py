@@ -0,0 +1,141 @@
+"""
+Spilling of pipeline workspace arrays to memory-mapped files.
+"""
+import os
+import shutil
+from tempfile import mkdtemp
+
+import numpy as np
+
+from zipline.lib.adjusted_array import AdjustedArray
+
+
+def resident_nbytes(value):
+    """
+    The number of bytes of memory held by a workspace value.
+
+    Arrays that have been spilled to disk are backed by the page cache, so
+    they count as free.
+    """
+    if isinstance(value, np.memmap):
+        return 0
+    if isinstance(value, AdjustedArray):
+        return resident_nbytes(value.data)
+    return getattr(value, 'nbytes', 0)
+
+
+class WorkspaceSpiller(object):
+    """
+    Keep the arrays in a pipeline workspace under a memory budget by moving
+    the largest ones to memory-mapped temporary files.
+
+    Spilled arrays are replaced in the workspace by copy-on-write
+    :class:`numpy.memmap` views of their files, so terms can keep reading
+    them as ordinary arrays while the operating system pages them in and out
+    as needed.
+
+    Parameters
+    ----------
+    budget : int
+        The number of bytes of memory that the workspace may use before
+        arrays start getting spilled.
+    dir : str, optional
+        The directory in which to create temporary files. By default, the
+        platform's default temporary directory is used.
+
+    Attributes
+    ----------
+    spilled : list[Term]
+        The terms that have been spilled, in the order they were spilled.
+
+    Notes
+    -----
+    Only plain, non-object numpy arrays can be spilled. Loaded terms, which
+    are stored as :class:`~zipline.lib.adjusted_array.AdjustedArray`, and
+    :class:`~zipline.lib.labelarray.LabelArray` results always stay in
+    memory.
+
+    ``WorkspaceSpiller`` is a context manager. Its temporary files are
+    removed on exit, so any spilled arrays that are still needed must be
+    copied back into memory with :meth:`materialize` first.
+    """
+    def __init__(self, budget, dir=None):
+        self.budget = budget
+        self._dir = dir
+        self._path = None
+        self._count = 0
+        self.spilled = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Remove all of the files created by this spiller.
+        """
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+
+    @staticmethod
+    def _can_spill(value):
+        # Views of other arrays don't own their memory, so spilling them
+        # wouldn't release anything.
+        return (
+            type(value) is np.ndarray and
+            value.dtype != object and
+            value.size > 0 and
+            value.flags.owndata
+        )
+
+    def _spill_one(self, value):
+        if self._path is None:
+            self._path = mkdtemp(prefix='zipline-spill-', dir=self._dir)
+        path = os.path.join(self._path, '%d.npy' % self._count)
+        self._count += 1
+        np.save(path, value, allow_pickle=False)
+        return np.load(path, mmap_mode='c')
+
+    def spill(self, workspace, candidates):
+        """
+        Spill the largest arrays among ``candidates`` until the arrays in
+        ``workspace`` use no more than ``budget`` bytes.
+
+        Parameters
+        ----------
+        workspace : dict[Term, np.ndarray]
+            The workspace to update in place.
+        candidates : iterable[Term]
+            The terms whose values may be spilled. Values that other code
+            still holds references to, like the values supplied in the
+            initial workspace, shouldn't be spilled because doing so wouldn't
+            release any memory.
+        """
+        total = sum(resident_nbytes(v) for v in workspace.values())
+        if total <= self.budget:
+            return
+
+        spillable = sorted(
+            (t for t in candidates
+             if t in workspace and self._can_spill(workspace[t])),
+            key=lambda t: workspace[t].nbytes,
+            reverse=True,
+        )
+        for term in spillable:
+            if total <= self.budget:
+                break
+            value = workspace[term]
+            workspace[term] = self._spill_one(value)
+            total -= value.nbytes
+            self.spilled.append(term)
+
+    @staticmethod
+    def materialize(value):
+        """
+        Copy ``value`` back into memory if it was spilled.
+        """
+        if isinstance(value, np.memmap):
+            return np.array(value)
+        return value
@@ -81,7 +81,7 @@ def filter_nodes(include_asset_exists, nodes):
     return filter(lambda n: n is not AssetExists(), nodes)
 
 
-def _render(g, out, format_, include_asset_exists=False):
+def _render(g, out, format_, include_asset_exists=False, heat=None):
     """
     Draw `g` as a graph to `out`, in format `format`.
 
@@ -94,12 +94,15 @@ def _render(g, out, format_, include_asset_exists=False):
         Output format.
     include_asset_exists : bool
         Whether to filter out `AssetExists()` nodes.
+    heat : dict[Term, float], optional
+        Values between 0 and 1 to use to color each term as a heatmap.
     """
     graph_attrs = {'rankdir': 'TB', 'splines': 'ortho'}
     cluster_attrs = {'style': 'filled', 'color': 'lightgoldenrod1'}
 
     in_nodes = g.loadable_terms
     out_nodes = list(g.outputs.values())
+    add_node = partial(add_term_node, heat=heat)
 
     f = BytesIO()
     with graph(f, "G", **graph_attrs):
@@ -107,19 +110,19 @@ def _render(g, out, format_, include_asset_exists=False):
         # Write outputs cluster.
         with cluster(f, 'Output', labelloc='b', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, out_nodes):
-                add_term_node(f, term)
+                add_node(f, term)
 
         # Write inputs cluster.
         with cluster(f, 'Input', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, in_nodes):
-                add_term_node(f, term)
+                add_node(f, term)
 
         # Write intermediate results.
         for term in filter_nodes(include_asset_exists,
                                  topological_sort(g.graph)):
             if term in in_nodes or term in out_nodes:
                 continue
-            add_term_node(f, term)
+            add_node(f, term)
 
         # Write edges
         for source, dest in g.graph.edges():
@@ -149,9 +152,12 @@ def _render(g, out, format_, include_asset_exists=False):
     out.write(proc_stdout)
 
 
-def display_graph(g, format='svg', include_asset_exists=False):
+def display_graph(g, format='svg', include_asset_exists=False, heat=None):
     """
     Display a TermGraph interactively from within IPython.
+
+    If ``heat`` is given, it should map terms to values between 0 and 1,
+    which are used to color the terms from yellow to red.
     """
     try:
         import IPython.display as display
@@ -164,7 +170,13 @@ def display_graph(g, format='svg', include_asset_exists=False):
         display_cls = partial(display.Image, format=format, embed=True)
 
     out = BytesIO()
-    _render(g, out, format, include_asset_exists=include_asset_exists)
+    _render(
+        g,
+        out,
+        format,
+        include_asset_exists=include_asset_exists,
+        heat=heat,
+    )
     return display_cls(data=out.getvalue())
 
 
@@ -180,8 +192,12 @@ def fmt(obj):
     return '"%s"' % r
 
 
-def add_term_node(f, term):
-    declare_node(f, id(term), attrs_for_node(term))
+def add_term_node(f, term, heat=None):
+    if heat is None:
+        attrs = attrs_for_node(term)
+    else:
+        attrs = attrs_for_node(term, **heat_attrs(heat.get(term, 0.0)))
+    declare_node(f, id(term), attrs)
 
 
 def declare_node(f, name, attributes):
@@ -212,6 +228,18 @@ def attrs_for_node(term, **overrides):
     return attrs
 
 
+def heat_attrs(heat):
+    """
+    Get node attributes that color a node by ``heat``, a value between 0 and
+    1.
+    """
+    # ylorrd9 has 9 colors, ranging from pale yellow to dark red.
+    return {
+        'colorscheme': 'ylorrd9',
+        'fillcolor': str(1 + int(round(8 * min(max(heat, 0.0), 1.0)))),
+    }
+
+
 def format_attrs(attrs):
     """
     Format key, value pairs from attrs into graphviz attrs format
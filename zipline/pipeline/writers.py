@@ -0,0 +1,167 @@
+"""
+Writers for streaming pipeline results to disk.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+_FORMATS_BY_EXTENSION = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.h5': 'hdf5',
+    '.hdf': 'hdf5',
+    '.hdf5': 'hdf5',
+}
+
+
+def flatten_pipeline_result(frame):
+    """
+    Convert a pipeline result into a flat frame that can be stored on disk.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        A frame returned by
+        :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline`.
+
+    Returns
+    -------
+    flat : pd.DataFrame
+        A frame with a default index and columns ``date``, ``sid``, and each
+        of the columns of ``frame`` in sorted order. Categorical columns are
+        converted to object columns, because the categories of different
+        chunks of results may differ.
+    """
+    index = frame.index
+    # MultiIndex.labels was renamed to codes in pandas 0.24.
+    codes = getattr(index, 'codes', None)
+    if codes is None:
+        codes = index.labels
+
+    # Convert each distinct asset to a sid once, rather than once per row.
+    level_sids = np.array([int(asset) for asset in index.levels[1]],
+                          dtype='int64')
+    out = pd.DataFrame({
+        'date': index.get_level_values(0),
+        'sid': level_sids[np.asarray(codes[1])],
+    }, columns=['date', 'sid'])
+    for name in sorted(frame.columns):
+        values = frame[name].values
+        if isinstance(values, pd.Categorical):
+            values = np.asarray(values, dtype=object)
+        out[name] = values
+    return out
+
+
+def _write_parquet(frames, path, **kwargs):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Writing pipeline results to parquet requires pyarrow, which is "
+            "not installed."
+        )
+
+    writer = None
+    rows = 0
+    try:
+        for frame in frames:
+            flat = flatten_pipeline_result(frame)
+            if writer is None:
+                table = pa.Table.from_pandas(flat, preserve_index=False)
+                writer = pq.ParquetWriter(path, table.schema, **kwargs)
+            else:
+                # Coerce later chunks to the schema of the first chunk, for
+                # example when a string column is entirely missing.
+                table = pa.Table.from_pandas(
+                    flat,
+                    schema=writer.schema,
+                    preserve_index=False,
+                )
+            writer.write_table(table)
+            rows += len(flat)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _write_hdf5(frames, path, key='pipeline', **kwargs):
+    store = pd.HDFStore(path, mode='a')
+    rows = 0
+    try:
+        if key in store:
+            store.remove(key)
+        for frame in frames:
+            flat = flatten_pipeline_result(frame)
+            store.append(key, flat, format='table', index=False, **kwargs)
+            rows += len(flat)
+    finally:
+        store.close()
+    return rows
+
+
+def write_pipeline_results(frames, path, format=None, **kwargs):
+    """
+    Write a sequence of pipeline results to a single file, one chunk at a
+    time.
+
+    This is meant to be used with
+    :meth:`~zipline.pipeline.engine.SimplePipelineEngine.run_pipeline_iter`,
+    so that only one chunk of results is held in memory at a time::
+
+        write_pipeline_results(
+            engine.run_pipeline_iter(pipe, start, end, chunksize=252),
+            'factors.parquet',
+        )
+
+    Parameters
+    ----------
+    frames : iterable[pd.DataFrame]
+        Pipeline results to write. Each frame is written as it's produced.
+    path : str
+        The file to write.
+    format : {'parquet', 'hdf5'}, optional
+        The file format to write. By default, this is inferred from the
+        extension of ``path``.
+    **kwargs
+        Forwarded to :class:`pyarrow.parquet.ParquetWriter` for parquet
+        files, or to :meth:`pandas.HDFStore.append` for hdf5 files. hdf5
+        files also accept ``key``, the key under which to store the results,
+        which defaults to ``'pipeline'``. Existing results under ``key`` are
+        replaced.
+
+    Returns
+    -------
+    rows : int
+        The number of rows written.
+
+    Notes
+    -----
+    Results are written in a flat layout, with ``date`` and ``sid`` columns
+    instead of a (date, asset) MultiIndex. See
+    :func:`flatten_pipeline_result`.
+
+    Writing parquet files requires pyarrow, and writing hdf5 files requires
+    PyTables. String columns written to hdf5 may need a ``min_itemsize``
+    large enough for the longest string in any chunk.
+    """
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        try:
+            format = _FORMATS_BY_EXTENSION[extension]
+        except KeyError:
+            raise ValueError(
+                "Can't infer the format of pipeline results to write to {!r}."
+                " Pass format='parquet' or format='hdf5'.".format(path)
+            )
+
+    if format == 'parquet':
+        return _write_parquet(frames, path, **kwargs)
+    elif format == 'hdf5':
+        return _write_hdf5(frames, path, **kwargs)
+    raise ValueError(
+        "Unknown format {!r}. Expected 'parquet' or 'hdf5'.".format(format)
+    )
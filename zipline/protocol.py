@@ -15,6 +15,7 @@
 from warnings import warn
 
 import pandas as pd
+from six import iteritems
 
 from .assets import Asset
 from .utils.enum import enum
@@ -180,7 +181,10 @@ class Portfolio(object):
         self_.pnl = 0.0
         self_.returns = 0.0
         self_.cash = capital_base
-        self_.positions = Positions()
+        self_._positions = Positions()
+        # A function which returns the current positions. The ledger sets
+        # this so that the positions are only built when they are accessed.
+        self_._get_positions = None
         self_.start_date = start_date
         self_.positions_value = 0.0
         self_.positions_exposure = 0.0
@@ -189,11 +193,24 @@ class Portfolio(object):
     def capital_used(self):
         return self.cash_flow
 
+    @property
+    def positions(self):
+        get_positions = self._get_positions
+        if get_positions is None:
+            return self._positions
+        return get_positions()
+
     def __setattr__(self, attr, value):
         raise AttributeError('cannot mutate Portfolio objects')
 
     def __repr__(self):
-        return "Portfolio({0})".format(self.__dict__)
+        fields = {
+            attr: value
+            for attr, value in iteritems(self.__dict__)
+            if not attr.startswith('_')
+        }
+        fields['positions'] = self.positions
+        return "Portfolio({0})".format(fields)
 
     # If you are adding new attributes, don't update this set. This method
     # is deprecated to normal attribute access so we don't want to encourage
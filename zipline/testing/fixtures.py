@@ -1811,6 +1811,9 @@ class WithDataPortal(WithAdjustmentReader,
         Should the minute bar reader be used? Defaults to True.
     DATA_PORTAL_USE_ADJUSTMENTS : bool
         Should the adjustment reader be used? Defaults to True.
+    DATA_PORTAL_HISTORY_CACHE_BYTES : int, optional
+        The byte budget for cached history windows. Defaults to None, which
+        bounds the number of windows instead.
 
     Methods
     -------
@@ -1830,6 +1833,7 @@ class WithDataPortal(WithAdjustmentReader,
 
     DATA_PORTAL_MINUTE_HISTORY_PREFETCH = DEFAULT_MINUTE_HISTORY_PREFETCH
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = DEFAULT_DAILY_HISTORY_PREFETCH
+    DATA_PORTAL_HISTORY_CACHE_BYTES = None
 
     def make_data_portal(self):
         if self.DATA_PORTAL_FIRST_TRADING_DAY is None:
@@ -1878,6 +1882,7 @@ class WithDataPortal(WithAdjustmentReader,
             DATA_PORTAL_MINUTE_HISTORY_PREFETCH,
             daily_history_prefetch_length=self.
             DATA_PORTAL_DAILY_HISTORY_PREFETCH,
+            history_cache_bytes=self.DATA_PORTAL_HISTORY_CACHE_BYTES,
         )
 
     def init_instance_fixtures(self):
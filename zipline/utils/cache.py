@@ -1,7 +1,7 @@
 """
 Caching utilities for zipline
 """
-from collections import MutableMapping
+from collections import MutableMapping, OrderedDict
 import errno
 from functools import partial
 import os
@@ -172,6 +172,74 @@ class ExpiringCache(object):
         self._cache[key] = CachedObject(value, expiration_dt)
 
 
+class ByteBudgetLRU(MutableMapping):
+    """
+    A mapping which evicts its least recently used items once the total size
+    of its values exceeds a budget.
+
+    Parameters
+    ----------
+    sizeof : callable[object -> int]
+        Function returning the number of bytes used by a value.
+    max_bytes : int, optional
+        The total size of the values above which items are evicted. The most
+        recently set item is never evicted, even if it alone exceeds the
+        budget. If not provided, the size of the values isn't bounded.
+    max_items : int, optional
+        The number of items above which items are evicted. If not provided,
+        the number of items isn't bounded.
+
+    Attributes
+    ----------
+    nbytes : int
+        The total size of the values in the cache.
+    evictions : int
+        The number of items evicted to stay within the bounds.
+    """
+    def __init__(self, sizeof, max_bytes=None, max_items=None):
+        self._sizeof = sizeof
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self._data = OrderedDict()
+        self.nbytes = 0
+        self.evictions = 0
+
+    def _over_budget(self):
+        return (
+            (self.max_bytes is not None and self.nbytes > self.max_bytes) or
+            (self.max_items is not None and len(self._data) > self.max_items)
+        )
+
+    def __getitem__(self, key):
+        value, nbytes = self._data.pop(key)
+        # Reinsert the item to mark it as the most recently used.
+        self._data[key] = value, nbytes
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._data:
+            del self[key]
+
+        nbytes = self._sizeof(value)
+        self._data[key] = value, nbytes
+        self.nbytes += nbytes
+
+        while len(self._data) > 1 and self._over_budget():
+            _, (_, evicted_nbytes) = self._data.popitem(last=False)
+            self.nbytes -= evicted_nbytes
+            self.evictions += 1
+
+    def __delitem__(self, key):
+        _, nbytes = self._data.pop(key)
+        self.nbytes -= nbytes
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
 class dataframe_cache(MutableMapping):
     """A disk-backed cache for dataframes.
 
@@ -389,3 +457,29 @@ class working_dir(object):
         if exc_info[0] is None:
             self._commit()
         rmtree(self.path)
+
+
+class resumable_working_dir(working_dir):
+    """A :class:`working_dir` at a fixed location, which is kept instead of
+    removed if an exception is raised in the context.
+
+    Entering a new ``resumable_working_dir`` at the same location picks up
+    the files left by the interrupted one, so that the work can be resumed.
+
+    Parameters
+    ----------
+    final_path : str
+        The location to move the files when committing.
+    path : str
+        The location of the working directory. It is created if it doesn't
+        exist.
+    """
+    def __init__(self, final_path, path):
+        ensure_directory(path)
+        self.path = path
+        self._final_path = final_path
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self._commit()
+            rmtree(self.path)
@@ -8,6 +8,7 @@ from six import PY2
 
 if PY2:
     from abc import ABCMeta
+    from collections import Mapping
     from types import DictProxyType
     from ctypes import py_object, pythonapi
 
@@ -84,6 +85,7 @@ if PY2:
     getargspec = inspect.getargspec
 
 else:
+    from collections.abc import Mapping
     from types import MappingProxyType as mappingproxy
     from math import ceil
 
@@ -120,6 +122,7 @@ else:
 unicode = type(u'')
 
 __all__ = [
+    'Mapping',
     'PY2',
     'exc_clear',
     'mappingproxy',
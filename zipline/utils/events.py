@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
 from collections import namedtuple
 import six
 import warnings
@@ -179,6 +180,52 @@ def lossless_float_to_int(funcname, func, argname, arg):
     raise TypeError(arg)
 
 
+def _execution_opens_and_closes(cal, minutes):
+    """
+    Get the execution open and close, in nanoseconds, of the session of
+    ``cal`` containing each of ``minutes``.
+    """
+    sessions = cal.minute_index_to_session_labels(minutes)
+    schedule = cal.schedule.reindex(sessions)
+    opens = cal.execution_time_from_open(schedule['market_open'])
+    closes = cal.execution_time_from_close(schedule['market_close'])
+    return pd.DatetimeIndex(opens).asi8, pd.DatetimeIndex(closes).asi8
+
+
+class _PrecomputedTriggers(object):
+    """
+    The minutes on which an event triggers, computed up front, along with a
+    pointer to the next one. The minutes must be visited in order.
+
+    Parameters
+    ----------
+    triggers : pd.DatetimeIndex
+        The minutes on which the event triggers.
+    """
+    __slots__ = ('_nanos', '_idx')
+
+    def __init__(self, triggers):
+        self._nanos = triggers.asi8.tolist()
+        self._idx = 0
+
+    def should_trigger(self, dt):
+        nanos = self._nanos
+        value = dt.value
+        idx = self._idx
+        end = len(nanos)
+        while idx < end and nanos[idx] < value:
+            idx += 1
+        self._idx = idx
+        return idx < end and nanos[idx] == value
+
+    def next_trigger(self, minutes, start):
+        nanos = self._nanos
+        idx = bisect_left(nanos, minutes[start].value, self._idx)
+        if idx == len(nanos):
+            return len(minutes)
+        return minutes.asi8.searchsorted(nanos[idx])
+
+
 class EventManager(object):
     """Manages a list of Event objects.
     This manages the logic for checking the rules and dispatching to the
@@ -197,6 +244,8 @@ class EventManager(object):
             if create_context is not None else
             lambda *_: nop_context
         )
+        # The precomputed triggers of events, keyed by the id of the event.
+        self._triggers = {}
 
     def add_event(self, event, prepend=False):
         """
@@ -207,14 +256,80 @@ class EventManager(object):
         else:
             self._events.append(event)
 
+    def precompute_triggers(self, minutes):
+        """
+        Compute the minutes on which each event triggers, so that dispatching
+        is a lookup instead of evaluating the rules on every bar.
+
+        Events whose rules can't be computed up front, and events added
+        afterwards, fall back to evaluating their rules.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            Every minute which will be passed to ``handle_data``, in order.
+        """
+        triggers = {}
+        for event in self._events:
+            if isinstance(event.rule, (Always, Never)):
+                # these are already as cheap as a lookup
+                continue
+
+            try:
+                mask = event.rule.trigger_mask(minutes)
+            except ValueError:
+                # minutes outside of the sessions of the rule's calendar
+                mask = None
+
+            if mask is not None:
+                triggers[id(event)] = _PrecomputedTriggers(minutes[mask])
+
+        self._triggers = triggers
+
     def handle_data(self, context, data, dt):
+        triggers = self._triggers
         with self._create_context(data):
             for event in self._events:
-                event.handle_data(
-                    context,
-                    data,
-                    dt,
-                )
+                event_triggers = triggers.get(id(event))
+                if event_triggers is None:
+                    event.handle_data(
+                        context,
+                        data,
+                        dt,
+                    )
+                elif event_triggers.should_trigger(dt):
+                    event.callback(context, data)
+
+    def next_trigger(self, minutes, start):
+        """
+        Find the next minute at which any of the events might trigger.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes of a single session.
+        start : int
+            The position in ``minutes`` to search from.
+
+        Returns
+        -------
+        idx : int
+            The position in ``minutes`` of the first minute at or after
+            ``start`` at which an event might trigger, or ``len(minutes)`` if
+            none of the events will trigger for the rest of the session.
+        """
+        triggers = self._triggers
+        next_idx = len(minutes)
+        for event in self._events:
+            event_triggers = triggers.get(id(event))
+            if event_triggers is None:
+                event_idx = event.next_trigger(minutes, start)
+            else:
+                event_idx = event_triggers.next_trigger(minutes, start)
+            next_idx = min(next_idx, event_idx)
+            if next_idx == start:
+                break
+        return next_idx
 
 
 class Event(namedtuple('Event', ['rule', 'callback'])):
@@ -234,6 +349,12 @@ class Event(namedtuple('Event', ['rule', 'callback'])):
         if self.rule.should_trigger(dt):
             self.callback(context, data)
 
+    def next_trigger(self, minutes, start):
+        """
+        Find the next minute at which the rule might trigger.
+        """
+        return self.rule.next_trigger(minutes, start)
+
 
 class EventRule(six.with_metaclass(ABCMeta)):
     # Instances of EventRule are assigned a calendar instance when scheduling
@@ -256,6 +377,38 @@ class EventRule(six.with_metaclass(ABCMeta)):
         """
         raise NotImplementedError('should_trigger')
 
+    def next_trigger(self, minutes, start):
+        """
+        Find the position in ``minutes``, the minutes of a single session, of
+        the first minute at or after ``start`` at which the rule might
+        trigger. ``len(minutes)`` means that the rule won't trigger for the
+        rest of the session.
+        This method should NOT mutate any observable state on the object.
+
+        The default can't look ahead, so it assumes the rule might trigger
+        on every minute.
+        """
+        return start
+
+    def trigger_mask(self, minutes):
+        """
+        Compute on which of ``minutes`` the rule triggers, as though
+        should_trigger were called on each of them in order, without
+        mutating any observable state on the object.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes to evaluate the rule on, in order.
+
+        Returns
+        -------
+        mask : np.ndarray[bool] or None
+            Whether the rule triggers on each of ``minutes``, or None if the
+            rule can't be computed up front.
+        """
+        return None
+
 
 class StatelessRule(EventRule):
     """
@@ -272,6 +425,17 @@ class StatelessRule(EventRule):
         return ComposedRule(self, rule, ComposedRule.lazy_and)
     __and__ = and_
 
+    def next_trigger(self, minutes, start):
+        """
+        Stateless rules give the same result for the same minute, so we can
+        look ahead by evaluating the rule on each of the remaining minutes.
+        """
+        should_trigger = self.should_trigger
+        for idx in range(start, len(minutes)):
+            if should_trigger(minutes[idx]):
+                return idx
+        return len(minutes)
+
 
 class ComposedRule(StatelessRule):
     """
@@ -313,6 +477,35 @@ class ComposedRule(StatelessRule):
         """
         return first_should_trigger(dt) and second_should_trigger(dt)
 
+    def next_trigger(self, minutes, start):
+        if self.composer is not ComposedRule.lazy_and:
+            return super(ComposedRule, self).next_trigger(minutes, start)
+
+        # Alternate between the two rules until they agree on a minute.
+        end = len(minutes)
+        idx = start
+        while idx < end:
+            idx = self.first.next_trigger(minutes, idx)
+            if idx == end:
+                break
+            second_idx = self.second.next_trigger(minutes, idx)
+            if second_idx == idx:
+                break
+            idx = second_idx
+        return idx
+
+    def trigger_mask(self, minutes):
+        if self.composer is not ComposedRule.lazy_and:
+            return None
+
+        first = self.first.trigger_mask(minutes)
+        if first is None:
+            return None
+        second = self.second.trigger_mask(minutes)
+        if second is None:
+            return None
+        return first & second
+
     @property
     def cal(self):
         return self.first.cal
@@ -335,6 +528,12 @@ class Always(StatelessRule):
         return True
     should_trigger = always_trigger
 
+    def next_trigger(self, minutes, start):
+        return start
+
+    def trigger_mask(self, minutes):
+        return np.ones(len(minutes), dtype=bool)
+
 
 class Never(StatelessRule):
     """
@@ -348,6 +547,12 @@ class Never(StatelessRule):
         return False
     should_trigger = never_trigger
 
+    def next_trigger(self, minutes, start):
+        return len(minutes)
+
+    def trigger_mask(self, minutes):
+        return np.zeros(len(minutes), dtype=bool)
+
 
 class AfterOpen(StatelessRule):
     """
@@ -404,6 +609,13 @@ class AfterOpen(StatelessRule):
 
         return dt == self._period_end
 
+    def trigger_mask(self, minutes):
+        opens, _ = _execution_opens_and_closes(self.cal, minutes)
+        period_ends = opens + (
+            pd.Timedelta(self.offset - self._one_minute).value
+        )
+        return minutes.asi8 == period_ends
+
 
 class BeforeClose(StatelessRule):
     """
@@ -457,6 +669,11 @@ class BeforeClose(StatelessRule):
 
         return self._period_start == dt
 
+    def trigger_mask(self, minutes):
+        _, closes = _execution_opens_and_closes(self.cal, minutes)
+        period_starts = closes - pd.Timedelta(self.offset).value
+        return minutes.asi8 == period_starts
+
 
 class NotHalfDay(StatelessRule):
     """
@@ -466,6 +683,10 @@ class NotHalfDay(StatelessRule):
         return self.cal.minute_to_session_label(dt) \
             not in self.cal.early_closes
 
+    def trigger_mask(self, minutes):
+        sessions = self.cal.minute_index_to_session_labels(minutes)
+        return ~sessions.isin(self.cal.early_closes)
+
 
 class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
     @preprocess(n=lossless_float_to_int('TradingDayOfWeekRule'))
@@ -480,6 +701,13 @@ class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
         val = self.cal.minute_to_session_label(dt, direction="none").value
         return val in self.execution_period_values
 
+    def trigger_mask(self, minutes):
+        sessions = self.cal.minute_index_to_session_labels(minutes)
+        return np.in1d(
+            sessions.asi8,
+            np.fromiter(self.execution_period_values, dtype=np.int64),
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -525,6 +753,13 @@ class TradingDayOfMonthRule(six.with_metaclass(ABCMeta, StatelessRule)):
         value = self.cal.minute_to_session_label(dt, direction="none").value
         return value in self.execution_period_values
 
+    def trigger_mask(self, minutes):
+        sessions = self.cal.minute_index_to_session_labels(minutes)
+        return np.in1d(
+            sessions.asi8,
+            np.fromiter(self.execution_period_values, dtype=np.int64),
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -600,6 +835,48 @@ class OncePerDay(StatefulRule):
             self.triggered = True
             return True
 
+    def next_trigger(self, minutes, start):
+        if (
+            self.triggered and
+            self.date is not None and
+            minutes[start] < self.next_date
+        ):
+            # we've already triggered today
+            return len(minutes)
+        return self.rule.next_trigger(minutes, start)
+
+    def trigger_mask(self, minutes):
+        if self.date is not None:
+            # we can only compute triggers from a fresh state
+            return None
+
+        rule_mask = self.rule.trigger_mask(minutes)
+        if rule_mask is None:
+            return None
+
+        # The rule resets on the first minute at least a day after the
+        # minute on which it last reset.
+        nanos = minutes.asi8
+        one_day = pd.Timedelta(1, unit='d').value
+        resets = []
+        idx = 0
+        while idx < len(nanos):
+            resets.append(idx)
+            idx = nanos.searchsorted(nanos[idx] + one_day)
+        resets = np.array(resets, dtype=np.int64)
+        next_resets = np.append(resets[1:], len(nanos))
+
+        # Trigger on the first minute of each day on which the rule does.
+        rule_triggers = np.flatnonzero(rule_mask)
+        firsts = rule_triggers.searchsorted(resets)
+        has_trigger = firsts < len(rule_triggers)
+        triggers = rule_triggers[firsts[has_trigger]]
+        triggers = triggers[triggers < next_resets[has_trigger]]
+
+        mask = np.zeros(len(minutes), dtype=bool)
+        mask[triggers] = True
+        return mask
+
 
 # Factory API
 
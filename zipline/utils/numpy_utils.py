@@ -19,10 +19,12 @@ from numpy import (
     empty,
     flatnonzero,
     hstack,
+    inf,
     isnan,
     nan,
     vectorize,
-    where
+    where,
+    zeros,
 )
 from numpy.lib.stride_tricks import as_strided
 from toolz import flip
@@ -324,6 +326,129 @@ def rolling_window(array, length):
     return as_strided(array, new_shape, new_strides)
 
 
+def window_span(windows):
+    """
+    Get the rows spanned by a stack of consecutive rolling windows.
+
+    This is the inverse of :func:`rolling_window`, and is useful for
+    computing rolling statistics over the stacks of windows passed to
+    ``CustomFactor.compute_batch`` without iterating over each window.
+
+    Parameters
+    ----------
+    windows : np.ndarray
+        An array of shape ``(N, length, ...)`` where each entry along the
+        first axis is the previous entry shifted forward by one row, such as
+        the result of :func:`rolling_window`.
+
+    Returns
+    -------
+    span : np.ndarray
+        A view of shape ``(N + length - 1, ...)`` over the rows spanned by
+        ``windows``.
+
+    Example
+    -------
+    >>> from numpy import arange
+    >>> windows = rolling_window(arange(10).reshape(5, 2), 3)
+    >>> window_span(windows)
+    array([[0, 1],
+           [2, 3],
+           [4, 5],
+           [6, 7],
+           [8, 9]])
+    """
+    count, length = windows.shape[:2]
+    if count > 1 and windows.strides[0] != windows.strides[1]:
+        raise ValueError(
+            "window_span expected consecutive rolling windows, but got an "
+            "array with strides %s" % (windows.strides,)
+        )
+    return as_strided(
+        windows,
+        (count + length - 1,) + windows.shape[2:],
+        windows.strides[1:],
+    )
+
+
+def _rolling_total(values, length):
+    # Differencing a single cumulative sum loses the precision of small
+    # windows once the running total grows large. Instead, split the rows into
+    # blocks of ``length`` rows: each window is a suffix of one block plus a
+    # prefix of the next, so no partial sum covers more than one window's worth
+    # of rows.
+    count = len(values) - length + 1
+    num_blocks = -(-len(values) // length)
+    padded = zeros((num_blocks * length,) + values.shape[1:], values.dtype)
+    padded[:len(values)] = values
+    blocks = padded.reshape((num_blocks, length) + values.shape[1:])
+
+    suffixes = blocks[:, ::-1].cumsum(axis=1)[:, ::-1].reshape(padded.shape)
+    prefixes = blocks.cumsum(axis=1).reshape(padded.shape)
+
+    # The window starting at row i takes the prefix ending at row
+    # i + length - 1, except when i starts a block, in which case that prefix
+    # is the same block as the suffix.
+    prefixes = prefixes[length - 1:length - 1 + count]
+    prefixes[::length] = 0
+    return suffixes[:count] + prefixes
+
+
+def rolling_nansum(array, length):
+    """
+    Compute the sum of each run of ``length`` consecutive rows of ``array``,
+    ignoring NaNs.
+
+    ``rolling_nansum(array, length)[i]`` is equal to
+    ``np.nansum(array[i:i + length], axis=0)``, up to rounding error, but is
+    computed from cumulative sums over blocks of ``length`` rows rather than
+    one sum per window.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array to sum. Sums are taken along the first axis.
+    length : int
+        The number of rows in each sum.
+
+    Returns
+    -------
+    sums : np.ndarray
+        An array of shape ``(len(array) - length + 1,) + array.shape[1:]``.
+
+    Example
+    -------
+    >>> from numpy import array, nan
+    >>> rolling_nansum(array([1.0, nan, 2.0, 3.0]), 2)
+    array([1., 2., 5.])
+    """
+    if not 0 < length <= len(array):
+        raise ValueError(
+            "Can't compute rolling sums of length {length} over an array of"
+            " shape {shape}.".format(length=length, shape=array.shape)
+        )
+
+    values = where(isnan(array), 0, array)
+    has_inf = False
+    if values.dtype.kind == 'f':
+        # Infinities would poison every later partial sum, so count them
+        # separately.
+        posinf = values == inf
+        neginf = values == -inf
+        has_inf = posinf.any() or neginf.any()
+        if has_inf:
+            values[posinf | neginf] = 0
+
+    out = _rolling_total(values, length)
+    if has_inf:
+        has_posinf = _rolling_total(posinf, length) > 0
+        has_neginf = _rolling_total(neginf, length) > 0
+        out[has_posinf] = inf
+        out[has_neginf] = -inf
+        out[has_posinf & has_neginf] = nan
+    return out
+
+
 # Sentinel value that isn't NaT.
 _notNaT = make_datetime64D(0)
 iNaT = int(NaTns.view(int64_dtype))
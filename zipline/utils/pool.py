@@ -1,7 +1,26 @@
+import multiprocessing
+
 from six.moves import map as imap
 from toolz import compose, identity
 
 
+def fork_pool(processes):
+    """
+    Create a :class:`multiprocessing.Pool` whose workers are forked from the
+    current process.
+
+    Forked workers inherit the state of the current process, so objects which
+    are expensive or impossible to pickle can be shared with the workers by
+    storing them in a module-level registry before creating the pool.
+    """
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2 always forks on platforms that support it.
+        context = multiprocessing
+    return context.Pool(processes)
+
+
 class ApplyAsyncResult(object):
     """An object that boxes results for calls to
     :meth:`~zipline.utils.pool.SequentialPool.apply_async`.